@@ -0,0 +1,46 @@
+## BATCH OF SEARCH JOBS: READS A JOB FILE (.jsonl OR .csv), RUNS EACH DIFFERENT SEARCH ONCE IN A POOL OF WORKER PROCESSES; JOBS OF THE SAME CORPUS SHARE ONE CORPUS OPEN
+## e.g. python batch.py jobs.jsonl --out BATCHES/2026_10 --workers 4
+## e.g. JOB FILE .jsonl (ONE SEARCH JOB PER LINE, SAME AS python client.py / server.py; "JobID" OPTIONAL):
+##   {"JobID": "messiah_gen", "Codex": 2, "Text": 1, "ELSSearchTerms": ["משיח"], "SkipDistanceDMinimum": -100, "SkipDistanceDMaximum": 100, "XW": 50, "Outputs": ["summary", "matches"]}
+## e.g. JOB FILE .csv (DELIMITER ';'; LISTS SEPARATED BY ','):
+##   JobID;Codex;Text;CustomCorpus;ELSSearchTerms;SkipDistanceDMinimum;SkipDistanceDMaximum;XW;Outputs
+##   messiah_gen;2;1;;משיח,תורה;-100;100;50;summary,matches
+## OUTPUT: --out/JOBID/ == FILES OF THE JOB + JOB.json + RESULT.json + LOG.txt; --out/BATCH_SUMMARY.json + BATCH_TIMING.csv == ALL JOBS (STATUS, DUPLICATES, SECONDS TO OPEN THE CORPUS + TO SEARCH, MATCHES)
+
+## BEGIN IMPORT MODULES
+import argparse
+import os
+import sys
+
+import mod_7D_BatchJobsRun ## MODULE.FUNCTION() #7D - BATCH JOBS RUN; ## RETURNS DictOfSummary
+## END IMPORT MODULES
+
+## BEGIN DECLARE VARIABLES
+Parser = argparse.ArgumentParser(description="Run a batch of ELS search jobs (.jsonl or .csv); jobs of the same text share one corpus load")
+Parser.add_argument("jobs", help="job file: .jsonl (one search job per line) or .csv (delimiter ';')")
+Parser.add_argument("--out", default=None, help="batch directory: one directory per job + BATCH_SUMMARY.json + BATCH_TIMING.csv (default: BATCHES/<name of the job file>)")
+Parser.add_argument("--workers", type=int, default=None, help="number of worker processes (default: number of CPUs)")
+## END DECLARE VARIABLES
+
+## BEGIN MAIN PROGRAM
+if __name__ == "__main__":
+
+    Arguments = Parser.parse_args()
+
+    ## PATHS OF THE COMMAND LINE ARE FROM THE CURRENT DIRECTORY; texts/ ARE READ NEXT TO THIS SCRIPT
+    FileNameOfJobs = os.path.abspath(Arguments.jobs)
+    DirectoryOfBatch = os.path.abspath(Arguments.out) if Arguments.out else None
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    DirectoryOfBatch = DirectoryOfBatch or os.path.join("BATCHES", os.path.splitext(os.path.basename(FileNameOfJobs))[0])
+
+    ## BEGIN TRY / EXCEPT - JOB FILE OR BATCH DIRECTORY NOT USABLE
+    try:
+        DictOfSummary = mod_7D_BatchJobsRun.fn_BatchJobsRun(FileNameOfJobs, DirectoryOfBatch, Arguments.workers)
+    except (OSError, ValueError) as e:
+        sys.exit(f"Batch not run: {e}")
+    ## END TRY / EXCEPT
+
+    ## EXIT CODE 1 IF A JOB FAILED
+    sys.exit(1 if DictOfSummary["NumberOfJobsFailed"] else 0)
+
+## END MAIN PROGRAM
@@ -0,0 +1,48 @@
+## READ A BUNDLE OF ALL FILES OF ONE RUN WRITTEN BY: python p.py --bundle [zip|tar.zst]
+## e.g. LIST OF FILES:  python bundle.py USER_GENERATED_FILES/USER_BUNDLE_....zip
+## e.g. PARAMETERS + COUNTS OF THE RUN:  python bundle.py USER_GENERATED_FILES/USER_BUNDLE_....zip --manifest
+## e.g. ONE FILE TO THE SCREEN:  python bundle.py USER_GENERATED_FILES/USER_BUNDLE_....zip --cat USER_FILE_WordsOfELSs_ELSMatches_DATASUMMARY_....csv
+## e.g. EXTRACT ALL FILES:  python bundle.py USER_GENERATED_FILES/USER_BUNDLE_....zip --extract USER_GENERATED_FILES
+
+## BEGIN IMPORT MODULES
+import argparse
+import json
+import shutil
+import sys
+
+import mod_99_WriteOutputToBundle ## MODULE.FUNCTION() #99 - WRITE OUTPUT TO BUNDLE + READ BUNDLE
+## END IMPORT MODULES
+
+## BEGIN DECLARE VARIABLES
+Parser = argparse.ArgumentParser(description="Read a bundle of all files of one run (written by: python p.py --bundle)")
+Parser.add_argument("bundle", help="bundle file (.zip or .tar.zst)")
+Parser.add_argument("--manifest", action="store_true", help="print MANIFEST.json (parameters + counts of the run)")
+Parser.add_argument("--cat", metavar="MEMBER", help="write one file of the bundle to the screen")
+Parser.add_argument("--extract", metavar="DIRECTORY", help="write the files of the bundle to this directory")
+Parser.add_argument("members", nargs="*", help="only these files (with --extract)")
+## END DECLARE VARIABLES
+
+## BEGIN MAIN PROGRAM
+Arguments = Parser.parse_args()
+
+## BEGIN IF / ELIF / ELSE - TYPE OF READ
+if Arguments.manifest:
+    print(json.dumps(mod_99_WriteOutputToBundle.fn_BundleManifestRead(Arguments.bundle), ensure_ascii=False, indent=2))
+
+elif Arguments.cat is not None:
+    for EachName, FileInBundle in mod_99_WriteOutputToBundle.fn_BundleMembersIterate(Arguments.bundle):
+        if EachName == Arguments.cat:
+            shutil.copyfileobj(FileInBundle, sys.stdout.buffer, mod_99_WriteOutputToBundle.ChunkSize)
+            break
+    else:
+        sys.exit(f"No {Arguments.cat} in bundle: {Arguments.bundle}")
+
+elif Arguments.extract is not None:
+    for FilePath in mod_99_WriteOutputToBundle.fn_BundleExtract(Arguments.bundle, Arguments.extract, Arguments.members or None):
+        print(FilePath)
+
+else:
+    for EachMember in mod_99_WriteOutputToBundle.fn_BundleManifestRead(Arguments.bundle)["Members"]:
+        print(f"{EachMember['Bytes']:>12} {EachMember['Rows']:>9}  {EachMember['Name']}")
+## END IF / ELIF / ELSE
+## END MAIN PROGRAM
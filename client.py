@@ -0,0 +1,128 @@
+## CLIENT OF THE LOCAL SEARCH SERVER (python server.py): SENDS ONE SEARCH JOB AND SHOWS ITS PROGRESS + RESULTS
+## e.g. python client.py --codex 2 --text 1 --columns 50 --dmin -100 --dmax 100 משיח
+## e.g. CUSTOM CORPUS + FILES:  python client.py --codex 2 --corpus "Gen 1:1-11:32" --outputs summary,matches --dmin 1 --dmax 50 תורה
+## e.g. RESULTS AS JSON (THE LOG GOES TO stderr):  python client.py --json --codex 2 --text 1 --dmin -100 --dmax 100 משיח
+## e.g. PROGRESS ONLY (STAGE, TERM, d, MATCHES, ETA):  python client.py --quiet --progress --codex 2 --text 1 --dmin -100 --dmax 100 משיח
+## e.g. CORPORA IN MEMORY:  python client.py --status
+## e.g. ESTIMATE ONLY (CANDIDATES, MATCHES + SECONDS PER TERM AND ENGINE; NOTHING SEARCHED):  python client.py --plan --codex 2 --text 43 --dmin -1000 --dmax 1000 משיח תורה
+## e.g. STOP THE RUNNING SEARCH:  python client.py --cancel  (OR Ctrl+C WHILE IT RUNS: THE RESULT STILL COMES WITH THE MATCHES FOUND SO FAR)
+
+## BEGIN IMPORT MODULES
+import argparse
+import csv
+import json
+import signal
+import sys
+
+import mod_7C_SearchClient ## MODULE.FUNCTION() #7C - SEARCH CLIENT; ## YIELDS EVENTS OF ONE SEARCH JOB
+## END IMPORT MODULES
+
+## BEGIN DECLARE VARIABLES
+Parser = argparse.ArgumentParser(description="Send one ELS search to the local search server (python server.py)")
+Parser.add_argument("terms", nargs="*", help="ELS search terms (Hebrew)")
+Parser.add_argument("--codex", type=int, default=2, help="1 Koren, 2 Leningrad, 3 MAM (default: %(default)s)")
+Parser.add_argument("--text", type=int, default=1, help="number of the text as in p.py (default: %(default)s)")
+Parser.add_argument("--corpus", help="custom corpus, e.g. Gen-Deut, Isa+Jer, Gen 1:1-11:32 (instead of --text)")
+Parser.add_argument("--columns", type=int, default=50, help="X / W / columns of the 2D matrix (default: %(default)s)")
+Parser.add_argument("--dmin", type=int, default=1, help="minimum skip distance (default: %(default)s)")
+Parser.add_argument("--dmax", type=int, default=100, help="maximum skip distance (default: %(default)s)")
+Parser.add_argument("--outputs", default="", help="files to write, as p.py --outputs (default: none)")
+Parser.add_argument("--json", action="store_true", help="write the result as JSON instead of a table of matches")
+Parser.add_argument("--quiet", action="store_true", help="do not show the log of the search")
+Parser.add_argument("--progress", action="store_true", help="show the progress of the search (stage, term, d, matches, ETA)")
+Parser.add_argument("--plan", action="store_true", help="only show the estimate of the search (candidates, matches and seconds per term and engine)")
+Parser.add_argument("--status", action="store_true", help="show the corpora in memory of the server")
+Parser.add_argument("--cancel", action="store_true", help="stop the search running on the server")
+Parser.add_argument("--host", default=mod_7C_SearchClient.HostDefault, help="server address (default: %(default)s)")
+Parser.add_argument("--port", type=int, default=mod_7C_SearchClient.PortDefault, help="server port (default: %(default)s)")
+## END DECLARE VARIABLES
+
+## BEGIN FUNCTION - SIGNAL HANDLE - 1ST Ctrl+C: STOP THE SEARCH ON THE SERVER + WAIT FOR ITS RESULT; 2ND Ctrl+C: QUIT AT ONCE
+def fn_SignalHandle(SignalNumber, Frame):
+
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    print("Stopping the search (Ctrl+C again to quit at once)...", file=sys.stderr)
+    mod_7C_SearchClient.fn_SearchJobCancel(Arguments.host, Arguments.port)
+
+## END FUNCTION
+
+## BEGIN MAIN PROGRAM
+Arguments = Parser.parse_args()
+
+## IF THE SERVER IS NOT RUNNING
+if not mod_7C_SearchClient.fn_ServerIsRunning(Arguments.host, Arguments.port):
+    sys.exit(f"No search server on {Arguments.host}:{Arguments.port}; start it with: python server.py")
+
+## BEGIN IF / ELSE - STATUS OR SEARCH JOB
+if Arguments.status:
+    print(json.dumps(mod_7C_SearchClient.fn_ServerStatusGet(Arguments.host, Arguments.port), ensure_ascii=False, indent=2))
+
+elif Arguments.cancel:
+    print("Search stopped" if mod_7C_SearchClient.fn_SearchJobCancel(Arguments.host, Arguments.port) else "No search running")
+
+else:
+
+    ## IF NO ELS SEARCH TERMS
+    if not Arguments.terms:
+        Parser.error("no ELS search terms")
+
+    ## SEARCH JOB; TEXT 48 == CUSTOM CORPUS (SAME AS p.py)
+    DictOfJob = {"Codex": Arguments.codex, "Text": 48 if Arguments.corpus else Arguments.text, "CustomCorpus": Arguments.corpus, "ELSSearchTerms": Arguments.terms, \
+        "SkipDistanceDMinimum": Arguments.dmin, "SkipDistanceDMaximum": Arguments.dmax, "XW": Arguments.columns, "Outputs": [EachOutput for EachOutput in Arguments.outputs.split(",") if EachOutput]}
+
+    ## ESTIMATE ONLY
+    if Arguments.plan:
+        try:
+            DictOfPlan = mod_7C_SearchClient.fn_SearchJobPlan(DictOfJob, Arguments.host, Arguments.port)
+        except ValueError as e:
+            sys.exit(f"Plan failed: {e}")
+        print(json.dumps(DictOfPlan, ensure_ascii=False, indent=2) if Arguments.json else DictOfPlan["Text"])
+        sys.exit(0)
+
+    signal.signal(signal.SIGINT, fn_SignalHandle)
+
+    ## BEGIN FOR LOOP - EACH EVENT OF THE JOB
+    for DictOfEvent in mod_7C_SearchClient.fn_SearchJobSend(DictOfJob, Arguments.host, Arguments.port):
+
+        ## BEGIN MATCH CASE - TYPE OF EVENT
+        match DictOfEvent["Event"]:
+
+            case "log":
+                if not Arguments.quiet:
+                    print(DictOfEvent["Line"], file=sys.stderr)
+
+            case "progress":
+                if Arguments.progress:
+                    print(f"{DictOfEvent['Stage']}: {DictOfEvent['Done'] or 0}/{DictOfEvent['Total'] or '?'}" + \
+                        (f" {DictOfEvent['Term']} d={DictOfEvent['D']}" if "D" in DictOfEvent else "") + \
+                        (f" matches={DictOfEvent['Matches']}" if "Matches" in DictOfEvent else "") + \
+                        (f" ETA {DictOfEvent['ETA']} s" if DictOfEvent["ETA"] is not None else ""), file=sys.stderr)
+
+            case "error":
+                sys.exit(f"Search failed: {DictOfEvent['Message']}")
+
+            case "result" if Arguments.json:
+                print(json.dumps(DictOfEvent, ensure_ascii=False, indent=2))
+
+            case "result":
+                ## MATCHES AS CSV (SAME DELIMITER AS THE CSV FILES IN USER_GENERATED_FILES) + ONE LINE PER TERM
+                f_csv = csv.writer(sys.stdout, delimiter=';')
+                f_csv.writerow(["Term", "N", "D", "K", "Book", "Chapter", "Verse", "WordNumber", "Word", "LetterPositionInWord"])
+                f_csv.writerows([EachMatch[EachKey] for EachKey in ("Term", "N", "D", "K", "Book", "Chapter", "Verse", "WordNumber", "Word", "LetterPositionInWord")] for EachMatch in DictOfEvent["Matches"])
+                for EachTerm in DictOfEvent["Terms"]:
+                    print(f"{EachTerm['Term']}: {EachTerm['Positive']} positive, {EachTerm['Negative']} negative", file=sys.stderr)
+                if not DictOfEvent["Coverage"]["IsComplete"]:
+                    for EachTerm in DictOfEvent["Coverage"]["Terms"]:
+                        print(f"{EachTerm['Term']}: stopped early; d searched {EachTerm['DRangesDone']}, d left {EachTerm['DRangesLeft']}", file=sys.stderr)
+                print(f"{DictOfEvent['Seconds']} s (corpus {'opened now' if DictOfEvent['IsCorpusOpenedNow'] else 'in memory'})", file=sys.stderr)
+
+            case _:
+                if not Arguments.quiet:
+                    print(DictOfEvent, file=sys.stderr)
+
+        ## END MATCH CASE
+
+    ## END FOR LOOP
+
+## END IF / ELSE
+## END MAIN PROGRAM
@@ -9,8 +9,13 @@ import threading
 import sys
 import io
 import os
+import json
+import queue
+import signal
 import subprocess
 
+## mod_7C_SearchClient (client of the local search server, python server.py) is imported by the methods that use it: urllib adds to the start of the GUI
+
 ## Set working directory to script location
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
@@ -35,7 +40,31 @@ class TorahBibleCodesGUI:
         36: "Ezra", 37: "Nehemiah", 38: "I Chronicles", 39: "II Chronicles",
         40: "Pentateuch (Torah)", 41: "Prophets (Nevi'im)", 42: "Writings (K'tuvim)",
         43: "Hebrew Bible (Tanach)", 44: "Samuel (Combined)", 45: "Kings (Combined)",
-        46: "Ezra-Nehemiah", 47: "Chronicles (Combined)"
+        46: "Ezra-Nehemiah", 47: "Chronicles (Combined)", 48: "Custom corpus"
+    }
+    
+    CUSTOM_CORPUS_TEXT = 48  ## Text number p.py uses for a custom corpus
+    
+    ## Outputs p.py can write (--outputs); only the stages these need are run
+    OUTPUTS = {
+        "summary": ("Match summary", True),
+        "matches": ("Matches by first/last letter", True),
+        "letters": ("All letter positions", True),
+        "matrix": ("2D matrix (CSV)", True),
+        "statistics": ("Letter statistics", True),
+        "words": ("Words with gematria values", True),
+        "xlsx": ("2D matrix (XLSX, colored)", False),
+    }
+    
+    ## Log lines + progress events of the search thread are shown once per frame, not once per line
+    FRAME_MS = 100
+    
+    ## Stages of the progress events (p.py --progress-json / search server)
+    STAGES = {
+        "DataObjects": "Preparing text", "SearchObjects": "Preparing search", "ELSObjects": "Preparing terms",
+        "LetterCodes": "Writing letter codes", "LetterObjects": "Preparing letters of matches", "SearchByLetterFirst": "Searching (first letter)", "SearchByLetterLast": "Searching (last letter)",
+        "GatherByLetterFirst": "Collecting matches (first letter)", "GatherByLetterLast": "Collecting matches (last letter)",
+        "LetterPositions": "Collecting letter positions", "Output": "Writing files", "Bundle": "Writing bundle", "Done": "Done",
     }
     
     def __init__(self, root):
@@ -48,13 +77,18 @@ class TorahBibleCodesGUI:
         
         self.codex_var = tk.IntVar(value=2)
         self.text_var = tk.IntVar(value=1)
+        self.custom_corpus_var = tk.StringVar(value="")
         self.matrix_var = tk.StringVar(value="50")
         self.skip_min_var = tk.StringVar(value="1")
         self.skip_max_var = tk.StringVar(value="100")
+        self.output_vars = {name: tk.BooleanVar(value=default) for name, (label, default) in self.OUTPUTS.items()}
         self.is_running = False
+        self.is_stopping = False  ## Stop pressed once: the search stops at the next skip distance and writes what it found
         self.process = None
+        self.events = queue.Queue()  ## ("log", text), ("progress", event) or ("finished", None) from the search thread
         
         self._build_ui()
+        self.root.after(self.FRAME_MS, self._drain_events)
         
     def _build_ui(self):
         main = ttk.Frame(self.root, padding=10)
@@ -86,6 +120,11 @@ class TorahBibleCodesGUI:
         self._populate_texts()
         self.text_listbox.selection_set(0)
         
+        ## Custom corpus (overrides the text selected above)
+        ttk.Label(left, text="Or custom corpus (optional):", font=('Helvetica', 9)).pack(anchor=tk.W, pady=(5,0))
+        ttk.Entry(left, textvariable=self.custom_corpus_var, width=30).pack(anchor=tk.W)
+        ttk.Label(left, text="(e.g. Gen-Deut, Isa+Jer, Gen 1:1-11:32)", font=('Helvetica', 9)).pack(anchor=tk.W)
+        
         ttk.Separator(left, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=10)
         
         ## Matrix size
@@ -116,12 +155,24 @@ class TorahBibleCodesGUI:
         
         ttk.Separator(left, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=10)
         
+        ## Outputs
+        ttk.Label(left, text="6. Outputs:", font=('Helvetica', 11, 'bold')).pack(anchor=tk.W, pady=(0,5))
+        outputs_frame = ttk.Frame(left)
+        outputs_frame.pack(fill=tk.X)
+        for i, (name, (label, default)) in enumerate(self.OUTPUTS.items()):
+            ttk.Checkbutton(outputs_frame, text=label, variable=self.output_vars[name]).grid(row=i // 2, column=i % 2, sticky=tk.W)
+        
+        ttk.Separator(left, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=10)
+        
         ## Buttons
         btn_frame = ttk.Frame(left)
         btn_frame.pack(fill=tk.X, pady=5)
         
+        self.preview_btn = ttk.Button(btn_frame, text="🔍 Preview", command=self._preview_search)
+        self.preview_btn.pack(side=tk.LEFT, padx=(0,5))
+        
         self.run_btn = ttk.Button(btn_frame, text="▶ Run Search", command=self._run_search)
-        self.run_btn.pack(side=tk.LEFT, padx=(0,5))
+        self.run_btn.pack(side=tk.LEFT, padx=5)
         
         self.stop_btn = ttk.Button(btn_frame, text="■ Stop", command=self._stop_search, state=tk.DISABLED)
         self.stop_btn.pack(side=tk.LEFT, padx=5)
@@ -140,7 +191,13 @@ class TorahBibleCodesGUI:
         
         self.output_text = scrolledtext.ScrolledText(right, height=30, width=60, font=('Courier', 10))
         self.output_text.pack(fill=tk.BOTH, expand=True)
-        self.output_text.insert('1.0', "Welcome to Torah Bible Codes!\n\nConfigure your search on the left and click 'Run Search'.\n\nOutput files will be saved to: USER_GENERATED_FILES/\n")
+        self.output_text.insert('1.0', "Welcome to Torah Bible Codes!\n\nConfigure your search on the left, click 'Preview' for an estimate of its time, then 'Run Search'.\n\nOutput files will be saved to: USER_GENERATED_FILES/\n")
+        
+        ## Progress of the search
+        self.progress_bar = ttk.Progressbar(right, mode='determinate', maximum=100)
+        self.progress_bar.pack(fill=tk.X, pady=(5,0))
+        self.progress_var = tk.StringVar(value="")
+        ttk.Label(right, textvariable=self.progress_var, anchor=tk.W).pack(fill=tk.X)
         
         ## Status bar
         self.status_var = tk.StringVar(value="Ready")
@@ -165,69 +222,183 @@ class TorahBibleCodesGUI:
     def _log(self, msg):
         self.output_text.insert(tk.END, msg)
         self.output_text.see(tk.END)
-        self.root.update_idletasks()
         
-    def _run_search(self):
-        if self.is_running:
-            return
-            
-        ## Get parameters
+    def _post(self, kind, payload=None):
+        """Queue a log line, progress event or end of search from the search thread"""
+        self.events.put((kind, payload))
+        
+    def _drain_events(self):
+        """Show everything queued since the last frame: the log in one insert, only the newest progress event"""
+        lines, progress, finished = [], None, False
+        while True:
+            try:
+                kind, payload = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "log":
+                lines.append(payload)
+            elif kind == "progress":
+                progress = payload
+            elif kind == "finished":
+                finished = True
+        if lines:
+            self._log("".join(lines))
+        if progress is not None:
+            self._show_progress(progress)
+        if finished:
+            self._search_finished()
+        self.root.after(self.FRAME_MS, self._drain_events)
+        
+    def _show_progress(self, event):
+        """Progress bar + one line: stage, term, d, matches so far and time left of the stage"""
+        if event["Total"]:
+            self.progress_bar["value"] = 100 * event["Done"] / event["Total"]
+        parts = [self.STAGES.get(event["Stage"], event["Stage"])]
+        if event.get("Term") is not None:
+            parts.append(f"term {event['Term']}")
+        if event.get("D") is not None:
+            parts.append(f"d = {event['D']}")
+        if event.get("Matches") is not None:
+            parts.append(f"{event['Matches']} matches")
+        if event["Total"]:
+            parts.append(f"{100 * event['Done'] // event['Total']}%")
+        if event.get("ETA") is not None:
+            parts.append(f"about {event['ETA']:.0f} s left")
+        self.progress_var.set(", ".join(parts))
+        
+    def _get_search_parameters(self):
+        """Parameters of the search as entered; None (after an error message) if there is no term or no output"""
         codex = self.codex_var.get()
         text_num = self._get_selected_text()
+        custom_corpus = self.custom_corpus_var.get().strip()
+        if custom_corpus:
+            text_num = self.CUSTOM_CORPUS_TEXT
         matrix_cols = self.matrix_var.get()
         skip_min = self.skip_min_var.get()
         skip_max = self.skip_max_var.get()
         terms = self.terms_text.get('1.0', tk.END).strip().split('\n')
         terms = [t.strip() for t in terms if t.strip()]
+        outputs = [name for name, var in self.output_vars.items() if var.get()]
         
         if not terms:
             messagebox.showerror("Error", "Please enter at least one search term.")
+            return None
+        if not outputs:
+            messagebox.showerror("Error", "Please select at least one output.")
+            return None
+        return (codex, text_num, custom_corpus, matrix_cols, skip_min, skip_max, terms, outputs)
+        
+    def _preview_search(self):
+        """Estimate of the search (candidates, matches and time per term and engine) before it is run; nothing is searched"""
+        if self.is_running:
+            return
+        params = self._get_search_parameters()
+        if params is None:
+            return
+            
+        self.is_running = True
+        self.is_stopping = False
+        self.run_btn.config(state=tk.DISABLED)
+        self.preview_btn.config(state=tk.DISABLED)
+        self.stop_btn.config(state=tk.NORMAL)
+        self.status_var.set("Estimating search...")
+        self._log("\n" + "-" * 50 + "\nEstimating search (nothing is searched yet)...\n")
+        
+        thread = threading.Thread(target=self._execute_plan, args=params)
+        thread.daemon = True
+        thread.start()
+        
+    def _execute_plan(self, codex, text_num, custom_corpus, matrix_cols, skip_min, skip_max, terms, outputs):
+        import mod_7C_SearchClient
+        try:
+            ## The search server has the corpus in memory; else p.py --plan reads the text, prints the plan and stops before the search
+            if mod_7C_SearchClient.fn_ServerIsRunning():
+                plan = mod_7C_SearchClient.fn_SearchJobPlan(self._search_job(codex, text_num, custom_corpus, matrix_cols, skip_min, skip_max, terms, outputs))
+                self._post("log", plan["Text"] + "\n")
+                return
+                
+            self.process = subprocess.Popen(
+                [sys.executable, 'p.py', '--outputs', ','.join(outputs), '--plan'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                cwd=os.path.dirname(os.path.abspath(__file__))
+            )
+            stdout, stderr = self.process.communicate(self._p_py_inputs(codex, text_num, custom_corpus, matrix_cols, skip_min, skip_max, terms))
+            
+            ## Only the lines of the plan: "SEARCH PLAN: ..." and the indented lines after it
+            lines = stdout.splitlines()
+            start = next((i for i, line in enumerate(lines) if line.startswith("SEARCH PLAN:")), None)
+            if start is None:
+                self._post("log", f"No estimate: {(stderr or stdout).strip().splitlines()[-1] if (stderr or stdout).strip() else 'p.py stopped'}\n")
+                return
+            end = start + 1
+            while end < len(lines) and lines[end].startswith("  "):
+                end += 1
+            self._post("log", "\n".join(lines[start:end]) + "\n")
+            
+        except Exception as e:
+            self._post("log", f"\nError: {str(e)}\n")
+        finally:
+            self._post("finished")
+            
+    def _run_search(self):
+        if self.is_running:
+            return
+        params = self._get_search_parameters()
+        if params is None:
             return
+        codex, text_num, custom_corpus, matrix_cols, skip_min, skip_max, terms, outputs = params
             
         self.is_running = True
+        self.is_stopping = False
         self.run_btn.config(state=tk.DISABLED)
+        self.preview_btn.config(state=tk.DISABLED)
         self.stop_btn.config(state=tk.NORMAL)
         self.status_var.set("Running search...")
         
         self.output_text.delete('1.0', tk.END)
+        self.progress_bar["value"] = 0
+        self.progress_var.set("")
         self._log(f"Starting ELS Search...\n")
         self._log(f"Codex: {self.CODICES[codex][0]}\n")
         self._log(f"Text: {self.TEXTS.get(text_num, 'Unknown')}\n")
+        if custom_corpus:
+            self._log(f"Custom corpus: {custom_corpus}\n")
         self._log(f"Matrix columns: {matrix_cols}\n")
         self._log(f"Skip distances: {skip_min} to {skip_max}\n")
         self._log(f"Search terms: {terms}\n")
+        self._log(f"Outputs: {', '.join(outputs)}\n")
         self._log("-" * 50 + "\n\n")
         
         ## Create input script for automated execution
         thread = threading.Thread(target=self._execute_search, 
-                                 args=(codex, text_num, matrix_cols, skip_min, skip_max, terms))
+                                 args=(codex, text_num, custom_corpus, matrix_cols, skip_min, skip_max, terms, outputs))
         thread.daemon = True
         thread.start()
         
-    def _execute_search(self, codex, text_num, matrix_cols, skip_min, skip_max, terms):
+    def _execute_search(self, codex, text_num, custom_corpus, matrix_cols, skip_min, skip_max, terms, outputs):
+        import mod_7C_SearchClient
         try:
-            ## Build input sequence for p.py
-            inputs = [
-                str(codex),      ## Codex selection
-                str(text_num),   ## Text selection  
-                matrix_cols,     ## Matrix columns
-                "1",             ## Manual input type
-                str(len(terms)), ## Number of search terms
-            ]
-            inputs.extend(terms)  ## Add each search term
-            inputs.extend([skip_min, skip_max])  ## Skip distances
-            
-            input_str = '\n'.join(inputs) + '\n'
+            ## Use the local search server when it is running: the corpus stays in memory between searches
+            if mod_7C_SearchClient.fn_ServerIsRunning():
+                self._execute_search_on_server(codex, text_num, custom_corpus, matrix_cols, skip_min, skip_max, terms, outputs)
+                return
+                
+            input_str = self._p_py_inputs(codex, text_num, custom_corpus, matrix_cols, skip_min, skip_max, terms)
             
-            ## Run p.py with piped input
+            ## Run p.py with piped input; the log comes on stdout, progress events (JSON lines) on stderr
+            ## On Windows p.py gets its own process group, so Stop can send it Ctrl+Break (it stops like on SIGTERM)
             self.process = subprocess.Popen(
-                [sys.executable, 'p.py'],
+                [sys.executable, 'p.py', '--outputs', ','.join(outputs), '--progress-json'],
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
+                stderr=subprocess.PIPE,
                 text=True,
                 bufsize=1,
-                cwd=os.path.dirname(os.path.abspath(__file__))
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if sys.platform == 'win32' else 0
             )
             
             ## Send all inputs
@@ -235,35 +406,124 @@ class TorahBibleCodesGUI:
             self.process.stdin.flush()
             self.process.stdin.close()
             
-            ## Read output line by line
+            ## Read progress events in a second thread
+            stderr_thread = threading.Thread(target=self._read_progress, args=(self.process.stderr,), daemon=True)
+            stderr_thread.start()
+            
+            ## Read output line by line until p.py exits (also after Stop: it still writes the matches found so far); shown in batches by _drain_events
             for line in iter(self.process.stdout.readline, ''):
-                if not self.is_running:
-                    break
-                self.root.after(0, self._log, line)
+                self._post("log", line)
                 
             self.process.wait()
+            stderr_thread.join()
             
-            self.root.after(0, self._log, "\n" + "=" * 50 + "\n")
-            self.root.after(0, self._log, "Search completed! Check USER_GENERATED_FILES/ for results.\n")
+            self._post("log", "\n" + "=" * 50 + "\n")
+            if self.process.returncode != 0:
+                self._post("log", "Search stopped without writing results.\n")
+            elif self.is_stopping:
+                self._post("log", "Search stopped early. The matches found so far and the skip distances searched (COVERAGE file) are in USER_GENERATED_FILES/.\n")
+            else:
+                self._post("log", "Search completed! Check USER_GENERATED_FILES/ for results.\n")
             
         except Exception as e:
-            self.root.after(0, self._log, f"\nError: {str(e)}\n")
+            self._post("log", f"\nError: {str(e)}\n")
         finally:
-            self.root.after(0, self._search_finished)
+            self._post("finished")
             
+    def _p_py_inputs(self, codex, text_num, custom_corpus, matrix_cols, skip_min, skip_max, terms):
+        """Answers to the questions of p.py, one per line"""
+        inputs = [
+            str(codex),      ## Codex selection
+            str(text_num),   ## Text selection  
+        ]
+        if text_num == self.CUSTOM_CORPUS_TEXT:
+            inputs.append(custom_corpus)  ## Custom corpus
+        inputs.extend([
+            matrix_cols,     ## Matrix columns
+            "1",             ## Manual input type
+            str(len(terms)), ## Number of search terms
+        ])
+        inputs.extend(terms)  ## Add each search term
+        inputs.extend([skip_min, skip_max])  ## Skip distances
+        return '\n'.join(inputs) + '\n'
+        
+    def _search_job(self, codex, text_num, custom_corpus, matrix_cols, skip_min, skip_max, terms, outputs):
+        """The search as one job of the search server"""
+        return {
+            "Codex": codex, "Text": text_num, "CustomCorpus": custom_corpus or None,
+            "ELSSearchTerms": terms, "SkipDistanceDMinimum": int(skip_min), "SkipDistanceDMaximum": int(skip_max),
+            "XW": int(matrix_cols), "Outputs": outputs,
+        }
+        
+    def _read_progress(self, stream):
+        """Progress events of p.py --progress-json; other lines on stderr (e.g. errors) go to the log"""
+        for line in iter(stream.readline, ''):
+            start = line.find('{"Event"')  ## The tqdm bar of p.py may precede an event on the same line
+            if start >= 0:
+                try:
+                    event = json.loads(line[start:])
+                except ValueError:
+                    pass
+                else:
+                    if start:
+                        self._post("log", line[:start] + "\n")
+                    self._post("progress", event)
+                    continue
+            self._post("log", line)
+            
+    def _execute_search_on_server(self, codex, text_num, custom_corpus, matrix_cols, skip_min, skip_max, terms, outputs):
+        """Send the search as one job to the local search server and show its events"""
+        import mod_7C_SearchClient
+        job = self._search_job(codex, text_num, custom_corpus, matrix_cols, skip_min, skip_max, terms, outputs)
+        self._post("log", "Using search server (python server.py)\n\n")
+        
+        for event in mod_7C_SearchClient.fn_SearchJobSend(job):
+            if event["Event"] == "log":
+                self._post("log", event["Line"] + "\n")
+            elif event["Event"] == "progress":
+                self._post("progress", event)
+            elif event["Event"] == "error":
+                self._post("log", f"\nError: {event['Message']}\n")
+            elif event["Event"] == "result":
+                summary = "".join(f"{t['Term']}: {t['Positive']} positive, {t['Negative']} negative\n" for t in event["Terms"])
+                corpus = "opened now" if event["IsCorpusOpenedNow"] else "already in memory"
+                coverage = event.get("Coverage") or {"IsComplete": True}
+                if coverage["IsComplete"]:
+                    self._post("log", "\n" + "=" * 50 + "\n" + summary + f"Search completed in {event['Seconds']} s (corpus {corpus}). Check USER_GENERATED_FILES/ for results.\n")
+                else:
+                    left = "".join(f"{t['Term']}: d not searched: {', '.join(f'{a} to {b}' for a, b in t['DRangesLeft']) or 'none'}\n" for t in coverage["Terms"])
+                    self._post("log", "\n" + "=" * 50 + "\n" + summary + left + f"Search stopped early after {event['Seconds']} s. The matches found so far are in USER_GENERATED_FILES/.\n")
+        
     def _search_finished(self):
         self.is_running = False
+        self.is_stopping = False
         self.process = None
         self.run_btn.config(state=tk.NORMAL)
+        self.preview_btn.config(state=tk.NORMAL)
         self.stop_btn.config(state=tk.DISABLED)
         self.status_var.set("Ready")
         
     def _stop_search(self):
+        """First Stop: the search stops at the next skip distance and still writes the matches found so far; second Stop: kill p.py"""
+        if not self.is_running:
+            return
+        if self.is_stopping:
+            if self.process:
+                self.process.kill()
+                self._log("\n\nSearch killed by user.\n")
+            return
+        self.is_stopping = True
+        self.status_var.set("Stopping... (writing matches found so far)")
+        self._log("\n\nStopping search... (writing matches found so far; press Stop again to kill it)\n")
         if self.process:
-            self.process.terminate()
-        self.is_running = False
-        self._log("\n\nSearch stopped by user.\n")
-        self._search_finished()
+            if sys.platform == 'win32':
+                self.process.send_signal(signal.CTRL_BREAK_EVENT)
+            else:
+                self.process.terminate()  ## p.py treats SIGTERM like Ctrl+C
+        else:
+            ## Search server: the job stops and still sends its result
+            import mod_7C_SearchClient
+            threading.Thread(target=mod_7C_SearchClient.fn_SearchJobCancel, daemon=True).start()
         
     def _open_output(self):
         output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "USER_GENERATED_FILES")
@@ -341,6 +601,11 @@ Recommendation: Start with Leningrad Codex for the most comprehensive searches."
    - Hebrew Bible/Tanach (43): The entire Hebrew Bible
    - Combined books (44-47): Samuel, Kings, Ezra-Nehemiah, Chronicles as single texts
 
+• Custom corpus: Type any combination of books and ranges into the custom corpus field; it is used instead of the text selected in the list. Join parts with +.
+   - Gen-Deut: a range of books
+   - Isa+Jer: books in the order given
+   - Gen 1:1-11:32 or Ps 119: chapters and verses within one book
+
 Recommendation: For beginners, start with Genesis or the Torah. Larger texts take longer to search but may reveal more patterns."""
         ttk.Label(help_text, text=text_text, wraplength=650, justify=tk.LEFT).pack(anchor=tk.W, pady=(0,10))
         
@@ -418,6 +683,18 @@ Tips:
 Recommendation: Start with 2-4 letter words to verify the search is working, then try longer terms."""
         ttk.Label(help_text, text=terms_text, wraplength=650, justify=tk.LEFT).pack(anchor=tk.W, pady=(0,10))
         
+        ## Preview
+        ttk.Label(help_text, text="Preview Before Running", font=('Helvetica', 13, 'bold')).pack(anchor=tk.W, pady=(10,5))
+        preview_text = """Click 'Preview' to see an estimate before anything is searched:
+
+• For each term: how often its first and last letters occur in the text
+• About how many matches to expect
+• Candidates (letter positions tried) and time for each search engine: in memory (from the rarer of the first and last letters), and chunked
+• Which engine is estimated to be faster: Run Search uses it
+
+The estimate grows with the length of the text, the number of terms and the range of skip distances. If it says hours or days, narrow the skip distances or search fewer terms."""
+        ttk.Label(help_text, text=preview_text, wraplength=650, justify=tk.LEFT).pack(anchor=tk.W, pady=(0,10))
+        
         ## Output Files
         ttk.Label(help_text, text="Understanding Output Files", font=('Helvetica', 13, 'bold')).pack(anchor=tk.W, pady=(10,5))
         output_text = """Results are saved to the USER_GENERATED_FILES folder:
@@ -1,10 +1,10 @@
 ## IMPORT MODULES
 
 ## BEGIN FUNCTION() #15 - ##
-def fn_CalculateYH_XW(FactorY, FactorX, ListOfFactors, L, LengthOfTextToSearch): ## PARAMETER L HERE IS ACTUALLY LLL
+def fn_CalculateYH_XW(FactorY, FactorX, ListOfFactors, LengthOfTextToSearch): ## RETURNS YH, XW; THE LETTERS ARE NOT COPIED (YH * XW - LengthOfTextToSearch == BLANK SPACES IN THE LAST ROW)
 
     """
-    ## MODULE.FUNCTION() #15 - CALCULATE XW AND YH FOR THE 2D MATRIX CSV FILE - RETURNS YH, XW, L
+    ## MODULE.FUNCTION() #15 - CALCULATE XW AND YH FOR THE 2D MATRIX CSV FILE - RETURNS YH, XW
     """
 
     ## TEST PRINT OUTPUT
@@ -20,8 +20,6 @@ def fn_CalculateYH_XW(FactorY, FactorX, ListOfFactors, L, LengthOfTextToSearch):
     ## XXX = 159 ## NECESSARY FOR CALCULATING ABSOLUTE X BELOW
     ## YYY = 491
 
-    LLL = L ## PECULAR PROPERTY OF PYTHON THAT THIS WILL ALTER THE ORIGINAL LIST L WHEN WE ALTER LLL
-
     ## IF FACTORY AND FACTORX ARE IN LIST OF PERFECT FACTORS/DIVISORS FOR LENGTH OF THE TEXT...
     if FactorY in ListOfFactors and FactorX in ListOfFactors:
         print(f"True - The X / W / #COLUMNS you have chosen is in the list of factors of this text length of {LengthOfTextToSearch} letters")
@@ -72,27 +70,11 @@ def fn_CalculateYH_XW(FactorY, FactorX, ListOfFactors, L, LengthOfTextToSearch):
         XW = int(FactorX)
         print(f"XW {XW}")
 
-        ## DECLARE VARIABLES
-        CCC = 0 ## CREATE COUNTER VARIABLE
-
-        ## ADD SPACES TO END OF TEXT STRING IN ORDER TO KEEP XW VS. YH CONSISTENTLY SYMMETRICAL
-        while CCC < SpaceToFillInLastRow:
-
-            ## APPEND BLANK SPACE TO LIST OF LETTERS IN SELECTED TEXT (FOR THE FINAL ROW TO FILL WITH BLANK SPACES AFTER RECALCULATION)
-            LLL.append(" ")
-
-            ## INCREMENT CCC COUNTER VARIABLE
-            CCC += 1
-        
-        ## TEST PRINT OUTPUT
-        print("\n")  ## PRINT SPACE
-        print(f"Length of LLL {len(LLL)}")
-
     ## TEST PRINT OUTPUT
     print("\n")  ## PRINT SPACE
     print("WITHIN FUNCTION:  END FUNCTION #15 - CALCULATE XW / YH")
 
     ## RETURN VARIABLES TO PROGRAM
-    return(YH, XW, L)
+    return(YH, XW)
 
 ## END FUNCTION() #15
\ No newline at end of file
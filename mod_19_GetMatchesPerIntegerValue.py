@@ -2,10 +2,10 @@ import numpy as np
 import math
 
 ## BEGIN FUNCTION () #19 - ##
-def fn_GetMatchesPerIntegerValue(NW4ELS, NumpyArrayOfNumberValuesOfEntireText):
+def fn_GetMatchesPerIntegerValue(NW4ELS, NumpyArrayOfNumberValuesOfEntireText, LengthOfTextToSearch=None):
 
     """
-    ## MODULE.FUNCTION() #19 - RETURNS: DictOfMatches4ELS
+    ## MODULE.FUNCTION() #19 - NumpyArrayOfNumberValuesOfEntireText == None (CHUNKED ELS SEARCH OUT OF CORE): NO INDEX MATCHES (None), MaxSkipDistance FROM LengthOfTextToSearch; RETURNS: DictOfMatches4ELS
     """
 
     ## TEST PRINT OUTPUT
@@ -21,10 +21,10 @@ def fn_GetMatchesPerIntegerValue(NW4ELS, NumpyArrayOfNumberValuesOfEntireText):
         ELSSearchTermNumber = EachELSTuple[0] ## INTEGER ## ELS SEARCH TERM NUMBER
         AllLettersInELSSearchTerm = EachELSTuple[1] ## LIST OF NUMBERS ## ## GEMATRIA NUMBER VALUES [40, 300, 10, 8] ====== [ח, י, ש, מ] ====== [מ, ש, י, ח]
         k = len(AllLettersInELSSearchTerm) ## LENGTH OF ELS SEARCH TERM ## 4
-        MaxSkipDistance = math.floor(len(NumpyArrayOfNumberValuesOfEntireText) / k)  ## MAXIMUM SKIP DISTANCE PER ELS SEARCH TERM
+        MaxSkipDistance = math.floor((len(NumpyArrayOfNumberValuesOfEntireText) if NumpyArrayOfNumberValuesOfEntireText is not None else LengthOfTextToSearch) / k)  ## MAXIMUM SKIP DISTANCE PER ELS SEARCH TERM
 
         ## BEGIN TEST DEVELOPMENT
-        ListOfListsOfIndexMatches = []
+        ListOfListsOfIndexMatches = [] if NumpyArrayOfNumberValuesOfEntireText is not None else None
 
         ## LetterCounter = 0 ## FOR 0-BASED LIST 
 
@@ -34,7 +34,7 @@ def fn_GetMatchesPerIntegerValue(NW4ELS, NumpyArrayOfNumberValuesOfEntireText):
         ## 3.) CHECK FOR EACH SKIP DISTANCE d THAT VALUES RETRIEVED FOR EACH ELS INDEX POSITION n ARE EQUAL TO VALUE OF THE ELS: [40, 300, 10, 8] ====== [ח, י, ש, מ] ====== [מ, ש, י, ח]
         
         ## BEGIN FOR EACH LETTER ## FOR EACH FIRST LETTER ONLY(!) OF THE ELS SEARCH TERM
-        for EachLetter in EachELSTuple[1]: ## FOR EACH LIST OF LETTER GEMATRIA NUMBER VALUES ## GEMATRIA NUMBER VALUES [40, 300, 10, 8] ====== [ח, י, ש, מ] ====== [מ, ש, י, ח]
+        for EachLetter in (EachELSTuple[1] if NumpyArrayOfNumberValuesOfEntireText is not None else ()): ## FOR EACH LIST OF LETTER GEMATRIA NUMBER VALUES ## GEMATRIA NUMBER VALUES [40, 300, 10, 8] ====== [ח, י, ש, מ] ====== [מ, ש, י, ח]
             
             ## MAKE ARRAYS FOR MATCHING INDEX POSITIONS EACH LETTER IN ELS SEARCH TERM
 
@@ -29,6 +29,8 @@ def fn_GetUserInput(NumberOfCodexChosen):
     print("4 - Numbers - 63530 letters")
     print("5 - Deuteronomy - 54892 letters")
     print("40 - Pentateuch (Torah) - 304805 letters")
+    print("\n")  ## PRINT SPACE
+    print("48 - Custom corpus (books, ranges of books, chapters and verses; e.g. Gen-Deut, Isa+Jer, Gen 1:1-11:32)")
 
     ## TEXT CHOSEN = USER INPUT (TEXT STRING)
     print("\n")  ## PRINT SPACE
@@ -72,6 +72,8 @@ def fn_GetUserInput(NumberOfCodexChosen):
     print("45 - Kings (I Kings and II Kings as one book) - 98460 letters")
     print("46 - Ezra-Nehemiah (Ezra and Nehemiah as one book) - 38277 letters")
     print("47 - Chronicles (I Chronicles and II Chronicles as one book) - 99478 letters")
+    print("\n")  ## PRINT SPACE
+    print("48 - Custom corpus (books, ranges of books, chapters and verses; e.g. Gen-Deut, Isa+Jer, Gen 1:1-11:32)")
     
     ## TEXT CHOSEN = USER INPUT (TEXT STRING)
     print("\n")  ## PRINT SPACE
@@ -0,0 +1,44 @@
+## FUNCTION () #1D - GET USER INPUT; ENTER CUSTOM CORPUS TO SEARCH ###
+
+def fn_GetUserInput(NumberOfCodexChosen):
+
+    """
+    ## MODULE.FUNCTION() #1D - GET USER INPUT; ENTER CUSTOM CORPUS TO SEARCH (BOOKS, BOOK RANGES, CHAPTER/VERSE RANGES); ## RETURNS STRING ##
+    """
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  BEGIN FUNCTION #1D - GET USER INPUT; ENTER CUSTOM CORPUS TO SEARCH")
+
+    ## GET USER INPUT
+    print("\n")  ## PRINT SPACE
+    print("Please enter the custom corpus to search; join the parts of the corpus with + :")
+    print("\n")  ## PRINT SPACE
+    print("Gen-Deut            - range of books (Genesis through Deuteronomy)")
+    print("Isa+Jer             - books joined in the order given (Isaiah, then Jeremiah)")
+    print("Gen 1:1-11:32       - range of verses within one book")
+    print("Ps 119              - one chapter")
+    print("1Sam 1-7 + 2Sam 5   - any combination of the above")
+
+    ## BEGIN IF - KOREN CODEX CONTAINS ONLY THE TORAH
+    if NumberOfCodexChosen == 1:
+        print("\n")  ## PRINT SPACE
+        print("Koren Codex: only the books of the Torah (Genesis - Deuteronomy) are available.")
+    ## END IF
+
+    ## CUSTOM CORPUS = USER INPUT (TEXT STRING)
+    print("\n")  ## PRINT SPACE
+    CustomCorpusSpec = input("Please enter custom corpus to search:  ").strip()
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print(f"You have chosen custom corpus: {CustomCorpusSpec}")
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  END FUNCTION #1D - GET USER INPUT; ENTER CUSTOM CORPUS TO SEARCH")
+
+    ## RETURN VARIABLES TO PROGRAM
+    return(CustomCorpusSpec)
+
+## END FUNCTION () #1D - GET USER INPUT; ENTER CUSTOM CORPUS TO SEARCH
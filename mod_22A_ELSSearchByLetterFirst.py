@@ -1,14 +1,15 @@
 ## IMPORT MODULES
+import itertools
 import time
 import tqdm
 
-## START TIMER
-TimeStart = time.time()
+import mod_22D_ELSSearchCoverage ## MODULE.FUNCTION() #22D - ELS SEARCH COVERAGE (RANGES OF SKIP DISTANCES)
+import mod_96_ProgressEventSend ## MODULE.FUNCTION() #96 - PROGRESS EVENT SEND (STAGE, TERM, d, MATCHES SO FAR, ETA)
 
 ## DEFINE FUNCTION ##
-def fn_ELSSearch(sL, sN, DELSO, DLO, SkipDistanceDMinimum, SkipDistanceDMaximum):
+def fn_ELSSearch(sL, sN, DELSO, DLO, SkipDistanceDMinimum, SkipDistanceDMaximum, ct=None, ckpt=None, ListOfD=None, TimeOfDeadline=None, MaxMatches=None):
 
-    """ ## MODULE.FUNCTION() #22A - ## RETURNS: DictOfMatches """
+    """ ## MODULE.FUNCTION() #22A - ct (CANCEL TOKEN) IS CHECKED BEFORE EACH SKIP DISTANCE d; ckpt (CHECKPOINT) GIVES THE MATCHES OF EACH d SEARCHED BEFORE (--resume) + SAVES EACH d SEARCHED NOW; d IN THE ORDER OF ListOfD, STOPPING BEFORE A d AFTER TimeOfDeadline OR AFTER A d WITH MaxMatches REACHED; ## RETURNS: DictOfMatches, DictOfRangesDone (SKIP DISTANCES SEARCHED COMPLETELY PER ELS SEARCH TERM) """
 
     ## TEST PRINT OUTPUT
     print("\n")  ## PRINT SPACE
@@ -16,39 +17,54 @@ def fn_ELSSearch(sL, sN, DELSO, DLO, SkipDistanceDMinimum, SkipDistanceDMaximum)
 
     ## TEST PRINT OUTPUT
     print("\n")
-    print(sL)
-    print("\n")
     print("Please wait while your ELS Search is conducted...")
 
+    ## START TIMER (WHEN THE ELS SEARCH STARTS, NOT WHEN THE MODULE IS IMPORTED)
+    TimeStart = time.time()
+
     ## DECLARE VARIABLES
-    DictOfMatches = {} ## KEY IS (n, d, k) WITH ELS MATCH
-        
-    ## BEGIN FOR EACH ELS OBJECT IN DICT OF ELS OBJECTS - TQDM PROGRESS BAR
-    for EachELSObject in tqdm.tqdm(DELSO.values(), total=(len(DELSO.values())), desc="SEARCH PROGRESS: ", unit="Search-Term"):  ## DELSO[1] ## DELSO[2] ## DELSO[3]
-
-        ## BEGIN FOR EACH LETTER IN ARRAY OF POSITIONS FOR FIRST LETTER OF ELS SEARCH TERM
-        # n, (n + d), (n + 2d), (n + 3d)... (n + (k-1)d)
-        # n = EachIndexPosition
-
-        ListTemp = [] ## TEMPORARY LIST
-        DictTemp = {} ## TEMPORARY DICTIONARY
-        
-        ELSSearchTermNumber = EachELSObject.ELSSearchTermNumber
-        k = EachELSObject.k ## LENGTH OF ELS TERM
-        d = SkipDistanceDMinimum ## SkipDistanceDMinimum ## SKIP DISTANCE STARTING POINT ## d = 1
-        c = list(range(0,k)) ## COUNTER
-        
-        ## BEGIN WHILE LOOP
-        while d < (SkipDistanceDMaximum + 1): ## while d < 101: ## while d < EachELSObject.MaxSkipDistance: ## LIMIT TO 100 B/C MAXSKIPDISTANCE MAKES THE PYTHON SEARCH SLOW
-
-            ## TEST PRINT OUTPUT
-            ## print("d = ", d)            
-
-            ## FOR EACH FIRST LETTER IN EACH ELS OBJECT
-            for EachIndexPosition in EachELSObject.ListOfListsOfIndexMatches[0]: ## DELSO[1].ListOfListsOfIndexMatches[0]  ## ARRAY OF FIRST LETTER MATCHES INDEX POSITIONS (n)
+    DictOfMatches = {EachELSObject.ELSSearchTermNumber: {} for EachELSObject in DELSO.values()} ## KEY IS ELSSearchTermNumber; VALUE: DICT, KEY IS (n, d, k) WITH ELS MATCH
+    DictOfSetsOfDDone = {EachELSObject.ELSSearchTermNumber: set() for EachELSObject in DELSO.values()} ## KEY IS ELSSearchTermNumber; VALUE: SET OF SKIP DISTANCES SEARCHED COMPLETELY
+    ListOfD = list(range(SkipDistanceDMinimum, SkipDistanceDMaximum + 1)) if ListOfD is None else ListOfD ## SKIP DISTANCES IN ORDER OF SEARCH (e.g. BY INCREASING |d|: MODULE.FUNCTION() #22D #3)
+    NumberOfStepsDone, NumberOfStepsTotal = 0, len(DELSO) * len(ListOfD) ## ONE STEP PER SKIP DISTANCE d OF EACH ELS SEARCH TERM (PROGRESS EVENTS)
+    IsStopped = False ## True IF CANCELLED
+
+    ## BEGIN FOR EACH SKIP DISTANCE d - TQDM PROGRESS BAR; EVERY ELS SEARCH TERM IS SEARCHED AT d BEFORE THE NEXT d
+    # n, (n + d), (n + 2d), (n + 3d)... (n + (k-1)d)
+    for d in tqdm.tqdm(ListOfD, desc="SEARCH PROGRESS: ", unit="Skip-Distance"):
+
+        ## IF THE TIME BUDGET IS USED UP: STOP BEFORE THIS d; EACH d BEFORE IS SEARCHED COMPLETELY
+        if TimeOfDeadline is not None and time.time() >= TimeOfDeadline:
+            break
+
+        ## BEGIN FOR EACH ELS OBJECT IN DICT OF ELS OBJECTS
+        for EachELSObject in DELSO.values():  ## DELSO[1] ## DELSO[2] ## DELSO[3]
+
+            ## IF SEARCH IS CANCELLED: STOP BEFORE THIS d OF THIS ELS SEARCH TERM; EACH d BEFORE IS SEARCHED COMPLETELY
+            if ct is not None and ct.fn_IsCancelled():
+                IsStopped = True
+                break
+
+            ListTemp = [] ## TEMPORARY LIST
+            ELSSearchTermNumber = EachELSObject.ELSSearchTermNumber
+            DictTemp = DictOfMatches[ELSSearchTermNumber] ## MATCHES OF THE ELS SEARCH TERM
+            k = EachELSObject.k ## LENGTH OF ELS TERM
+            c = list(range(0,k)) ## COUNTER
+
+            ## ANCHOR == THE RARER END LETTER OF THE TERM: THE FIRST LETTER (AT n) OR THE LAST LETTER (AT n + (k-1)d, SO n == ITS POSITION - (k-1)d); SAME MATCHES IN THE SAME ORDER, FEWER CANDIDATES
+            IsAnchorOnLetterLast = len(EachELSObject.ListOfListsOfIndexMatches[-1]) < len(EachELSObject.ListOfListsOfIndexMatches[0])
+            ListOfIndexPositionsOfAnchor = EachELSObject.ListOfListsOfIndexMatches[-1 if IsAnchorOnLetterLast else 0]
+            ShiftOfAnchor = (k - 1) * d if IsAnchorOnLetterLast else 0
+
+            ## MATCHES OF d FROM THE CHECKPOINT (--resume): d IS NOT SEARCHED AGAIN
+            ListOfNFromCheckpoint = ckpt.fn_MatchesGet("SearchByLetterFirst", ELSSearchTermNumber, d) if ckpt is not None else None
+            NumberOfMatchesOfDBefore = len(DictTemp)
+
+            ## FOR EACH ANCHOR LETTER IN EACH ELS OBJECT
+            for EachIndexPosition in (ListOfIndexPositionsOfAnchor if ListOfNFromCheckpoint is None else ()): ## ARRAY OF ANCHOR LETTER MATCHES INDEX POSITIONS (FIRST LETTER: n; LAST LETTER: n + (k-1)d)
 
                 ## GET INDEX POSITION NUMBER N
-                n = DLO[EachIndexPosition].LetterPositionIndex
+                n = DLO[EachIndexPosition].LetterPositionIndex - ShiftOfAnchor
 
                 ## TEST PRINT OUTPUT
                 ## print("n = ", n)
@@ -108,15 +124,43 @@ def fn_ELSSearch(sL, sN, DELSO, DLO, SkipDistanceDMinimum, SkipDistanceDMaximum)
                 ## RESET LIST
                 ListTemp = [] ## RESET TEMPORARY LIST
 
-            ## INCREMENT DISTANCE COUNTER
-            d += 1
+            ## BEGIN IF / ELIF - ADD MATCHES OF d FROM THE CHECKPOINT (SAME ORDER AS FOUND) OR SAVE MATCHES OF d TO THE CHECKPOINT
+            if ListOfNFromCheckpoint is not None:
+
+                for n in ListOfNFromCheckpoint:
+                    DictTemp[n, d, k] = list(EachELSObject.Letters)
+
+            elif ckpt is not None:
+
+                ckpt.fn_UnitDone("SearchByLetterFirst", ELSSearchTermNumber, d, [EachKey[0] for EachKey in itertools.islice(reversed(DictTemp), len(DictTemp) - NumberOfMatchesOfDBefore)][::-1])
+
+            ## END IF / ELIF
+
+            ## d IS SEARCHED COMPLETELY FOR THIS ELS SEARCH TERM
+            DictOfSetsOfDDone[ELSSearchTermNumber].add(d)
+
+            ## CALL MODULE.FUNCTION() #96 - PROGRESS EVENT SEND; AT MOST ~10 PER SECOND
+            NumberOfStepsDone += 1
+            mod_96_ProgressEventSend.fn_ProgressEventSend("SearchByLetterFirst", NumberOfStepsDone, NumberOfStepsTotal, ELSSearchTermNumber, D=d, Matches=sum(len(EachDict) for EachDict in DictOfMatches.values()))
+
+        ## END FOR EACH ELS OBJECT IN DICT OF ELS OBJECTS
+
+        ## IF SEARCH IS CANCELLED: NO MORE SKIP DISTANCES
+        if IsStopped:
+            break
+
+        ## IF ENOUGH MATCHES (--max-matches): STOP AFTER THIS d; ALL MATCHES OF EACH d SEARCHED ARE KEPT
+        if MaxMatches is not None and sum(len(EachDict) for EachDict in DictOfMatches.values()) >= MaxMatches:
+            break
 
-        ## END WHILE LOOP
+    ## END FOR EACH SKIP DISTANCE d
 
-        ## ADD TEMP DICT FOR EACH ELS SEARCH TERM TO DICT OF MATCHES
-        DictOfMatches[ELSSearchTermNumber] = DictTemp
+    ## MATCHES OF EACH ELS SEARCH TERM IN ORDER OF d (SAME AS A SEARCH UP FROM SkipDistanceDMinimum); MATCHES OF THE SAME d STAY IN THE ORDER FOUND
+    for ELSSearchTermNumber, DictTemp in DictOfMatches.items():
+        DictOfMatches[ELSSearchTermNumber] = dict(sorted(DictTemp.items(), key=lambda EachItem: EachItem[0][1]))
 
-    ## END FOR EACH ELS OBJECT IN DICT OF ELS OBJECTS
+    ## CALL MODULE.FUNCTION() #22D #4 - RANGES CREATE; SKIP DISTANCES SEARCHED COMPLETELY PER ELS SEARCH TERM
+    DictOfRangesDone = {ELSSearchTermNumber: mod_22D_ELSSearchCoverage.fn_RangesCreate(SetOfDDone) for ELSSearchTermNumber, SetOfDDone in DictOfSetsOfDDone.items()}
 
     ## TEST PRINT OUTPUT
     print("--- %s seconds ---" % (time.time() - TimeStart))
@@ -126,7 +170,7 @@ def fn_ELSSearch(sL, sN, DELSO, DLO, SkipDistanceDMinimum, SkipDistanceDMaximum)
     print("WITHIN FUNCTION:  END FUNCTION #22A - ELS SEARCH BY FIRST LETTER - FORWARD SEARCH: POSITIVE DIRECTION;")
 
     ## RETURN VARIABLES
-    return(DictOfMatches)
+    return(DictOfMatches, DictOfRangesDone)
 
 
 
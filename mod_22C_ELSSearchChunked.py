@@ -0,0 +1,234 @@
+## IMPORT MODULES
+import array
+import itertools
+import mmap
+import time
+
+import mod_9A_GetNumberValues4Letters ## MODULE.FUNCTION() #9A - GET NUMBER VALUE OF EACH LETTER IN STRING-OF-LETTERS; ## RETURNS ListOfNumberValues4Letters
+import mod_96_ProgressEventSend ## MODULE.FUNCTION() #96 - PROGRESS EVENT SEND (STAGE, TERM, d, MATCHES SO FAR, ETA)
+
+## DECLARE VARIABLES
+ChunkSizeDefault = 1000000 ## NUMBER OF LETTERS OWNED BY EACH WINDOW; EACH WINDOW ALSO READS THE OVERLAP OF (k-1)*|d_max| LETTERS
+TypeCodeOfLetterCodes = "H" ## UNSIGNED 2-BYTE INTEGER PER LETTER (GEMATRIA NUMBER VALUES 1 - 400)
+
+## BEGIN FUNCTION () #22C #1 - LETTER CODE FILE WRITE
+def fn_LetterCodeFileWrite(N, FileNameForLetterCodes, ChunkSize=ChunkSizeDefault):
+
+    """
+    ## MODULE.FUNCTION() #22C #1 - LETTER CODE FILE WRITE; WRITES THE GEMATRIA NUMBER VALUE OF EACH LETTER (N, OR ANY ITERABLE / GENERATOR OF VALUES) TO A BINARY FILE, ONE CHUNK AT A TIME; ## RETURNS LengthOfTextToSearch
+    """
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  BEGIN FUNCTION #22C #1 - LETTER CODE FILE WRITE")
+
+    ## DECLARE VARIABLES
+    LengthOfTextToSearch = 0
+    IteratorOfNumberValues = iter(N)
+
+    ## OPEN BINARY FILE
+    with open(FileNameForLetterCodes, "wb") as File:
+
+        ## BEGIN WHILE LOOP - WRITE ONE CHUNK OF LETTER CODES AT A TIME
+        while True:
+
+            ArrayOfLetterCodes = array.array(TypeCodeOfLetterCodes, itertools.islice(IteratorOfNumberValues, ChunkSize))
+
+            ## IF NO MORE LETTERS
+            if len(ArrayOfLetterCodes) == 0:
+                break
+
+            ArrayOfLetterCodes.tofile(File)
+            LengthOfTextToSearch += len(ArrayOfLetterCodes)
+
+        ## END WHILE LOOP
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print(f"Letter codes written to {FileNameForLetterCodes} : {LengthOfTextToSearch} letters")
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  END FUNCTION #22C #1 - LETTER CODE FILE WRITE")
+
+    ## RETURN VARIABLES
+    return(LengthOfTextToSearch)
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #22C #2 - LETTER CODES OF VERSES GET
+def fn_LetterCodesOfVersesGet(D):
+
+    """
+    ## MODULE.FUNCTION() #22C #2 - LETTER CODES OF VERSES GET; GENERATOR OF THE GEMATRIA NUMBER VALUE OF EACH LETTER OF THE TEXT, ONE VERSE OF D AT A TIME (SAME VALUES AS N OF #8 WITHOUT N); FOR #22C #1 OUT OF CORE; ## YIELDS LetterGematriaNumberValue
+    """
+
+    ## BEGIN FOR EACH VERSE
+    for EachVerse in D.values():
+
+        ## CALL MODULE.FUNCTION() #9A - GET NUMBER VALUES FOR THE LETTERS OF THIS VERSE ONLY
+        yield from mod_9A_GetNumberValues4Letters.fn_GetNumberValues(EachVerse)
+
+    ## END FOR EACH VERSE
+
+## END FUNCTION
+
+## BEGIN MAIN FUNCTION
+## FUNCTION () #22C #0 - ELS SEARCH CHUNKED
+def fn_ELSSearch(FileNameForLetterCodes, DELSO, SkipDistanceDMinimum, SkipDistanceDMaximum, ChunkSize=ChunkSizeDefault, IsSearchByLetterLast=False, ct=None, ckpt=None):
+
+    """
+    ## MODULE.FUNCTION() #22C - ELS SEARCH CHUNKED; MEMORY-MAPS THE LETTER CODE FILE AND SEARCHES IT IN WINDOWS OF ChunkSize LETTERS, EACH OVERLAPPING THE NEXT WINDOW BY (k-1)*|d_max| LETTERS; EACH MATCH IS OWNED BY THE WINDOW OF ITS LOWEST LETTER POSITION, SO NO MATCH IS LOST OR COUNTED TWICE; SAME RESULT AS #22A (OR #23 IF IsSearchByLetterLast);
+    ## THE TEXT IS READ WINDOW BY WINDOW (PURE PYTHON SCAN); OUT OF CORE (MODULE.FUNCTION() #97 #2) THE SESSION HOLDS NO N / DLO OF THE WHOLE TEXT, ONLY THE PARSED VERSES + THE LETTER OBJECTS OF THE ELS MATCHES (#8F);
+    ## ct (CANCEL TOKEN) IS CHECKED BEFORE EACH ELS SEARCH TERM OF EACH WINDOW; A SKIP DISTANCE IS ONLY DONE WHEN ALL WINDOWS ARE SEARCHED, SO A CANCELLED SEARCH KEEPS ITS MATCHES BUT HAS NO RANGES DONE;
+    ## ckpt (CHECKPOINT) GIVES THE MATCHES OF EACH d OF EACH WINDOW SEARCHED BEFORE (--resume) + SAVES EACH d OF EACH WINDOW SEARCHED NOW; ## RETURNS: DictOfMatches, DictOfRangesDone
+    """
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  BEGIN FUNCTION #22C - ELS SEARCH CHUNKED - MEMORY-MAPPED WINDOWS OF LETTER CODES")
+
+    ## START TIMER
+    TimeStart = time.time()
+
+    ## DECLARE VARIABLES
+    DictOfMatches = {} ## KEY IS (n, d, k) WITH ELS MATCH
+    SkipDistanceDAbsoluteMaximum = max(abs(SkipDistanceDMinimum), abs(SkipDistanceDMaximum))
+    kMaximum = max([EachELSObject.k for EachELSObject in DELSO.values()], default=1)
+    Overlap = (kMaximum - 1) * SkipDistanceDAbsoluteMaximum ## LETTERS READ PAST THE END OF EACH WINDOW
+    StageOfProgress = "SearchByLetterLast" if IsSearchByLetterLast else "SearchByLetterFirst" ## STAGE OF THE PROGRESS EVENTS
+    IsStopped = False ## True IF CANCELLED BEFORE THE LAST WINDOW WAS SEARCHED
+
+    ## BEGIN FOR EACH ELS OBJECT - CREATE EMPTY DICT OF MATCHES; LETTERS TO COMPARE IN ORDER OF INCREASING LETTER POSITION FOR d >= 0 AND d < 0
+    DictOfLettersInOrder = {}
+    for EachELSObject in DELSO.values():
+
+        DictOfMatches[EachELSObject.ELSSearchTermNumber] = {}
+
+        ## #23 COMPARES THE LETTERS FROM THE LAST LETTER OF THE ELS SEARCH TERM
+        ListOfLetters = list(EachELSObject.Letters[::-1]) if IsSearchByLetterLast else list(EachELSObject.Letters)
+
+        ## READING FROM THE LOWEST LETTER POSITION: SAME ORDER FOR d >= 0; REVERSED ORDER FOR d < 0
+        DictOfLettersInOrder[EachELSObject.ELSSearchTermNumber] = (ListOfLetters, ListOfLetters[::-1])
+
+    ## END FOR EACH ELS OBJECT
+
+    ## OPEN + MEMORY-MAP LETTER CODE FILE
+    with open(FileNameForLetterCodes, "rb") as File, mmap.mmap(File.fileno(), 0, access=mmap.ACCESS_READ) as MemoryMap:
+
+        ## VIEW OF THE WHOLE FILE AS LETTER CODES; NOTHING IS READ UNTIL A WINDOW IS INDEXED
+        MemoryViewOfLetterCodes = memoryview(MemoryMap).cast(TypeCodeOfLetterCodes)
+        LengthOfTextToSearch = len(MemoryViewOfLetterCodes)
+        NumberOfStepsDone, NumberOfStepsTotal = 0, -(-LengthOfTextToSearch // ChunkSize) * len(DELSO) * (SkipDistanceDMaximum - SkipDistanceDMinimum + 1) ## ONE STEP PER SKIP DISTANCE d OF EACH ELS SEARCH TERM IN EACH WINDOW (PROGRESS EVENTS)
+
+        ## BEGIN FOR EACH WINDOW
+        for WindowStart in range(0, LengthOfTextToSearch, ChunkSize):
+
+            ## WINDOW OWNS LOWEST LETTER POSITIONS WindowStart ... WindowEndOwned - 1 (0-BASED); READS UP TO WindowEnd
+            WindowEndOwned = min(WindowStart + ChunkSize, LengthOfTextToSearch)
+            WindowEnd = min(WindowEndOwned + Overlap, LengthOfTextToSearch)
+            Window = MemoryViewOfLetterCodes[WindowStart:WindowEnd]
+
+            ## TEST PRINT OUTPUT
+            print(f"SEARCH WINDOW: letters {WindowStart + 1} - {WindowEnd} of {LengthOfTextToSearch}")
+
+            ## BEGIN FOR EACH ELS OBJECT
+            for EachELSObject in DELSO.values():
+
+                ## IF SEARCH IS CANCELLED: STOP BEFORE THIS ELS SEARCH TERM
+                if ct is not None and ct.fn_IsCancelled():
+                    IsStopped = True
+                    break
+
+                ELSSearchTermNumber = EachELSObject.ELSSearchTermNumber
+                k = EachELSObject.k ## LENGTH OF ELS TERM
+                ListOfLettersForward, ListOfLettersBackward = DictOfLettersInOrder[ELSSearchTermNumber]
+                DictTemp = DictOfMatches[ELSSearchTermNumber]
+
+                ## WINDOW POSITIONS (0-BASED) OF THE LOWEST LETTER OF THE ELS: FOR d >= 0 THE 1ST LETTER; FOR d < 0 THE kTH LETTER
+                ListOfPositionsForward = [i for i in range(WindowEndOwned - WindowStart) if Window[i] == ListOfLettersForward[0]]
+                ListOfPositionsBackward = [i for i in range(WindowEndOwned - WindowStart) if Window[i] == ListOfLettersBackward[0]]
+
+                ## BEGIN FOR EACH SKIP DISTANCE d
+                for d in range(SkipDistanceDMinimum, SkipDistanceDMaximum + 1):
+
+                    ## STEP BETWEEN LETTERS READ FROM THE LOWEST LETTER POSITION
+                    Step = abs(d)
+                    Span = (k - 1) * Step
+
+                    ## BEGIN IF / ELSE
+                    if d >= 0:
+                        ListOfPositions, ListOfLetters = ListOfPositionsForward, ListOfLettersForward
+                    else:
+                        ListOfPositions, ListOfLetters = ListOfPositionsBackward, ListOfLettersBackward
+                    ## END IF / ELSE
+
+                    ## MATCHES OF d IN THIS WINDOW FROM THE CHECKPOINT (--resume): NOT SEARCHED AGAIN
+                    ListOfNFromCheckpoint = ckpt.fn_MatchesGet(StageOfProgress, ELSSearchTermNumber, d, WindowStart // ChunkSize + 1) if ckpt is not None else None
+                    ListOfNOfD = [] ## n OF THE MATCHES OF d FOUND NOW (FOR THE CHECKPOINT)
+                    if ListOfNFromCheckpoint is not None:
+                        for n in ListOfNFromCheckpoint:
+                            DictTemp[n, d, k] = ListOfLetters if d >= 0 else ListOfLetters[::-1]
+                        ListOfPositions = ()
+
+                    ## BEGIN FOR EACH LOWEST LETTER POSITION
+                    for i in ListOfPositions:
+
+                        ## IF LAST LETTER IS PAST THE END OF THE TEXT
+                        if WindowStart + i + Span >= LengthOfTextToSearch:
+                            break
+
+                        ## IF ELS MATCH
+                        if all(Window[i + (EachNumber * Step)] == ListOfLetters[EachNumber] for EachNumber in range(1, k)):
+
+                            ## n == 1-BASED POSITION OF THE LETTER THE SEARCH STARTS FROM (SAME AS DLO[i].LetterPositionIndex)
+                            n = WindowStart + i + 1 if d >= 0 else WindowStart + i + Span + 1
+
+                            ## ADD TUPLE TO DICT; VALUES READ FROM n IN STEPS OF d (SAME AS #22A / #23)
+                            DictTemp[n, d, k] = ListOfLetters if d >= 0 else ListOfLetters[::-1]
+                            ListOfNOfD.append(n)
+
+                    ## END FOR EACH LOWEST LETTER POSITION
+
+                    ## SAVE MATCHES OF d IN THIS WINDOW TO THE CHECKPOINT
+                    if ckpt is not None and ListOfNFromCheckpoint is None:
+                        ckpt.fn_UnitDone(StageOfProgress, ELSSearchTermNumber, d, ListOfNOfD, WindowStart // ChunkSize + 1)
+
+                    ## CALL MODULE.FUNCTION() #96 - PROGRESS EVENT SEND; AT MOST ~10 PER SECOND
+                    NumberOfStepsDone += 1
+                    mod_96_ProgressEventSend.fn_ProgressEventSend(StageOfProgress, NumberOfStepsDone, NumberOfStepsTotal, ELSSearchTermNumber, D=d, Window=WindowStart // ChunkSize + 1, Matches=sum(len(EachDict) for EachDict in DictOfMatches.values()))
+
+                ## END FOR EACH SKIP DISTANCE d
+
+            ## END FOR EACH ELS OBJECT
+
+            ## RELEASE VIEW OF WINDOW
+            Window.release()
+
+            ## IF SEARCH IS CANCELLED: NO MORE WINDOWS
+            if IsStopped:
+                break
+
+        ## END FOR EACH WINDOW
+
+        ## RELEASE VIEW OF FILE BEFORE MEMORY MAP IS CLOSED
+        MemoryViewOfLetterCodes.release()
+
+    ## SORT MATCHES BY (d, n): SAME ORDER AS #22A / #23
+    for ELSSearchTermNumber, DictTemp in DictOfMatches.items():
+        DictOfMatches[ELSSearchTermNumber] = {EachKey: list(DictTemp[EachKey]) for EachKey in sorted(DictTemp, key=lambda EachKey: (EachKey[1], EachKey[0]))}
+
+    ## TEST PRINT OUTPUT
+    print("--- %s seconds ---" % (time.time() - TimeStart))
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  END FUNCTION #22C - ELS SEARCH CHUNKED - MEMORY-MAPPED WINDOWS OF LETTER CODES")
+
+    ## SKIP DISTANCES SEARCHED IN ALL WINDOWS
+    DictOfRangesDone = {ELSSearchTermNumber: [] if IsStopped else [[SkipDistanceDMinimum, SkipDistanceDMaximum]] for ELSSearchTermNumber in DictOfMatches}
+
+    ## RETURN VARIABLES
+    return(DictOfMatches, DictOfRangesDone)
+
+## END FUNCTION () #22C - ELS SEARCH CHUNKED
@@ -0,0 +1,140 @@
+## IMPORT MODULES
+import itertools
+
+## DECLARE VARIABLES
+## COVERAGE OF AN ELS SEARCH: WHICH SKIP DISTANCES (d) OF EACH ELS SEARCH TERM WERE SEARCHED COMPLETELY; A RANGE [dFrom, dTo] INCLUDES BOTH ENDS; SkipDistanceAbsoluteDone: EVERY d WITH |d| <= IT IS DONE FOR EVERY TERM
+## e.g. STOPPED AT d = 13: {"IsComplete": false, ..., "SkipDistanceAbsoluteDone": 12, "Terms": [{"TermNumber": 1, "Term": "משיח", "DRangesDone": [[-100, 12]], "DRangesLeft": [[13, 100]]}]}
+
+## BEGIN FUNCTION () #22D #1 - RANGES INTERSECT - SKIP DISTANCES IN BOTH LISTS OF RANGES
+def fn_RangesIntersect(ListOfRangesA, ListOfRangesB):
+
+    ## DECLARE VARIABLES
+    ListOfRanges = []
+
+    ## BEGIN FOR LOOP - EACH PAIR OF RANGES THAT OVERLAP
+    for dFromA, dToA in ListOfRangesA:
+        for dFromB, dToB in ListOfRangesB:
+            if max(dFromA, dFromB) <= min(dToA, dToB):
+                ListOfRanges.append([max(dFromA, dFromB), min(dToA, dToB)])
+    ## END FOR LOOP
+
+    ## RETURN VARIABLES
+    return(sorted(ListOfRanges))
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #22D #2 - RANGES COMPLEMENT - SKIP DISTANCES OF SkipDistanceDMinimum - SkipDistanceDMaximum NOT IN THE RANGES (SORTED, NOT OVERLAPPING)
+def fn_RangesComplement(ListOfRanges, SkipDistanceDMinimum, SkipDistanceDMaximum):
+
+    ## DECLARE VARIABLES
+    ListOfRangesLeft = []
+    dNext = SkipDistanceDMinimum ## FIRST d NOT YET COVERED
+
+    ## BEGIN FOR LOOP - EACH GAP BEFORE A RANGE
+    for dFrom, dTo in ListOfRanges:
+        if dFrom > dNext:
+            ListOfRangesLeft.append([dNext, dFrom - 1])
+        dNext = max(dNext, dTo + 1)
+    ## END FOR LOOP
+
+    ## GAP AFTER THE LAST RANGE
+    if dNext <= SkipDistanceDMaximum:
+        ListOfRangesLeft.append([dNext, SkipDistanceDMaximum])
+
+    ## RETURN VARIABLES
+    return(ListOfRangesLeft)
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #22D #3 - SKIP DISTANCES ORDER - d OF SkipDistanceDMinimum - SkipDistanceDMaximum IN THE ORDER OF THE ELS SEARCH: UP FROM SkipDistanceDMinimum, OR BY INCREASING |d| (-1, 1, -2, 2, ...) IF IsByDistance
+def fn_SkipDistancesOrder(SkipDistanceDMinimum, SkipDistanceDMaximum, IsByDistance=False):
+
+    ## DECLARE VARIABLES
+    ListOfD = list(range(SkipDistanceDMinimum, SkipDistanceDMaximum + 1))
+
+    ## RETURN VARIABLES
+    return(sorted(ListOfD, key=lambda d: (abs(d), d)) if IsByDistance else ListOfD)
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #22D #4 - RANGES CREATE - SKIP DISTANCES (ANY ORDER) AS SORTED RANGES OF CONSECUTIVE d, e.g. {-2, -1, 1, 2, 3} --> [[-2, -1], [1, 3]]
+def fn_RangesCreate(SetOfD):
+
+    ## DECLARE VARIABLES
+    ListOfRanges = []
+
+    ## BEGIN FOR LOOP - EACH d IN ORDER; JOINED TO THE RANGE BEFORE IF NEXT TO IT
+    for d in sorted(SetOfD):
+        if ListOfRanges and ListOfRanges[-1][1] + 1 == d:
+            ListOfRanges[-1][1] = d
+        else:
+            ListOfRanges.append([d, d])
+    ## END FOR LOOP
+
+    ## RETURN VARIABLES
+    return(ListOfRanges)
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #22D #5 - SKIP DISTANCE ABSOLUTE DONE - LARGEST D WITH EVERY d OF |d| <= D (IN SkipDistanceDMinimum - SkipDistanceDMaximum) DONE FOR EVERY ELS SEARCH TERM; None IF NOT EVEN THE SMALLEST |d|
+def fn_SkipDistanceAbsoluteDone(ListOfTerms, SkipDistanceDMinimum, SkipDistanceDMaximum):
+
+    ## DECLARE VARIABLES
+    SkipDistanceAbsoluteDone = None
+
+    ## BEGIN FOR LOOP - EACH |d| IN ORDER (BOTH d OF THE SAME |d| MUST BE DONE)
+    for SkipDistanceAbsolute, ListOfD in itertools.groupby(fn_SkipDistancesOrder(SkipDistanceDMinimum, SkipDistanceDMaximum, IsByDistance=True), key=abs):
+
+        if not all(any(dFrom <= d <= dTo for dFrom, dTo in EachTerm["DRangesDone"]) for d in ListOfD for EachTerm in ListOfTerms):
+            break
+        SkipDistanceAbsoluteDone = SkipDistanceAbsolute
+
+    ## END FOR LOOP
+
+    ## RETURN VARIABLES
+    return(SkipDistanceAbsoluteDone)
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #22D #6 - MATCHES OF RANGES DONE - MATCHES (n, d, k) OF EACH ELS SEARCH TERM WITH d IN ITS DRangesDone OF THE COVERAGE (DONE BY EVERY ELS SEARCH RUN); ## RETURNS DictOfMatches
+def fn_MatchesOfRangesDoneGet(DictOfMatches, DictOfCoverage):
+
+    ## DECLARE VARIABLES
+    DictOfRangesDone = {EachTerm["TermNumber"]: EachTerm["DRangesDone"] for EachTerm in DictOfCoverage["Terms"]}
+
+    ## RETURN VARIABLES
+    return({ELSSearchTermNumber: {ndk: Value for ndk, Value in EachDict.items() if any(dFrom <= ndk[1] <= dTo for dFrom, dTo in DictOfRangesDone[ELSSearchTermNumber])} \
+        for ELSSearchTermNumber, EachDict in DictOfMatches.items()})
+
+## END FUNCTION
+
+## BEGIN MAIN FUNCTION
+## FUNCTION () #22D #0 - ELS SEARCH COVERAGE CREATE
+def fn_ELSSearchCoverageCreate(DictOfSearchTermsWithSpaces, SkipDistanceDMinimum, SkipDistanceDMaximum, ListOfDictsOfRangesDone, ListOfStagesSkipped=()):
+
+    """
+    ## MODULE.FUNCTION() #22D - ELS SEARCH COVERAGE CREATE; A SKIP DISTANCE (d) OF AN ELS SEARCH TERM IS DONE IF EVERY ELS SEARCH RUN (#22A / #23 / #22C: ONE DictOfRangesDone EACH) SEARCHED IT COMPLETELY; ## RETURNS DictOfCoverage
+    """
+
+    ## DECLARE VARIABLES
+    ListOfTerms = []
+    IsComplete = not ListOfStagesSkipped
+
+    ## BEGIN FOR LOOP - EACH ELS SEARCH TERM
+    for ELSSearchTermNumber, EachSearchTerm in DictOfSearchTermsWithSpaces.items():
+
+        ListOfRangesDone = [[SkipDistanceDMinimum, SkipDistanceDMaximum]]
+        for DictOfRangesDone in ListOfDictsOfRangesDone:
+            ListOfRangesDone = fn_RangesIntersect(ListOfRangesDone, DictOfRangesDone.get(ELSSearchTermNumber, []))
+
+        ListOfRangesLeft = fn_RangesComplement(ListOfRangesDone, SkipDistanceDMinimum, SkipDistanceDMaximum)
+        IsComplete = IsComplete and not ListOfRangesLeft
+        ListOfTerms.append({"TermNumber": ELSSearchTermNumber, "Term": EachSearchTerm, "DRangesDone": ListOfRangesDone, "DRangesLeft": ListOfRangesLeft})
+
+    ## END FOR LOOP
+
+    ## RETURN VARIABLES
+    return({"IsComplete": IsComplete, "SkipDistanceDMinimum": SkipDistanceDMinimum, "SkipDistanceDMaximum": SkipDistanceDMaximum, "StagesSkipped": list(ListOfStagesSkipped), \
+        "SkipDistanceAbsoluteDone": fn_SkipDistanceAbsoluteDone(ListOfTerms, SkipDistanceDMinimum, SkipDistanceDMaximum), "Terms": ListOfTerms})
+
+## END FUNCTION () #22D - ELS SEARCH COVERAGE CREATE
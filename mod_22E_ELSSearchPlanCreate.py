@@ -0,0 +1,170 @@
+## IMPORT MODULES
+import math
+
+## DECLARE VARIABLES
+## PLAN OF AN ELS SEARCH: ESTIMATED CANDIDATES (LETTER POSITIONS OF THE ANCHOR LETTER TRIED AT EACH d), MATCHES AND SECONDS PER ELS SEARCH TERM AND ENGINE, BEFORE ANYTHING IS SEARCHED
+## ENGINES: "InMemory" == MODULE.FUNCTION() #22A (+ #23): EVERY LETTER OF THE TERM IS READ FOR EVERY RARER END LETTER (FIRST OR LAST, THE ANCHOR) AT EVERY d;
+##          "Chunked" == MODULE.FUNCTION() #22C (python p.py --chunk-size, OR CHOSEN BY THE PLAN): ANCHORED ON THE LETTER AT THE LOWEST POSITION (FIRST LETTER FOR d >= 0, LAST FOR d < 0), STOPS AT THE FIRST LETTER THAT DIFFERS
+## SECONDS PER STEP, MEASURED ON GENESIS (LENINGRAD); OTHER COMPUTERS ARE FASTER OR SLOWER BY ABOUT THE SAME FACTOR FOR BOTH ENGINES
+SecondsPerLetterReadInMemory = 3.0e-6 ## ONE sN[n + e] OF #22A / #23 (PANDAS SERIES)
+SecondsPerCandidateChunked = 1.2e-6 ## ONE LOWEST LETTER POSITION TRIED AT ONE d BY #22C
+SecondsPerLetterScannedChunked = 5.0e-8 ## #22C FINDS THE ANCHOR LETTERS OF EACH TERM IN EACH WINDOW (2 SCANS: d >= 0 + d < 0)
+DictOfEngines = {"InMemory": "in memory (#22A / #23)", "Chunked": "chunked (#22C)"}
+
+## BEGIN FUNCTION () #22E #1 - LETTER COUNTS GET - NUMBER OF EACH LETTER IN THE TEXT FROM THE LETTER STATISTICS (MODULE.FUNCTION() #9AA); FINAL LETTERS HAVE THE SAME NUMBER VALUE AS THEIR LETTER, SO BOTH GET THE COUNT OF e.g. "מ/ם"; ## RETURNS DictOfLetterCounts
+def fn_LetterCountsGet(ListOfTuplesOfLetterStatistics):
+
+    ## DECLARE VARIABLES
+    DictOfLetterCounts = {}
+
+    ## BEGIN FOR LOOP - EACH (LETTER, COUNT, LENGTH OF TEXT, DECIMAL, PERCENT); "כ/ך" COMES AFTER "כ" AND "ך", SO ITS COUNT IS KEPT
+    for EachLetterTuple in ListOfTuplesOfLetterStatistics:
+        for EachLetter in EachLetterTuple[0].split("/"):
+            DictOfLetterCounts[EachLetter] = EachLetterTuple[1]
+    ## END FOR LOOP
+
+    ## RETURN VARIABLES
+    return(DictOfLetterCounts)
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #22E #2 - STARTS SUM - LETTER POSITIONS WHERE AN ELS OF k LETTERS FITS IN THE TEXT, SUMMED OVER THE d >= 0 AND OVER THE d < 0 OF ListOfD; ## RETURNS StartsForward, StartsBackward
+def fn_StartsSum(LengthOfTextToSearch, k, ListOfD):
+
+    ## DECLARE VARIABLES
+    StartsForward, StartsBackward = 0, 0
+
+    ## BEGIN FOR LOOP - EACH d
+    for d in ListOfD:
+        if d >= 0:
+            StartsForward += max(0, LengthOfTextToSearch - (k - 1) * d)
+        else:
+            StartsBackward += max(0, LengthOfTextToSearch + (k - 1) * d)
+    ## END FOR LOOP
+
+    ## RETURN VARIABLES
+    return(StartsForward, StartsBackward)
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #22E #3 - TERM PLAN CREATE - CANDIDATES, MATCHES + SECONDS OF ONE ELS SEARCH TERM FOR EACH ENGINE; TupleOfStarts FROM MODULE.FUNCTION() #22E #2 FOR k OF THE TERM; ## RETURNS DictOfTermPlan
+def fn_TermPlanCreate(ELSSearchTermNumber, SearchTermWithSpaces, DictOfLetterCounts, LengthOfTextToSearch, ListOfD, TupleOfStarts, IsSearchByLetterLast=False, ChunkSize=None):
+
+    ## DECLARE VARIABLES
+    SearchTerm = SearchTermWithSpaces.replace(" ", "")
+    k = len(SearchTerm) ## LENGTH OF ELS TERM
+    ListOfCounts = [DictOfLetterCounts.get(EachLetter, 0) for EachLetter in SearchTerm]
+    CountFirst, CountLast = ListOfCounts[0], ListOfCounts[-1]
+    ListOfP = [EachCount / LengthOfTextToSearch for EachCount in ListOfCounts] ## CHANCE OF EACH LETTER AT ONE LETTER POSITION
+    StartsForward, StartsBackward = TupleOfStarts
+    NumberOfStages = 2 if IsSearchByLetterLast else 1
+    NumberOfWindows = -(-LengthOfTextToSearch // ChunkSize) if ChunkSize else 1
+    SkipDistanceDAbsoluteMaximum = max((abs(d) for d in ListOfD), default=0)
+
+    ## EXPECTED MATCHES: EACH LETTER POSITION WHERE THE ELS FITS x CHANCE OF THE k LETTERS; d = 0 READS ONE LETTER k TIMES (ONLY A MATCH IF ALL LETTERS ARE THE SAME == SAME COUNT)
+    MatchesExpected = (StartsForward + StartsBackward) * math.prod(ListOfP)
+    if 0 in ListOfD and k > 1 and len(set(ListOfCounts)) > 1:
+        MatchesExpected -= LengthOfTextToSearch * math.prod(ListOfP)
+
+    ## #22A (+ #23) TRIES EVERY RARER END LETTER AT EVERY d AND READS ALL k LETTERS
+    CandidatesInMemory = len(ListOfD) * min(CountFirst, CountLast) * NumberOfStages
+    SecondsInMemory = CandidatesInMemory * k * SecondsPerLetterReadInMemory
+
+    ## #22C TRIES THE ANCHOR LETTERS WHERE THE ELS FITS (FIRST LETTER FOR d >= 0, LAST FOR d < 0; REVERSED FOR THE SEARCH BY LAST LETTER) AND STOPS AT THE FIRST LETTER THAT DIFFERS: 1 + p2 + p2p3 + ... LETTERS READ
+    LettersReadFromFirst = max(1.0, sum(math.prod(ListOfP[1:j]) for j in range(1, k)))
+    LettersReadFromLast = max(1.0, sum(math.prod(ListOfP[::-1][1:j]) for j in range(1, k)))
+    ListOfAnchors = [(StartsForward, ListOfP[0], LettersReadFromFirst), (StartsBackward, ListOfP[-1], LettersReadFromLast)]
+    if IsSearchByLetterLast:
+        ListOfAnchors += [(StartsForward, ListOfP[-1], LettersReadFromLast), (StartsBackward, ListOfP[0], LettersReadFromFirst)]
+    CandidatesChunked = sum(Starts * p for Starts, p, _ in ListOfAnchors)
+    SecondsChunked = sum(Starts * p * LettersRead for Starts, p, LettersRead in ListOfAnchors) * SecondsPerCandidateChunked \
+        + NumberOfStages * 2 * (LengthOfTextToSearch + (NumberOfWindows - 1) * (k - 1) * SkipDistanceDAbsoluteMaximum) * SecondsPerLetterScannedChunked
+
+    ## RETURN VARIABLES
+    return({"TermNumber": ELSSearchTermNumber, "Term": SearchTermWithSpaces, "k": k, "LetterFirst": SearchTerm[0], "CountOfLetterFirst": CountFirst, "LetterLast": SearchTerm[-1], "CountOfLetterLast": CountLast, \
+        "LetterRarer": SearchTerm[0] if CountFirst <= CountLast else SearchTerm[-1], "MatchesExpected": round(MatchesExpected, 1), \
+        "Engines": {"InMemory": {"Anchor": "rarer end letter" + (" (both searches)" if IsSearchByLetterLast else ""), "Candidates": CandidatesInMemory, "Seconds": round(SecondsInMemory, 3)}, \
+            "Chunked": {"Anchor": "first letter for d >= 0, last letter for d < 0" + (" (+ reversed for the last-letter search)" if IsSearchByLetterLast else ""), "Candidates": round(CandidatesChunked), "Seconds": round(SecondsChunked, 3)}}, \
+        "EngineFaster": "InMemory" if SecondsInMemory < SecondsChunked else "Chunked"})
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #22E #4 - SEARCH PLAN TEXT CREATE - THE PLAN AS LINES FOR THE LOG / GUI PREVIEW; ## RETURNS TextOfPlan
+def fn_SearchPlanTextCreate(DictOfPlan):
+
+    ## DECLARE VARIABLES
+    ListOfLines = [f"SEARCH PLAN: {len(DictOfPlan['Terms'])} terms x {DictOfPlan['NumberOfD']} skip distances ({DictOfPlan['SkipDistanceDMinimum']} to {DictOfPlan['SkipDistanceDMaximum']}) in {DictOfPlan['LengthOfText']} letters" \
+        + (" (search by first + last letter)" if DictOfPlan["IsSearchByLetterLast"] else "")]
+
+    ## BEGIN FOR LOOP - ONE LINE PER ELS SEARCH TERM
+    for EachTerm in DictOfPlan["Terms"]:
+        ListOfLines.append(f"  {EachTerm['TermNumber']}. {EachTerm['Term']} (k = {EachTerm['k']}): first letter {EachTerm['LetterFirst']} x {EachTerm['CountOfLetterFirst']}, last letter {EachTerm['LetterLast']} x {EachTerm['CountOfLetterLast']} (rarer, anchor in memory: {EachTerm['LetterRarer']}); " \
+            + f"about {EachTerm['MatchesExpected']:.0f} matches; " + "; ".join(f"{EachEngine}: {EachDict['Candidates']} candidates, {fn_SecondsFormat(EachDict['Seconds'])}" for EachEngine, EachDict in EachTerm["Engines"].items()))
+    ## END FOR LOOP
+
+    ## TOTAL PER ENGINE + THE ENGINE OF THIS SEARCH
+    ListOfLines.append("  TOTAL: " + "; ".join(f"{DictOfEngines[EachEngine]}: {fn_SecondsFormat(EachDict['Seconds'])}" for EachEngine, EachDict in DictOfPlan["Engines"].items()) + f"; about {DictOfPlan['MatchesExpected']:.0f} matches")
+    ListOfLines.append(f"  THIS SEARCH: {DictOfEngines[DictOfPlan['EngineChosen']]}: {fn_SecondsFormat(DictOfPlan['SecondsEstimated'])}" \
+        + (f"; ESTIMATED FASTER: {DictOfEngines[DictOfPlan['EngineFasterEstimated']]} (" + ("NOT CHOSEN: --chunk-size GIVEN" if DictOfPlan["EngineChosen"] == "Chunked" else "NOT CHOSEN AUTOMATICALLY") + ")" if DictOfPlan["EngineFasterEstimated"] != DictOfPlan["EngineChosen"] else "") + (f"; NOTE: {DictOfPlan['Note']}" if DictOfPlan["Note"] else ""))
+
+    ## RETURN VARIABLES
+    return("\n".join(ListOfLines))
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #22E #5 - SECONDS FORMAT - e.g. 42 s, 12 min, 3.5 h, 2.1 days; ## RETURNS STRING
+def fn_SecondsFormat(Seconds):
+
+    ## BEGIN IF / ELIF / ELSE
+    if Seconds < 120:
+        return(f"{Seconds:.0f} s" if Seconds >= 1 else "< 1 s")
+    elif Seconds < 7200:
+        return(f"{Seconds / 60:.0f} min")
+    elif Seconds < 172800:
+        return(f"{Seconds / 3600:.1f} h")
+    else:
+        return(f"{Seconds / 86400:.1f} days")
+    ## END IF / ELIF / ELSE
+
+## END FUNCTION
+
+## BEGIN MAIN FUNCTION
+## FUNCTION () #22E #0 - ELS SEARCH PLAN CREATE
+def fn_SearchPlanCreate(ListOfTuplesOfLetterStatistics, LengthOfTextToSearch, ListOfSearchTermsWithSpaces, SkipDistanceDMinimum, SkipDistanceDMaximum, IsSearchByLetterLast=False, ChunkSize=None, IsSearchByDistance=False, IsEngineChosenByPlan=False):
+
+    """
+    ## MODULE.FUNCTION() #22E - ELS SEARCH PLAN CREATE; ESTIMATES FOR EACH ELS SEARCH TERM AND ENGINE (#22A / #23 IN MEMORY, #22C CHUNKED) THE CANDIDATES, MATCHES AND SECONDS OF THE ELS SEARCH FROM THE LETTER STATISTICS (MODULE.FUNCTION() #9AA), THE LENGTH OF THE TEXT + TERM AND THE SKIP DISTANCES;
+    ## EngineFasterEstimated == THE ENGINE ESTIMATED FASTER FOR ALL TERMS TOGETHER (ONE ENGINE SEARCHES ALL TERMS; NOT CHUNKED WITH IsSearchByDistance == --time-budget / --max-matches);
+    ## EngineChosen == THE ENGINE THE SEARCH WILL USE: CHUNKED IF ChunkSize IS GIVEN, ELSE EngineFasterEstimated IF IsEngineChosenByPlan (session.fn_Search(IsEngineChosenByPlan=True): p.py + THE SEARCH SERVER), ELSE IN MEMORY;
+    ## LetterRarer == THE ANCHOR OF #22A + #23 (THE RARER END LETTER OF EACH TERM); #22C STARTS FROM THE LETTER AT THE LOWEST POSITION; ## RETURNS DictOfPlan
+    """
+
+    ## DECLARE VARIABLES
+    DictOfLetterCounts = fn_LetterCountsGet(ListOfTuplesOfLetterStatistics)
+    ListOfD = list(range(SkipDistanceDMinimum, SkipDistanceDMaximum + 1))
+
+    ## CALL MODULE.FUNCTION() #22E #2 - STARTS SUM; ONCE PER LENGTH OF TERM
+    DictOfStarts = {k: fn_StartsSum(LengthOfTextToSearch, k, ListOfD) for k in {len(EachSearchTerm.replace(" ", "")) for EachSearchTerm in ListOfSearchTermsWithSpaces}}
+
+    ## CALL MODULE.FUNCTION() #22E #3 - TERM PLAN CREATE; ONE PER ELS SEARCH TERM (1-BASED, SAME AS DictOfSearchTermsWithSpaces)
+    ListOfTermPlans = [fn_TermPlanCreate(ELSSearchTermNumber, EachSearchTerm, DictOfLetterCounts, LengthOfTextToSearch, ListOfD, DictOfStarts[len(EachSearchTerm.replace(" ", ""))], IsSearchByLetterLast, ChunkSize) \
+        for ELSSearchTermNumber, EachSearchTerm in enumerate(ListOfSearchTermsWithSpaces, start=1)]
+
+    ## TOTAL PER ENGINE
+    DictOfEnginesTotal = {EachEngine: {"Candidates": sum(EachTerm["Engines"][EachEngine]["Candidates"] for EachTerm in ListOfTermPlans), "Seconds": round(sum(EachTerm["Engines"][EachEngine]["Seconds"] for EachTerm in ListOfTermPlans), 3)} for EachEngine in DictOfEngines}
+    EngineFasterEstimated = "InMemory" if IsSearchByDistance else min(DictOfEnginesTotal, key=lambda EachEngine: DictOfEnginesTotal[EachEngine]["Seconds"])
+    EngineChosen = "Chunked" if ChunkSize is not None else EngineFasterEstimated if IsEngineChosenByPlan else "InMemory"
+    Note = "--time-budget / --max-matches stop the search early; only the in-memory engine searches by increasing |d|" if IsSearchByDistance else ""
+
+    DictOfPlan = {"LengthOfText": LengthOfTextToSearch, "SkipDistanceDMinimum": SkipDistanceDMinimum, "SkipDistanceDMaximum": SkipDistanceDMaximum, "NumberOfD": len(ListOfD), "IsSearchByLetterLast": IsSearchByLetterLast, \
+        "Terms": ListOfTermPlans, "Engines": DictOfEnginesTotal, "MatchesExpected": round(sum(EachTerm["MatchesExpected"] for EachTerm in ListOfTermPlans), 1), \
+        "EngineChosen": EngineChosen, "EngineFasterEstimated": EngineFasterEstimated, "SecondsEstimated": DictOfEnginesTotal[EngineChosen]["Seconds"], "Note": Note}
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print(fn_SearchPlanTextCreate(DictOfPlan))
+
+    ## RETURN VARIABLES
+    return(DictOfPlan)
+
+## END FUNCTION () #22E - ELS SEARCH PLAN CREATE
@@ -72,8 +72,8 @@ def fn_GatherData4ELSMatches(DictOfSearchTerms, DictOfSearchTermsWithSpaces, DLO
             ## UPDATE DLO WITH EACH (n)'s VERSE TEXT - ONLY UPDATES FIRST AND LAST LETTERS OF EACH ELS
             DLO[n].Verse = DS[VerseCoordinatesDS]
 
-            ## CREATE TUPLE
-            TupleTest = (ndk, GematriaValues, WordGematriaNumberValue, DictOfSearchTermsWithSpaces[ELSSearchTermNumber], WordNumber, WordCoordinatesDWTK, WordText, LetterPositionInWord, LetterCoordinatesD5K, DS[VerseCoordinatesDS])
+            ## CREATE TUPLE; WORD + VERSE BY ID (WordNumber, VerseCoordinatesDS) - THEIR TEXT IS LOOKED UP IN DW / DS WHEN WRITTEN (MODULE.FUNCTION() #99 - TEXT DICTIONARY)
+            TupleTest = (ndk, GematriaValues, WordGematriaNumberValue, DictOfSearchTermsWithSpaces[ELSSearchTermNumber], WordNumber, WordCoordinatesDWTK, WordNumber, LetterPositionInWord, LetterCoordinatesD5K, VerseCoordinatesDS)
 
             ## APPEND VALUE TO LIST TO BE RETURNED
             LTM4ELS_ABS.append(TupleTest)
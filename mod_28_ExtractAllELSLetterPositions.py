@@ -137,12 +137,12 @@ def fn_ExtractAllELSLetterPositions(LTM4ELS_LF_ABS, DLO, DW, DS):
             ListTemp.append(DLO[numero].Letter)
             ListTemp.append(DLO[numero].LetterPositionIndex)
             ListTemp.append(DLO[numero].LetterCoordinatesD5K)
-            ListTemp.append(DLO[numero].Word)
+            ListTemp.append(WordNumber) ## WORD BY ID; TEXT IS LOOKED UP IN DW WHEN WRITTEN (MODULE.FUNCTION() #99 - TEXT DICTIONARY)
             ListTemp.append(DLO[numero].LetterPositionInWord)
             ListTemp.append(DLO[numero].WordNumber)
             ListTemp.append(DLO[numero].WordCoordinatesDWTK)
             ListTemp.append(DLO[numero].WordNumberInVerse)
-            ListTemp.append(DLO[numero].Verse)
+            ListTemp.append(VerseCoordinatesDS) ## VERSE BY ID; TEXT IS LOOKED UP IN DS WHEN WRITTEN (MODULE.FUNCTION() #99 - TEXT DICTIONARY)
 
             """
             HEADERS FOR CSV OUTPUT
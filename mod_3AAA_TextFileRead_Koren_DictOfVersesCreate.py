@@ -0,0 +1,93 @@
+## IMPORT MODULES
+
+## DECLARE VARIABLES
+## FILE NAMES OF THE KOREN TEXTS; SAME FILES AS OPENED BY MODULE.FUNCTION() #2A
+DictOfFileNamesKoren = {
+    1: "texts/text_koren_1genesis.txt",
+    2: "texts/text_koren_2exodus.txt",
+    3: "texts/text_koren_3leviticus.txt",
+    4: "texts/text_koren_4numbers.txt",
+    5: "texts/text_koren_5deuteronomy.txt",
+}
+
+## FUNCTION () #3AAA - TEXT FILE READ - STREAMING LINE-BY-LINE READ OF KOREN TEXT FILE(S) INTO DICTIONARY OF VERSES
+def fn_TextFileRead(NumberOfTextChosen):
+
+    """
+    ## MODULE.FUNCTION() #3AAA - TEXT FILE READ; READS EACH KOREN TEXT FILE LINE BY LINE, FIXES KEYS AND MERGES VERSES SPLIT BETWEEN TWO LINES IN THE SAME PASS (REPLACES #2A, #3A1, #3A2, #3A3, #3A4); RETURNS DictOfVersesForKoren
+    """
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  BEGIN FUNCTION #3AAA - TEXT FILE READ - STREAMING READ OF KOREN TEXT FILE(S)")
+
+    ## DECLARE VARIABLES
+    DictOfVersesForKoren = {}
+
+    ## BEGIN MATCH CASE - GET NUMBER(S) OF BOOK(S) CHOSEN
+    match NumberOfTextChosen:
+
+        ## TORAH
+        case 40:
+            ListOfBookNumbers = [1, 2, 3, 4, 5]
+
+        ## ONLY 1 (ONE) TEXT
+        case _:
+            ListOfBookNumbers = [NumberOfTextChosen]
+
+    ## END MATCH CASE
+
+    ## BEGIN FOR LOOP - FOR EACH TEXT FILE
+    for EachBookNumber in ListOfBookNumbers:
+
+        ## OPEN TEXT FILE; ITERATE OVER THE LINES WITHOUT READING THE WHOLE FILE INTO ONE STRING
+        with open(DictOfFileNamesKoren[EachBookNumber], encoding="utf-8-sig") as File:
+
+            ## BEGIN FOR LOOP - FOR EACH LINE IN TEXT FILE
+            for EachLine in File:
+
+                ## SPLIT THE LINE AT THE SPACES; e.g. ['1', '05', '62', 'WYMT', 'YWSP', ..., '']
+                ListOfElementsInLine = EachLine.rstrip("\n").split(" ")
+
+                ## IF FIRST ELEMENT IN LINE IS AN EMPTY STRING, THEN THERE IS NO KEY; SKIP LINE
+                if ListOfElementsInLine[0] == '':
+                    continue
+
+                ## FIX KEY: KEEP NUMERIC ELEMENTS ONLY; REVERSE NUMBERS OF TWO DIGITS OR MORE (e.g. '05' == 50); CONVERT TO INTEGER
+                TupleKey = tuple(int(EachElement[::-1]) for EachElement in ListOfElementsInLine[0:3] if EachElement.isnumeric())
+
+                ## IF KEY IS NOT A 3-INTEGER TUPLE-KEY, THEN SKIP LINE
+                if len(TupleKey) != 3:
+                    continue
+
+                ## GET LIST ELEMENTS OF THE WORDS IN LINE
+                ListOfWordsInLine = ListOfElementsInLine[3:]
+
+                ## IF TUPLE KEY ALREADY EXISTS IN DICT (VERSE SPLIT BETWEEN TWO LINES), THEN EXTEND THAT LIST WITH THE NEXT LINE
+                if TupleKey in DictOfVersesForKoren:
+                    DictOfVersesForKoren[TupleKey].extend(ListOfWordsInLine)
+
+                ## ELSE IF NOT YET IN DICT, CREATE NEW TUPLE KEY IN DICT (BOOK#, CHAPTER#, VERSE#) TOGETHER WITH ITS VALUE
+                else:
+                    DictOfVersesForKoren[TupleKey] = ListOfWordsInLine
+
+            ## END FOR LOOP - FOR EACH LINE IN TEXT FILE
+
+    ## END FOR LOOP - FOR EACH TEXT FILE
+
+    ## BEGIN FOR LOOP - DELETE LAST ELEMENT (WORD) IF BLANK STRING / EMPTY
+    for EachListOfWords in DictOfVersesForKoren.values():
+
+        if EachListOfWords and EachListOfWords[-1] == '':
+            del(EachListOfWords[-1])
+
+    ## END FOR LOOP - DELETE LAST ELEMENT (WORD) IF BLANK STRING / EMPTY
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  END FUNCTION #3AAA - TEXT FILE READ - STREAMING READ OF KOREN TEXT FILE(S)")
+
+    ## RETURN VARIABLES TO PROGRAM
+    return(DictOfVersesForKoren)
+
+## END FUNCTION () #3AAA - TEXT FILE READ - STREAMING READ OF KOREN TEXT FILE(S)
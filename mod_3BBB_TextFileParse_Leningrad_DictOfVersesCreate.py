@@ -0,0 +1,124 @@
+## IMPORT MODULES
+import json
+import re
+
+## DECLARE VARIABLES
+## COMPILE REGEX ONCE: REMOVE BRACKETS AND CONTENTS WITHIN BRACKETS (SAME PATTERN AS MODULE.FUNCTION() #3BB)
+RegexBrackets = re.compile("[\[].*?[\]]")
+
+## FUNCTION () #3BBB - TEXT FILE PARSE - ONE-SHOT PARSE OF LENINGRAD JSON INTO DICTIONARIES OF VERSES
+def fn_TextFileParse(JSON, NumberOfTextChosen):
+
+    """
+    ## MODULE.FUNCTION() #3BBB - TEXT FILE PARSE; PARSES EACH JSON STRING ONCE AND CREATES BOTH DICTIONARIES OF VERSES IN ONE TRAVERSAL (REPLACES #3B, #3BB, #4, #5, #6, #7); RETURNS SearchTextChosen, DictOfVersesNoSpaces, DictOfVersesWithSpaces
+    """
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  BEGIN FUNCTION #3BBB - TEXT FILE PARSE - ONE-SHOT PARSE OF LENINGRAD JSON")
+
+    ## DECLARE VARIABLES
+    DictOfVersesNoSpaces = {} ## EMPTY DICTIONARY TO HOLD KEYS + VERSES
+    DictOfVersesWithSpaces = {} ## EMPTY DICTIONARY TO HOLD KEYS + VERSES
+
+    ## BEGIN MATCH CASE - GET NUMBER(S) OF BOOK(S) CHOSEN; SAME ORDER AS THE FILES OPENED BY MODULE.FUNCTION() #2B
+    match NumberOfTextChosen:
+
+        ## TORAH
+        case 40:
+            SearchTextChosen = tuple(range(1, 6))
+
+        ## NEVI'IM (PROPHETS)
+        case 41:
+            SearchTextChosen = tuple(range(6, 27))
+
+        ## K'TUVIM (WRITINGS)
+        case 42:
+            SearchTextChosen = tuple(range(27, 40))
+
+        ## TANACH (HEBREW BIBLE)
+        case 43:
+            SearchTextChosen = tuple(range(1, 40))
+
+        ## SAMUEL I & II
+        case 44:
+            SearchTextChosen = (8, 9)
+
+        ## KINGS I & II
+        case 45:
+            SearchTextChosen = (10, 11)
+
+        ## EZRA & NEHEMIAH
+        case 46:
+            SearchTextChosen = (36, 37)
+
+        ## CHRONICLES I & II
+        case 47:
+            SearchTextChosen = (38, 39)
+
+        ## ONLY 1 (ONE) TEXT
+        case _:
+            SearchTextChosen = (NumberOfTextChosen,)
+
+    ## END MATCH CASE
+
+    ## IF ONLY 1 (ONE) TEXT WAS OPENED, WRAP THE STRING IN A TUPLE
+    if isinstance(JSON, str):
+        JSON = (JSON,)
+
+    ## BEGIN FOR LOOP - EACH BOOK: PARSE JSON STRING ONLY ONCE
+    for NumberOfBook, EachJSONString in zip(SearchTextChosen, JSON):
+
+        ## CONVERT JSON STRING TO DICTIONARY
+        DictOfJSON = json.loads(EachJSONString)
+
+        ## DECLARE VARIABLES
+        ChapterCounter = 1
+
+        ## BEGIN FOR LOOP - EACH CHAPTER
+        for Chapter in DictOfJSON['text']:
+
+            ## DECLARE VARIABLES
+            VerseCounter = 1
+
+            ## BEGIN FOR LOOP - EACH VERSE
+            for Verse in Chapter:
+
+                KeyTuple = (NumberOfBook, ChapterCounter, VerseCounter)
+
+                ## REMOVE HYPHENS (MAQAF); REMOVE BRACKETS AND CONTENTS WITHIN BRACKETS; REMOVE ZERO WIDTH JOINER
+                Verse = Verse.replace("־", " ")
+                Verse = RegexBrackets.sub("", Verse)
+                Verse = Verse.replace(u"\u200D", "")
+
+                ## DEAL WITH DOUBLE WHITE SPACES: FILTER OUT THE "WORDS" WITH EMPTY STRINGS
+                ListOfWords = Verse.split(" ")
+                VerseWithSpaces = " ".join([EachWord for EachWord in ListOfWords if EachWord != ''])
+
+                ## ASSIGN EACH VERSE TO EACH 3-INTEGER TUPLE-KEY --> D[1,1,1] AND DS[1,1,1]
+                DictOfVersesWithSpaces[KeyTuple] = VerseWithSpaces
+                DictOfVersesNoSpaces[KeyTuple] = Verse.replace(" ", "")
+
+                ## INCREMENT VERSE COUNTER
+                VerseCounter += 1
+
+            ## END FOR LOOP
+
+            ## INCREMENT CHAPTER COUNTER
+            ChapterCounter += 1
+
+        ## END FOR LOOP
+
+        ## RELEASE THE PARSED JSON OF THIS BOOK BEFORE PARSING THE NEXT BOOK
+        del DictOfJSON
+
+    ## END FOR LOOP
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  END FUNCTION #3BBB - TEXT FILE PARSE - ONE-SHOT PARSE OF LENINGRAD JSON")
+
+    ## RETURN VARIABLES TO PROGRAM
+    return(SearchTextChosen, DictOfVersesNoSpaces, DictOfVersesWithSpaces)
+
+## END FUNCTION () #3BBB - TEXT FILE PARSE - ONE-SHOT PARSE OF LENINGRAD JSON
@@ -0,0 +1,190 @@
+## IMPORT MODULES
+import re
+
+## DECLARE VARIABLES
+## BOOK NUMBERS (1-39) WITH FULL NAMES AND COMMON ABBREVIATIONS; COMPARED IN LOWER CASE WITHOUT SPACES OR DOTS
+DictOfBookNamesAndAbbreviations = {
+    1: ("Genesis", "Gen", "Ge", "Gn"),
+    2: ("Exodus", "Exod", "Ex"),
+    3: ("Leviticus", "Lev", "Lv"),
+    4: ("Numbers", "Num", "Nm"),
+    5: ("Deuteronomy", "Deut", "Dt"),
+    6: ("Joshua", "Josh"),
+    7: ("Judges", "Judg"),
+    8: ("ISamuel", "ISam", "1Samuel", "1Sam"),
+    9: ("IISamuel", "IISam", "2Samuel", "2Sam"),
+    10: ("IKings", "IKgs", "1Kings", "1Kgs"),
+    11: ("IIKings", "IIKgs", "2Kings", "2Kgs"),
+    12: ("Isaiah", "Isa"),
+    13: ("Jeremiah", "Jer"),
+    14: ("Ezekiel", "Ezek"),
+    15: ("Hosea", "Hos"),
+    16: ("Joel",),
+    17: ("Amos",),
+    18: ("Obadiah", "Obad"),
+    19: ("Jonah", "Jon"),
+    20: ("Micah", "Mic"),
+    21: ("Nahum", "Nah"),
+    22: ("Habakkuk", "Hab"),
+    23: ("Zephaniah", "Zeph"),
+    24: ("Haggai", "Hag"),
+    25: ("Zechariah", "Zech"),
+    26: ("Malachi", "Mal"),
+    27: ("Psalms", "Psalm", "Ps", "Psa"),
+    28: ("Proverbs", "Prov"),
+    29: ("Job",),
+    30: ("SongOfSongs", "Song"),
+    31: ("Ruth",),
+    32: ("Lamentations", "Lam"),
+    33: ("Ecclesiastes", "Eccl", "Eccles"),
+    34: ("Esther", "Esth"),
+    35: ("Daniel", "Dan"),
+    36: ("Ezra",),
+    37: ("Nehemiah", "Neh"),
+    38: ("IChronicles", "IChr", "1Chronicles", "1Chr"),
+    39: ("IIChronicles", "IIChr", "2Chronicles", "2Chr"),
+}
+
+## CREATE LOOKUP DICTIONARY: LOWER CASE NAME --> BOOK NUMBER
+DictOfBookNumbersByName = {}
+for EachBookNumber, EachTupleOfNames in DictOfBookNamesAndAbbreviations.items():
+    for EachName in EachTupleOfNames:
+        DictOfBookNumbersByName[EachName.lower()] = EachBookNumber
+
+## REGEX: BOOK NAME FOLLOWED BY OPTIONAL CHAPTER[:VERSE][-CHAPTER[:VERSE]] ## e.g. 'Gen 1:1-11:32', '1 Sam 3', 'Isa'
+RegexBookAndReference = re.compile(r"^(?P<Book>.*?[A-Za-z].*?)\s*(?P<Reference>\d+(?::\d+)?(?:\s*-\s*\d+(?::\d+)?)?)?$")
+
+## BEGIN FUNCTION () #5A #1 - CONVERT BOOK NAME OR ABBREVIATION TO NUMBER
+def fn_ConvertBookNameToNumber(BookName):
+
+    ## REMOVE SPACES AND DOTS; e.g. 'I Sam.' --> 'isam'
+    BookNameNormalized = re.sub(r"[\s.]", "", BookName).lower()
+
+    ## BEGIN IF / ELSE
+    if BookNameNormalized in DictOfBookNumbersByName:
+        BookNumber = DictOfBookNumbersByName[BookNameNormalized]
+    else:
+        raise ValueError(f"Unknown book name in custom corpus: '{BookName.strip()}'")
+    ## END IF / ELSE
+
+    ## RETURN VARIABLES
+    return(BookNumber)
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #5A #2 - CONVERT CHAPTER:VERSE STRING TO TUPLE (CHAPTER, VERSE); VERSE IS None IF NOT GIVEN
+def fn_ConvertChapterVerse(ChapterVerse):
+
+    ## BEGIN IF / ELSE
+    if ":" in ChapterVerse:
+        Chapter, Verse = ChapterVerse.split(":")
+        TupleChapterVerse = (int(Chapter), int(Verse))
+    else:
+        TupleChapterVerse = (int(ChapterVerse), None)
+    ## END IF / ELSE
+
+    ## RETURN VARIABLES
+    return(TupleChapterVerse)
+
+## END FUNCTION
+
+## BEGIN MAIN FUNCTION
+## FUNCTION () #5A #0 - CUSTOM CORPUS SPEC PARSE
+def fn_CustomCorpusSpecParse(CustomCorpusSpec):
+
+    """
+    ## MODULE.FUNCTION() #5A - CUSTOM CORPUS SPEC PARSE; e.g. 'Gen-Deut', 'Isa+Jer', 'Gen 1:1-11:32'; ## RETURNS ListOfSegments OF (BookNumber, (StartChapter, StartVerse), (EndChapter, EndVerse)); None == WHOLE BOOK / WHOLE CHAPTER
+    """
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  BEGIN FUNCTION #5A - CUSTOM CORPUS SPEC PARSE")
+
+    ## DECLARE VARIABLES
+    ListOfSegments = []
+
+    ## BEGIN FOR LOOP - FOR EACH PART OF THE CUSTOM CORPUS JOINED WITH +
+    for EachPart in CustomCorpusSpec.split("+"):
+
+        EachPart = EachPart.strip()
+
+        ## IF PART IS EMPTY, e.g. 'Gen++Exod'
+        if EachPart == "":
+            raise ValueError(f"Empty part in custom corpus: '{CustomCorpusSpec}'")
+
+        ## SPLIT AT FIRST HYPHEN TO CHECK FOR RANGE OF BOOKS, e.g. 'Gen-Deut'
+        BookFirst, Hyphen, BookLast = EachPart.partition("-")
+
+        ## BEGIN IF / ELSE - RANGE OF BOOKS OR ONE BOOK (WITH OPTIONAL CHAPTER/VERSE RANGE)
+        ## IF RANGE OF BOOKS: BOTH SIDES OF THE HYPHEN ARE BOOK NAMES ONLY
+        if Hyphen and re.search(r"[A-Za-z]", BookLast) and not re.search(r"\d\s*$|:", BookFirst):
+
+            NumberOfBookFirst = fn_ConvertBookNameToNumber(BookFirst)
+            NumberOfBookLast = fn_ConvertBookNameToNumber(BookLast)
+
+            ## IF RANGE IS BACKWARDS, e.g. 'Deut-Gen'
+            if NumberOfBookFirst > NumberOfBookLast:
+                raise ValueError(f"Range of books is backwards in custom corpus: '{EachPart}'")
+
+            ## ADD EACH WHOLE BOOK IN RANGE OF BOOKS
+            for EachBookNumber in range(NumberOfBookFirst, NumberOfBookLast + 1):
+                ListOfSegments.append((EachBookNumber, None, None))
+
+        ## ELSE IF ONE BOOK WITH OPTIONAL CHAPTER/VERSE RANGE
+        else:
+
+            MatchBookAndReference = RegexBookAndReference.match(EachPart)
+
+            ## IF NOT A VALID PART, e.g. 'Gen 1:1-'
+            if MatchBookAndReference is None:
+                raise ValueError(f"Cannot read part of custom corpus: '{EachPart}'")
+
+            BookNumber = fn_ConvertBookNameToNumber(MatchBookAndReference.group("Book"))
+            Reference = MatchBookAndReference.group("Reference")
+
+            ## BEGIN IF / ELIF / ELSE
+            ## IF NO CHAPTER/VERSE GIVEN: WHOLE BOOK
+            if Reference is None:
+                ListOfSegments.append((BookNumber, None, None))
+
+            ## ELSE IF RANGE, e.g. '1:1-11:32', '1-11', '1:1-5' (SAME CHAPTER)
+            elif "-" in Reference:
+
+                StartReference, EndReference = [EachReference.strip() for EachReference in Reference.split("-")]
+                StartChapterVerse = fn_ConvertChapterVerse(StartReference)
+
+                ## IF END IS A VERSE NUMBER ONLY IN THE SAME CHAPTER, e.g. '1:1-5'
+                if StartChapterVerse[1] is not None and ":" not in EndReference:
+                    EndChapterVerse = (StartChapterVerse[0], int(EndReference))
+                else:
+                    EndChapterVerse = fn_ConvertChapterVerse(EndReference)
+
+                ## IF RANGE IS BACKWARDS, e.g. 'Gen 11-1'
+                if (EndChapterVerse[0], EndChapterVerse[1] or 0) < (StartChapterVerse[0], StartChapterVerse[1] or 0):
+                    raise ValueError(f"Range of verses is backwards in custom corpus: '{EachPart}'")
+
+                ListOfSegments.append((BookNumber, StartChapterVerse, EndChapterVerse))
+
+            ## ELSE ONE CHAPTER OR ONE VERSE, e.g. '119' OR '1:1'
+            else:
+                ChapterVerse = fn_ConvertChapterVerse(Reference)
+                ListOfSegments.append((BookNumber, ChapterVerse, ChapterVerse))
+
+            ## END IF / ELIF / ELSE
+
+        ## END IF / ELSE - RANGE OF BOOKS OR ONE BOOK
+
+    ## END FOR LOOP
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print(f"ListOfSegments : {ListOfSegments}")
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  END FUNCTION #5A - CUSTOM CORPUS SPEC PARSE")
+
+    ## RETURN VARIABLES TO PROGRAM
+    return(ListOfSegments)
+
+## END FUNCTION () #5A - CUSTOM CORPUS SPEC PARSE
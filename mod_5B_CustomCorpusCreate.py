@@ -0,0 +1,155 @@
+## IMPORT MODULES
+import mod_2B_TextFileOpen_Leningrad ## MODULE.FUNCTION() #2B - TEXT FILE OPEN; ## RETURNS TEXT FILE STRING
+import mod_2C_TextFileOpen_MAM ## MODULE.FUNCTION() #2C - TEXT FILE OPEN; ## RETURNS TEXT FILE STRING
+import mod_3AAA_TextFileRead_Koren_DictOfVersesCreate ## MODULE.FUNCTION() #3AAA - TEXT FILE READ; ## RETURNS DictOfVersesForKoren
+import mod_3A5_TextFileParse_Koren ## MODULE.FUNCTION() #3A5 - TEXT FILE PARSE
+import mod_3BBB_TextFileParse_Leningrad_DictOfVersesCreate ## MODULE.FUNCTION() #3BBB - TEXT FILE PARSE; ## RETURNS SearchTextChosen, DictOfVersesNoSpaces, DictOfVersesWithSpaces
+import mod_3C_TextFilePreprocess_MAM_ExtractStrings ## FUNCTION() #3C CALLS #3CC INTERNALLY
+import mod_3CCC_TextFileParse_MAM ## MODULE.FUNCTION() #3CCC - TEXT FILE PARSE
+
+## DECLARE VARIABLES
+## CACHE OF PARSED BOOKS: KEY: (NumberOfCodexChosen, BookNumber); VALUE: (D, DS) OF THAT ONE BOOK
+DictOfCachedBooks = {}
+
+## BEGIN FUNCTION () #5B #1 - GET DICTIONARIES OF VERSES OF ONE BOOK (FROM CACHE, OR PARSE AND ADD TO CACHE)
+def fn_GetBook(NumberOfCodexChosen, BookNumber):
+
+    ## IF BOOK NOT YET PARSED FOR THIS CODEX
+    if (NumberOfCodexChosen, BookNumber) not in DictOfCachedBooks:
+
+        ## BEGIN MATCH CASE - DEAL WITH CHOICE OF CODEX (SAME CALLS AS p.py FOR ONE (1) TEXT)
+        match NumberOfCodexChosen:
+
+            ## KOREN CODEX - CODEX A (TORAH ONLY)
+            case 1:
+
+                ## IF BOOK IS NOT IN THE TORAH
+                if BookNumber > 5:
+                    raise ValueError(f"Book # {BookNumber} is not available in the Koren Codex (Torah only: books 1-5)")
+
+                DVK = mod_3AAA_TextFileRead_Koren_DictOfVersesCreate.fn_TextFileRead(BookNumber)
+                LW4AV, DVKH, DVKHS, VerseCountTotal, WordCountTotal, LetterCountTotal = mod_3A5_TextFileParse_Koren.fn_TextFileParse(DVK)
+                D, DS = DVKH, DVKHS
+
+            ## LENINGRAD CODEX - CODEX B
+            case 2:
+
+                JSON = mod_2B_TextFileOpen_Leningrad.fn_TextFileOpen(BookNumber)
+                SearchTextChosen, D, DS = mod_3BBB_TextFileParse_Leningrad_DictOfVersesCreate.fn_TextFileParse(JSON, BookNumber)
+
+            ## MAM COLLECTION OF MANUSCRIPTS - CODEX C
+            case 3:
+
+                ListOfTuples = mod_2C_TextFileOpen_MAM.fn_TextFileOpen(BookNumber)
+                DictOfKeysVersesWithSpaces, DictOfKeysVersesNoSpaces, DictOfListsOfWordsInVerse = mod_3C_TextFilePreprocess_MAM_ExtractStrings.fn_ExtractStrings(ListOfTuples)
+                LW4AV, DVMAMH, DVMAMHS, VerseCountTotal, WordCountTotal, LetterCountTotal = mod_3CCC_TextFileParse_MAM.fn_TextFileParse(DictOfListsOfWordsInVerse)
+                D, DS = DVMAMH, DictOfKeysVersesWithSpaces
+
+        ## END MATCH CASE
+
+        ## ADD BOOK TO CACHE
+        DictOfCachedBooks[(NumberOfCodexChosen, BookNumber)] = (D, DS)
+
+    ## RETURN VARIABLES
+    return(DictOfCachedBooks[(NumberOfCodexChosen, BookNumber)])
+
+## END FUNCTION
+
+## BEGIN MAIN FUNCTION
+## FUNCTION () #5B #0 - CUSTOM CORPUS CREATE
+def fn_CustomCorpusCreate(NumberOfCodexChosen, ListOfSegments):
+
+    """
+    ## MODULE.FUNCTION() #5B - CUSTOM CORPUS CREATE; SELECTS THE VERSES OF EACH SEGMENT FROM THE CACHED BOOKS (VERSE STRINGS ARE SHARED, NOT COPIED); ## RETURNS SearchTextChosen, D, DS, ListOfCorpusOffsets
+    """
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  BEGIN FUNCTION #5B - CUSTOM CORPUS CREATE")
+
+    ## DECLARE VARIABLES
+    D = {} ## DICTIONARY OF VERSES WITH NO SPACES OF THE CUSTOM CORPUS
+    DS = {} ## DICTIONARY OF VERSES WITH SPACES OF THE CUSTOM CORPUS
+    ListOfBookNumbers = []
+    ListOfCorpusOffsets = [] ## OFFSET TABLE: ONE TUPLE PER SEGMENT: (BookNumber, FirstVerseKey, LastVerseKey, FirstLetterPositionIndex (1-BASED), NumberOfLetters)
+    TotalLetterCounter = 1
+
+    ## BEGIN FOR LOOP - FOR EACH SEGMENT OF THE CUSTOM CORPUS
+    for BookNumber, StartChapterVerse, EndChapterVerse in ListOfSegments:
+
+        ## GET DICTIONARIES OF VERSES OF THE WHOLE BOOK
+        DBook, DSBook = fn_GetBook(NumberOfCodexChosen, BookNumber)
+
+        ## DECLARE VARIABLES
+        FirstVerseKey = None
+        LastVerseKey = None
+        LetterCountInSegment = 0
+
+        ## BEGIN FOR LOOP - SELECT VERSES OF SEGMENT
+        for EachKey, EachVerse in DBook.items(): ## EachKey == (BOOK#, CHAPTER#, VERSE#)
+
+            ## BEGIN IF - SKIP VERSES OUTSIDE OF SEGMENT
+            ## IF SEGMENT IS NOT THE WHOLE BOOK
+            if StartChapterVerse is not None:
+
+                ## IF BEFORE FIRST VERSE (NO VERSE GIVEN == FROM VERSE 1)
+                if (EachKey[1], EachKey[2]) < (StartChapterVerse[0], StartChapterVerse[1] or 1):
+                    continue
+
+                ## IF AFTER LAST CHAPTER (NO VERSE GIVEN == TO LAST VERSE OF CHAPTER)
+                if EndChapterVerse[1] is None and EachKey[1] > EndChapterVerse[0]:
+                    break
+
+                ## IF AFTER LAST VERSE
+                if EndChapterVerse[1] is not None and (EachKey[1], EachKey[2]) > EndChapterVerse:
+                    break
+
+            ## END IF - SKIP VERSES OUTSIDE OF SEGMENT
+
+            ## IF VERSE ALREADY SELECTED BY AN EARLIER SEGMENT, e.g. 'Gen+Gen 1'
+            if EachKey in D:
+                raise ValueError(f"Verse {EachKey} is selected more than once in custom corpus")
+
+            ## ADD VERSE TO THE CUSTOM CORPUS
+            D[EachKey] = EachVerse
+            DS[EachKey] = DSBook[EachKey]
+
+            ## UPDATE OFFSET TABLE VARIABLES
+            if FirstVerseKey is None:
+                FirstVerseKey = EachKey
+            LastVerseKey = EachKey
+            LetterCountInSegment += len(EachVerse)
+
+        ## END FOR LOOP - SELECT VERSES OF SEGMENT
+
+        ## IF NO VERSE FOUND IN SEGMENT, e.g. 'Gen 51'
+        if FirstVerseKey is None:
+            raise ValueError(f"No verses found in custom corpus for book # {BookNumber}, {StartChapterVerse} - {EndChapterVerse}")
+
+        ## ADD SEGMENT TO OFFSET TABLE
+        ListOfCorpusOffsets.append((BookNumber, FirstVerseKey, LastVerseKey, TotalLetterCounter, LetterCountInSegment))
+        TotalLetterCounter += LetterCountInSegment
+
+        ## ADD BOOK NUMBER TO LIST OF BOOK NUMBERS
+        if BookNumber not in ListOfBookNumbers:
+            ListOfBookNumbers.append(BookNumber)
+
+    ## END FOR LOOP - FOR EACH SEGMENT OF THE CUSTOM CORPUS
+
+    ## CONVERT LIST TO TUPLE
+    SearchTextChosen = tuple(ListOfBookNumbers)
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print(f"Custom corpus: {len(D)} verses; {TotalLetterCounter - 1} letters")
+    for EachOffset in ListOfCorpusOffsets:
+        print(f"Book # {EachOffset[0]}: {EachOffset[1]} - {EachOffset[2]}; letters {EachOffset[3]} - {EachOffset[3] + EachOffset[4] - 1}")
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  END FUNCTION #5B - CUSTOM CORPUS CREATE")
+
+    ## RETURN VARIABLES TO PROGRAM
+    return(SearchTextChosen, D, DS, ListOfCorpusOffsets)
+
+## END FUNCTION () #5B - CUSTOM CORPUS CREATE
@@ -0,0 +1,113 @@
+## IMPORT MODULES
+import mod_2B_TextFileOpen_Leningrad ## MODULE.FUNCTION() #2B - TEXT FILE OPEN; ## RETURNS TEXT FILE STRING
+import mod_2C_TextFileOpen_MAM ## MODULE.FUNCTION() #2C - TEXT FILE OPEN; ## RETURNS TEXT FILE STRING
+import mod_3AAA_TextFileRead_Koren_DictOfVersesCreate ## MODULE.FUNCTION() #3AAA - TEXT FILE READ; STREAMING LINE-BY-LINE READ OF KOREN TEXT FILE(S); ## RETURNS DictOfVersesForKoren
+import mod_3A5_TextFileParse_Koren ## MODULE.FUNCTION() #3A5 - TEXT FILE PARSE
+import mod_3BBB_TextFileParse_Leningrad_DictOfVersesCreate ## MODULE.FUNCTION() #3BBB - TEXT FILE PARSE; PARSES EACH JSON STRING ONCE; ## RETURNS SearchTextChosen, DictOfVersesNoSpaces, DictOfVersesWithSpaces
+import mod_3C_TextFilePreprocess_MAM_ExtractStrings ## FUNCTION() #3C CALLS #3CC INTERNALLY
+import mod_3CCC_TextFileParse_MAM ## MODULE.FUNCTION() #3CCC - RETURNS: LW4AV, DVMAMH, DVMAMHS, VerseCountTotal, WordCountTotal, LetterCountTotal
+import mod_5A_CustomCorpusSpecParse ## MODULE.FUNCTION() #5A - CUSTOM CORPUS SPEC PARSE; ## RETURNS ListOfSegments
+import mod_5B_CustomCorpusCreate ## MODULE.FUNCTION() #5B - CUSTOM CORPUS CREATE FROM CACHED BOOKS; ## RETURNS SearchTextChosen, D, DS, ListOfCorpusOffsets
+
+## mod_cls_Session (numpy + THE ELS SEARCH) IS IMPORTED BY fn_CorpusOpen: THE PROMPTS OF p.py BEFORE THE TEXT IS READ ONLY NEED NumberOfTextCustomCorpus
+
+## DECLARE VARIABLES
+NumberOfTextCustomCorpus = 48 ## NUMBER OF TEXT TO CHOOSE FOR A CUSTOM CORPUS, e.g. Gen-Deut, Isa+Jer, Gen 1:1-11:32
+
+## BEGIN FUNCTION () #7A - CORPUS OPEN ##
+def fn_CorpusOpen(NumberOfCodexChosen, NumberOfTextChosen, CustomCorpusSpec=None, IsDataObjectsInBackground=True):
+
+    """
+    ## MODULE.FUNCTION() #7A - CORPUS OPEN; READS + PARSES THE TEXT(S) CHOSEN (CODEX 1 KOREN, 2 LENINGRAD, 3 MAM; TEXT 48 == CUSTOM CORPUS OF CustomCorpusSpec) ONCE; IsDataObjectsInBackground=False: NO DATA OBJECTS OF THE WHOLE TEXT UNTIL A SEARCH NEEDS THEM (CHUNKED ELS SEARCH OUT OF CORE); ## RETURNS session (SESSION OBJECT) FOR ANY NUMBER OF ELS SEARCHES: session.fn_Search(...)
+    """
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  BEGIN FUNCTION #7A - CORPUS OPEN")
+
+    ## DECLARE VARIABLES
+    ListOfCorpusOffsets = None ## OFFSET TABLE OF CUSTOM CORPUS: (BookNumber, FirstVerseKey, LastVerseKey, FirstLetterPositionIndex, NumberOfLetters)
+
+    ## IF CODEX IS UNKNOWN
+    if NumberOfCodexChosen not in (1, 2, 3):
+        raise ValueError(f"Unknown codex: {NumberOfCodexChosen} (choose 1 Koren, 2 Leningrad or 3 MAM)")
+
+    ## IF A CUSTOM CORPUS HAS NO SPEC
+    if NumberOfTextChosen == NumberOfTextCustomCorpus and not CustomCorpusSpec:
+        raise ValueError(f"Text {NumberOfTextCustomCorpus} (custom corpus) needs a CustomCorpusSpec, e.g. 'Gen 1:1-11:32'")
+
+    ## BEGIN MATCH CASE - DEAL WITH CHOICE OF CODEX
+    match NumberOfCodexChosen:
+
+        ## CUSTOM CORPUS - ANY CODEX
+        case _ if NumberOfTextChosen == NumberOfTextCustomCorpus:
+
+            ## CALL MODULE.FUNCTION() #5A - CUSTOM CORPUS SPEC PARSE; e.g. 'Gen 1:1-11:32' --> [(1, (1, 1), (11, 32))]
+            ListOfSegments = mod_5A_CustomCorpusSpecParse.fn_CustomCorpusSpecParse(CustomCorpusSpec)
+
+            ## CALL MODULE.FUNCTION() #5B - CUSTOM CORPUS CREATE; SELECTS THE VERSES OF EACH SEGMENT FROM THE CACHED BOOKS; RETURNS DICTIONARIES OF VERSES D AND DS + OFFSET TABLE
+            SearchTextChosen, D, DS, ListOfCorpusOffsets = mod_5B_CustomCorpusCreate.fn_CustomCorpusCreate(NumberOfCodexChosen, ListOfSegments)
+
+        ## KOREN CODEX - CODEX A
+        case 1:
+
+            ## CALL MODULE.FUNCTION() #3AAA - TEXT FILE READ - STREAMING LINE-BY-LINE READ; FIX KEYS AND LINES / VERSES (DOUBLE INSTANCES WITH VERSE SPLIT BETWEEN THE TWO LINES) IN THE SAME PASS
+            ## (REPLACES MODULE.FUNCTIONS() #2A, #3A1, #3A2, #3A3, #3A4)
+            DVK = mod_3AAA_TextFileRead_Koren_DictOfVersesCreate.fn_TextFileRead(NumberOfTextChosen)
+
+            ## CALL MODULE.FUNCTION() #3A5 - TEXT FILE PARSE - PARSE ## (Koren DVKH ~ DS Leningrad); (Koren DVKHS ~ DS Leningrad)
+            LW4AV, DVKH, DVKHS, VerseCountTotal, WordCountTotal, LetterCountTotal = mod_3A5_TextFileParse_Koren.fn_TextFileParse(DVK)
+
+            ## SEARCH TEXT CHOSEN: TUPLE OF ONE INTEGER (THE NUMBER OF THE CODEX)
+            SearchTextChosen = (NumberOfCodexChosen,)
+
+            ## INTEGRATE KOREN DICTIONARIES INTO OJBECTS: D AND DS
+            D, DS = DVKH, DVKHS
+
+        ## LENINGRAD CODEX - CODEX B
+        case 2:
+
+            ## CALL MODULE.FUNCTION() #2B - TEXT FILE OPEN
+            JSON = mod_2B_TextFileOpen_Leningrad.fn_TextFileOpen(NumberOfTextChosen)
+
+            ## CALL MODULE.FUNCTION() #3BBB - TEXT FILE PARSE; PARSES EACH JSON STRING ONCE; RETURNS 1.) TUPLE OF BOOK NUMBERS; 2.) DICTIONARY OF VERSES WITH NO SPACES; 3.) DICTIONARY OF VERSES WITH SPACES
+            ## (REPLACES MODULE.FUNCTIONS() #3B, #3BB, #4, #5, #6, #7)
+            SearchTextChosen, D, DS = mod_3BBB_TextFileParse_Leningrad_DictOfVersesCreate.fn_TextFileParse(JSON, NumberOfTextChosen)
+
+            ## GET NUMBER OF TEXT CHOSEN
+            SearchTextChosen = NumberOfTextChosen ## e.g. 1, 5, 35, 39, 40, 41, 42, 43, 44, 45, 46, 47
+
+        ## MAM COLLECTION OF MANUSCRIPTS - CODEX C
+        case 3:
+
+            ## CALL MODULE.FUNCTION() #2C - TEXT FILE OPEN
+            ListOfTuples = mod_2C_TextFileOpen_MAM.fn_TextFileOpen(NumberOfTextChosen)
+
+            ## CALL MODULE.FUNCTION() #3C - TEXT FILE PREPROCESS - EXTRACT KEYS AND VERSES & WORDS; DICT OF VERSES CREATE
+            DictOfKeysVersesWithSpaces, DictOfKeysVersesNoSpaces, DictOfListsOfWordsInVerse = mod_3C_TextFilePreprocess_MAM_ExtractStrings.fn_ExtractStrings(ListOfTuples)
+
+            ## CALL MODULE.FUNCTION() #3CCC - TEXT FILE PARSE - PARSE ## (MAM DVMAM ~ Koren DVKH ~ DS Leningrad)
+            LW4AV, DVMAMH, DVMAMHS, VerseCountTotal, WordCountTotal, LetterCountTotal = mod_3CCC_TextFileParse_MAM.fn_TextFileParse(DictOfListsOfWordsInVerse)
+
+            ## GET NUMBER OF TEXT CHOSEN
+            SearchTextChosen = NumberOfTextChosen ## e.g. 1, 5, 35, 39, 40, 41, 42, 43, 44, 45, 46, 47
+
+            ## INTEGRATE MAM DICTIONARIES OF VERSES INTO OBJECTS: D AND DS ## DS == DICTIONARY OF VERSES WITH SPACES OF #3C
+            D, DS = DVMAMH, DictOfKeysVersesWithSpaces
+
+    ## END MATCH CASE - DEAL WITH CHOICE OF CODEX
+
+    ## IMPORT MODULES ONLY IF NEEDED
+    from mod_cls_Session import cls_Session as SESSION
+
+    ## CREATE NEW OBJECT INSTANCE OF CLASS: SESSION; STARTS MODULE.FUNCTION() #8 (DATA OBJECTS CREATE) IN A BACKGROUND THREAD (IF IsDataObjectsInBackground)
+    session = SESSION(NumberOfCodexChosen, NumberOfTextChosen, CustomCorpusSpec if NumberOfTextChosen == NumberOfTextCustomCorpus else None, SearchTextChosen, D, DS, ListOfCorpusOffsets, IsDataObjectsInBackground)
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  END FUNCTION #7A - CORPUS OPEN")
+
+    ## RETURN VARIABLES
+    return(session)
+
+## END FUNCTION () #7A - CORPUS OPEN
@@ -0,0 +1,118 @@
+## IMPORT MODULES
+import contextlib
+import time
+
+import mod_22E_ELSSearchPlanCreate ## MODULE.FUNCTION() #22E - ELS SEARCH PLAN CREATE (TEXT OF THE PLAN)
+
+from mod_cls_EventStream import cls_EventStream as ES
+
+## DECLARE VARIABLES
+## SEARCH JOB (JSON): {"Codex": 2, "Text": 1, "CustomCorpus": null, "ELSSearchTerms": ["משיח"], "SkipDistanceDMinimum": -100, "SkipDistanceDMaximum": 100, "XW": 50, "Outputs": ["summary"], "Options": {...}}
+TupleOfKeysOfJobRequired = ("Codex", "Text", "ELSSearchTerms", "SkipDistanceDMinimum", "SkipDistanceDMaximum")
+XWDefault = 50 ## X / W / #COLUMNS OF THE 2D MATRIX IF NOT IN THE JOB
+
+## Options: OTHER KEYWORD ARGUMENTS OF session.fn_Search (== FLAGS OF p.py) A JOB MAY GIVE
+TupleOfOptionsOfJob = ("ListOfStages", "ChunkSizeForELSSearch", "FileFormatForELSLetterPositions", "IsLegacyLetterPositionFiles", "IsMatrixCSVGzip", \
+    "ListOfMatchIDsForELSWindows", "XWForELSWindows", "RowsAroundForELSWindows", "ColumnsAroundForELSWindows", "DatabaseFileName", "IsTextIDsOnly", "BundleFormat", \
+    "DirectoryOfCheckpoint", "IsResume", "SecondsOfTimeBudget", "MaxMatches")
+TupleOfOptionsOfPlan = ("ListOfStages", "ChunkSizeForELSSearch", "SecondsOfTimeBudget", "MaxMatches") ## Options THAT CHANGE THE SEARCH PLAN (session.fn_SearchPlan)
+
+## BEGIN FUNCTION () #7B #1 - SEARCH RESULTS CREATE - gso OF ONE SEARCH AS A DICT OF NUMBERS + STRINGS (FOR JSON)
+def fn_SearchResultsCreate(gso):
+
+    ## DECLARE VARIABLES
+    ListOfTerms = [{"TermNumber": ELSSearchTermNumber, "Term": gso.DictOfSearchTermsWithSpaces[ELSSearchTermNumber], "Positive": EachELSObject.NMP, "Negative": EachELSObject.NMN} for ELSSearchTermNumber, EachELSObject in gso.DELSO.items()]
+    ListOfMatches = []
+
+    ## BEGIN FOR LOOP - EACH ELS MATCH BY FIRST LETTER (POSITIVE, THEN NEGATIVE); SAME ORDER AS THE MatchIDs OF THE FILES
+    ## (ndk, GematriaValues, WordGematriaNumberValue, Term, WordNumber, WordCoordinatesDWTK, WORD ID, LetterPositionInWord, LetterCoordinatesD5K, VERSE ID)
+    for EachTupleOfMatch in (gso.LTM4ELS_LF_POS or []) + (gso.LTM4ELS_LF_NEG or []):
+
+        n, d, k = EachTupleOfMatch[0]
+        LetterCoordinatesD5K = EachTupleOfMatch[8]
+        ListOfMatches.append({"Term": EachTupleOfMatch[3], "N": int(n), "D": int(d), "K": int(k), \
+            "Book": int(LetterCoordinatesD5K[0]), "Chapter": int(LetterCoordinatesD5K[1]), "Verse": int(LetterCoordinatesD5K[2]), \
+            "WordNumber": int(EachTupleOfMatch[4]), "Word": gso.DW[EachTupleOfMatch[6]][0], "LetterPositionInWord": int(EachTupleOfMatch[7])})
+
+    ## END FOR LOOP
+
+    ## RETURN VARIABLES
+    return({"LengthOfText": gso.LengthOfTextToSearch, "XW": gso.XW, "YH": gso.YH, \
+        "SkipDistanceDMinimum": gso.SkipDistanceDMinimum, "SkipDistanceDMaximum": gso.SkipDistanceDMaximum, "Outputs": sorted(gso.SetOfOutputs), \
+        "Terms": ListOfTerms, "Matches": ListOfMatches, "Coverage": gso.DictOfCoverage, "RunID": gso.RunID, "Bundle": gso.FileNameForBundle})
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #7B #2 - SEARCH JOB CHECK - RAISES ValueError IF A KEY IS MISSING OR AN OPTION IS UNKNOWN; ## RETURNS DictOfOptions
+def fn_SearchJobCheck(DictOfJob):
+
+    ## IF THE JOB IS NOT COMPLETE
+    for EachKey in TupleOfKeysOfJobRequired:
+        if EachKey not in DictOfJob:
+            raise ValueError(f"Search job has no '{EachKey}' (needs: {', '.join(TupleOfKeysOfJobRequired)})")
+
+    ## IF AN OPTION IS UNKNOWN
+    DictOfOptions = DictOfJob.get("Options") or {}
+    for EachOption in DictOfOptions:
+        if EachOption not in TupleOfOptionsOfJob:
+            raise ValueError(f"Unknown option: '{EachOption}' (choose from: {', '.join(TupleOfOptionsOfJob)})")
+
+    ## RETURN VARIABLES
+    return(DictOfOptions)
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #7B #3 - SEARCH JOB PLAN - ESTIMATE OF ONE SEARCH JOB (MODULE.FUNCTION() #22E) AGAINST THE CORPUS IN THE SESSION CACHE sc, WITHOUT SEARCHING; ## RETURNS DictOfPlan (+ Text OF THE PLAN)
+def fn_SearchJobPlan(sc, DictOfJob):
+
+    ## DECLARE VARIABLES
+    DictOfOptions = fn_SearchJobCheck(DictOfJob)
+
+    ## CORPUS FROM THE CACHE OR OPENED NOW (MODULE.FUNCTION() #7A)
+    session, IsOpenedNow = sc.fn_SessionGet(int(DictOfJob["Codex"]), int(DictOfJob["Text"]), DictOfJob.get("CustomCorpus"))
+
+    ## CALL MODULE.FUNCTION() #22E - ELS SEARCH PLAN CREATE
+    DictOfPlan = session.fn_SearchPlan(DictOfJob["ELSSearchTerms"], int(DictOfJob["SkipDistanceDMinimum"]), int(DictOfJob["SkipDistanceDMaximum"]), ListOfOutputs=DictOfJob.get("Outputs") or (), \
+        IsEngineChosenByPlan=True, **{EachOption: EachValue for EachOption, EachValue in DictOfOptions.items() if EachOption in TupleOfOptionsOfPlan})
+
+    ## RETURN VARIABLES
+    return(dict(DictOfPlan, Text=mod_22E_ELSSearchPlanCreate.fn_SearchPlanTextCreate(DictOfPlan), IsCorpusOpenedNow=IsOpenedNow))
+
+## END FUNCTION
+
+## BEGIN MAIN FUNCTION
+## FUNCTION () #7B #0 - SEARCH JOB RUN
+def fn_SearchJobRun(sc, DictOfJob, fn_EventSend, ct=None, DirectoryOfOutput=None):
+
+    """
+    ## MODULE.FUNCTION() #7B - SEARCH JOB RUN; ONE SEARCH JOB (DICT OF JSON) AGAINST THE CORPUS IN THE SESSION CACHE sc (OPENED ONCE, THEN KEPT); EACH LINE PRINTED MEANWHILE IS SENT TO fn_EventSend AS {"Event": "log", ...}, EACH PROGRESS EVENT OF THE SEARCH (MODULE.FUNCTION() #96) AS {"Event": "progress", ...}; ct (CANCEL TOKEN) STOPS THE ELS SEARCH WITH THE MATCHES FOUND SO FAR; DirectoryOfOutput: DIRECTORY OF THE FILES OF THE JOB (None == USER_GENERATED_FILES; NOT AN OPTION OF THE JOB, CLIENTS OF THE SERVER CANNOT CHOOSE IT); ONLY ONE JOB AT A TIME (sys.stdout IS SHARED); ## RETURNS DictOfResults
+    """
+
+    ## CALL MODULE.FUNCTION() #7B #2 - SEARCH JOB CHECK
+    DictOfOptions = fn_SearchJobCheck(DictOfJob)
+
+    ## DECLARE VARIABLES
+    TimeOfJobStart = time.time()
+    es = ES(fn_EventSend)
+
+    ## ALL PRINT OUTPUT OF THE PROGRAM GOES TO THE CLIENT AS EVENTS
+    with contextlib.redirect_stdout(es):
+
+        ## CORPUS FROM THE CACHE OR OPENED NOW (MODULE.FUNCTION() #7A)
+        session, IsOpenedNow = sc.fn_SessionGet(int(DictOfJob["Codex"]), int(DictOfJob["Text"]), DictOfJob.get("CustomCorpus"))
+        fn_EventSend({"Event": "corpus", "IsOpenedNow": IsOpenedNow, "LengthOfText": session.LengthOfTextToSearch})
+
+        ## ELS SEARCH + OUTPUT FILES OF THE JOB; PROGRESS EVENTS GO TO THE CLIENT AS THEY ARE (NOT AS LINES OF THE LOG); ENGINE CHOSEN BY THE PLAN (MODULE.FUNCTION() #22E) AS IN p.py
+        gso = session.fn_Search(DictOfJob["ELSSearchTerms"], int(DictOfJob["SkipDistanceDMinimum"]), int(DictOfJob["SkipDistanceDMaximum"]), int(DictOfJob.get("XW") or XWDefault), \
+            ListOfOutputs=DictOfJob.get("Outputs") or (), fn_ProgressEvent=fn_EventSend, ct=ct, IsEngineChosenByPlan=True, **DictOfOptions, **({"DirectoryOfOutput": DirectoryOfOutput} if DirectoryOfOutput is not None else {}))
+
+        es.flush()
+
+    ## RESULTS OF THE JOB
+    DictOfResults = dict(Codex=DictOfJob["Codex"], Text=DictOfJob["Text"], CustomCorpus=session.CustomCorpusSpec, IsCorpusOpenedNow=IsOpenedNow, \
+        **fn_SearchResultsCreate(gso), Seconds=round(time.time() - TimeOfJobStart, 3))
+
+    ## RETURN VARIABLES
+    return(DictOfResults)
+
+## END FUNCTION () #7B - SEARCH JOB RUN
@@ -0,0 +1,67 @@
+## IMPORT MODULES
+import json
+import urllib.error
+import urllib.request
+
+## DECLARE VARIABLES
+HostDefault = "127.0.0.1" ## SEARCH SERVER ONLY LISTENS ON THIS COMPUTER
+PortDefault = 8765
+
+## BEGIN FUNCTION () #7C #1 - SERVER IS RUNNING - ## RETURNS True IF THE SEARCH SERVER (python server.py) ANSWERS
+def fn_ServerIsRunning(Host=HostDefault, Port=PortDefault, Timeout=0.5):
+
+    try:
+        with urllib.request.urlopen(f"http://{Host}:{Port}/status", timeout=Timeout) as Response:
+            return(Response.status == 200)
+    except (OSError, urllib.error.URLError):
+        return(False)
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #7C #2 - SERVER STATUS GET - ## RETURNS DictOfStatus (CORPORA IN MEMORY, JOBS RUN)
+def fn_ServerStatusGet(Host=HostDefault, Port=PortDefault, Timeout=5):
+
+    with urllib.request.urlopen(f"http://{Host}:{Port}/status", timeout=Timeout) as Response:
+        return(json.loads(Response.read().decode("utf-8")))
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #7C #3 - SEARCH JOB CANCEL - STOPS THE RUNNING JOB OF THE SERVER; ITS CLIENT STILL GETS THE RESULT (MATCHES FOUND SO FAR + Coverage); ## RETURNS True IF A JOB WAS RUNNING
+def fn_SearchJobCancel(Host=HostDefault, Port=PortDefault, Timeout=5):
+
+    Request = urllib.request.Request(f"http://{Host}:{Port}/cancel", data=b"", method="POST")
+    with urllib.request.urlopen(Request, timeout=Timeout) as Response:
+        return(json.loads(Response.read().decode("utf-8"))["IsCancelled"])
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #7C #4 - SEARCH JOB PLAN - ESTIMATE OF ONE SEARCH JOB BY THE SERVER (MODULE.FUNCTION() #22E), NOTHING SEARCHED; ## RETURNS DictOfPlan (+ Text OF THE PLAN)
+def fn_SearchJobPlan(DictOfJob, Host=HostDefault, Port=PortDefault, Timeout=None):
+
+    Request = urllib.request.Request(f"http://{Host}:{Port}/plan", data=json.dumps(DictOfJob, ensure_ascii=False).encode("utf-8"), headers={"Content-Type": "application/json"}, method="POST")
+    try:
+        with urllib.request.urlopen(Request, timeout=Timeout) as Response:
+            return(json.loads(Response.read().decode("utf-8")))
+    except urllib.error.HTTPError as e:
+        raise ValueError(json.loads(e.read().decode("utf-8"))["Message"])
+
+## END FUNCTION
+
+## BEGIN MAIN FUNCTION
+## FUNCTION () #7C #0 - SEARCH JOB SEND
+def fn_SearchJobSend(DictOfJob, Host=HostDefault, Port=PortDefault, Timeout=None):
+
+    """
+    ## MODULE.FUNCTION() #7C - SEARCH JOB SEND; POSTS ONE SEARCH JOB (SEE MODULE.FUNCTION() #7B) TO THE SEARCH SERVER; YIELDS EACH EVENT (DICT) AS IT ARRIVES: log, corpus, ..., LAST: result OR error
+    """
+
+    ## DECLARE VARIABLES
+    Request = urllib.request.Request(f"http://{Host}:{Port}/search", data=json.dumps(DictOfJob, ensure_ascii=False).encode("utf-8"), headers={"Content-Type": "application/json"}, method="POST")
+
+    ## ONE JSON EVENT PER LINE
+    with urllib.request.urlopen(Request, timeout=Timeout) as Response:
+        for EachLine in Response:
+            if EachLine.strip():
+                yield json.loads(EachLine.decode("utf-8"))
+
+## END FUNCTION () #7C - SEARCH JOB SEND
@@ -0,0 +1,276 @@
+## IMPORT MODULES
+import concurrent.futures
+import contextlib
+import csv
+import json
+import os
+import shutil
+import time
+
+import mod_7A_CorpusOpen ## MODULE.FUNCTION() #7A - CORPUS OPEN (NUMBER OF TEXT OF A CUSTOM CORPUS)
+import mod_7B_SearchJobRun ## MODULE.FUNCTION() #7B - SEARCH JOB RUN; ## RETURNS DictOfResults
+
+from mod_cls_SessionCache import cls_SessionCache as SESSIONCACHE
+
+## DECLARE VARIABLES
+## JOB FILE: .jsonl == ONE SEARCH JOB (JSON, SEE mod_7B_SearchJobRun.py) PER LINE, OPTIONAL "JobID"; .csv == ONE JOB PER ROW, DELIMITER ';' (SAME AS THE CSV FILES IN USER_GENERATED_FILES):
+## JobID;Codex;Text;CustomCorpus;ELSSearchTerms;SkipDistanceDMinimum;SkipDistanceDMaximum;XW;Outputs
+## messiah_gen;2;1;;משיח,תורה;-100;100;50;summary,matches
+## BATCH DIRECTORY: ONE DIRECTORY PER JOB (FILES OF THE JOB + JOB.json + RESULT.json + LOG.txt) + BATCH_SUMMARY.json + BATCH_TIMING.csv + ONE LOG PER TASK (CORPUS OPEN)
+TupleOfColumnsOfJobFile = ("JobID", "Codex", "Text", "CustomCorpus", "ELSSearchTerms", "SkipDistanceDMinimum", "SkipDistanceDMaximum", "XW", "Outputs")
+FileNameForBatchSummary = "BATCH_SUMMARY.json"
+FileNameForBatchTiming = "BATCH_TIMING.csv"
+
+## BEGIN FUNCTION () #7D #1 - JOB FILE READ - JOBS OF A .jsonl OR .csv FILE; ## RETURNS ListOfJobs (DICTS OF #7B + JobID)
+def fn_JobFileRead(FileNameOfJobs):
+
+    ## DECLARE VARIABLES
+    ListOfJobs = []
+
+    ## BEGIN IF / ELSE - CSV OR JSON LINES
+    with open(FileNameOfJobs, encoding="utf-8-sig", newline="") as File:
+
+        if FileNameOfJobs.lower().endswith(".csv"):
+
+            ReaderOfCSV = csv.DictReader(File, delimiter=";")
+
+            ## IF A COLUMN NEEDED IS MISSING (JobID, CustomCorpus, XW, Outputs ARE OPTIONAL)
+            ListOfColumnsMissing = [EachColumn for EachColumn in TupleOfColumnsOfJobFile if EachColumn in mod_7B_SearchJobRun.TupleOfKeysOfJobRequired and EachColumn not in (ReaderOfCSV.fieldnames or ())]
+            if ListOfColumnsMissing:
+                raise ValueError(f"Job file {FileNameOfJobs} has no column(s): {', '.join(ListOfColumnsMissing)} (columns: {';'.join(TupleOfColumnsOfJobFile)})")
+
+            for EachRow in ReaderOfCSV:
+                ListOfJobs.append({"JobID": EachRow.get("JobID") or None, "Codex": int(EachRow["Codex"]), "Text": int(EachRow["Text"]), "CustomCorpus": EachRow.get("CustomCorpus") or None, \
+                    "ELSSearchTerms": [EachTerm.strip() for EachTerm in EachRow["ELSSearchTerms"].split(",") if EachTerm.strip()], \
+                    "SkipDistanceDMinimum": int(EachRow["SkipDistanceDMinimum"]), "SkipDistanceDMaximum": int(EachRow["SkipDistanceDMaximum"]), \
+                    "XW": int(EachRow.get("XW") or mod_7B_SearchJobRun.XWDefault), "Outputs": [EachOutput for EachOutput in (EachRow.get("Outputs") or "").split(",") if EachOutput]})
+
+        else:
+
+            for EachLine in File:
+                if EachLine.strip():
+                    ListOfJobs.append(json.loads(EachLine))
+
+    ## END IF / ELSE
+
+    ## JOB IDS: JOB_0001, JOB_0002, ... IF NOT GIVEN; ALSO THE NAME OF THE DIRECTORY OF THE JOB
+    for NumberOfJob, DictOfJob in enumerate(ListOfJobs, 1):
+        DictOfJob["JobID"] = str(DictOfJob.get("JobID") or f"JOB_{NumberOfJob:04d}")
+
+    ## IF A JOB ID IS NOT A NAME OF A DIRECTORY
+    for DictOfJob in ListOfJobs:
+        if DictOfJob["JobID"] in (".", "..") or "/" in DictOfJob["JobID"] or os.sep in DictOfJob["JobID"]:
+            raise ValueError(f"Job ID '{DictOfJob['JobID']}' is not a name of a directory")
+
+    ## IF TWO JOBS HAVE THE SAME JOB ID
+    ListOfJobIDs = [DictOfJob["JobID"] for DictOfJob in ListOfJobs]
+    if len(set(ListOfJobIDs)) != len(ListOfJobIDs):
+        raise ValueError(f"Job IDs are not unique in {FileNameOfJobs}: " + ", ".join(sorted({EachJobID for EachJobID in ListOfJobIDs if ListOfJobIDs.count(EachJobID) > 1})))
+
+    ## RETURN VARIABLES
+    return(ListOfJobs)
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #7D #2 - JOB KEYS CREATE - SAME CORPUS (CODEX, TEXT, SPEC) + SAME SEARCH (TERMS, SKIP DISTANCES, XW, OUTPUTS, OPTIONS); ## RETURNS KeyOfCorpus, KeyOfSearch
+def fn_JobKeysCreate(DictOfJob):
+
+    ## SPEC ONLY COUNTS FOR A CUSTOM CORPUS (SAME AS THE SESSION CACHE)
+    KeyOfCorpus = (int(DictOfJob["Codex"]), int(DictOfJob["Text"]), DictOfJob.get("CustomCorpus") if int(DictOfJob["Text"]) == mod_7A_CorpusOpen.NumberOfTextCustomCorpus else None)
+    KeyOfSearch = json.dumps([KeyOfCorpus, DictOfJob["ELSSearchTerms"], int(DictOfJob["SkipDistanceDMinimum"]), int(DictOfJob["SkipDistanceDMaximum"]), \
+        int(DictOfJob.get("XW") or mod_7B_SearchJobRun.XWDefault), sorted(DictOfJob.get("Outputs") or ()), DictOfJob.get("Options") or {}], ensure_ascii=False, sort_keys=True)
+
+    ## RETURN VARIABLES
+    return(KeyOfCorpus, KeyOfSearch)
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #7D #3 - TASKS CREATE - JOBS OF THE SAME CORPUS IN ONE TASK (THE CORPUS IS OPENED ONCE PER TASK); WHILE THERE ARE FEWER TASKS THAN WORKERS, THE TASK WITH THE MOST JOBS IS SPLIT IN TWO; ## RETURNS ListOfTasks (LISTS OF JOBS)
+def fn_TasksCreate(ListOfJobs, NumberOfWorkers):
+
+    ## DECLARE VARIABLES
+    DictOfTasks = {}
+
+    ## JOBS BY CORPUS, IN ORDER OF THE JOB FILE
+    for DictOfJob in ListOfJobs:
+        DictOfTasks.setdefault(fn_JobKeysCreate(DictOfJob)[0], []).append(DictOfJob)
+
+    ListOfTasks = list(DictOfTasks.values())
+
+    ## BEGIN WHILE LOOP - IDLE WORKERS: SPLIT THE LARGEST TASK (ITS CORPUS IS OPENED BY ONE MORE WORKER)
+    while len(ListOfTasks) < NumberOfWorkers and max(len(EachTask) for EachTask in ListOfTasks) > 1:
+        EachTask = max(ListOfTasks, key=len)
+        ListOfTasks.remove(EachTask)
+        ListOfTasks += [EachTask[:len(EachTask) // 2], EachTask[len(EachTask) // 2:]]
+    ## END WHILE LOOP
+
+    ## LARGEST TASKS FIRST (BEST USE OF THE WORKERS)
+    ListOfTasks.sort(key=lambda EachTask: -sum(len(DictOfJob["ELSSearchTerms"]) * (int(DictOfJob["SkipDistanceDMaximum"]) - int(DictOfJob["SkipDistanceDMinimum"]) + 1) for DictOfJob in EachTask))
+
+    ## RETURN VARIABLES
+    return(ListOfTasks)
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #7D #4 - TASK RUN - IN A WORKER PROCESS: OPENS THE CORPUS ONCE, THEN RUNS EACH JOB IN ITS OWN DIRECTORY; ## RETURNS ListOfRows (ONE DICT PER JOB FOR THE SUMMARY)
+def fn_TaskRun(NumberOfTask, ListOfJobs, DirectoryOfBatch):
+
+    ## DECLARE VARIABLES
+    sc = SESSIONCACHE(MaxSessions=1)
+    ListOfRows = []
+
+    ## LOG OF THE TASK (CORPUS OPEN); THE LOG OF EACH JOB GOES TO ITS OWN DIRECTORY
+    with open(os.path.join(DirectoryOfBatch, f"TASK_{NumberOfTask:03d}.log"), "w", encoding="utf-8") as FileOfLog, contextlib.redirect_stdout(FileOfLog), contextlib.redirect_stderr(FileOfLog):
+
+        ## BEGIN FOR LOOP - EACH JOB OF THE TASK
+        for DictOfJob in ListOfJobs:
+
+            DirectoryOfJob = os.path.join(DirectoryOfBatch, DictOfJob["JobID"])
+            DictOfRow = {"JobID": DictOfJob["JobID"], "Codex": DictOfJob["Codex"], "Text": DictOfJob["Text"], "CustomCorpus": DictOfJob.get("CustomCorpus"), \
+                "ELSSearchTerms": DictOfJob["ELSSearchTerms"], "SkipDistanceDMinimum": DictOfJob["SkipDistanceDMinimum"], "SkipDistanceDMaximum": DictOfJob["SkipDistanceDMaximum"], \
+                "Task": NumberOfTask, "Worker": os.getpid(), "Directory": DictOfJob["JobID"], "DuplicateOf": None}
+
+            ## BEGIN TRY / EXCEPT - A FAILED JOB DOES NOT STOP THE OTHER JOBS
+            try:
+
+                os.makedirs(DirectoryOfJob, exist_ok=True)
+                with open(os.path.join(DirectoryOfJob, "JOB.json"), "w", encoding="utf-8") as File:
+                    json.dump(DictOfJob, File, ensure_ascii=False, indent=2)
+
+                ## CORPUS OPENED ONCE PER TASK (READS texts/ FROM THE DIRECTORY OF THE PROGRAM) + ITS DATA OBJECTS + SEARCH OBJECTS (FIRST SEARCH OF A SESSION ONLY; TIMED HERE, NOT AS PART OF THE SEARCH)
+                TimeStart = time.time()
+                session, IsOpenedNow = sc.fn_SessionGet(int(DictOfJob["Codex"]), int(DictOfJob["Text"]), DictOfJob.get("CustomCorpus"))
+                _ = session.fn_DataObjectsGet(), session.fn_SearchObjectsGet()
+                DictOfRow.update(IsCorpusOpenedNow=IsOpenedNow, SecondsCorpusOpen=round(time.time() - TimeStart, 3))
+
+                ## FILES OF THE JOB ARE WRITTEN STRAIGHT INTO THE DIRECTORY OF THE JOB; A RELATIVE DirectoryOfCheckpoint / DatabaseFileName OF THE JOB IS IN IT TOO
+                DictOfJobToRun = {EachKey: EachValue for EachKey, EachValue in DictOfJob.items() if EachKey != "JobID"}
+                DictOfJobToRun["Options"] = {EachOption: os.path.join(DirectoryOfJob, EachValue) if EachOption in ("DirectoryOfCheckpoint", "DatabaseFileName") and EachValue else EachValue \
+                    for EachOption, EachValue in (DictOfJob.get("Options") or {}).items()}
+                with open(os.path.join(DirectoryOfJob, "LOG.txt"), "w", encoding="utf-8") as FileOfJobLog:
+                    DictOfResults = mod_7B_SearchJobRun.fn_SearchJobRun(sc, DictOfJobToRun, lambda DictOfEvent: FileOfJobLog.write(DictOfEvent["Line"] + "\n") if DictOfEvent["Event"] == "log" else None, \
+                        DirectoryOfOutput=DirectoryOfJob)
+
+                with open(os.path.join(DirectoryOfJob, "RESULT.json"), "w", encoding="utf-8") as File:
+                    json.dump(DictOfResults, File, ensure_ascii=False, indent=2)
+
+                DictOfRow.update(Status="done", SecondsSearch=round(DictOfResults["Seconds"], 3), IsComplete=DictOfResults["Coverage"]["IsComplete"], \
+                    Matches={EachTerm["Term"]: {"Positive": EachTerm["Positive"], "Negative": EachTerm["Negative"]} for EachTerm in DictOfResults["Terms"]})
+
+            except Exception as e:
+
+                DictOfRow.update(Status="error", Error=f"{type(e).__name__}: {e}")
+                print(f"JOB {DictOfJob['JobID']} FAILED: {type(e).__name__}: {e}")
+
+            ## END TRY / EXCEPT
+
+            ListOfRows.append(DictOfRow)
+
+        ## END FOR LOOP
+
+    ## RETURN VARIABLES
+    return(ListOfRows)
+
+## END FUNCTION
+
+## BEGIN MAIN FUNCTION
+## FUNCTION () #7D #0 - BATCH JOBS RUN
+def fn_BatchJobsRun(FileNameOfJobs, DirectoryOfBatch, NumberOfWorkers=None):
+
+    """
+    ## MODULE.FUNCTION() #7D - BATCH JOBS RUN; READS THE JOBS OF FileNameOfJobs (.jsonl / .csv), RUNS EACH DIFFERENT SEARCH ONCE (A DUPLICATE JOB GETS A COPY OF THE FILES OF THE FIRST), JOBS OF THE SAME CORPUS IN ONE TASK (CORPUS OPENED ONCE PER TASK),
+    ## TASKS IN NumberOfWorkers PROCESSES (DEFAULT: NUMBER OF CPUS); WRITES BATCH_SUMMARY.json + BATCH_TIMING.csv TO DirectoryOfBatch; ## RETURNS DictOfSummary
+    """
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  BEGIN FUNCTION #7D - BATCH JOBS RUN")
+
+    ## DECLARE VARIABLES
+    TimeOfBatchStart = time.time()
+    DirectoryOfBatch = os.path.abspath(DirectoryOfBatch)
+    ListOfJobs = fn_JobFileRead(FileNameOfJobs)
+    NumberOfWorkers = NumberOfWorkers or os.cpu_count() or 1
+    DictOfJobsFirst = {} ## KEY IS KeyOfSearch; VALUE: JobID OF THE FIRST JOB OF THIS SEARCH
+    DictOfDuplicates = {} ## KEY IS JobID OF A DUPLICATE JOB; VALUE: JobID OF THE FIRST JOB OF THE SAME SEARCH
+    ListOfJobsToRun = []
+    DictOfRows = {}
+
+    ## IF THE BATCH DIRECTORY HAS A BATCH ALREADY
+    if os.path.exists(os.path.join(DirectoryOfBatch, FileNameForBatchSummary)):
+        raise ValueError(f"{DirectoryOfBatch} has a batch already ({FileNameForBatchSummary}); choose another directory")
+
+    os.makedirs(DirectoryOfBatch, exist_ok=True)
+
+    ## BEGIN FOR LOOP - EACH DIFFERENT SEARCH IS RUN ONCE
+    for DictOfJob in ListOfJobs:
+        KeyOfSearch = fn_JobKeysCreate(DictOfJob)[1]
+        if KeyOfSearch in DictOfJobsFirst:
+            DictOfDuplicates[DictOfJob["JobID"]] = DictOfJobsFirst[KeyOfSearch]
+        else:
+            DictOfJobsFirst[KeyOfSearch] = DictOfJob["JobID"]
+            ListOfJobsToRun.append(DictOfJob)
+    ## END FOR LOOP
+
+    ## CALL MODULE.FUNCTION() #7D #3 - TASKS CREATE
+    ListOfTasks = fn_TasksCreate(ListOfJobsToRun, NumberOfWorkers) if ListOfJobsToRun else []
+
+    ## TEST PRINT OUTPUT
+    print(f"{len(ListOfJobs)} jobs: {len(ListOfJobsToRun)} to run, {len(DictOfDuplicates)} duplicates; {len(ListOfTasks)} tasks on {min(NumberOfWorkers, len(ListOfTasks))} workers")
+
+    ## BEGIN WITH - EACH TASK IN A WORKER PROCESS; ROWS OF THE SUMMARY AS EACH TASK ENDS
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max(1, min(NumberOfWorkers, len(ListOfTasks)))) as Executor:
+
+        ListOfFutures = [Executor.submit(fn_TaskRun, NumberOfTask, EachTask, DirectoryOfBatch) for NumberOfTask, EachTask in enumerate(ListOfTasks, 1)]
+
+        for EachFuture in concurrent.futures.as_completed(ListOfFutures):
+            for DictOfRow in EachFuture.result():
+                DictOfRows[DictOfRow["JobID"]] = DictOfRow
+                print(f"{DictOfRow['JobID']}: {DictOfRow['Status']}" + (f" in {DictOfRow['SecondsSearch']} s" if DictOfRow["Status"] == "done" else f" ({DictOfRow['Error']})"))
+
+    ## END WITH
+
+    ## BEGIN FOR LOOP - DUPLICATE JOBS: COPY OF THE DIRECTORY OF THE FIRST JOB (JOB.json OF THE DUPLICATE)
+    for EachJobID, JobIDFirst in DictOfDuplicates.items():
+
+        DictOfJob = next(DictOfJob for DictOfJob in ListOfJobs if DictOfJob["JobID"] == EachJobID)
+        DictOfRows[EachJobID] = dict(DictOfRows[JobIDFirst], JobID=EachJobID, Directory=EachJobID, DuplicateOf=JobIDFirst, IsCorpusOpenedNow=False, SecondsCorpusOpen=0.0, SecondsSearch=0.0)
+
+        if os.path.isdir(os.path.join(DirectoryOfBatch, JobIDFirst)):
+            shutil.copytree(os.path.join(DirectoryOfBatch, JobIDFirst), os.path.join(DirectoryOfBatch, EachJobID), dirs_exist_ok=True)
+            with open(os.path.join(DirectoryOfBatch, EachJobID, "JOB.json"), "w", encoding="utf-8") as File:
+                json.dump(DictOfJob, File, ensure_ascii=False, indent=2)
+
+    ## END FOR LOOP
+
+    ## ROWS IN ORDER OF THE JOB FILE
+    ListOfRows = [DictOfRows[DictOfJob["JobID"]] for DictOfJob in ListOfJobs]
+    DictOfSummary = {"JobFile": os.path.abspath(FileNameOfJobs), "Started": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(TimeOfBatchStart)), "Seconds": round(time.time() - TimeOfBatchStart, 3), \
+        "Workers": min(NumberOfWorkers, len(ListOfTasks)), "NumberOfJobs": len(ListOfJobs), "NumberOfJobsRun": len(ListOfJobsToRun), "NumberOfJobsDuplicate": len(DictOfDuplicates), \
+        "NumberOfJobsFailed": sum(DictOfRow["Status"] == "error" for DictOfRow in ListOfRows), "NumberOfCorpora": len({fn_JobKeysCreate(DictOfJob)[0] for DictOfJob in ListOfJobs}), \
+        "NumberOfCorpusOpens": sum(bool(DictOfRow.get("IsCorpusOpenedNow")) for DictOfRow in ListOfRows), \
+        "SecondsCorpusOpen": round(sum(DictOfRow.get("SecondsCorpusOpen") or 0 for DictOfRow in ListOfRows), 3), "SecondsSearch": round(sum(DictOfRow.get("SecondsSearch") or 0 for DictOfRow in ListOfRows), 3), \
+        "Jobs": ListOfRows}
+
+    ## WRITE BATCH SUMMARY + TIMING REPORT (ONE ROW PER JOB)
+    with open(os.path.join(DirectoryOfBatch, FileNameForBatchSummary), "w", encoding="utf-8") as File:
+        json.dump(DictOfSummary, File, ensure_ascii=False, indent=2)
+
+    with open(os.path.join(DirectoryOfBatch, FileNameForBatchTiming), "w", encoding="utf-8", newline="") as File:
+        f_csv = csv.writer(File, delimiter=";")
+        f_csv.writerow(["JobID", "Status", "DuplicateOf", "Task", "Worker", "IsCorpusOpenedNow", "SecondsCorpusOpen", "SecondsSearch", "Matches"])
+        f_csv.writerows([DictOfRow["JobID"], DictOfRow["Status"], DictOfRow["DuplicateOf"] or "", DictOfRow["Task"], DictOfRow["Worker"], DictOfRow.get("IsCorpusOpenedNow", ""), \
+            DictOfRow.get("SecondsCorpusOpen", ""), DictOfRow.get("SecondsSearch", ""), sum(EachCount["Positive"] + EachCount["Negative"] for EachCount in (DictOfRow.get("Matches") or {}).values())] for DictOfRow in ListOfRows)
+
+    ## TEST PRINT OUTPUT
+    print(f"Batch done in {DictOfSummary['Seconds']} s: {DictOfSummary['NumberOfJobsRun']} run, {DictOfSummary['NumberOfJobsDuplicate']} duplicates, {DictOfSummary['NumberOfJobsFailed']} failed; {DictOfSummary['NumberOfCorpusOpens']} corpus opens for {DictOfSummary['NumberOfCorpora']} corpora")
+    print(f"Summary: {os.path.join(DirectoryOfBatch, FileNameForBatchSummary)}; timing: {os.path.join(DirectoryOfBatch, FileNameForBatchTiming)}")
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  END FUNCTION #7D - BATCH JOBS RUN")
+
+    ## RETURN VARIABLES
+    return(DictOfSummary)
+
+## END FUNCTION () #7D - BATCH JOBS RUN
@@ -0,0 +1,98 @@
+## IMPORT MODULES
+import hashlib
+import json
+import os
+
+import mod_7B_SearchJobRun ## MODULE.FUNCTION() #7B - SEARCH JOB RUN (KEYS OF A SEARCH JOB)
+
+## DECLARE VARIABLES
+## SEARCH SPEC == ONE SEARCH JOB (JSON, SEE mod_7B_SearchJobRun.py); SHARD SPEC FILE (ONE PER SHARD, RUN ANYWHERE WITH: python shard.py run SHARD_001_OF_004.json):
+## {"Shard": {"SpecID": "3f0c9a1b27de", "Number": 1, "Of": 4, "TermNumbers": [1], "SkipDistanceDMinimum": -100, "SkipDistanceDMaximum": -51}, "Spec": {...}, "Job": {... ONLY THE TERMS + SKIP DISTANCES OF THE SHARD ...}}
+VersionOfShard = 1
+
+## BEGIN FUNCTION () #7E #1 - SPEC ID CREATE - SAME SEARCH == SAME ID (ORDER OF KEYS DOES NOT COUNT); ## RETURNS SpecID
+def fn_SpecIDCreate(DictOfSpec):
+
+    ## RETURN VARIABLES
+    return(hashlib.sha256(json.dumps(DictOfSpec, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()[:12])
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #7E #2 - RANGE SPLIT - dFrom - dTo IN NumberOfParts CONSECUTIVE RANGES OF (ALMOST) THE SAME SIZE; ## RETURNS ListOfRanges
+def fn_RangeSplit(dFrom, dTo, NumberOfParts):
+
+    ## DECLARE VARIABLES
+    NumberOfD = dTo - dFrom + 1
+
+    ## RETURN VARIABLES
+    return([[dFrom + (NumberOfD * EachPart) // NumberOfParts, dFrom + (NumberOfD * (EachPart + 1)) // NumberOfParts - 1] for EachPart in range(NumberOfParts)])
+
+## END FUNCTION
+
+## BEGIN MAIN FUNCTION
+## FUNCTION () #7E #0 - SHARD SPECS CREATE
+def fn_ShardSpecsCreate(DictOfSpec, NumberOfShards, DirectoryOfShards=None):
+
+    """
+    ## MODULE.FUNCTION() #7E - SHARD SPECS CREATE; SPLITS ONE SEARCH SPEC INTO NumberOfShards SHARDS: THE ELS SEARCH TERMS IN G GROUPS x THE SKIP DISTANCES IN NumberOfShards / G RANGES (G == LARGEST DIVISOR OF NumberOfShards NOT MORE THAN THE NUMBER OF TERMS);
+    ## EVERY (TERM, d) IS IN EXACTLY ONE SHARD; THE SAME SPEC + NumberOfShards ALWAYS GIVES THE SAME SHARDS; WRITES SHARD_nnn_OF_NNN.json TO DirectoryOfShards (IF GIVEN); ## RETURNS ListOfShardSpecs
+    """
+
+    ## IF THE SPEC IS NOT COMPLETE
+    for EachKey in mod_7B_SearchJobRun.TupleOfKeysOfJobRequired:
+        if EachKey not in DictOfSpec:
+            raise ValueError(f"Search spec has no '{EachKey}' (needs: {', '.join(mod_7B_SearchJobRun.TupleOfKeysOfJobRequired)})")
+
+    ## IF THE SPEC WOULD STOP BEFORE EVERY d IS SEARCHED (THE MERGE NEEDS EVERY d OF EVERY TERM)
+    for EachOption in ("SecondsOfTimeBudget", "MaxMatches"):
+        if (DictOfSpec.get("Options") or {}).get(EachOption) is not None:
+            raise ValueError(f"A sharded search searches every skip distance; remove '{EachOption}' from the Options of the spec")
+
+    ## DECLARE VARIABLES
+    DictOfSpec = {EachKey: EachValue for EachKey, EachValue in DictOfSpec.items() if EachKey != "JobID"}
+    SpecID = fn_SpecIDCreate(DictOfSpec)
+    ListOfTermNumbers = list(range(1, len(DictOfSpec["ELSSearchTerms"]) + 1)) ## 1-BASED, SAME AS DictOfSearchTermsWithSpaces OF THE WHOLE SEARCH
+    SkipDistanceDMinimum, SkipDistanceDMaximum = int(DictOfSpec["SkipDistanceDMinimum"]), int(DictOfSpec["SkipDistanceDMaximum"])
+    ListOfShardSpecs = []
+
+    ## IF THE SHARDS CANNOT ALL HAVE A TERM + A SKIP DISTANCE
+    if not 1 <= NumberOfShards <= len(ListOfTermNumbers) * (SkipDistanceDMaximum - SkipDistanceDMinimum + 1):
+        raise ValueError(f"Number of shards must be 1 - {len(ListOfTermNumbers) * (SkipDistanceDMaximum - SkipDistanceDMinimum + 1)} (terms x skip distances), not {NumberOfShards}")
+
+    ## GROUPS OF TERMS x RANGES OF SKIP DISTANCES; SPLITTING THE TERMS FIRST KEEPS EACH TERM'S SKIP DISTANCES TOGETHER
+    NumberOfGroups = max(EachDivisor for EachDivisor in range(1, min(NumberOfShards, len(ListOfTermNumbers)) + 1) if NumberOfShards % EachDivisor == 0)
+    NumberOfRanges = NumberOfShards // NumberOfGroups
+
+    ## IF A RANGE WOULD HAVE NO SKIP DISTANCE
+    if NumberOfRanges > SkipDistanceDMaximum - SkipDistanceDMinimum + 1:
+        raise ValueError(f"{NumberOfShards} shards need {NumberOfRanges} ranges of skip distances, but there are only {SkipDistanceDMaximum - SkipDistanceDMinimum + 1}; use fewer shards")
+
+    ListOfGroupsOfTerms = [ListOfTermNumbers[(len(ListOfTermNumbers) * EachGroup) // NumberOfGroups:(len(ListOfTermNumbers) * (EachGroup + 1)) // NumberOfGroups] for EachGroup in range(NumberOfGroups)]
+
+    ## BEGIN FOR LOOP - EACH GROUP OF TERMS x EACH RANGE OF SKIP DISTANCES
+    for ListOfTermNumbersOfShard in ListOfGroupsOfTerms:
+        for dFrom, dTo in fn_RangeSplit(SkipDistanceDMinimum, SkipDistanceDMaximum, NumberOfRanges):
+
+            NumberOfShard = len(ListOfShardSpecs) + 1
+            DictOfJob = dict(DictOfSpec, ELSSearchTerms=[DictOfSpec["ELSSearchTerms"][EachTermNumber - 1] for EachTermNumber in ListOfTermNumbersOfShard], SkipDistanceDMinimum=dFrom, SkipDistanceDMaximum=dTo)
+            ListOfShardSpecs.append({"Shard": {"Version": VersionOfShard, "SpecID": SpecID, "Number": NumberOfShard, "Of": NumberOfShards, "TermNumbers": ListOfTermNumbersOfShard, \
+                "SkipDistanceDMinimum": dFrom, "SkipDistanceDMaximum": dTo}, "Spec": DictOfSpec, "Job": DictOfJob})
+
+    ## END FOR LOOP
+
+    ## WRITE ONE FILE PER SHARD
+    if DirectoryOfShards is not None:
+        os.makedirs(DirectoryOfShards, exist_ok=True)
+        Width = len(str(NumberOfShards))
+        for DictOfShardSpec in ListOfShardSpecs:
+            DictOfShardSpec["FileName"] = os.path.join(DirectoryOfShards, f"SHARD_{DictOfShardSpec['Shard']['Number']:0{max(3, Width)}d}_OF_{NumberOfShards:0{max(3, Width)}d}.json")
+            with open(DictOfShardSpec["FileName"], "w", encoding="utf-8") as File:
+                json.dump({EachKey: EachValue for EachKey, EachValue in DictOfShardSpec.items() if EachKey != "FileName"}, File, ensure_ascii=False, indent=2)
+
+    ## TEST PRINT OUTPUT
+    print(f"Spec {SpecID}: {len(ListOfTermNumbers)} terms x skip distances {SkipDistanceDMinimum} - {SkipDistanceDMaximum} in {NumberOfShards} shards ({NumberOfGroups} groups of terms x {NumberOfRanges} ranges)")
+
+    ## RETURN VARIABLES
+    return(ListOfShardSpecs)
+
+## END FUNCTION () #7E - SHARD SPECS CREATE
@@ -0,0 +1,135 @@
+## IMPORT MODULES
+import json
+import os
+import platform
+import shutil
+import tempfile
+import time
+
+import mod_7A_CorpusOpen ## MODULE.FUNCTION() #7A - CORPUS OPEN; ## RETURNS session (SESSION OBJECT)
+import mod_7B_SearchJobRun ## MODULE.FUNCTION() #7B - SEARCH JOB RUN (KEYS + OPTIONS OF A SEARCH JOB)
+import mod_7E_ShardSpecsCreate ## MODULE.FUNCTION() #7E - SHARD SPECS CREATE (SPEC ID)
+import mod_cls_Checkpoint ## CHECKPOINT FILE NAME
+import mod_97_OutputPlanCreate ## MODULE.FUNCTION() #97 - OUTPUT PLAN CREATE; ## RETURNS SetOfOutputs, SetOfStages
+
+from mod_cls_Checkpoint import cls_Checkpoint as CKPT
+
+## DECLARE VARIABLES
+## SHARD RESULT FILE (JSON): EVERYTHING THE MERGE NEEDS, NOTHING OF THE MACHINE IT RAN ON EXCEPT Host + Started (FOR THE LOG)
+## {"ShardResult": 1, "SpecID": "3f0c9a1b27de", "Shard": {...}, "Spec": {...}, "Corpus": {"Codex": 2, "Text": 1, "CustomCorpus": null, "LengthOfText": 78064}, "Stages": ["SearchByLetterFirst", "SearchByLetterLast"],
+##  "Coverage": [{"TermNumber": 1, "Term": "משיח", "DRangesDone": [[-100, -51]]}], "Units": [{"Stage": "SearchByLetterFirst", "TermNumber": 1, "DRange": [-100, -51], "Matches": [[6021, -99], ...]}], ...}
+VersionOfShardResult = 1
+TupleOfOptionsOfShard = ("ChunkSizeForELSSearch",) ## Options OF THE SPEC THAT CHANGE HOW A SHARD SEARCHES; ALL OTHER Options ONLY CHANGE THE FILES WRITTEN BY THE MERGE
+
+## BEGIN FUNCTION () #7F #1 - SEARCH STAGES OF SPEC - ELS SEARCHES THE OUTPUTS OF THE SPEC NEED (BY FIRST LETTER ALWAYS RUNS); ## RETURNS ListOfStages
+def fn_SearchStagesOfSpec(DictOfSpec):
+
+    ## DECLARE VARIABLES
+    DictOfOptions = DictOfSpec.get("Options") or {}
+    _, SetOfStages = mod_97_OutputPlanCreate.fn_OutputPlanCreate(DictOfSpec.get("Outputs") or (), DictOfOptions.get("ListOfStages") or ())
+
+    ## RETURN VARIABLES
+    return(["SearchByLetterFirst"] + (["SearchByLetterLast"] if "SearchByLetterLast" in SetOfStages else []))
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #7F #2 - UNITS CREATE - MATCHES OF THE CHECKPOINT OF THE SHARD AS LINES OF CONSECUTIVE d (ORIGINAL TERM NUMBERS; WINDOWS OF --chunk-size JOINED; ONLY d SEARCHED COMPLETELY); ## RETURNS ListOfUnits
+def fn_UnitsCreate(ckpt, ListOfTermNumbersOfShard, DictOfRangesDone):
+
+    ## DECLARE VARIABLES
+    DictOfMatchesOfD = {} ## KEY IS (Stage, TermNumber, d); VALUE: LIST OF n
+    ListOfUnits = []
+
+    ## BEGIN FOR LOOP - EACH (STAGE, TERM, WINDOW, d) OF THE CHECKPOINT; WINDOWS OF THE SAME d IN ORDER OF THE WINDOW
+    for (Stage, ELSSearchTermNumber, Window, d), ListOfN in sorted(ckpt.DictOfUnitsDone.items(), key=lambda EachItem: (EachItem[0][0], EachItem[0][1], EachItem[0][3], EachItem[0][2] or 0)):
+
+        TermNumber = ListOfTermNumbersOfShard[ELSSearchTermNumber - 1]
+        if any(dFrom <= d <= dTo for dFrom, dTo in DictOfRangesDone.get(TermNumber, [])):
+            DictOfMatchesOfD.setdefault((Stage, TermNumber, d), []).extend(ListOfN)
+
+    ## END FOR LOOP
+
+    ## BEGIN FOR LOOP - EACH d IN ORDER; CONSECUTIVE d OF THE SAME STAGE + TERM IN ONE LINE
+    for (Stage, TermNumber, d), ListOfN in sorted(DictOfMatchesOfD.items()):
+
+        DictOfUnits = ListOfUnits[-1] if ListOfUnits else None
+        if DictOfUnits is not None and (DictOfUnits["Stage"], DictOfUnits["TermNumber"], DictOfUnits["DRange"][1] + 1) == (Stage, TermNumber, d):
+            DictOfUnits["DRange"][1] = d
+        else:
+            DictOfUnits = {"Stage": Stage, "TermNumber": TermNumber, "DRange": [d, d], "Matches": []}
+            ListOfUnits.append(DictOfUnits)
+
+        DictOfUnits["Matches"].extend([n, d] for n in sorted(ListOfN))
+
+    ## END FOR LOOP
+
+    ## RETURN VARIABLES
+    return(ListOfUnits)
+
+## END FUNCTION
+
+## BEGIN MAIN FUNCTION
+## FUNCTION () #7F #0 - SHARD RUN
+def fn_ShardRun(DictOfShardSpec, FileNameForShardResult, ct=None):
+
+    """
+    ## MODULE.FUNCTION() #7F - SHARD RUN; ONLY THE ELS SEARCH OF ONE SHARD (TERMS + SKIP DISTANCES OF DictOfShardSpec["Job"]), NO OUTPUT FILES; WRITES THE MATCHES OF EACH d + THE SKIP DISTANCES SEARCHED COMPLETELY TO FileNameForShardResult;
+    ## ct (CANCEL TOKEN) STOPS THE SHARD EARLY: THE RESULT THEN HOLDS ONLY THE d DONE AND THE MERGE REFUSES IT (GAP); ## RETURNS DictOfShardResult
+    """
+
+    ## DECLARE VARIABLES
+    DictOfShard, DictOfSpec, DictOfJob = DictOfShardSpec["Shard"], DictOfShardSpec["Spec"], DictOfShardSpec["Job"]
+    DictOfOptions = {EachKey: EachValue for EachKey, EachValue in (DictOfSpec.get("Options") or {}).items() if EachKey in TupleOfOptionsOfShard}
+    ListOfStages = fn_SearchStagesOfSpec(DictOfSpec)
+    TimeOfShardStart = time.time()
+
+    ## IF THE SHARD SPEC WAS CHANGED AFTER THE SPLIT
+    if DictOfShard["SpecID"] != mod_7E_ShardSpecsCreate.fn_SpecIDCreate(DictOfSpec):
+        raise ValueError(f"Shard {DictOfShard['Number']} of {DictOfShard['Of']}: spec does not match SpecID {DictOfShard['SpecID']} (changed after the split?)")
+
+    DirectoryOfCheckpoint = tempfile.mkdtemp(prefix=f"SHARD_{DictOfShard['Number']}_") ## CHECKPOINT OF THE SHARD == MATCHES OF EACH d SEARCHED
+
+    ## BEGIN TRY / FINALLY - THE CHECKPOINT OF THE SHARD IS ONLY NEEDED UNTIL ITS MATCHES ARE IN THE RESULT
+    try:
+
+        ## CALL MODULE.FUNCTION() #7A - CORPUS OPEN
+        session = mod_7A_CorpusOpen.fn_CorpusOpen(int(DictOfJob["Codex"]), int(DictOfJob["Text"]), DictOfJob.get("CustomCorpus"))
+
+        ## ELS SEARCH ONLY (BY LAST LETTER TOO IF AN OUTPUT OF THE SPEC NEEDS IT); EACH d SEARCHED IS SAVED TO THE CHECKPOINT WITH ITS MATCHES
+        gso = session.fn_Search(DictOfJob["ELSSearchTerms"], int(DictOfJob["SkipDistanceDMinimum"]), int(DictOfJob["SkipDistanceDMaximum"]), int(DictOfJob.get("XW") or mod_7B_SearchJobRun.XWDefault), \
+            ListOfOutputs=(), ListOfStages=ListOfStages[1:], ct=ct, DirectoryOfCheckpoint=DirectoryOfCheckpoint, **DictOfOptions)
+
+        ## SKIP DISTANCES SEARCHED COMPLETELY (ALL STAGES) PER ORIGINAL TERM NUMBER
+        DictOfRangesDone = {DictOfShard["TermNumbers"][EachTerm["TermNumber"] - 1]: EachTerm["DRangesDone"] for EachTerm in gso.DictOfCoverage["Terms"]}
+
+        ## MATCHES OF EACH d FROM THE CHECKPOINT OF THE SHARD (ITS 1ST LINE == THE SEARCH OF THE SHARD)
+        with open(os.path.join(DirectoryOfCheckpoint, mod_cls_Checkpoint.FileNameForCheckpoint), encoding="utf-8") as File:
+            DictOfSearchOfShard = json.loads(File.readline())
+        ListOfUnits = fn_UnitsCreate(CKPT(DirectoryOfCheckpoint, DictOfSearchOfShard, IsResume=True), DictOfShard["TermNumbers"], DictOfRangesDone)
+
+    finally:
+        shutil.rmtree(DirectoryOfCheckpoint, ignore_errors=True)
+
+    ## END TRY / FINALLY
+
+    ## RESULT OF THE SHARD
+    DictOfShardResult = {"ShardResult": VersionOfShardResult, "SpecID": DictOfShard["SpecID"], "Shard": DictOfShard, "Spec": DictOfSpec, \
+        "Corpus": {"Codex": DictOfJob["Codex"], "Text": DictOfJob["Text"], "CustomCorpus": session.CustomCorpusSpec, "LengthOfText": session.LengthOfTextToSearch}, "Stages": ListOfStages, \
+        "IsComplete": gso.DictOfCoverage["IsComplete"], "Coverage": [{"TermNumber": TermNumber, "Term": DictOfSpec["ELSSearchTerms"][TermNumber - 1], "DRangesDone": ListOfRangesDone} for TermNumber, ListOfRangesDone in DictOfRangesDone.items()], \
+        "Terms": [{"TermNumber": DictOfShard["TermNumbers"][ELSSearchTermNumber - 1], "Positive": EachELSObject.NMP, "Negative": EachELSObject.NMN} for ELSSearchTermNumber, EachELSObject in gso.DELSO.items()], \
+        "Units": ListOfUnits, "Seconds": round(time.time() - TimeOfShardStart, 3), "Host": platform.node(), "Started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(TimeOfShardStart))}
+
+    ## WRITE THE RESULT; A FILE THAT IS THERE IS ONLY REPLACED WHEN THE NEW ONE IS COMPLETE
+    os.makedirs(os.path.dirname(os.path.abspath(FileNameForShardResult)), exist_ok=True)
+    with open(FileNameForShardResult + ".tmp", "w", encoding="utf-8") as File:
+        json.dump(DictOfShardResult, File, ensure_ascii=False)
+    os.replace(FileNameForShardResult + ".tmp", FileNameForShardResult)
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print(f"SHARD {DictOfShard['Number']} OF {DictOfShard['Of']} ({'COMPLETE' if DictOfShardResult['IsComplete'] else 'STOPPED EARLY'}): {sum(len(EachUnits['Matches']) for EachUnits in ListOfUnits)} MATCHES IN {FileNameForShardResult}")
+
+    ## RETURN VARIABLES
+    return(DictOfShardResult)
+
+## END FUNCTION () #7F - SHARD RUN
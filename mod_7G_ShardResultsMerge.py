@@ -0,0 +1,167 @@
+## IMPORT MODULES
+import json
+import os
+
+import mod_7B_SearchJobRun ## MODULE.FUNCTION() #7B - SEARCH JOB RUN; ## RETURNS DictOfResults
+import mod_7E_ShardSpecsCreate ## MODULE.FUNCTION() #7E - SHARD SPECS CREATE (SPEC ID)
+import mod_7F_ShardRun ## MODULE.FUNCTION() #7F - SHARD RUN (VERSION OF THE SHARD RESULT FILE)
+import mod_22D_ELSSearchCoverage ## MODULE.FUNCTION() #22D - ELS SEARCH COVERAGE (RANGES COMPLEMENT)
+
+from mod_cls_Checkpoint import cls_Checkpoint as CKPT
+from mod_cls_SessionCache import cls_SessionCache as SESSIONCACHE
+
+## DECLARE VARIABLES
+## MERGE DIRECTORY: CHECKPOINT.jsonl (MATCHES OF ALL SHARDS) + USER_GENERATED_FILES/ (SAME FILES AS python p.py OF THE WHOLE SEARCH) + MERGED_RESULT.json + LOG.txt
+FileNameForMergedResult = "MERGED_RESULT.json"
+
+## BEGIN FUNCTION () #7G #1 - SHARD RESULTS READ - SAME SPEC, CORPUS + STAGES IN EVERY SHARD RESULT; ## RETURNS ListOfShardResults
+def fn_ShardResultsRead(ListOfFileNames):
+
+    ## DECLARE VARIABLES
+    ListOfShardResults = []
+
+    ## IF NO SHARD RESULTS
+    if not ListOfFileNames:
+        raise ValueError("No shard results to merge")
+
+    ## BEGIN FOR LOOP - EACH SHARD RESULT FILE
+    for EachFileName in ListOfFileNames:
+
+        with open(EachFileName, encoding="utf-8") as File:
+            DictOfShardResult = json.load(File)
+
+        ## IF NOT A SHARD RESULT OF THIS VERSION
+        if DictOfShardResult.get("ShardResult") != mod_7F_ShardRun.VersionOfShardResult:
+            raise ValueError(f"{EachFileName} is not a shard result (version {mod_7F_ShardRun.VersionOfShardResult})")
+
+        ## IF THE SPEC OF THE RESULT IS NOT ITS SpecID
+        if DictOfShardResult["SpecID"] != mod_7E_ShardSpecsCreate.fn_SpecIDCreate(DictOfShardResult["Spec"]):
+            raise ValueError(f"{EachFileName}: spec does not match SpecID {DictOfShardResult['SpecID']}")
+
+        ## IF THE RESULT IS OF ANOTHER SEARCH THAN THE FIRST
+        for EachKey in ("SpecID", "Corpus", "Stages"):
+            if ListOfShardResults and DictOfShardResult[EachKey] != ListOfShardResults[0][EachKey]:
+                raise ValueError(f"{EachFileName}: {EachKey} {DictOfShardResult[EachKey]!r} is not {ListOfShardResults[0][EachKey]!r} of {ListOfShardResults[0]['FileName']}")
+
+        DictOfShardResult["FileName"] = EachFileName
+        ListOfShardResults.append(DictOfShardResult)
+
+    ## END FOR LOOP
+
+    ## RETURN VARIABLES
+    return(ListOfShardResults)
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #7G #2 - COVERAGE CHECK - EVERY d OF EVERY TERM OF THE SPEC IN EXACTLY ONE SHARD RESULT; ## RETURNS DictOfCoverage (SAME AS #22D)
+def fn_CoverageCheck(ListOfShardResults):
+
+    ## DECLARE VARIABLES
+    DictOfSpec = ListOfShardResults[0]["Spec"]
+    SkipDistanceDMinimum, SkipDistanceDMaximum = int(DictOfSpec["SkipDistanceDMinimum"]), int(DictOfSpec["SkipDistanceDMaximum"])
+    ListOfTerms, ListOfErrors = [], []
+
+    ## BEGIN FOR LOOP - EACH ELS SEARCH TERM OF THE SPEC
+    for TermNumber, EachSearchTerm in enumerate(DictOfSpec["ELSSearchTerms"], start=1):
+
+        ## RANGES DONE OF THE TERM IN EACH SHARD, IN ORDER OF d
+        ListOfRangesOfShards = sorted((dFrom, dTo, DictOfShardResult["Shard"]["Number"]) for DictOfShardResult in ListOfShardResults \
+            for EachTerm in DictOfShardResult["Coverage"] if EachTerm["TermNumber"] == TermNumber for dFrom, dTo in EachTerm["DRangesDone"])
+
+        ## IF 2 SHARDS SEARCHED THE SAME d (e.g. THE SAME SHARD TWICE, OR SHARDS OF 2 SPLITS)
+        for (dFromA, dToA, NumberOfShardA), (dFromB, dToB, NumberOfShardB) in zip(ListOfRangesOfShards, ListOfRangesOfShards[1:]):
+            if dFromB <= dToA:
+                ListOfErrors.append(f"{EachSearchTerm} (term {TermNumber}): d {dFromB} - {min(dToA, dToB)} in shard {NumberOfShardA} and shard {NumberOfShardB}")
+
+        ## IF NO SHARD SEARCHED A d (SHARD MISSING OR STOPPED EARLY)
+        ListOfRangesLeft = mod_22D_ELSSearchCoverage.fn_RangesComplement([[dFrom, dTo] for dFrom, dTo, _ in ListOfRangesOfShards], SkipDistanceDMinimum, SkipDistanceDMaximum)
+        for dFrom, dTo in ListOfRangesLeft:
+            ListOfErrors.append(f"{EachSearchTerm} (term {TermNumber}): d {dFrom} - {dTo} in no shard")
+
+        ListOfTerms.append({"TermNumber": TermNumber, "Term": EachSearchTerm, "DRangesDone": mod_22D_ELSSearchCoverage.fn_RangesComplement(ListOfRangesLeft, SkipDistanceDMinimum, SkipDistanceDMaximum), "DRangesLeft": ListOfRangesLeft})
+
+    ## END FOR LOOP
+
+    ## IF COVERAGE IS NOT COMPLETE + NOT OVERLAPPING
+    if ListOfErrors:
+        raise ValueError(f"Shard results of spec {ListOfShardResults[0]['SpecID']} cannot be merged:\n" + "\n".join(ListOfErrors))
+
+    ## RETURN VARIABLES
+    return({"IsComplete": True, "SkipDistanceDMinimum": SkipDistanceDMinimum, "SkipDistanceDMaximum": SkipDistanceDMaximum, "StagesSkipped": [], \
+        "SkipDistanceAbsoluteDone": mod_22D_ELSSearchCoverage.fn_SkipDistanceAbsoluteDone(ListOfTerms, SkipDistanceDMinimum, SkipDistanceDMaximum), "Terms": ListOfTerms})
+
+## END FUNCTION
+
+## BEGIN MAIN FUNCTION
+## FUNCTION () #7G #0 - SHARD RESULTS MERGE
+def fn_ShardResultsMerge(ListOfFileNames, DirectoryOfMerge):
+
+    """
+    ## MODULE.FUNCTION() #7G - SHARD RESULTS MERGE; CHECKS THAT THE SHARD RESULTS ARE OF ONE SPEC AND THAT EVERY (TERM, d) IS IN EXACTLY ONE OF THEM (ValueError IF NOT); WRITES THEIR MATCHES AS ONE CHECKPOINT (mod_cls_Checkpoint) AND RESUMES THE WHOLE SEARCH FROM IT:
+    ## NOTHING IS SEARCHED AGAIN, THE FILES OF THE OUTPUTS OF THE SPEC ARE THE SAME AS OF ONE python p.py RUN (DirectoryOfMerge/USER_GENERATED_FILES/); ## RETURNS DictOfResults (+ MERGED_RESULT.json)
+    """
+
+    ## DECLARE VARIABLES
+    ListOfShardResults = fn_ShardResultsRead(ListOfFileNames)
+    DictOfCoverage = fn_CoverageCheck(ListOfShardResults)
+    DictOfSpec, DictOfCorpus = ListOfShardResults[0]["Spec"], ListOfShardResults[0]["Corpus"]
+    DirectoryOfMerge = os.path.abspath(DirectoryOfMerge)
+    sc = SESSIONCACHE(MaxSessions=1)
+
+    ## IF THE MERGE DIRECTORY HOLDS A MERGE ALREADY
+    if os.path.exists(os.path.join(DirectoryOfMerge, FileNameForMergedResult)):
+        raise ValueError(f"{DirectoryOfMerge} holds a merge already; choose another directory")
+
+    ## CORPUS OF THE SPEC (READS texts/ FROM THE DIRECTORY OF THE PROGRAM); MUST BE THE TEXT THE SHARDS SEARCHED
+    session, _ = sc.fn_SessionGet(int(DictOfCorpus["Codex"]), int(DictOfCorpus["Text"]), DictOfCorpus["CustomCorpus"])
+    if session.LengthOfTextToSearch != DictOfCorpus["LengthOfText"]:
+        raise ValueError(f"Text has {session.LengthOfTextToSearch} letters here, the shards searched {DictOfCorpus['LengthOfText']}")
+
+    ## CHECKPOINT OF THE WHOLE SEARCH (SAME 1ST LINE AS session.fn_Search WRITES) WITH THE MATCHES OF EACH d OF EVERY SHARD
+    os.makedirs(os.path.join(DirectoryOfMerge, "USER_GENERATED_FILES"), exist_ok=True)
+    ckpt = CKPT(DirectoryOfMerge, {"Codex": session.NumberOfCodexChosen, "Text": session.NumberOfTextChosen, "CustomCorpus": session.CustomCorpusSpec, "LengthOfText": session.LengthOfTextToSearch, \
+        "ELSSearchTerms": DictOfSpec["ELSSearchTerms"], "SkipDistanceDMinimum": int(DictOfSpec["SkipDistanceDMinimum"]), "SkipDistanceDMaximum": int(DictOfSpec["SkipDistanceDMaximum"]), "ChunkSize": None})
+
+    ## BEGIN FOR LOOP - EACH d OF EACH LINE OF EACH SHARD RESULT
+    for DictOfShardResult in ListOfShardResults:
+        for DictOfUnits in DictOfShardResult["Units"]:
+
+            DictOfNOfD = {d: [] for d in range(DictOfUnits["DRange"][0], DictOfUnits["DRange"][1] + 1)}
+            for n, d in DictOfUnits["Matches"]:
+                DictOfNOfD[d].append(n)
+            for d, ListOfN in DictOfNOfD.items():
+                ckpt.fn_UnitDone(DictOfUnits["Stage"], DictOfUnits["TermNumber"], d, ListOfN)
+
+    ## END FOR LOOP
+
+    ckpt.fn_Save()
+    SizeOfCheckpoint = os.path.getsize(ckpt.FileNameForCheckpoint)
+
+    ## WHOLE SEARCH RESUMED FROM THE CHECKPOINT; FILES ARE WRITTEN STRAIGHT INTO USER_GENERATED_FILES OF THE MERGE DIRECTORY
+    DictOfJob = dict(DictOfSpec, Options=dict({EachKey: EachValue for EachKey, EachValue in (DictOfSpec.get("Options") or {}).items() if EachKey not in ("ChunkSizeForELSSearch", "DirectoryOfCheckpoint", "IsResume")}, \
+        DirectoryOfCheckpoint=DirectoryOfMerge, IsResume=True))
+    with open(os.path.join(DirectoryOfMerge, "LOG.txt"), "w", encoding="utf-8") as FileOfLog:
+        DictOfResults = mod_7B_SearchJobRun.fn_SearchJobRun(sc, DictOfJob, lambda DictOfEvent: FileOfLog.write(DictOfEvent["Line"] + "\n") if DictOfEvent["Event"] == "log" else None, \
+            DirectoryOfOutput=os.path.join(DirectoryOfMerge, "USER_GENERATED_FILES"))
+
+    ## IF THE MERGE SEARCHED A d ITSELF (A SHARD RESULT WITHOUT THE MATCHES OF A d IT SAYS IT SEARCHED)
+    if os.path.getsize(ckpt.FileNameForCheckpoint) != SizeOfCheckpoint:
+        raise ValueError(f"Shard results do not hold the matches of every d they cover; see {ckpt.FileNameForCheckpoint}")
+
+    ## RESULT OF THE MERGE == RESULT OF THE WHOLE SEARCH + THE SHARDS IT CAME FROM
+    DictOfResults.update(SpecID=ListOfShardResults[0]["SpecID"], Coverage=DictOfCoverage, \
+        Shards=[{"Number": DictOfShardResult["Shard"]["Number"], "Of": DictOfShardResult["Shard"]["Of"], "TermNumbers": DictOfShardResult["Shard"]["TermNumbers"], \
+            "SkipDistanceDMinimum": DictOfShardResult["Shard"]["SkipDistanceDMinimum"], "SkipDistanceDMaximum": DictOfShardResult["Shard"]["SkipDistanceDMaximum"], \
+            "Seconds": DictOfShardResult["Seconds"], "Host": DictOfShardResult["Host"], "Started": DictOfShardResult["Started"], "FileName": DictOfShardResult["FileName"]} \
+            for DictOfShardResult in sorted(ListOfShardResults, key=lambda EachResult: EachResult["Shard"]["Number"])])
+    with open(os.path.join(DirectoryOfMerge, FileNameForMergedResult), "w", encoding="utf-8") as File:
+        json.dump(DictOfResults, File, ensure_ascii=False, indent=2)
+
+    ## TEST PRINT OUTPUT
+    print(f"Spec {DictOfResults['SpecID']}: {len(ListOfShardResults)} shard results merged; " + "; ".join(f"{EachTerm['Term']}: {EachTerm['Positive']} positive, {EachTerm['Negative']} negative" for EachTerm in DictOfResults["Terms"]))
+    print(f"Files in {os.path.join(DirectoryOfMerge, 'USER_GENERATED_FILES')}")
+
+    ## RETURN VARIABLES
+    return(DictOfResults)
+
+## END FUNCTION () #7G - SHARD RESULTS MERGE
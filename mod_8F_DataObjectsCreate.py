@@ -0,0 +1,118 @@
+## IMPORT MODULES
+import mod_9A_GetNumberValues4Letters ## MODULE.FUNCTION() #9A - GET NUMBER VALUE OF EACH LETTER IN STRING-OF-LETTERS; ## RETURNS ListOfNumberValues4Letters
+
+## IMPORT CLASSES
+from mod_cls_LetterObject import cls_LetterObject as LO
+
+## FUNCTION () #8F - DATA OBJECTS CREATE ##
+def fn_DataObjectsCreate(D, DS, SetOfLetterPositions):
+
+    """
+    ## MODULE.FUNCTION() #8F - DATA OBJECTS CREATE FOR THE LETTER POSITIONS OF THE ELS MATCHES ONLY (CHUNKED ELS SEARCH OUT OF CORE, MODULE.FUNCTION() #97 #2);
+    ## WALKS THE VERSES OF D (LETTERS, AS #8A + #9AAA) AND DS (WORDS, AS #8B + #8C + #8E + #11A) IN ORDER + KEEPS ONLY THE LETTERS + WORDS AT SetOfLetterPositions (1-BASED), WORD NUMBER OF EACH LETTER AS #11B;
+    ## SAME KEYS + VALUES AS DLO + DW OF #8 FOR THESE POSITIONS; ## RETURNS DLO, DW
+    """
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  BEGIN FUNCTION #8F - DATA OBJECTS CREATE FOR THE LETTER POSITIONS OF THE ELS MATCHES")
+
+    ## DECLARE VARIABLES
+    ListOfLetterPositions = sorted(SetOfLetterPositions) ## 1-BASED LETTER POSITIONS IN ORDER OF THE TEXT
+    DLO = {} ## DICTIONARY OF LETTER OBJECTS: ONLY THE LETTERS OF THE ELS MATCHES
+    DW = {} ## DICTIONARY OF WORDS: ONLY THE WORDS WITH A LETTER OF AN ELS MATCH
+    DictOfWordsOfLetterPositions = {} ## KEY: LETTER POSITION; VALUE: (WordNumber, WordCoordinatesDWTK)
+
+    IndexOfNextLetterPosition = 0 ## NEXT LETTER POSITION OF ListOfLetterPositions NOT YET FOUND
+    TotalLetterCounter = 1 ## 1-BASED POSITION OF THE FIRST LETTER OF THE VERSE
+
+    ## BEGIN FOR LOOP
+    ## FOR EACH VERSE IN DICTIONARY "D" (NO SPACES) UNTIL THE LAST LETTER POSITION IS FOUND...
+    for key, EachVerse in D.items():
+
+        ## IF ALL LETTER POSITIONS ARE FOUND
+        if IndexOfNextLetterPosition == len(ListOfLetterPositions):
+            break
+
+        ## BEGIN WHILE LOOP - EACH LETTER POSITION IN THIS VERSE
+        while IndexOfNextLetterPosition < len(ListOfLetterPositions) and ListOfLetterPositions[IndexOfNextLetterPosition] < TotalLetterCounter + len(EachVerse):
+
+            LetterPositionIndex = ListOfLetterPositions[IndexOfNextLetterPosition]
+            VerseLetterCounter = LetterPositionIndex - TotalLetterCounter + 1
+            letter = EachVerse[VerseLetterCounter - 1]
+
+            ## INITIALIZE / CREATE INSTANCE OF CLASS: LETTER OBJECT (SAME KEYS AS #8A)
+            lo = LO(Letter=letter, LetterPositionIndex=LetterPositionIndex, LetterCoordinatesD5K=key + (VerseLetterCounter, LetterPositionIndex,), LetterCoordinatesDL=key + (VerseLetterCounter,), VerseCoordinatesDS=key)
+
+            ## CALL MODULE.FUNCTION() #9A - ADD LETTER GEMATRIA NUMBER VALUE (SAME AS #9AAA)
+            lo.LetterGematriaNumberValue = mod_9A_GetNumberValues4Letters.fn_GetNumberValues(letter)[0]
+
+            DLO[LetterPositionIndex] = lo
+            IndexOfNextLetterPosition += 1
+
+        ## END WHILE LOOP
+
+        ## POSITION OF THE FIRST LETTER OF THE NEXT VERSE
+        TotalLetterCounter += len(EachVerse)
+
+    ## END FOR LOOP
+
+    ## DECLARE VARIABLES
+    IndexOfNextLetterPosition = 0 ## NEXT LETTER POSITION OF ListOfLetterPositions NOT YET IN A WORD
+    WordLetterCounter = 1 ## 1-BASED POSITION OF THE FIRST LETTER OF THE WORD (SAME COUNT AS #8C)
+    TotalWordCounter = 1
+
+    ## BEGIN FOR LOOP
+    ## FOR EACH VERSE IN DICTIONARY "DS" (WITH SPACES) UNTIL THE WORD OF THE LAST LETTER POSITION IS FOUND...
+    for key, EachVerse in DS.items():
+
+        ## IF THE WORDS OF ALL LETTER POSITIONS ARE FOUND
+        if IndexOfNextLetterPosition == len(ListOfLetterPositions):
+            break
+
+        ## BEGIN FOR LOOP - EACH WORD OF THE VERSE
+        for VerseWordCounter, EachWord in enumerate(EachVerse.split(), 1):
+
+            ## BEGIN IF - A LETTER POSITION IS IN THIS WORD
+            if IndexOfNextLetterPosition < len(ListOfLetterPositions) and ListOfLetterPositions[IndexOfNextLetterPosition] < WordLetterCounter + len(EachWord):
+
+                ## CALL MODULE.FUNCTION() #9A - GEMATRIA NUMBER VALUES OF THE LETTERS OF THE WORD (SAME AS #9B)
+                ListOfNumberValues4Letters = mod_9A_GetNumberValues4Letters.fn_GetNumberValues(EachWord)
+
+                ## SAME TUPLE AS #11A: ('בראשית', [1, 2, 3, 4, 5, 6], (1, [2, 200, 1, 300, 10, 400], 913))
+                DW[TotalWordCounter] = (EachWord, list(range(WordLetterCounter, WordLetterCounter + len(EachWord))), (TotalWordCounter, ListOfNumberValues4Letters, sum(ListOfNumberValues4Letters)))
+
+                ## SAME KEY AS #8B / #8E: (BOOK#, CHAPTER#, VERSE#, WORD#INVERSE, WORD#INTEXT)
+                WordCoordinatesDWTK = key + (VerseWordCounter, TotalWordCounter,)
+
+                ## BEGIN WHILE LOOP - EACH LETTER POSITION IN THIS WORD
+                while IndexOfNextLetterPosition < len(ListOfLetterPositions) and ListOfLetterPositions[IndexOfNextLetterPosition] < WordLetterCounter + len(EachWord):
+                    DictOfWordsOfLetterPositions[ListOfLetterPositions[IndexOfNextLetterPosition]] = (TotalWordCounter, WordCoordinatesDWTK)
+                    IndexOfNextLetterPosition += 1
+                ## END WHILE LOOP
+
+            ## END IF
+
+            ## INCREMENT
+            WordLetterCounter += len(EachWord)
+            TotalWordCounter += 1
+
+        ## END FOR LOOP
+
+    ## END FOR LOOP
+
+    ## ASSIGN WORD NUMBER TO EACH LETTER OBJECT (SAME AS #11B)
+    for LetterPositionIndex, (WordNumber, WordCoordinatesDWTK) in DictOfWordsOfLetterPositions.items():
+        if LetterPositionIndex in DLO:
+            DLO[LetterPositionIndex].WordNumber = WordNumber
+            DLO[LetterPositionIndex].WordCoordinatesDWTK = WordCoordinatesDWTK
+
+    ## TEST PRINT OUTPUT
+    print(f"Letter objects created: {len(DLO)} letters in {len(DW)} words of the ELS matches")
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  END FUNCTION #8F - DATA OBJECTS CREATE FOR THE LETTER POSITIONS OF THE ELS MATCHES")
+
+    ## RETURN VARIABLES TO PROGRAM
+    return(DLO, DW)
+
+## END FUNCTION () #8F - DATA OBJECTS CREATE
@@ -0,0 +1,104 @@
+## IMPORT MODULES
+import concurrent.futures
+import mod_8A_DataObjectsCreate ## MODULE.FUNCTION() #8A - DATA OBJECTS CREATE; ## RETURNS TUPLE OF (STRING-SEQUENCE OF LETTERS, LIST OF LETTERS, DICTIONARY OF LETTERS WITH 4-DIGIT TUPLE-KEY, DICTIONARY OF LETTERS WITH 5-DIGIT TUPLE-KEY
+import mod_8B_DataObjectsCreate ## MODULE.FUNCTION() #8B - DATA OBJECTS CREATE; ## RETURNS LIST OF WORDS
+import mod_8C_DataObjectsCreate ## MODULE.FUNCTION() #8C - DATA OBJECTS CREATE; ## RETURNS ListOfIndexes4LettersInEachWord
+import mod_8D_DataObjectsCreate ## MODULE.FUNCTION() #8D - DATA OBJECTS CREATE; ## RETURNS D5K == DICT OF D5 KEYS
+import mod_8E_DataObjectsCreate ## MODULE.FUNCTION() #8E - DATA OBJECTS CREATE; ## RETURNS DWTK == DICT OF DWT KEYS
+import mod_9A_GetNumberValues4Letters ## MODULE.FUNCTION() #9A - GET NUMBER VALUE OF EACH LETTER IN STRING-OF-LETTERS; ## RETURNS ListOfNumberValues4Letters
+import mod_9AA_CalculateLetterPercentages ## MODULE.FUNCTION() #9AA - CALCULATE LETTER PERCENTAGES; ## RETURNS 
+import mod_9AAA_AddGematriaNumberValuesToLetterObjects ## MODULE.FUNCTION() #9AAA - ADD LETTER GEMATRIA NUMBER VALUE TO EACH INSTANCE OF LETTER OBJECT
+import mod_9B_GetNumberValues4Words ## MODULE.FUNCTION() #9B - GET NUMBER VALUE OF EACH LETTER IN WORD STRING ## RETURNS ListOfNumberValues4Words
+import mod_10_ListOfIndexesCustomCreate ## MODULE.FUNCTION() #10 - CREATE LIST OF CUSTOM INDEXES FOR EACH LETTER IN SELECTED TEXT NON-0-INDEXED / 1-INDEXED ## RETURNS ListOfIndexesCustom
+import mod_11A_TupleOfWordsAndGematriaValuesCreate ## MODULE.FUNCTION() ## 11A - DATA OBJECT CREATE - RETURNS TUPLE OF WORDS WITH EACH WORD'S GEMATRIA NUMBER VALUE
+import mod_11B_AssignWordNumberToEachLetterObject ## MODULE.FUNCTION() ## 11B-- ASSIGN WORD NUMBER TO EACH LETTER OBJECT IN SELECT TEXT
+
+## FUNCTION () #8 - DATA OBJECTS CREATE - CALLS MODULE.FUNCTIONS() #8A - #11B IN ORDER ##
+def fn_DataObjectsCreate(D, DS):
+
+    """
+    ## MODULE.FUNCTION() #8 - DATA OBJECTS CREATE; CALLS MODULE.FUNCTIONS() #8A, #9AA, #8B, #8C, #8D, #8E, #9A, #9AAA, #9B, #10, #11A, #11B; ## RETURNS TUPLE OF ALL DATA OBJECTS OF THE SELECTED TEXT(S)
+    """
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  BEGIN FUNCTION #8 - DATA OBJECTS CREATE")
+
+    ## CREATE DATA OBJECTS + CREATE DICTIONARY OF CUSTOM LETTER OBJECTS (DLO)
+    ## CALL MODULE.FUNCTION() #8A - DATA OBJECTS CREATE - RETURNS 1.) STRING OF LETTERS; 2.) LIST OF LETTERS; 3.) DICT OF LETTERS WITH 4-DIGIT TUPLE KEY; 4.) DICT OF LETTERS WITH 5-DIGIT TUPLE KEY; 5.) DICT OF INSTANCES OF LETTER OBJECTS
+    S, L, DL, D5, DLO = mod_8A_DataObjectsCreate.fn_DataObjectsCreate(D)
+
+    ## CALL MODULE.FUNCTION() #9AA - CALCULATE LETTER PERCENTAGES
+    ListOfTuplesOfLetterStatistics = mod_9AA_CalculateLetterPercentages.fn_CalculatePercentages(S)
+
+    ## CALL MODULE.FUNCTION() #8B - DATA OBJECTS CREATE - RETURNS LIST OF [1.) WORD # IN TEXT; 2.) GEMATRIA VALUES FOR EACH LETTER; 3.) GEMATRIA VALUE FOR ENTIRE WORD]
+    LW, LNWEV, DWV, DWT = mod_8B_DataObjectsCreate.fn_DataObjectsCreate(DS) ## RETURNS ListOfWords, ListOfNumbersOfWordsEachVerse, DictionaryOfWordsEachVerse
+
+    ## CALL MODULE.FUNCTION() #8C - DATA OBJECTS CREATE - RETURNS ListOfIndexes4LettersInEachWord
+    ListOfIndexes4LettersInEachWord = mod_8C_DataObjectsCreate.fn_DataObjectsCreate(LW)
+
+    ## CALL MODULE.FUNCTION() #8D - DATA OBJECTS CREATE - RETURNS DICT OF D5 KEYS AS VALUES WITH 1-INDEXED KEY FOR # OF LETTERS IN TEXT
+    D5K = mod_8D_DataObjectsCreate.fn_DataObjectsCreate(D5)
+
+    ## CALL MODULE.FUNCTION() #8E - DATA OBJECTS CREATE - RETURNS DICT OF DWT KEYS AS VALUES WITH 1-INDEXED KEY FOR # OF WORDS IN TEXT
+    DWTK = mod_8E_DataObjectsCreate.fn_DataObjectsCreate(DWT)
+
+    ## CALL MODULE.FUNCTION() #9A - GET NUMBER VALUE FOR LETTERS - RETURNS LIST OF NUMBER VALUES FOR EACH LETTER OF STRING
+    N = mod_9A_GetNumberValues4Letters.fn_GetNumberValues(S) ## RETURNS ListOfNumberValues4Letters
+
+    ## UPDATE LETTER OBJECTS
+    ## CALL MODULE.FUNCTION() #9AAA - ADD LETTER GEMATRIA NUMBER VALUE TO EACH INSTANCE OF LETTER OBJECT; ## RETURNS DICTIONARY OF LETTER OBJECTS
+    DLO = mod_9AAA_AddGematriaNumberValuesToLetterObjects.fn_AddGematriaNumberValuesToLetterObjects(DLO, N)
+    
+    ###########################################
+    ## 1ST TIME MODULE.FUNCTION() #9B IS CALLED
+    ## CALL MODULE.FUNCTION() #9B - GET NUMBER VALUE FOR WORDS - RETURNS LIST OF TUPLES OF NUMBER VALUES FOR EACH LETTER OF STRING
+    NW = mod_9B_GetNumberValues4Words.fn_GetNumberValues(LW) ## CALLS MODULE.FUNCTION() #9A; ## RETURNS LIST OF TUPLES OF GEMATRIA VALUES FOR ('WORD', [L,E,T,T,E,R,S], SUM)
+
+    ## 1ST TIME MODULE.FUNCTION() #10 IS CALLED
+    ## CALL MODULE.FUNCTION() #10 - CREATE LIST OF CUSTOM INDEXES NON-0-INDEXED / 1-INDEXED RETURNS LIST OF CUSTOM INDEXES
+    ListOfIndexesCustom = mod_10_ListOfIndexesCustomCreate.fn_ListOfIndexesCustomCreate(D5)
+
+    ## TEST PRINT OUTPUT
+    ## print(f"ListOfIndexesCustom {ListOfIndexesCustom}")
+
+    ## 1ST TIME MODULE.FUNCTION() #11A IS CALLED
+    ## CALL MODULE.FUNCTION() #11A - DATA OBJECT CREATE - RETURNS TUPLE OF WORDS WITH EACH WORD'S GEMATRIA NUMBER VALUE
+    W, DW = mod_11A_TupleOfWordsAndGematriaValuesCreate.fn_TupleOfWordsAndGematriaValuesCreate(LW, NW, ListOfIndexesCustom, ListOfIndexes4LettersInEachWord)
+
+    ## CALL MODULE.FUNCTION() ## 11B - ASSIGN WORD NUMBER TO EACH LETTER OBJECT IN SELECT TEXT
+    DLO = mod_11B_AssignWordNumberToEachLetterObject.fn_AssignWordNumberToEachLetterObject(DLO, DW, DWTK)
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  END FUNCTION #8 - DATA OBJECTS CREATE")
+
+    ## RETURN VARIABLES TO PROGRAM
+    return(S, L, DL, D5, DLO, ListOfTuplesOfLetterStatistics, LW, LNWEV, DWV, DWT, ListOfIndexes4LettersInEachWord, D5K, DWTK, N, NW, ListOfIndexesCustom, W, DW)
+
+## END FUNCTION () #8 - DATA OBJECTS CREATE
+
+## FUNCTION () #8 #2 - DATA OBJECTS CREATE IN BACKGROUND THREAD ##
+def fn_DataObjectsCreateInBackground(D, DS):
+
+    """
+    ## MODULE.FUNCTION() #8 - DATA OBJECTS CREATE IN BACKGROUND THREAD; STARTS fn_DataObjectsCreate() WHILE THE USER IS STILL ANSWERING THE OTHER QUESTIONS; ## RETURNS FUTURE: FutureOfDataObjects.result() WAITS FOR AND RETURNS THE TUPLE OF DATA OBJECTS
+    """
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  BEGIN FUNCTION #8 - DATA OBJECTS CREATE IN BACKGROUND THREAD")
+
+    ## START ONE BACKGROUND THREAD; DO NOT WAIT FOR IT TO FINISH HERE
+    Executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    FutureOfDataObjects = Executor.submit(fn_DataObjectsCreate, D, DS)
+    Executor.shutdown(wait=False)
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  END FUNCTION #8 - DATA OBJECTS CREATE IN BACKGROUND THREAD")
+
+    ## RETURN VARIABLES TO PROGRAM
+    return(FutureOfDataObjects)
+
+## END FUNCTION () #8 #2 - DATA OBJECTS CREATE IN BACKGROUND THREAD
@@ -0,0 +1,78 @@
+## IMPORT MODULES
+import contextvars
+import json
+import sys
+import time
+
+## DECLARE VARIABLES
+## PROGRESS EVENT (DICT): {"Event": "progress", "Stage": "SearchByLetterFirst", "Done": 120, "Total": 201, "TermNumber": 1, "Term": "משיח", "D": 19, "Matches": 48, "Seconds": 5.2, "ETA": 3.5}
+## Done / Total == STEPS OF THE STAGE (e.g. ONE STEP PER SKIP DISTANCE d OF EACH ELS SEARCH TERM); None FOR A STAGE WITHOUT STEPS; ETA == SECONDS LEFT IN THE STAGE
+SecondsBetweenEvents = 0.1 ## AT MOST ~10 EVENTS PER SECOND; THE FIRST + LAST EVENT OF EACH STAGE ARE ALWAYS SENT
+ContextVarOfProgress = contextvars.ContextVar("ProgressOfSearch", default=None) ## DICT OF THE RECEIVER OF THE SEARCH RUNNING IN THIS CONTEXT; None == NO PROGRESS EVENTS
+
+## BEGIN FUNCTION () #96 #1 - PROGRESS RECEIVER SET - EVENTS OF THIS CONTEXT (+ THREADS THAT COPY IT) GO TO fn_ProgressEvent; ## RETURNS Token (FOR fn_ProgressReceiverReset)
+def fn_ProgressReceiverSet(fn_ProgressEvent, DictOfSearchTermsWithSpaces=None):
+
+    ## RETURN VARIABLES
+    return(ContextVarOfProgress.set(None if fn_ProgressEvent is None else \
+        {"fn_ProgressEvent": fn_ProgressEvent, "DictOfTerms": DictOfSearchTermsWithSpaces or {}, "Stage": None, "TimeOfStageStart": 0.0, "TimeOfLastEvent": 0.0}))
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #96 #2 - PROGRESS RECEIVER RESET - RECEIVER BEFORE fn_ProgressReceiverSet
+def fn_ProgressReceiverReset(Token):
+
+    ContextVarOfProgress.reset(Token)
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #96 #3 - PROGRESS EVENT PRINT - RECEIVER FOR p.py --progress-json: ONE JSON LINE PER EVENT ON stderr (stdout KEEPS THE LOG)
+def fn_ProgressEventPrint(DictOfEvent):
+
+    sys.stderr.write(json.dumps(DictOfEvent, ensure_ascii=False) + "\n")
+    sys.stderr.flush()
+
+## END FUNCTION
+
+## BEGIN MAIN FUNCTION
+## FUNCTION () #96 #0 - PROGRESS EVENT SEND
+def fn_ProgressEventSend(Stage, Done=None, Total=None, TermNumber=None, **DictOfFields):
+
+    """
+    ## MODULE.FUNCTION() #96 - PROGRESS EVENT SEND; CALLED BY EACH STAGE OF THE ELS SEARCH (e.g. ONCE PER SKIP DISTANCE d); SENDS {"Event": "progress", ...} TO THE RECEIVER OF fn_ProgressReceiverSet, AT MOST ONCE PER SecondsBetweenEvents PER STAGE; NOTHING IF NO RECEIVER; ## RETURNS True IF SENT
+    """
+
+    ## DECLARE VARIABLES
+    DictOfProgress = ContextVarOfProgress.get()
+
+    ## IF NO RECEIVER
+    if DictOfProgress is None:
+        return(False)
+
+    TimeNow = time.time()
+
+    ## BEGIN IF / ELIF - NEW STAGE OR TOO SOON AFTER THE LAST EVENT (NOT THE LAST STEP)
+    if Stage != DictOfProgress["Stage"]:
+        DictOfProgress["Stage"], DictOfProgress["TimeOfStageStart"] = Stage, TimeNow
+
+    elif Done != Total and TimeNow - DictOfProgress["TimeOfLastEvent"] < SecondsBetweenEvents:
+        return(False)
+    ## END IF / ELIF
+
+    DictOfProgress["TimeOfLastEvent"] = TimeNow
+    Seconds = TimeNow - DictOfProgress["TimeOfStageStart"]
+
+    ## SECONDS LEFT IN THE STAGE AT THE RATE SO FAR
+    ETA = round(Seconds * (Total - Done) / Done, 1) if Done and Total else None
+
+    DictOfEvent = {"Event": "progress", "Stage": Stage, "Done": Done, "Total": Total}
+    if TermNumber is not None:
+        DictOfEvent.update(TermNumber=TermNumber, Term=DictOfProgress["DictOfTerms"].get(TermNumber))
+    DictOfEvent.update(DictOfFields, Seconds=round(Seconds, 1), ETA=ETA)
+
+    DictOfProgress["fn_ProgressEvent"](DictOfEvent)
+
+    ## RETURN VARIABLES
+    return(True)
+
+## END FUNCTION () #96 - PROGRESS EVENT SEND
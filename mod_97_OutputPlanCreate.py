@@ -0,0 +1,101 @@
+## IMPORT MODULES
+
+## DECLARE VARIABLES
+## STAGES OF THE PROGRAM THAT ARE ONLY NEEDED FOR SOME OUTPUTS; KEY: STAGE; VALUE: TUPLE OF STAGES THAT MUST RUN FIRST
+## (READING THE TEXT, #8 - #21, THE ELS SEARCH BY FIRST LETTER AND #24 / #25 ALWAYS RUN)
+DictOfStageDependencies = {
+    "Matrix2D": (), ## MODULE.FUNCTION() #99 - 2D MATRIX CREATE
+    "SearchByLetterLast": (), ## MODULE.FUNCTION() #23 / #22C - ELS SEARCH BY LAST LETTER
+    "UpdateW": (), ## MODULE.FUNCTION() #26 - UPDATE W
+    "GatherByLetterFirst": (), ## MODULE.FUNCTION() #27 - GATHER DATA 4 ELS MATCHES BY FIRST LETTER (POSITIVE + NEGATIVE)
+    "GatherByLetterLast": ("SearchByLetterLast",), ## MODULE.FUNCTION() #27 - GATHER DATA 4 ELS MATCHES BY LAST LETTER (POSITIVE + NEGATIVE)
+    "LetterPositions": ("GatherByLetterFirst",), ## MODULE.FUNCTION() #28 - ALL ELS LETTER POSITIONS + #98 - FILE NAMES 4 ELS TERMS
+    "Regex": (), ## MODULE.FUNCTION() #40 - TEST DEVELOPMENT: REGEX OF TEXT + ELS SEARCH TERMS
+    "PandasSeries": (), ## MODULE.FUNCTION() #41 - TEST DEVELOPMENT: PANDAS SERIES OF MATCHES OF EACH LETTER OF EACH ELS SEARCH TERM
+}
+
+## OUTPUTS THE USER CAN CHOOSE; KEY: OUTPUT; VALUE: TUPLE OF STAGES IT NEEDS
+DictOfOutputs = {
+    "statistics": (), ## USER_FILE_LetterStatistics_...
+    "matrix": ("Matrix2D",), ## USER_FILE_Matrix2D_... .csv
+    "words": ("UpdateW",), ## USER_FILE_WordsInSelectedBiblicalTexts_...
+    "summary": (), ## USER_FILE_WordsOfELSs_ELSMatches_DATASUMMARY_...
+    "matches": ("GatherByLetterFirst", "GatherByLetterLast"), ## USER_FILE_WordsOfELSs_ELSMatches_BY_LETTER_FIRST/LAST_POSITIVE/NEGATIVE_...
+    "letters": ("LetterPositions",), ## USER_FILE_WordsOfELSs_ELSMatches_ALL_LETTER_POSITIONS_... (+ --legacy-letter-files)
+    "xlsx": ("Matrix2D",), ## --xlsx
+    "windows": ("GatherByLetterFirst",), ## --els-windows
+    "sqlite": ("LetterPositions",), ## --sqlite
+    "coverage": (), ## USER_FILE_WordsOfELSs_ELSMatches_COVERAGE_... .json (ALSO WRITTEN WHENEVER THE ELS SEARCH IS STOPPED BEFORE ALL SKIP DISTANCES ARE SEARCHED)
+    "test": ("Regex", "PandasSeries"), ## TEST DEVELOPMENT OBJECTS OF THE GLOBAL SEARCH OBJECT (gso)
+}
+
+TupleOfOutputsDefault = ("statistics", "matrix", "words", "summary", "matches", "letters") ## OUTPUTS WRITTEN WHEN --outputs IS NOT GIVEN
+
+## STAGES + OUTPUTS THAT NEED THE DATA OBJECTS OF THE WHOLE TEXT (#8 - #11B: S, L, N, DLO, W, ...); WITHOUT THEM A CHUNKED ELS SEARCH (--chunk-size) RUNS OUT OF CORE (MODULE.FUNCTION() #97 #2)
+TupleOfStagesOfWholeText = ("Matrix2D", "UpdateW", "Regex", "PandasSeries") ## EVERY LETTER / WORD OF THE TEXT
+TupleOfOutputsOfWholeText = ("windows",) ## S + D5K AROUND THE ELS MATCHES
+
+## BEGIN FUNCTION () #97 - OUTPUT PLAN CREATE ##
+def fn_OutputPlanCreate(ListOfOutputs, ListOfStages=()):
+
+    """
+    ## MODULE.FUNCTION() #97 - OUTPUT PLAN CREATE; CHECKS THE OUTPUTS CHOSEN BY THE USER AND COLLECTS EVERY STAGE THEY NEED (WITH THE STAGES THOSE STAGES NEED) + THE STAGES IN ListOfStages (e.g. FOR A SEARCH OF THE SESSION API WITHOUT FILES); STAGES NOT IN THE PLAN ARE NEVER RUN; ## RETURNS SetOfOutputs, SetOfStages
+    """
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  BEGIN FUNCTION #97 - OUTPUT PLAN CREATE")
+
+    ## DECLARE VARIABLES
+    SetOfOutputs = set(ListOfOutputs)
+    SetOfStages = set()
+
+    ## IF AN OUTPUT IS UNKNOWN
+    for EachOutput in SetOfOutputs:
+        if EachOutput not in DictOfOutputs:
+            raise ValueError(f"Unknown output: '{EachOutput}' (choose from: {', '.join(DictOfOutputs)})")
+
+    ## IF A STAGE IS UNKNOWN
+    for EachStage in ListOfStages:
+        if EachStage not in DictOfStageDependencies:
+            raise ValueError(f"Unknown stage: '{EachStage}' (choose from: {', '.join(DictOfStageDependencies)})")
+
+    ## STAGES OF EACH OUTPUT; EACH STAGE ADDS THE STAGES IT NEEDS
+    ListOfStagesToAdd = [EachStage for EachOutput in SetOfOutputs for EachStage in DictOfOutputs[EachOutput]] + list(ListOfStages)
+
+    ## BEGIN WHILE LOOP
+    while ListOfStagesToAdd:
+
+        EachStage = ListOfStagesToAdd.pop()
+        if EachStage not in SetOfStages:
+            SetOfStages.add(EachStage)
+            ListOfStagesToAdd.extend(DictOfStageDependencies[EachStage])
+
+    ## END WHILE LOOP
+
+    ## TEST PRINT OUTPUT
+    print(f"Outputs: {sorted(SetOfOutputs)}")
+    print(f"Stages: {sorted(SetOfStages)}")
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION:  END FUNCTION #97 - OUTPUT PLAN CREATE")
+
+    ## RETURN VARIABLES
+    return(SetOfOutputs, SetOfStages)
+
+## END FUNCTION () #97 - OUTPUT PLAN CREATE
+
+## BEGIN FUNCTION () #97 #2 - OUT OF CORE CHECK ##
+def fn_IsOutOfCore(SetOfOutputs, SetOfStages, ChunkSize=None):
+
+    """
+    ## MODULE.FUNCTION() #97 #2 - OUT OF CORE CHECK; A CHUNKED ELS SEARCH (ChunkSize) RUNS OUT OF CORE IF NO STAGE / OUTPUT OF THE PLAN NEEDS THE DATA OBJECTS OF THE WHOLE TEXT:
+    ## THE LETTER CODES ARE WRITTEN VERSE BY VERSE (#22C #2) + ONLY THE LETTERS + WORDS OF THE ELS MATCHES GET OBJECTS (#8F); ## RETURNS IsOutOfCore
+    """
+
+    ## DECLARE VARIABLES
+    IsOutOfCore = ChunkSize is not None and not SetOfStages & set(TupleOfStagesOfWholeText) and not SetOfOutputs & set(TupleOfOutputsOfWholeText)
+
+    ## RETURN VARIABLES
+    return(IsOutOfCore)
+
+## END FUNCTION () #97 #2 - OUT OF CORE CHECK
@@ -1,7 +1,8 @@
 ## IMPORT MODULES ##
+import re
 
 ## FUNCTION () #98 - FILE NAMES CREATE ##
-def fn_FileNamesCreate(XW, YH, NumberOfTextChosen, NumberOfCodexChosen):
+def fn_FileNamesCreate(XW, YH, NumberOfTextChosen, NumberOfCodexChosen, CustomCorpusSpec=None):
 
     """
     ## MODULE.FUNCTION() #98 - 
@@ -169,6 +170,10 @@ def fn_FileNamesCreate(XW, YH, NumberOfTextChosen, NumberOfCodexChosen):
 
     elif NumberOfTextChosen == 47:
         TextTitle = "CHRONICLES_Both_Books_Together"
+
+    elif NumberOfTextChosen == 48:
+        ## CUSTOM CORPUS: KEEP LETTERS, DIGITS, + AND - OF CUSTOM CORPUS; e.g. 'Gen 1:1-11:32' --> 'CUSTOM_Gen_1_1-11_32'
+        TextTitle = "CUSTOM_" + re.sub(r"[^0-9A-Za-z+-]+", "_", CustomCorpusSpec).strip("_")
          
 
     ## ELSE ALL OTHER CASES (NEVER CALLED)
@@ -185,6 +190,11 @@ def fn_FileNamesCreate(XW, YH, NumberOfTextChosen, NumberOfCodexChosen):
     FileNameForELSMatchesByLetterFirstNegative = f"USER_FILE_WordsOfELSs_ELSMatches_BY_LETTER_FIRST_NEGATIVE_{CodexTitle}_{NumberOfTextChosen}{TextTitle}_{XWString}x{YHString}.csv"
     FileNameForELSMatchesByLetterLastPositive = f"USER_FILE_WordsOfELSs_ELSMatches_BY_LETTER_LAST_POSITIVE_{CodexTitle}_{NumberOfTextChosen}{TextTitle}_{XWString}x{YHString}.csv"
     FileNameForELSMatchesByLetterLastNegative = f"USER_FILE_WordsOfELSs_ELSMatches_BY_LETTER_LAST_NEGATIVE_{CodexTitle}_{NumberOfTextChosen}{TextTitle}_{XWString}x{YHString}.csv"
+    FileNameForELSMatchesAllLetterPositions = f"USER_FILE_WordsOfELSs_ELSMatches_ALL_LETTER_POSITIONS_{CodexTitle}_{NumberOfTextChosen}{TextTitle}_{XWString}x{YHString}.csv"
+    FileNameForELSWindows = f"USER_FILE_WordsOfELSs_ELSMatches_WINDOWS_{CodexTitle}_{NumberOfTextChosen}{TextTitle}_{XWString}x{YHString}.csv"
+    FileNameForTextDictionary = f"USER_FILE_WordsOfELSs_ELSMatches_TEXTS_{CodexTitle}_{NumberOfTextChosen}{TextTitle}_{XWString}x{YHString}.csv"
+    FileNameForCoverage = f"USER_FILE_WordsOfELSs_ELSMatches_COVERAGE_{CodexTitle}_{NumberOfTextChosen}{TextTitle}_{XWString}x{YHString}.json"
+    FileNameForBundle = f"USER_BUNDLE_{CodexTitle}_{NumberOfTextChosen}{TextTitle}_{XWString}x{YHString}" ## EXTENSION (.zip / .tar.zst) ADDED BY MODULE.FUNCTION() #99 - WRITE OUTPUT TO BUNDLE
    
    
     ## TEST PRINT OUTPUT
@@ -192,6 +202,6 @@ def fn_FileNamesCreate(XW, YH, NumberOfTextChosen, NumberOfCodexChosen):
     print("WITHIN FUNCTION:  END FUNCTION #98 - FILE NAMES CREATE")
 
     ## RETURN VARIABLES TO PROGRAM
-    return(FileNameForMatrixXLSX, FileNameForMatrixCSV, FileNameForLetterStatistics, FileNameForGematriaTexts, FileNameForELSMatchesDataSummary, FileNameForELSMatchesByLetterFirstPositive,  FileNameForELSMatchesByLetterFirstNegative, FileNameForELSMatchesByLetterLastPositive, FileNameForELSMatchesByLetterLastNegative)
+    return(FileNameForMatrixXLSX, FileNameForMatrixCSV, FileNameForLetterStatistics, FileNameForGematriaTexts, FileNameForELSMatchesDataSummary, FileNameForELSMatchesByLetterFirstPositive,  FileNameForELSMatchesByLetterFirstNegative, FileNameForELSMatchesByLetterLastPositive, FileNameForELSMatchesByLetterLastNegative, FileNameForELSMatchesAllLetterPositions, FileNameForELSWindows, FileNameForTextDictionary, FileNameForCoverage, FileNameForBundle)
 
 ## END FUNCTION () #98- FILE NAMES CREATE
@@ -1,7 +1,8 @@
 ## IMPORT MODULES
+import re
 
 ## FUNCTION () #98 - FILE NAMES CREATE ##
-def fn_FileNamesCreate(XW, YH, NumberOfCodexChosen, NumberOfTextChosen, W4ELS, DELSO):
+def fn_FileNamesCreate(XW, YH, NumberOfCodexChosen, NumberOfTextChosen, W4ELS, DELSO, CustomCorpusSpec=None):
 
     """
     ## MODULE.FUNCTION() #98 - 
@@ -170,6 +171,10 @@ def fn_FileNamesCreate(XW, YH, NumberOfCodexChosen, NumberOfTextChosen, W4ELS, D
 
     elif NumberOfTextChosen == 47:
         TextTitle = "CHRONICLES_Both_Books_Together"
+
+    elif NumberOfTextChosen == 48:
+        ## CUSTOM CORPUS: KEEP LETTERS, DIGITS, + AND - OF CUSTOM CORPUS; e.g. 'Gen 1:1-11:32' --> 'CUSTOM_Gen_1_1-11_32'
+        TextTitle = "CUSTOM_" + re.sub(r"[^0-9A-Za-z+-]+", "_", CustomCorpusSpec).strip("_")
          
     
     ## ELSE ALL OTHER CASES (NEVER CALLED)
@@ -0,0 +1,134 @@
+## IMPORT MODULES
+import json
+import os
+import shutil
+import tarfile
+import time
+import zipfile
+
+## DECLARE VARIABLES
+TupleOfBundleFormats = ("zip", "tar.zst") ## tar.zst NEEDS zstandard (pip install zstandard)
+FileNameForManifest = "MANIFEST.json" ## LAST MEMBER OF EACH BUNDLE: PARAMETERS + COUNTS OF THE RUN + NAME, SIZE AND NUMBER OF ROWS OF EACH MEMBER
+ChunkSize = 1048576 ## BYTES COPIED AT ONCE (EXTRACT)
+
+## BEGIN FUNCTION () #99 #1 - BUNDLE FORMAT GET - tar.zst ONLY IF zstandard CAN BE IMPORTED, OTHERWISE zip
+def fn_BundleFormatGet(BundleFormat):
+
+    ## IF FORMAT IS UNKNOWN
+    if BundleFormat not in TupleOfBundleFormats:
+        raise ValueError(f"Unknown bundle format: '{BundleFormat}' (choose one of: {', '.join(TupleOfBundleFormats)})")
+
+    ## tar.zst WHEN AVAILABLE
+    if BundleFormat == "tar.zst":
+        try:
+            import zstandard
+        except ImportError:
+            print("zstandard is not installed; writing a .zip bundle instead of .tar.zst")
+            BundleFormat = "zip"
+
+    ## RETURN VARIABLES
+    return(BundleFormat)
+
+## END FUNCTION
+
+## BEGIN MAIN FUNCTION
+## FUNCTION () #99 #0 - WRITE OUTPUT TO BUNDLE - MANIFEST OF ALL FILES OF ONE RUN; CLOSES THE BUNDLE
+def fn_WriteOutputToBundle(of, DictOfParameters, DictOfCounts):
+
+    """
+    ## MODULE.FUNCTION() #99 - WRITE OUTPUT TO BUNDLE; THE WRITERS OF THE RUN HAVE STREAMED EACH FILE STRAIGHT INTO ITS MEMBER OF THE .zip (DEFLATE PER MEMBER) OR .tar.zst BUNDLE OF of (mod_cls_OutputFiles); WRITES MANIFEST.json (PARAMETERS + COUNTS + MEMBERS) AS THE LAST MEMBER AND CLOSES THE BUNDLE; ## RETURNS FileNameForBundle (WITH EXTENSION)
+    """
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION: BEGIN FUNCTION #99 - WRITE OUTPUT TO BUNDLE")
+
+    ## DECLARE VARIABLES
+    ListOfMembers = list(of.ListOfMembers) ## ONE DICT PER MEMBER: Name, Bytes, Rows
+
+    ## MANIFEST: LAST MEMBER
+    DictOfManifest = {
+        "CreatedUTC": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "Parameters": DictOfParameters,
+        "Counts": dict(DictOfCounts, Files=len(ListOfMembers), Bytes=sum(EachMember["Bytes"] for EachMember in ListOfMembers)),
+        "Members": ListOfMembers,
+    }
+
+    ## WRITE MANIFEST + CLOSE BUNDLE
+    with of.fn_Open(FileNameForManifest, 'wb') as f:
+        f.write(json.dumps(DictOfManifest, ensure_ascii=False, indent=2).encode("utf-8"))
+    of.fn_Close()
+
+    ## TEST PRINT OUTPUT
+    print(f"Bundle: {of.fn_PathGet(of.FileNameForBundle)}; {len(ListOfMembers)} files")
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION: END FUNCTION #99 - WRITE OUTPUT TO BUNDLE")
+
+    ## RETURN VARIABLES
+    return(of.FileNameForBundle)
+
+## END FUNCTION () #99 - WRITE OUTPUT TO BUNDLE
+
+## BEGIN FUNCTION () #99 #3 - BUNDLE MEMBERS ITERATE - YIELDS (NAME, BINARY FILE OBJECT) OF EACH MEMBER IN ORDER; EACH FILE OBJECT IS ONLY VALID UNTIL THE NEXT MEMBER
+def fn_BundleMembersIterate(BundleFilePath):
+
+    ## BEGIN IF / ELSE - zip OR tar.zst
+    if BundleFilePath.endswith(".zip"):
+
+        with zipfile.ZipFile(BundleFilePath) as Bundle:
+            for EachName in Bundle.namelist():
+                with Bundle.open(EachName) as FileInBundle:
+                    yield (EachName, FileInBundle)
+
+    else:
+
+        ## IMPORT MODULES ONLY IF NEEDED
+        import zstandard
+        with open(BundleFilePath, 'rb') as FileOfBundle, zstandard.ZstdDecompressor().stream_reader(FileOfBundle) as StreamOfBundle, tarfile.open(fileobj=StreamOfBundle, mode='r|') as Bundle:
+            for EachTarInfo in Bundle:
+                if EachTarInfo.isfile():
+                    yield (EachTarInfo.name, Bundle.extractfile(EachTarInfo))
+
+    ## END IF / ELSE
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #99 #4 - BUNDLE MANIFEST READ - ## RETURNS DictOfManifest
+def fn_BundleManifestRead(BundleFilePath):
+
+    ## zip: READ ONE MEMBER; tar.zst: STREAM TO THE LAST MEMBER
+    if BundleFilePath.endswith(".zip"):
+        with zipfile.ZipFile(BundleFilePath) as Bundle:
+            return(json.loads(Bundle.read(FileNameForManifest).decode("utf-8")))
+
+    for EachName, FileInBundle in fn_BundleMembersIterate(BundleFilePath):
+        if EachName == FileNameForManifest:
+            return(json.loads(FileInBundle.read().decode("utf-8")))
+
+    raise ValueError(f"No {FileNameForManifest} in bundle: {BundleFilePath}")
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #99 #5 - BUNDLE EXTRACT - WRITE MEMBERS (ALL OR ListOfNames) TO A DIRECTORY; ## RETURNS LIST OF FILE PATHS
+def fn_BundleExtract(BundleFilePath, DirectoryName, ListOfNames=None):
+
+    ## DECLARE VARIABLES
+    ListOfFilePaths = []
+    os.makedirs(DirectoryName, exist_ok=True)
+
+    ## BEGIN FOR LOOP - EACH MEMBER; NAMES ARE FLAT FILE NAMES (NO DIRECTORIES)
+    for EachName, FileInBundle in fn_BundleMembersIterate(BundleFilePath):
+
+        if ListOfNames is None or EachName in ListOfNames:
+
+            FilePath = os.path.join(DirectoryName, os.path.basename(EachName))
+            with open(FilePath, 'wb') as f:
+                shutil.copyfileobj(FileInBundle, f, ChunkSize)
+            ListOfFilePaths.append(FilePath)
+
+    ## END FOR LOOP
+
+    ## RETURN VARIABLES
+    return(ListOfFilePaths)
+
+## END FUNCTION
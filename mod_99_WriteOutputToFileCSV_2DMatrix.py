@@ -1,21 +1,43 @@
 ## IMPORT MODULES
 import csv
+import io
+import itertools
+from mod_cls_OutputFiles import cls_OutputFiles as OF ## FILES OF THE RUN: IN THE DIRECTORY OF OUTPUT OR STREAMED INTO THE BUNDLE (--bundle)
 
 ## DECLARE VARIABLES
+NumberOfRowsPerBlock = 1000 ## ROWS WRITTEN TO THE FILE AT ONCE; MEMORY FOR THE 2D MATRIX IS ONE BLOCK OF ROWS, NOT THE WHOLE TEXT
 
 ## DEFINE FUNCTIONS
-def fn_WriteOutputToFile(ListOfRows, FileNameForMatrix):
+def fn_WriteOutputToFile(ListOfRows, FileNameForMatrix, IsGzip=False, of=None):
 
     """
-    ## MODULE.FUNCTION() #99 - 
+    ## MODULE.FUNCTION() #99 - WRITE OUTPUT TO FILE - CSV 2D MATRIX; ListOfRows IS ANY ITERABLE OF ROWS (e.g. M2D OBJECT - ROWS ARE CREATED WHEN ITERATED); WRITTEN IN BLOCKS OF NumberOfRowsPerBlock ROWS; IsGzip == True WRITES FileNameForMatrix + .gz; ## RETURNS FileNameForMatrix
     """
 
+    ## GZIP: SAME CSV, COMPRESSED
+    if IsGzip:
+        FileNameForMatrix = FileNameForMatrix + ".gz"
+
+    ## ONE BLOCK OF CSV TEXT IN MEMORY AT A TIME
+    Buffer = io.StringIO(newline='')
+    f_csv = csv.writer(Buffer, delimiter=';')
+    ## f_csv.writerow(headers) ## HEADERS OPTIONAL - REMOVE COMMENTS BEFORE f_csv.writerow(headers) IF YOU WANT CSV FILE TO CONTAIN HEADERS
+
     ## OPEN (IF EXISTS) / CREATE (IF NOT EXISTS) CSV FILE; WRITE OUTPUT TO CSV FILE
-    with open("USER_GENERATED_FILES/" + FileNameForMatrix,'w', encoding="utf-8", newline='') as f:
+    with (of or OF()).fn_Open(FileNameForMatrix, IsGzip=IsGzip) as f:
+
+        ## BEGIN WHILE LOOP - EACH BLOCK OF ROWS
+        IteratorOfRows = iter(ListOfRows)
+        while ListOfRowsInBlock := list(itertools.islice(IteratorOfRows, NumberOfRowsPerBlock)):
+
+            f_csv.writerows(ListOfRowsInBlock)
+            f.write(Buffer.getvalue())
 
-        f_csv = csv.writer(f, delimiter=';')
-        ## f_csv.writerow(headers) ## HEADERS OPTIONAL - REMOVE COMMENTS BEFORE f_csv.writerow(headers) IF YOU WANT CSV FILE TO CONTAIN HEADERS
-        f_csv.writerows(ListOfRows)
+            ## EMPTY BUFFER FOR NEXT BLOCK
+            Buffer.seek(0)
+            Buffer.truncate()
 
+        ## END WHILE LOOP
 
-   
+    ## RETURN VARIABLES
+    return(FileNameForMatrix)
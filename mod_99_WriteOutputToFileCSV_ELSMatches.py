@@ -1,5 +1,7 @@
 ## IMPORT MODULES
 import csv
+import mod_99_WriteOutputToFileCSV_TextDictionary ## MODULE.FUNCTION() #99 - TEXT OF WORD + VERSE LOOKED UP BY ID WHEN WRITTEN
+from mod_cls_OutputFiles import cls_OutputFiles as OF ## FILES OF THE RUN: IN THE DIRECTORY OF OUTPUT OR STREAMED INTO THE BUNDLE (--bundle)
 
 ## DECLARE VARIABLES
 headers = ["(n, d, k)", "[Gematria of ELS]", "Gematria WordTotal of ELS", "ELS Search Term", "Found in WordNumber In Text", "WordCoordinatesDWTK", "Found in Word In Text", \
@@ -7,14 +9,18 @@ headers = ["(n, d, k)", "[Gematria of ELS]", "Gematria WordTotal of ELS", "ELS S
 ## rows = []
 
 ## DEFINE FUNCTIONS ##
-def fn_WriteOutputToFile(TupleOfTuples, FileNameForELSMatches):
+def fn_WriteOutputToFile(TupleOfTuples, FileNameForELSMatches, DW=None, DS=None, of=None):
 
     """
-    ## MODULE.FUNCTION() #99 - 
+    ## MODULE.FUNCTION() #99 - WORD + VERSE ARE WRITTEN AS TEXT (LOOKED UP IN DW / DS); DW, DS == None WRITES THEIR IDS (WordNumber, VerseCoordinatesDS) - SEE TEXT DICTIONARY
     """
+
+    ## TEXT OF WORD + VERSE IN PLACE OF THEIR IDS
+    if DW is not None:
+        TupleOfTuples = mod_99_WriteOutputToFileCSV_TextDictionary.fn_RowsExpand(TupleOfTuples, mod_99_WriteOutputToFileCSV_TextDictionary.TupleOfIndexesOfTextIDs4ELSMatches, DW, DS)
     
     ## OPEN (IF EXISTS) / CREATE (IF NOT EXISTS) CSV FILE; WRITE OUTPUT TO CSV FILE
-    with open("USER_GENERATED_FILES/" + FileNameForELSMatches,'w', encoding="utf-8", newline='') as f:
+    with (of or OF()).fn_Open(FileNameForELSMatches) as f:
 
         f_csv = csv.writer(f, delimiter=';')
         f_csv.writerow(headers) ## HEADERS OPTIONAL - REMOVE COMMENTS BEFORE f_csv.writerow(headers) IF YOU WANT CSV FILE TO CONTAIN HEADERS
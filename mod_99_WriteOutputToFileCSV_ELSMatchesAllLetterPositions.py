@@ -1,5 +1,6 @@
 ## IMPORT MODULES
 import csv
+from mod_cls_OutputFiles import cls_OutputFiles as OF ## FILES OF THE RUN: IN THE DIRECTORY OF OUTPUT OR STREAMED INTO THE BUNDLE (--bundle)
 
 ## DECLARE VARIABLES
 #headers = ["Letter", "LetterPositionIndex", "LetterCoordinatesD5K", "LetterPositionInWord", "WordNumber", "WordNumberInVerse", "WordCoordinatesDWTK"]
@@ -9,7 +10,7 @@ headers = ["(n,d,k)", "LetterGematriaNumberValue", "Letter", "LetterPositionInde
 
 ## DEFINE FUNCTIONS
 
-def fn_WriteOutputToFile(Dict4FileNames4ELSTerms): ## KEYS: FileNamesForELSTerms, VALUES: MasterList4LetterInfo
+def fn_WriteOutputToFile(Dict4FileNames4ELSTerms, of=None): ## KEYS: FileNamesForELSTerms, VALUES: MasterList4LetterInfo
 
     """
     ## MODULE.FUNCTION() #99 - 
@@ -21,11 +22,12 @@ def fn_WriteOutputToFile(Dict4FileNames4ELSTerms): ## KEYS: FileNamesForELSTerms
     ## VALUE: MasterList4LetterInfo
         
     ELSCounter = 1
+    of = of or OF() ## FILES IN USER_GENERATED_FILES IF NOT GIVEN
 
     for EachKey, EachValue in Dict4FileNames4ELSTerms.items(): ## EachFileName
 
         ## OPEN (IF EXISTS) / CREATE (IF NOT EXISTS) CSV FILE; WRITE OUTPUT TO CSV FILE
-        with open(f"USER_GENERATED_FILES/" + EachKey,'w', encoding="utf-8", newline='') as f:
+        with of.fn_Open(EachKey) as f:
             
             f_csv = csv.writer(f, delimiter=';')
             f_csv.writerow(headers) ## HEADERS OPTIONAL - REMOVE COMMENTS BEFORE f_csv.writerow(headers) IF YOU WANT CSV FILE TO CONTAIN HEADERS
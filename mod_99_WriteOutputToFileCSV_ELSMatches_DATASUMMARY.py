@@ -1,19 +1,20 @@
 ## IMPORT MODULES
 import csv
+from mod_cls_OutputFiles import cls_OutputFiles as OF ## FILES OF THE RUN: IN THE DIRECTORY OF OUTPUT OR STREAMED INTO THE BUNDLE (--bundle)
 
 ## DECLARE VARIABLES
 headers = ["ELS Search Term", "(ELS Search Term #, [Gematria LetterValues], Gematria WordTotal)", "Gematria WordTotal", "# Positive ELS Matches", "# Negative ELS Matches"]
 ## rows = []
 
 ## DEFINE FUNCTIONS
-def fn_WriteOutputToFile(W, FileNameForELSMatchesDataSummary):
+def fn_WriteOutputToFile(W, FileNameForELSMatchesDataSummary, of=None):
 
     """
     ## MODULE.FUNCTION() #99 - 
     """
     
     ## OPEN (IF EXISTS) / CREATE (IF NOT EXISTS) CSV FILE; WRITE OUTPUT TO CSV FILE
-    with open("USER_GENERATED_FILES/" + FileNameForELSMatchesDataSummary,'w', encoding="utf-8", newline='') as f:
+    with (of or OF()).fn_Open(FileNameForELSMatchesDataSummary) as f:
 
         f_csv = csv.writer(f, delimiter=';')
         f_csv.writerow(headers) ## HEADERS OPTIONAL - REMOVE COMMENTS BEFORE f_csv.writerow(headers) IF YOU WANT CSV FILE TO CONTAIN HEADERS
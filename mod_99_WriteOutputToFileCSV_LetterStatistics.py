@@ -1,18 +1,19 @@
 ## IMPORT MODULES
 import csv 
+from mod_cls_OutputFiles import cls_OutputFiles as OF ## FILES OF THE RUN: IN THE DIRECTORY OF OUTPUT OR STREAMED INTO THE BUNDLE (--bundle)
 
 ## DECLARE VARIABLES
 headers = ["Hebrew Letter", "Number Of Instances", "Length Of Text", "Percentage Of Text as Decimal", "Percentage Of Text as %"]
 
 ## DEFINE FUNCTIONS
-def fn_WriteOutputToFile(ListOfRows, FileName):
+def fn_WriteOutputToFile(ListOfRows, FileName, of=None):
 
     """
     ## MODULE.FUNCTION() #99 - 
     """
 
     ## OPEN (IF EXISTS) / CREATE (IF NOT EXISTS) CSV FILE; WRITE OUTPUT TO CSV FILE
-    with open("USER_GENERATED_FILES/" + FileName,'w', encoding="utf-8", newline='') as f:
+    with (of or OF()).fn_Open(FileName) as f:
 
         f_csv = csv.writer(f, delimiter=';')
         f_csv.writerow(headers) ## HEADERS OPTIONAL ## REMOVE COMMENTS BEFORE f_csv.writerow(headers) IF YOU WANT CSV FILE TO CONTAIN HEADERS
@@ -0,0 +1,75 @@
+## IMPORT MODULES
+import csv
+import itertools
+from mod_cls_OutputFiles import cls_OutputFiles as OF ## FILES OF THE RUN: IN THE DIRECTORY OF OUTPUT OR STREAMED INTO THE BUNDLE (--bundle)
+
+## DECLARE VARIABLES
+## RECORDS OF ELS MATCHES (#27) + LETTER POSITIONS (#28) HOLD THE WordNumber (KEY OF DW) + VerseCoordinatesDS (KEY OF DS) INSTEAD OF THE TEXT OF THE WORD + VERSE
+## INDEX OF (WORD ID, VERSE ID) IN EACH RECORD
+TupleOfIndexesOfTextIDs4ELSMatches = (6, 9) ## (ndk, GematriaValues, WordGematriaNumberValue, Term, WordNumber, WordCoordinatesDWTK, WORD ID, LetterPositionInWord, LetterCoordinatesD5K, VERSE ID)
+TupleOfIndexesOfTextIDs4LetterPositions = (5, 10) ## (ndk, LetterGematriaNumberValue, Letter, LetterPositionIndex, LetterCoordinatesD5K, WORD ID, LetterPositionInWord, WordNumber, WordCoordinatesDWTK, WordNumberInVerse, VERSE ID)
+headers = ["Type", "ID", "Text"] ## Type: Word (ID == WordNumber) OR Verse (ID == VerseCoordinatesDS)
+
+## BEGIN FUNCTION () #99 #1 - ROWS EXPAND - GENERATOR OF RECORDS WITH THE TEXT OF THE WORD + VERSE IN PLACE OF THEIR IDS; NOTHING IS COPIED UNTIL EACH ROW IS WRITTEN
+def fn_RowsExpand(ListOfRecords, TupleOfIndexesOfTextIDs, DW, DS):
+
+    ## DECLARE VARIABLES
+    IndexOfWordID, IndexOfVerseID = TupleOfIndexesOfTextIDs
+
+    ## BEGIN FOR LOOP - EACH RECORD
+    for EachRecord in ListOfRecords:
+
+        EachRow = list(EachRecord)
+        EachRow[IndexOfWordID] = DW[EachRecord[IndexOfWordID]][0]
+        EachRow[IndexOfVerseID] = DS[EachRecord[IndexOfVerseID]]
+        yield EachRow
+
+    ## END FOR LOOP
+
+## END FUNCTION
+
+## BEGIN MAIN FUNCTION
+## FUNCTION () #99 #0 - WRITE OUTPUT TO FILE - TEXT DICTIONARY
+def fn_WriteOutputToFile(ListOfListsOfELSMatches, ListOfMasterLists4LetterPositions, DW, DS, FileNameForTextDictionary, of=None):
+
+    """
+    ## MODULE.FUNCTION() #99 - WRITE OUTPUT TO FILE - TEXT DICTIONARY; ONE ROW PER WORD + VERSE REFERENCED BY ANY ELS MATCH OR LETTER POSITION, WRITTEN ONCE PER RUN; WITH --text-ids THE OTHER CSV FILES HOLD ONLY THE IDS; ## RETURNS FileNameForTextDictionary
+    """
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION: BEGIN FUNCTION #99 - WRITE OUTPUT TO FILE - TEXT DICTIONARY")
+
+    ## DECLARE VARIABLES
+    SetOfWordIDs = set()
+    SetOfVerseIDs = set()
+
+    ## COLLECT IDS OF ALL ELS MATCHES (None == STAGE NOT RUN)
+    IndexOfWordID, IndexOfVerseID = TupleOfIndexesOfTextIDs4ELSMatches
+    for EachRecord in itertools.chain.from_iterable(EachList or [] for EachList in ListOfListsOfELSMatches):
+        SetOfWordIDs.add(EachRecord[IndexOfWordID])
+        SetOfVerseIDs.add(EachRecord[IndexOfVerseID])
+
+    ## COLLECT IDS OF ALL LETTER POSITIONS; MASTER LIST == ONE LIST OF LETTERS PER ELS MATCH
+    IndexOfWordID, IndexOfVerseID = TupleOfIndexesOfTextIDs4LetterPositions
+    for EachRecord in itertools.chain.from_iterable(EachListOfLetters for EachMasterList in ListOfMasterLists4LetterPositions for EachListOfLetters in (EachMasterList or [])):
+        SetOfWordIDs.add(EachRecord[IndexOfWordID])
+        SetOfVerseIDs.add(EachRecord[IndexOfVerseID])
+
+    ## OPEN (IF EXISTS) / CREATE (IF NOT EXISTS) CSV FILE; WRITE OUTPUT TO CSV FILE
+    with (of or OF()).fn_Open(FileNameForTextDictionary) as f:
+
+        f_csv = csv.writer(f, delimiter=';')
+        f_csv.writerow(headers)
+        f_csv.writerows(("Word", WordNumber, DW[WordNumber][0]) for WordNumber in sorted(SetOfWordIDs))
+        f_csv.writerows(("Verse", VerseCoordinatesDS, DS[VerseCoordinatesDS]) for VerseCoordinatesDS in sorted(SetOfVerseIDs))
+
+    ## TEST PRINT OUTPUT
+    print(f"Words: {len(SetOfWordIDs)}; Verses: {len(SetOfVerseIDs)}")
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION: END FUNCTION #99 - WRITE OUTPUT TO FILE - TEXT DICTIONARY")
+
+    ## RETURN VARIABLES
+    return(FileNameForTextDictionary)
+
+## END FUNCTION () #99 - WRITE OUTPUT TO FILE - TEXT DICTIONARY
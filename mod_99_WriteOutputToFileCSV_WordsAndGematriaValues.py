@@ -1,5 +1,6 @@
 ## IMPORT MODULES
 import csv
+from mod_cls_OutputFiles import cls_OutputFiles as OF ## FILES OF THE RUN: IN THE DIRECTORY OF OUTPUT OR STREAMED INTO THE BUNDLE (--bundle)
 
 ## DECLARE VARIABLES
 headers = ["WordCoordinatesDWTK", "Word in Text", "Letter Positions (n)", "(Word#, [Gematria LetterValues], Gematria WordTotal)", "GematriaWordTotal"]
@@ -7,14 +8,14 @@ headers = ["WordCoordinatesDWTK", "Word in Text", "Letter Positions (n)", "(Word
 
 ## DEFINE FUNCTIONS
 
-def fn_WriteOutputToFile(W, FileNameForGematria):
+def fn_WriteOutputToFile(W, FileNameForGematria, of=None):
 
     """
     ## MODULE.FUNCTION() #99 - 
     """
     
     ## OPEN (IF EXISTS) / CREATE (IF NOT EXISTS) CSV FILE; WRITE OUTPUT TO CSV FILE
-    with open("USER_GENERATED_FILES/" + FileNameForGematria,'w', encoding="utf-8", newline='') as f:
+    with (of or OF()).fn_Open(FileNameForGematria) as f:
 
         f_csv = csv.writer(f, delimiter=';')
         f_csv.writerow(headers) ## HEADERS OPTIONAL - REMOVE COMMENTS BEFORE f_csv.writerow(headers) IF YOU WANT CSV FILE TO CONTAIN HEADERS
@@ -0,0 +1,19 @@
+## IMPORT MODULES
+import json
+from mod_cls_OutputFiles import cls_OutputFiles as OF ## FILES OF THE RUN: IN THE DIRECTORY OF OUTPUT OR STREAMED INTO THE BUNDLE (--bundle)
+
+## BEGIN FUNCTION () #99 - WRITE OUTPUT TO FILE - COVERAGE ##
+def fn_WriteOutputToFile(DictOfCoverage, FileNameForCoverage, of=None):
+
+    """
+    ## MODULE.FUNCTION() #99 - WRITE OUTPUT TO FILE - COVERAGE; SKIP DISTANCES (d) OF EACH ELS SEARCH TERM SEARCHED COMPLETELY (DRangesDone) + NOT SEARCHED (DRangesLeft) (MODULE.FUNCTION() #22D); ## RETURNS FileNameForCoverage
+    """
+
+    ## OPEN (IF EXISTS) / CREATE (IF NOT EXISTS) JSON FILE; WRITE OUTPUT TO JSON FILE
+    with (of or OF()).fn_Open(FileNameForCoverage) as f:
+        json.dump(DictOfCoverage, f, ensure_ascii=False, indent=2)
+
+    ## RETURN VARIABLES
+    return(FileNameForCoverage)
+
+## END FUNCTION () #99 - WRITE OUTPUT TO FILE - COVERAGE
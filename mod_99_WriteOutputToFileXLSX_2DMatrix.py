@@ -1,133 +1,105 @@
 ## IMPORT MODULES
-import xlsxwriter
+from mod_cls_OutputFiles import cls_OutputFiles as OF ## FILES OF THE RUN: IN THE DIRECTORY OF OUTPUT OR STREAMED INTO THE BUNDLE (--bundle)
 
 ## DECLARE VARIABLES
+## ONE COLOR PER ELS SEARCH TERM (REPEATS AFTER THE LAST COLOR): (FILL, TEXT)
+ListOfColors4ELSTerms = [
+    ('#FFC7CE', '#9C0006'), ## LIGHT RED FILL WITH DARK RED TEXT
+    ('#a4a4f5', '#0303fc'), ## LIGHT BLUE FILL WITH DARK BLUE TEXT
+    ('#C6EFCE', '#006100'), ## LIGHT GREEN FILL WITH DARK GREEN TEXT
+    ('#cc00ff', '#000000'), ## PURPLE FILL WITH BLACK TEXT
+    ('#c08763', '#ffffff'), ## BROWN FILL WITH WHITE TEXT
+    ('#FFEB9C', '#9C5700'), ## YELLOW FILL WITH DARK YELLOW TEXT
+]
+
+## BEGIN FUNCTION () #99 #1 - CELLS OF ELS MATCHES - MAP EACH LETTER POSITION (n) OF EACH ELS MATCH TO (ROW, COLUMN) OF THE 2D MATRIX
+def fn_CellsOfELSMatchesCreate(XW, DELSO):
 
-## DEFINE FUNCTIONS
-def fn_WriteOutputToFile(YH, XW, ListOfRowsOfLetters, FileNameForMatrixXLSX):
+    ## DECLARE VARIABLES
+    DictOfCellsInRows = {} ## KEY: ROW; VALUE: DICT OF {COLUMN: ELS SEARCH TERM NUMBER}
+
+    ## BEGIN FOR EACH ELS OBJECT - POSITIVE + NEGATIVE MATCHES BY FIRST LETTER
+    for ELSSearchTermNumber, EachELSObject in DELSO.items():
+
+        for EachDictOfMatches in (EachELSObject.DELSMLF_POS or {}, EachELSObject.DELSMLF_NEG or {}):
+
+            for n, d, k in EachDictOfMatches:
+
+                for EachNumber in range(k):
+
+                    ## 1-BASED LETTER POSITION --> ROW + COLUMN; COLUMN 0 IS THE D5K OF THE LAST LETTER, LETTERS ARE RIGHT-TO-LEFT
+                    Row, PositionInRow = divmod((n + (EachNumber * d)) - 1, XW)
+                    DictOfCellsInRows.setdefault(Row, {})[XW - PositionInRow] = ELSSearchTermNumber
+
+    ## END FOR EACH ELS OBJECT
+
+    ## RETURN VARIABLES
+    return(DictOfCellsInRows)
+
+## END FUNCTION
+
+## BEGIN MAIN FUNCTION
+## FUNCTION () #99 #0 - WRITE OUTPUT TO FILE - XLSX 2D MATRIX
+def fn_WriteOutputToFile(YH, XW, ListOfRowsOfLetters, FileNameForMatrixXLSX, DELSO=None, of=None):
 
     """
-    ## MODULE.FUNCTION() #99 - 
+    ## MODULE.FUNCTION() #99 - WRITE OUTPUT TO FILE - XLSX 2D MATRIX; constant_memory WORKBOOK WRITTEN ONE ROW AT A TIME (write_row); ONLY THE CELLS OF THE LETTERS OF THE ELS MATCHES IN DELSO GET A FORMAT (ONE COLOR PER ELS SEARCH TERM)
     """
 
-    ## CREATE XLSX WORKBOOK FILE WITH WORKSHEET; WRITE OUTPUT TO XLSX EXCEL FILE
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION: BEGIN FUNCTION #99 - WRITE OUTPUT TO FILE - XLSX 2D MATRIX")
 
     ## DIMENSIONS OF THE 2D MATRIX == XW COLUMNS x YH ROWS
     ## TEST PRINT OUTPUT
-    print("\n")
     print(f"YH = {YH}; XW = {XW}")
 
-    ## PURE XLSXWRITER CODE; ## NO PANDAS PROXY
-    workbook = xlsxwriter.Workbook("USER_GENERATED_FILES/" + FileNameForMatrixXLSX)
+    ## IMPORT MODULES ONLY IF NEEDED (--xlsx)
+    import xlsxwriter
+
+    ## PURE XLSXWRITER CODE; ## NO PANDAS PROXY; constant_memory: EACH ROW IS WRITTEN TO DISK WHEN THE NEXT ROW BEGINS
+    workbook = xlsxwriter.Workbook(None, {'constant_memory': True}) ## FILE IS GIVEN WHEN CLOSED (BELOW)
     worksheet = workbook.add_worksheet()
 
-    ## DEFINE FORMATS
-    ## FORMAT: LIGHT RED FILL WITH DARK RED TEXT
-    format1 = workbook.add_format({'bg_color': '#FFC7CE',
-                                   'font_color': '#9C0006'})
-
-    ## FORMAT: GREEN FILL WITH DARK GREEN TEXT
-    format2 = workbook.add_format({'bg_color': '#a4a4f5%',
-                                   'font_color': '#0303fc'})
-
-    ## FORMAT: 
-    format3 = workbook.add_format({'bg_color': '#cc00ff',
-                                   'font_color': '#000000'})
-
-    ## FORMAT: 
-    format4 = workbook.add_format({'bg_color': '#c08763',
-                                   'font_color': '#ffffff'})
-
-    
-    
-    # ## SET COLUMN WIDTHS
-    worksheet.set_column_pixels(0,0,120)
-    worksheet.set_column_pixels(1,(XW),30)
-    worksheet.set_column_pixels(XW,XW,120)
-
-    ## FLATTEN ListOfRowsOfLetters INTO ONE LONG 1-D LIST
-    ListOfCells = []
-    for EachRow in ListOfRowsOfLetters:
-        for EachCell in EachRow:
-            ListOfCells.append(EachCell)
-
-   
-    ## CONVERT TUPLES TO STRINGS BECAUSE XLSX WRITER CAN'T DEAL WITH TUPLES
-    ListOfCells = [str(CellContent) if type(CellContent) is tuple else CellContent for CellContent in ListOfCells]
-    
-    ## DECLARE VARIABLES
-    counter = 0
+    ## SET COLUMN WIDTHS: D5K | XW LETTERS | D5K
+    worksheet.set_column_pixels(0, 0, 120)
+    worksheet.set_column_pixels(1, XW, 30)
+    worksheet.set_column_pixels(XW + 1, XW + 1, 120)
 
-    ## START FROM FIRST CELL IN TOP LEFT:  (0,0)
+    ## DEFINE FORMATS - ONE PER ELS SEARCH TERM
+    DictOfFormats4ELSTerms = {}
+    DictOfCellsInRows = {}
+    if DELSO is not None:
 
-    ## BEGIN FOR LOOP
-    for row in range(0, YH):
+        for EachCounter, ELSSearchTermNumber in enumerate(DELSO):
+            FillColor, FontColor = ListOfColors4ELSTerms[EachCounter % len(ListOfColors4ELSTerms)]
+            DictOfFormats4ELSTerms[ELSSearchTermNumber] = workbook.add_format({'bg_color': FillColor, 'font_color': FontColor})
 
-        ## BEGIN FOR LOOP
-        for column in range(0, (XW+2)):
+        ## GET CELLS OF ALL LETTERS OF ALL ELS MATCHES
+        DictOfCellsInRows = fn_CellsOfELSMatchesCreate(XW, DELSO)
 
-            ## WRITE TO THE INDIVIDUAL CELL
-            worksheet.write(row, column, ListOfCells[counter])
+    ## BEGIN FOR LOOP - EACH ROW OF THE 2D MATRIX, IN ORDER (REQUIRED BY constant_memory)
+    for Row, EachRow in enumerate(ListOfRowsOfLetters):
 
-            ## INCREMENT COUNTER VARIABLE
-            counter += 1
+        ## CONVERT TUPLES (D5K) TO STRINGS BECAUSE XLSX WRITER CAN'T DEAL WITH TUPLES
+        ListOfCells = [str(CellContent) if type(CellContent) is tuple else CellContent for CellContent in EachRow]
 
-            ## INCREMENT XW COLUMN FOR EACH CELL GOING TO THE RIGHT
-            column += 1
+        ## WRITE ROW
+        worksheet.write_row(Row, 0, ListOfCells)
 
-        ## END FOR LOOP
+        ## REWRITE CELLS OF ELS MATCHES IN THIS ROW WITH THE FORMAT OF THE ELS SEARCH TERM (ROW IS STILL IN MEMORY)
+        for Column, ELSSearchTermNumber in DictOfCellsInRows.get(Row, {}).items():
+            worksheet.write(Row, Column, ListOfCells[Column], DictOfFormats4ELSTerms[ELSSearchTermNumber])
 
-        ## INCREMENT YH ROW FOR EACH ROW OF CELLS
-        row += 1
-    
     ## END FOR LOOP
 
-    ## SET CONDITIONAL FORMAT FOR ELS MATCHES
-    worksheet.conditional_format(0,0,YH,(XW+2), {'type':     'text',
-                                        'criteria': 'containing',
-                                        'value':    'מ',
-                                        'format':   format1})
-
-    ## SET CONDITIONAL FORMAT FOR ELS MATCHES
-    worksheet.conditional_format(0,0,YH,(XW+2), {'type':     'text',
-                                        'criteria': 'containing',
-                                        'value':    'ם',
-                                        'format':   format1})
-
-    ## SET CONDITIONAL FORMAT FOR ELS MATCHES
-    worksheet.conditional_format(0,0,YH,(XW+2), {'type':     'text',
-                                        'criteria': 'containing',
-                                        'value':    'ת',
-                                        'format':   format1})
-
-    ## SET CONDITIONAL FORMAT FOR ELS MATCHES
-    worksheet.conditional_format(0,0,YH,(XW+2), {'type':     'text',
-                                       'criteria': 'containing',
-                                       'value':    'ל',
-                                       'format':   format2})
-
-    ## SET CONDITIONAL FORMAT FOR ELS MATCHES
-    worksheet.conditional_format(0,0,YH,(XW+2), {'type':     'text',
-                                       'criteria': 'containing',
-                                       'value':    'א',
-                                       'format':   format2})
+    ## CLOSE XLSX EXCEL FILE; xlsxwriter ONLY WRITES THE FILE WHEN CLOSED, SO THE FILE (OR MEMBER OF THE BUNDLE) IS ONLY OPENED NOW
+    with (of or OF()).fn_Open(FileNameForMatrixXLSX, 'wb') as f:
+        workbook.filename = f
+        workbook.close()
 
-    """
-    ## SET CONDITIONAL FORMAT FOR ELS MATCHES
-    worksheet.conditional_format(0,0,YH,(XW+2), {'type':     'text',
-                                       'criteria': 'containing',
-                                       'value':    'ר',
-                                       'format':   format3})
-
-    ## SET CONDITIONAL FORMAT FOR ELS MATCHES
-    worksheet.conditional_format(0,0,YH,(XW+2), {'type':     'text',
-                                       'criteria': 'containing',
-                                       'value':    'ד',
-                                       'format':   format4})
-    """
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION: END FUNCTION #99 - WRITE OUTPUT TO FILE - XLSX 2D MATRIX")
 
-    ## worksheet.write('A1', 'Hello world', format1)
-    ## worksheet.write('A2', 'Hello world', format2)
-    
-    ## CLOSE XLSX EXCEL FILE
-    workbook.close()
+## END FUNCTION () #99 - WRITE OUTPUT TO FILE - XLSX 2D MATRIX
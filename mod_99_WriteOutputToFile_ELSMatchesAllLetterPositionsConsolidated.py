@@ -0,0 +1,172 @@
+## IMPORT MODULES
+import csv
+import os
+import mod_99_WriteOutputToFileCSV_TextDictionary ## MODULE.FUNCTION() #99 - TEXT OF WORD + VERSE LOOKED UP BY ID WHEN WRITTEN
+import mod_99_WriteOutputToFileCSV_ELSMatchesAllLetterPositions ## MODULE.FUNCTION() #99 - HEADERS + WRITER OF THE LEGACY LAYOUT (ONE CSV FILE PER ELS MATCH)
+from mod_cls_OutputFiles import cls_OutputFiles as OF ## FILES OF THE RUN: IN THE DIRECTORY OF OUTPUT OR STREAMED INTO THE BUNDLE (--bundle)
+
+## DECLARE VARIABLES
+## ONE ROW PER LETTER OF EACH ELS MATCH; (n,d,k) IS SPLIT INTO 3 COLUMNS; FileNameLegacy == NAME OF THE CSV FILE OF THE LEGACY LAYOUT FOR THAT ELS MATCH, ON THE ROW OF ITS 1ST LETTER ONLY (EMPTY ON THE OTHER ROWS)
+headers = ["MatchID", "FileNameLegacy", "n", "d", "k", "LetterGematriaNumberValue", "Letter", "LetterPositionIndex", "LetterCoordinatesD5K", "Found in Word in Text", "LetterPositionIndex In Word", "WordNumber", "WordCoordinatesDWTK", "WordNumberInVerse", "Found In Verse"]
+TupleOfFileFormats = ("csv", "parquet", "feather") ## PARQUET / FEATHER NEED pandas + pyarrow
+
+## BEGIN FUNCTION () #99 #1 - ROWS CREATE - GENERATOR OF ONE ROW PER LETTER OF EACH ELS MATCH
+def fn_RowsCreate(MasterList4LetterPositions_POS, Dict4FileNames4ELSTerms_POS, MasterList4LetterPositions_NEG, Dict4FileNames4ELSTerms_NEG, DW=None, DS=None):
+
+    ## DECLARE VARIABLES
+    MatchID = 1 ## 1-BASED; POSITIVE MATCHES FIRST, THEN NEGATIVE MATCHES
+
+    ## BEGIN FOR LOOP - POSITIVE AND NEGATIVE ELS MATCHES; FILE NAMES ARE IN THE SAME ORDER AS THE MASTER LIST (SAME AS MODULE.FUNCTION() #99 - ITERATE OUTPUT FOR ELS MATCHES)
+    for MasterList4LetterPositions, Dict4FileNames4ELSTerms in ((MasterList4LetterPositions_POS, Dict4FileNames4ELSTerms_POS), (MasterList4LetterPositions_NEG, Dict4FileNames4ELSTerms_NEG)):
+
+        for EachFileName, EachListOfTuples4LetterInfo in zip(Dict4FileNames4ELSTerms, MasterList4LetterPositions):
+
+            ## TEXT OF WORD + VERSE IN PLACE OF THEIR IDS (DW, DS == None: IDS ONLY)
+            if DW is not None:
+                EachListOfTuples4LetterInfo = mod_99_WriteOutputToFileCSV_TextDictionary.fn_RowsExpand(EachListOfTuples4LetterInfo, mod_99_WriteOutputToFileCSV_TextDictionary.TupleOfIndexesOfTextIDs4LetterPositions, DW, DS)
+
+            for LetterNumber, EachTupleOfLetterInfo in enumerate(EachListOfTuples4LetterInfo):
+
+                ## (n,d,k) --> n, d, k; TUPLES OF COORDINATES ARE KEPT AS THEY APPEAR IN THE LEGACY CSV FILES
+                n, d, k = EachTupleOfLetterInfo[0]
+                yield (MatchID, EachFileName if LetterNumber == 0 else None, n, d, k, EachTupleOfLetterInfo[1], EachTupleOfLetterInfo[2], EachTupleOfLetterInfo[3], str(EachTupleOfLetterInfo[4]), EachTupleOfLetterInfo[5], EachTupleOfLetterInfo[6], EachTupleOfLetterInfo[7], str(EachTupleOfLetterInfo[8]), EachTupleOfLetterInfo[9], EachTupleOfLetterInfo[10] if DW is not None else str(EachTupleOfLetterInfo[10]))
+
+            ## INCREMENT MATCH ID
+            MatchID += 1
+
+    ## END FOR LOOP
+
+## END FUNCTION
+
+## BEGIN MAIN FUNCTION
+## FUNCTION () #99 #0 - WRITE OUTPUT TO FILE - ALL LETTER POSITIONS OF ALL ELS MATCHES IN ONE FILE
+def fn_WriteOutputToFile(MasterList4LetterPositions_POS, Dict4FileNames4ELSTerms_POS, MasterList4LetterPositions_NEG, Dict4FileNames4ELSTerms_NEG, FileNameForELSMatchesAllLetterPositions, FileFormat="csv", DW=None, DS=None, of=None):
+
+    """
+    ## MODULE.FUNCTION() #99 - WRITE OUTPUT TO FILE; ALL LETTER POSITIONS OF ALL (POSITIVE + NEGATIVE) ELS MATCHES IN ONE CSV (BULK writerows) OR PARQUET / FEATHER (COLUMNAR) FILE KEYED BY MatchID, INSTEAD OF ONE CSV FILE PER ELS MATCH; WORD + VERSE AS TEXT (DW, DS) OR AS IDS (DW, DS == None); ## RETURNS FileNameForELSMatchesAllLetterPositions
+    """
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION: BEGIN FUNCTION #99 - WRITE OUTPUT TO FILE - ALL LETTER POSITIONS OF ALL ELS MATCHES (CONSOLIDATED)")
+
+    ## IF FORMAT IS UNKNOWN
+    if FileFormat not in TupleOfFileFormats:
+        raise ValueError(f"Unknown file format for ELS letter positions: '{FileFormat}' (choose one of: {', '.join(TupleOfFileFormats)})")
+
+    ## FILE EXTENSION == FILE FORMAT
+    FileNameForELSMatchesAllLetterPositions = os.path.splitext(FileNameForELSMatchesAllLetterPositions)[0] + "." + FileFormat
+
+    ## GENERATOR OF ROWS; NOTHING IS COPIED UNTIL THE ROWS ARE WRITTEN
+    of = of or OF() ## FILES IN USER_GENERATED_FILES IF NOT GIVEN
+    Rows = fn_RowsCreate(MasterList4LetterPositions_POS, Dict4FileNames4ELSTerms_POS, MasterList4LetterPositions_NEG, Dict4FileNames4ELSTerms_NEG, DW, DS)
+
+    ## BEGIN MATCH CASE - FILE FORMAT
+    match FileFormat:
+
+        ## CSV: ONE FILE, ONE BULK WRITE
+        case "csv":
+
+            ## OPEN (IF EXISTS) / CREATE (IF NOT EXISTS) CSV FILE; WRITE OUTPUT TO CSV FILE
+            with of.fn_Open(FileNameForELSMatchesAllLetterPositions) as f:
+
+                f_csv = csv.writer(f, delimiter=';')
+                f_csv.writerow(headers)
+                f_csv.writerows(Rows)
+
+        ## PARQUET / FEATHER: ONE COLUMN PER HEADER
+        case _:
+
+            ## IMPORT MODULES ONLY IF NEEDED; PARQUET / FEATHER ALSO NEED pyarrow
+            import pandas as pd
+
+            ## CREATE DATAFRAME FROM COLUMNS
+            DataFrameOfLetterPositions = pd.DataFrame.from_records(Rows, columns=headers)
+
+            ## WRITE OUTPUT TO FILE
+            with of.fn_Open(FileNameForELSMatchesAllLetterPositions, 'wb') as f:
+                if FileFormat == "parquet":
+                    DataFrameOfLetterPositions.to_parquet(f, index=False)
+                else:
+                    DataFrameOfLetterPositions.to_feather(f)
+
+    ## END MATCH CASE
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print(f"ELS letter positions written to: {of.fn_PathGet(FileNameForELSMatchesAllLetterPositions)}")
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION: END FUNCTION #99 - WRITE OUTPUT TO FILE - ALL LETTER POSITIONS OF ALL ELS MATCHES (CONSOLIDATED)")
+
+    ## RETURN VARIABLES
+    return(FileNameForELSMatchesAllLetterPositions)
+
+## END FUNCTION () #99 - WRITE OUTPUT TO FILE - ALL LETTER POSITIONS OF ALL ELS MATCHES (CONSOLIDATED)
+
+## BEGIN FUNCTION () #99 #2 - LEGACY FILES CREATE - ONE CSV FILE PER ELS MATCH FROM THE CONSOLIDATED FILE (ON DEMAND)
+def fn_LegacyFilesCreate(FileNameForELSMatchesAllLetterPositions, of=None, Rows=None):
+
+    """
+    ## MODULE.FUNCTION() #99 - LEGACY FILES CREATE; READS THE CONSOLIDATED FILE AND WRITES THE SAME ONE-CSV-FILE-PER-ELS-MATCH LAYOUT AS MODULE.FUNCTION() #99 - ITERATE OUTPUT FOR ELS MATCHES;
+    ## Rows (fn_RowsCreate) IN PLACE OF READING THE FILE BACK WHEN IT WAS STREAMED INTO A BUNDLE (--bundle); ## RETURNS NUMBER OF FILES WRITTEN
+    """
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION: BEGIN FUNCTION #99 - LEGACY FILES CREATE - ONE CSV FILE PER ELS MATCH")
+
+    ## DECLARE VARIABLES
+    Dict4FileNames4ELSTerms = {} ## KEY: FILE NAME OF LEGACY LAYOUT; VALUE: LIST OF ROWS OF THE LEGACY LAYOUT
+    of = of or OF() ## FILES IN USER_GENERATED_FILES IF NOT GIVEN
+    FileNameWithPath = of.fn_PathGet(FileNameForELSMatchesAllLetterPositions)
+    f = None
+
+    ## BEGIN IF / ELIF - READ ROWS OF CONSOLIDATED FILE (IF NOT GIVEN)
+    if Rows is None and FileNameForELSMatchesAllLetterPositions.endswith(".csv"):
+
+        f = open(FileNameWithPath, 'r', encoding="utf-8", newline='')
+        Rows = csv.reader(f, delimiter=';')
+        next(Rows) ## SKIP HEADERS
+
+    elif Rows is None:
+
+        ## IMPORT MODULES ONLY IF NEEDED
+        import pandas as pd
+
+        if FileNameForELSMatchesAllLetterPositions.endswith(".parquet"):
+            Rows = pd.read_parquet(FileNameWithPath).itertuples(index=False, name=None)
+        else:
+            Rows = pd.read_feather(FileNameWithPath).itertuples(index=False, name=None)
+
+    ## END IF / ELIF
+
+    ## BEGIN FOR LOOP - GROUP ROWS BY FILE NAME OF LEGACY LAYOUT (ON THE 1ST ROW OF EACH ELS MATCH; THE ROWS OF A MATCH FOLLOW ONE ANOTHER); (n, d, k) IS JOINED INTO THE 1ST COLUMN AGAIN
+    for EachRow in Rows:
+
+        if EachRow[1]:
+            ListOfRowsOfLetters = Dict4FileNames4ELSTerms.setdefault(EachRow[1], [])
+        ListOfRowsOfLetters.append((f"({EachRow[2]}, {EachRow[3]}, {EachRow[4]})",) + tuple(EachRow[5:]))
+
+    ## END FOR LOOP
+
+    ## CLOSE CSV FILE
+    if f is not None:
+        f.close()
+
+    ## CALL MODULE.FUNCTION() #99 - WRITE ONE CSV FILE PER ELS MATCH
+    _ = mod_99_WriteOutputToFileCSV_ELSMatchesAllLetterPositions.fn_WriteOutputToFile(Dict4FileNames4ELSTerms, of)
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print(f"Legacy ELS letter position files written: {len(Dict4FileNames4ELSTerms)}")
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION: END FUNCTION #99 - LEGACY FILES CREATE - ONE CSV FILE PER ELS MATCH")
+
+    ## RETURN VARIABLES
+    return(len(Dict4FileNames4ELSTerms))
+
+## END FUNCTION () #99 - LEGACY FILES CREATE - ONE CSV FILE PER ELS MATCH
@@ -0,0 +1,150 @@
+## IMPORT MODULES
+import csv
+import os
+from mod_99_WriteOutputToFileXLSX_2DMatrix import ListOfColors4ELSTerms ## SAME COLORS AS THE XLSX 2D MATRIX
+from mod_cls_OutputFiles import cls_OutputFiles as OF ## FILES OF THE RUN: IN THE DIRECTORY OF OUTPUT OR STREAMED INTO THE BUNDLE (--bundle)
+
+## DECLARE VARIABLES
+RowsAroundDefault = 5 ## ROWS ABOVE THE FIRST + BELOW THE LAST ROW OF THE ELS MATCH
+ColumnsAroundDefault = 10 ## COLUMNS RIGHT OF + LEFT OF THE COLUMNS OF THE ELS MATCH
+
+## BEGIN FUNCTION () #99 #1 - ELS WINDOW CREATE - CUT OUT ONE WINDOW OF THE 2D MATRIX OF WIDTH XW AROUND ONE ELS MATCH (n,d,k); INDEX ARITHMETIC ON S, THE FULL 2D MATRIX IS NEVER CREATED
+def fn_ELSWindowCreate(S, D5K, n, d, k, XW, RowsAround=RowsAroundDefault, ColumnsAround=ColumnsAroundDefault):
+
+    ## DECLARE VARIABLES
+    LengthOfText = len(S)
+    YH = -(-LengthOfText // XW) ## NUMBER OF ROWS OF THE FULL 2D MATRIX (LAST ROW MAY BE SHORT)
+
+    ## 0-BASED (ROW, COLUMN) OF EACH LETTER OF THE ELS MATCH; n IS 1-BASED
+    SetOfCellsOfELS = {divmod((n - 1) + (EachNumber * d), XW) for EachNumber in range(k)}
+    ListOfRowsOfELS = [Row for Row, Column in SetOfCellsOfELS]
+    ListOfColumnsOfELS = [Column for Row, Column in SetOfCellsOfELS]
+
+    ## WINDOW: ROWS + COLUMNS OF THE ELS MATCH + MARGINS; CLIPPED TO THE 2D MATRIX
+    RowFirst = max(min(ListOfRowsOfELS) - RowsAround, 0)
+    RowLast = min(max(ListOfRowsOfELS) + RowsAround, YH - 1)
+    ColumnFirst = max(min(ListOfColumnsOfELS) - ColumnsAround, 0)
+    ColumnLast = min(max(ListOfColumnsOfELS) + ColumnsAround, XW - 1)
+
+    ListOfRowsOfWindow = [] ## ROWS OF CELLS; SAME LAYOUT AS THE 2D MATRIX: [D5K OF LAST LETTER, LETTERS RIGHT-TO-LEFT, D5K OF FIRST LETTER]
+    ListOfCellsOfELSInWindow = [] ## 0-BASED (ROW, COLUMN) IN THE WINDOW OF EACH LETTER OF THE ELS MATCH (COLUMN 0 == D5K)
+
+    ## BEGIN FOR LOOP - EACH ROW OF THE WINDOW
+    for Row in range(RowFirst, RowLast + 1):
+
+        ## LETTERS RIGHT-TO-LEFT: LAST COLUMN FIRST; BLANK SPACE PAST THE END OF THE TEXT
+        ListOfLetters = []
+        for Column in range(ColumnLast, ColumnFirst - 1, -1):
+
+            PositionIndex = (Row * XW) + Column
+            ListOfLetters.append(S[PositionIndex] if PositionIndex < LengthOfText else " ")
+
+            if (Row, Column) in SetOfCellsOfELS:
+                ListOfCellsOfELSInWindow.append((Row - RowFirst, len(ListOfLetters)))
+
+        ## COORDINATES D5K OF FIRST + LAST LETTER OF THE ROW OF THE WINDOW; 1-BASED KEYS
+        KeyOfFirstLetterInRow = min((Row * XW) + ColumnFirst + 1, LengthOfText)
+        KeyOfLastLetterInRow = min((Row * XW) + ColumnLast + 1, LengthOfText)
+
+        ListOfRowsOfWindow.append([D5K[KeyOfLastLetterInRow]] + ListOfLetters + [D5K[KeyOfFirstLetterInRow]])
+
+    ## END FOR LOOP
+
+    ## RETURN VARIABLES
+    return(ListOfRowsOfWindow, ListOfCellsOfELSInWindow)
+
+## END FUNCTION
+
+## BEGIN MAIN FUNCTION
+## FUNCTION () #99 #0 - WRITE OUTPUT TO FILE - ELS WINDOWS
+def fn_WriteOutputToFile(S, D5K, LTM4ELS_LF_POS, LTM4ELS_LF_NEG, FileNameForELSWindows, ListOfMatchIDs=None, XW=None, RowsAround=RowsAroundDefault, ColumnsAround=ColumnsAroundDefault, IsXLSX=False, of=None):
+
+    """
+    ## MODULE.FUNCTION() #99 - WRITE OUTPUT TO FILE - ELS WINDOWS; ONE SMALL TABLE PER ELS MATCH (MatchID AS IN THE CONSOLIDATED FILE OF ALL LETTER POSITIONS), CUT OUT OF THE 2D MATRIX OF WIDTH |d| (OR XW) AROUND THE LETTERS OF THE MATCH; LETTERS OF THE ELS ARE MARKED [א] IN THE CSV FILE AND COLORED IN THE XLSX FILE (ONE WORKSHEET PER MATCH); ## RETURNS FileNameForELSWindows
+    """
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION: BEGIN FUNCTION #99 - WRITE OUTPUT TO FILE - ELS WINDOWS")
+
+    ## ALL MATCHES: 1-BASED MatchID; POSITIVE MATCHES FIRST, THEN NEGATIVE MATCHES
+    ListOfMatches = list(LTM4ELS_LF_POS or []) + list(LTM4ELS_LF_NEG or [])
+    if ListOfMatchIDs is None:
+        ListOfMatchIDs = range(1, len(ListOfMatches) + 1)
+
+    ## IF A MatchID DOES NOT EXIST
+    for MatchID in ListOfMatchIDs:
+        if not 1 <= MatchID <= len(ListOfMatches):
+            raise ValueError(f"MatchID {MatchID} is not one of the {len(ListOfMatches)} ELS matches")
+
+    of = of or OF() ## FILES IN USER_GENERATED_FILES IF NOT GIVEN
+
+    ## XLSX: IMPORT MODULES ONLY IF NEEDED (--xlsx); FILE IS GIVEN WHEN CLOSED (AFTER THE CSV FILE: ONE FILE OF A BUNDLE AT A TIME)
+    if IsXLSX:
+        import xlsxwriter
+        workbook = xlsxwriter.Workbook(None, {'constant_memory': True})
+        FillColor, FontColor = ListOfColors4ELSTerms[0]
+        FormatOfELSLetter = workbook.add_format({'bg_color': FillColor, 'font_color': FontColor})
+
+    ## OPEN (IF EXISTS) / CREATE (IF NOT EXISTS) CSV FILE; WRITE OUTPUT TO CSV FILE
+    with of.fn_Open(FileNameForELSWindows) as f:
+
+        f_csv = csv.writer(f, delimiter=';')
+
+        ## BEGIN FOR LOOP - EACH SELECTED ELS MATCH
+        for MatchID in ListOfMatchIDs:
+
+            ## (n,d,k) + ELS SEARCH TERM OF THE MATCH
+            (n, d, k), TermWithSpaces = ListOfMatches[MatchID - 1][0], ListOfMatches[MatchID - 1][3]
+
+            ## WIDTH OF THE WINDOW: |d| (ELS IS ONE COLUMN) UNLESS CHOSEN BY USER; d == 0 (ALL LETTERS ON ONE POSITION) == ONE COLUMN
+            XWOfWindow = XW if XW is not None else max(abs(d), 1)
+
+            ListOfRowsOfWindow, ListOfCellsOfELSInWindow = fn_ELSWindowCreate(S, D5K, n, d, k, XWOfWindow, RowsAround, ColumnsAround)
+
+            ## CSV: HEADER OF THE BLOCK; ROWS WITH THE LETTERS OF THE ELS MARKED; BLANK ROW BETWEEN BLOCKS
+            ListOfRowsOfCSV = [[str(CellContent) if type(CellContent) is tuple else CellContent for CellContent in EachRow] for EachRow in ListOfRowsOfWindow]
+            for Row, Column in ListOfCellsOfELSInWindow:
+                ListOfRowsOfCSV[Row][Column] = f"[{ListOfRowsOfCSV[Row][Column]}]"
+
+            f_csv.writerow(["MatchID", MatchID, "(n,d,k)", str((n, d, k)), "ELS", TermWithSpaces, "Width", XWOfWindow])
+            f_csv.writerows(ListOfRowsOfCSV)
+            f_csv.writerow([])
+
+            ## XLSX: ONE WORKSHEET PER MATCH; CELLS OF THE ELS COLORED
+            if IsXLSX:
+
+                worksheet = workbook.add_worksheet(f"Match{MatchID}")
+                worksheet.set_column_pixels(0, 0, 120)
+                worksheet.set_column_pixels(len(ListOfRowsOfWindow[0]) - 1, len(ListOfRowsOfWindow[0]) - 1, 120)
+
+                ## ROW 0 == HEADER OF THE BLOCK; ROWS OF THE WINDOW BEGIN AT ROW 1
+                worksheet.write_row(0, 0, ["MatchID", MatchID, "(n,d,k)", str((n, d, k)), "ELS", TermWithSpaces, "Width", XWOfWindow])
+
+                for Row, EachRow in enumerate(ListOfRowsOfWindow):
+
+                    ## CONVERT TUPLES (D5K) TO STRINGS BECAUSE XLSX WRITER CAN'T DEAL WITH TUPLES
+                    ListOfCells = [str(CellContent) if type(CellContent) is tuple else CellContent for CellContent in EachRow]
+                    worksheet.write_row(Row + 1, 0, ListOfCells)
+
+                    for RowOfELS, Column in ListOfCellsOfELSInWindow:
+                        if RowOfELS == Row:
+                            worksheet.write(Row + 1, Column, ListOfCells[Column], FormatOfELSLetter)
+
+        ## END FOR LOOP
+
+    ## CLOSE XLSX EXCEL FILE; xlsxwriter ONLY WRITES THE FILE WHEN CLOSED
+    if IsXLSX:
+        with of.fn_Open(os.path.splitext(FileNameForELSWindows)[0] + ".xlsx", 'wb') as FileOfXLSX:
+            workbook.filename = FileOfXLSX
+            workbook.close()
+
+    ## TEST PRINT OUTPUT
+    print(f"ELS windows written: {len(ListOfMatchIDs)}")
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION: END FUNCTION #99 - WRITE OUTPUT TO FILE - ELS WINDOWS")
+
+    ## RETURN VARIABLES
+    return(FileNameForELSWindows)
+
+## END FUNCTION () #99 - WRITE OUTPUT TO FILE - ELS WINDOWS
@@ -0,0 +1,241 @@
+## IMPORT MODULES
+import sqlite3
+import time
+
+## DECLARE VARIABLES
+DatabaseFileNameDefault = "USER_GENERATED_FILES/USER_FILE_ELSMatches.sqlite" ## ONE DATABASE FOR ALL RUNS
+SecondsToWaitForLock = 60 ## A SECOND RUN WRITING TO THE SAME DATABASE WAITS UNTIL THE FIRST ONE HAS COMMITTED
+
+## TABLES: Runs --< Terms --< Matches --< LetterPositions
+ListOfStatementsCreate = [
+    """CREATE TABLE IF NOT EXISTS Runs (
+        RunID INTEGER PRIMARY KEY,
+        CreatedAt TEXT,
+        Codex INTEGER,
+        TextNumber INTEGER,
+        CustomCorpus TEXT,
+        LengthOfText INTEGER,
+        XW INTEGER,
+        YH INTEGER,
+        DMin INTEGER,
+        DMax INTEGER)""",
+    """CREATE TABLE IF NOT EXISTS Terms (
+        TermID INTEGER PRIMARY KEY,
+        RunID INTEGER REFERENCES Runs(RunID),
+        TermNumber INTEGER,
+        Term TEXT,
+        TermWithSpaces TEXT,
+        K INTEGER,
+        GematriaValue INTEGER)""",
+    """CREATE TABLE IF NOT EXISTS Matches (
+        MatchID INTEGER PRIMARY KEY,
+        RunID INTEGER REFERENCES Runs(RunID),
+        TermID INTEGER REFERENCES Terms(TermID),
+        N INTEGER,
+        D INTEGER,
+        K INTEGER,
+        Book INTEGER,
+        Chapter INTEGER,
+        Verse INTEGER)""",
+    """CREATE TABLE IF NOT EXISTS LetterPositions (
+        MatchID INTEGER REFERENCES Matches(MatchID),
+        LetterNumber INTEGER,
+        LetterPositionIndex INTEGER,
+        Letter TEXT,
+        LetterGematriaNumberValue INTEGER,
+        Book INTEGER,
+        Chapter INTEGER,
+        Verse INTEGER,
+        WordNumber INTEGER,
+        Word TEXT,
+        LetterPositionInWord INTEGER)""",
+    "CREATE INDEX IF NOT EXISTS IndexTermsTerm ON Terms(Term)",
+    "CREATE INDEX IF NOT EXISTS IndexMatchesTermID ON Matches(TermID)",
+    "CREATE INDEX IF NOT EXISTS IndexMatchesD ON Matches(D)",
+    "CREATE INDEX IF NOT EXISTS IndexMatchesBook ON Matches(Book, Chapter, Verse)",
+    "CREATE INDEX IF NOT EXISTS IndexLetterPositionsMatchID ON LetterPositions(MatchID)",
+]
+
+## BEGIN FUNCTION () #99 #1 - DATABASE OPEN - CREATES TABLES + INDEXES IF NOT EXISTS
+def fn_DatabaseOpen(DatabaseFileName=DatabaseFileNameDefault):
+
+    ## OPEN (IF EXISTS) / CREATE (IF NOT EXISTS) DATABASE
+    Connection = sqlite3.connect(DatabaseFileName, timeout=SecondsToWaitForLock)
+
+    ## CREATE TABLES + INDEXES
+    with Connection:
+        for EachStatement in ListOfStatementsCreate:
+            Connection.execute(EachStatement)
+
+    ## RETURN VARIABLES
+    return(Connection)
+
+## END FUNCTION
+
+## BEGIN MAIN FUNCTION
+## FUNCTION () #99 #0 - WRITE OUTPUT TO SQLITE
+def fn_WriteOutputToSQLite(DatabaseFileName, NumberOfCodexChosen, NumberOfTextChosen, CustomCorpusSpec, LengthOfTextToSearch, XW, YH, SkipDistanceDMinimum, SkipDistanceDMaximum, DictOfSearchTerms, DictOfSearchTermsWithSpaces, DELSO, DELSMLF_POS, DELSMLF_NEG, LTM4ELS_LF_POS, LTM4ELS_LF_NEG, MasterList4LetterPositions_POS, MasterList4LetterPositions_NEG, DW):
+
+    """
+    ## MODULE.FUNCTION() #99 - WRITE OUTPUT TO SQLITE; ADDS ONE RUN WITH ITS TERMS, ELS MATCHES (BY FIRST LETTER, POSITIVE + NEGATIVE) AND LETTER POSITIONS TO THE DATABASE (TEXT OF EACH WORD FROM DW BY WordNumber); TERM OF EACH MATCH BY ITS ELS SEARCH TERM NUMBER (KEYS OF DELSMLF_POS / DELSMLF_NEG, SAME ORDER AS LTM4ELS); ALL ROWS ARE INSERTED WITH executemany IN ONE TRANSACTION (BEGIN IMMEDIATE); ## RETURNS RunID
+    """
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION: BEGIN FUNCTION #99 - WRITE OUTPUT TO SQLITE")
+
+    ## DECLARE VARIABLES
+    ListOfRowsOfMatches = []
+    ListOfRowsOfLetterPositions = []
+
+    ## OPEN DATABASE
+    Connection = fn_DatabaseOpen(DatabaseFileName)
+
+    ## BEGIN TRANSACTION - COMMITS AT THE END OF THE with BLOCK; ROLLS BACK IF AN EXCEPTION IS RAISED
+    with Connection:
+
+        ## WRITE LOCK FROM THE START: NO OTHER RUN CAN ADD MATCHES UNTIL COMMITTED, SO THE MatchIDs BELOW STAY FREE
+        Connection.execute("BEGIN IMMEDIATE")
+
+        ## ADD RUN
+        Cursor = Connection.execute("INSERT INTO Runs (CreatedAt, Codex, TextNumber, CustomCorpus, LengthOfText, XW, YH, DMin, DMax) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", \
+            (time.strftime("%Y-%m-%d %H:%M:%S"), NumberOfCodexChosen, NumberOfTextChosen, CustomCorpusSpec, LengthOfTextToSearch, XW, YH, SkipDistanceDMinimum, SkipDistanceDMaximum))
+        RunID = Cursor.lastrowid
+
+        ## ADD TERMS; KEEP TermID OF EACH ELS SEARCH TERM NUMBER (TWO TERMS CAN BE THE SAME WORD)
+        DictOfTermIDs = {}
+        for ELSSearchTermNumber, EachELSObject in DELSO.items():
+
+            Cursor = Connection.execute("INSERT INTO Terms (RunID, TermNumber, Term, TermWithSpaces, K, GematriaValue) VALUES (?, ?, ?, ?, ?, ?)", \
+                (RunID, ELSSearchTermNumber, DictOfSearchTerms[ELSSearchTermNumber], DictOfSearchTermsWithSpaces[ELSSearchTermNumber], EachELSObject.k, sum(EachELSObject.Letters)))
+            DictOfTermIDs[ELSSearchTermNumber] = Cursor.lastrowid
+
+        ## FIRST FREE MatchID (UNDER THE WRITE LOCK); MatchIDs ARE ASSIGNED HERE SO THAT LETTER POSITIONS CAN BE INSERTED WITH THE SAME executemany
+        MatchID = Connection.execute("SELECT COALESCE(MAX(MatchID), 0) + 1 FROM Matches").fetchone()[0]
+
+        ## BEGIN FOR LOOP - EACH ELS MATCH + ITS LETTER POSITIONS (SAME ORDER IN LTM4ELS AND MASTER LIST)
+        for DELSMLF, LTM4ELS, MasterList4LetterPositions in ((DELSMLF_POS, LTM4ELS_LF_POS, MasterList4LetterPositions_POS), (DELSMLF_NEG, LTM4ELS_LF_NEG, MasterList4LetterPositions_NEG)):
+
+            ## ELS SEARCH TERM NUMBER OF EACH MATCH (MATCHES OF EACH TERM IN TURN, AS GATHERED BY MODULE.FUNCTION() #27)
+            ListOfELSSearchTermNumbers = [ELSSearchTermNumber for ELSSearchTermNumber, EachDict in DELSMLF.items() for _ in EachDict]
+
+            for ELSSearchTermNumber, EachTupleOfMatch, EachListOfTuples4LetterInfo in zip(ListOfELSSearchTermNumbers, LTM4ELS, MasterList4LetterPositions):
+
+                ## (n, d, k); BOOK, CHAPTER, VERSE OF FIRST LETTER FROM LetterCoordinatesD5K (BOOK#, CHAPTER#, VERSE#, LETTER#INVERSE, LETTER#INTEXT)
+                n, d, k = EachTupleOfMatch[0]
+                LetterCoordinatesD5K = EachTupleOfMatch[8]
+                ListOfRowsOfMatches.append((MatchID, RunID, DictOfTermIDs[ELSSearchTermNumber], n, d, k, LetterCoordinatesD5K[0], LetterCoordinatesD5K[1], LetterCoordinatesD5K[2]))
+
+                ## LETTER POSITIONS: (ndk, LetterGematriaNumberValue, Letter, LetterPositionIndex, LetterCoordinatesD5K, WORD ID, LetterPositionInWord, WordNumber, WordCoordinatesDWTK, WordNumberInVerse, VERSE ID)
+                for LetterNumber, EachTupleOfLetterInfo in enumerate(EachListOfTuples4LetterInfo, start=1):
+                    ListOfRowsOfLetterPositions.append((MatchID, LetterNumber, EachTupleOfLetterInfo[3], EachTupleOfLetterInfo[2], EachTupleOfLetterInfo[1], EachTupleOfLetterInfo[4][0], EachTupleOfLetterInfo[4][1], EachTupleOfLetterInfo[4][2], EachTupleOfLetterInfo[7], DW[EachTupleOfLetterInfo[5]][0], EachTupleOfLetterInfo[6]))
+
+                ## INCREMENT MATCH ID
+                MatchID += 1
+
+        ## END FOR LOOP
+
+        ## BULK INSERT
+        Connection.executemany("INSERT INTO Matches (MatchID, RunID, TermID, N, D, K, Book, Chapter, Verse) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", ListOfRowsOfMatches)
+        Connection.executemany("INSERT INTO LetterPositions (MatchID, LetterNumber, LetterPositionIndex, Letter, LetterGematriaNumberValue, Book, Chapter, Verse, WordNumber, Word, LetterPositionInWord) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", ListOfRowsOfLetterPositions)
+
+    ## END TRANSACTION
+
+    ## CLOSE DATABASE
+    Connection.close()
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print(f"SQLite: run # {RunID} with {len(ListOfRowsOfMatches)} ELS matches written to {DatabaseFileName}")
+
+    ## TEST PRINT OUTPUT
+    print("\n")  ## PRINT SPACE
+    print("WITHIN FUNCTION: END FUNCTION #99 - WRITE OUTPUT TO SQLITE")
+
+    ## RETURN VARIABLES
+    return(RunID)
+
+## END FUNCTION () #99 - WRITE OUTPUT TO SQLITE
+
+## BEGIN FUNCTION () #99 #2 - QUERY MATCHES
+def fn_QueryMatches(DatabaseFileName=DatabaseFileNameDefault, Term=None, DMaxAbsolute=None, Book=None, Chapter=None, RunID=None, Limit=None):
+
+    """
+    ## MODULE.FUNCTION() #99 - QUERY MATCHES; e.g. ALL MATCHES OF 'משיח' WITH |d| < 50 IN GENESIS: fn_QueryMatches(Term='משיח', DMaxAbsolute=49, Book=1); ## RETURNS ListOfHeaders, ListOfRows
+    """
+
+    ## DECLARE VARIABLES
+    ListOfHeaders = ["RunID", "MatchID", "Term", "N", "D", "K", "Book", "Chapter", "Verse", "Codex", "TextNumber", "CustomCorpus"]
+    ListOfConditions = []
+    ListOfParameters = []
+
+    ## BEGIN IF - ADD CONDITION FOR EACH FILTER GIVEN
+    if Term is not None:
+        ListOfConditions.append("(Terms.Term = ? OR Terms.TermWithSpaces = ?)")
+        ListOfParameters.extend([Term, Term])
+    if DMaxAbsolute is not None:
+        ListOfConditions.append("Matches.D BETWEEN ? AND ?") ## BETWEEN (NOT ABS()) SO THAT THE INDEX ON D IS USED
+        ListOfParameters.extend([-DMaxAbsolute, DMaxAbsolute])
+    if Book is not None:
+        ListOfConditions.append("Matches.Book = ?")
+        ListOfParameters.append(Book)
+    if Chapter is not None:
+        ListOfConditions.append("Matches.Chapter = ?")
+        ListOfParameters.append(Chapter)
+    if RunID is not None:
+        ListOfConditions.append("Matches.RunID = ?")
+        ListOfParameters.append(RunID)
+    ## END IF
+
+    ## CREATE QUERY
+    Query = "SELECT Matches.RunID, Matches.MatchID, Terms.TermWithSpaces, Matches.N, Matches.D, Matches.K, Matches.Book, Matches.Chapter, Matches.Verse, Runs.Codex, Runs.TextNumber, Runs.CustomCorpus" \
+        " FROM Matches JOIN Terms ON Terms.TermID = Matches.TermID JOIN Runs ON Runs.RunID = Matches.RunID"
+    if ListOfConditions:
+        Query += " WHERE " + " AND ".join(ListOfConditions)
+    Query += " ORDER BY Matches.RunID, Matches.MatchID"
+    if Limit is not None:
+        Query += " LIMIT ?"
+        ListOfParameters.append(Limit)
+
+    ## RUN QUERY
+    Connection = fn_DatabaseOpen(DatabaseFileName)
+    ListOfRows = Connection.execute(Query, ListOfParameters).fetchall()
+    Connection.close()
+
+    ## RETURN VARIABLES
+    return(ListOfHeaders, ListOfRows)
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #99 #3 - QUERY LETTER POSITIONS OF ONE MATCH
+def fn_QueryLetterPositions(MatchID, DatabaseFileName=DatabaseFileNameDefault):
+
+    ## DECLARE VARIABLES
+    ListOfHeaders = ["MatchID", "LetterNumber", "LetterPositionIndex", "Letter", "LetterGematriaNumberValue", "Book", "Chapter", "Verse", "WordNumber", "Word", "LetterPositionInWord"]
+
+    ## RUN QUERY
+    Connection = fn_DatabaseOpen(DatabaseFileName)
+    ListOfRows = Connection.execute("SELECT " + ", ".join(ListOfHeaders) + " FROM LetterPositions WHERE MatchID = ? ORDER BY LetterNumber", (MatchID,)).fetchall()
+    Connection.close()
+
+    ## RETURN VARIABLES
+    return(ListOfHeaders, ListOfRows)
+
+## END FUNCTION
+
+## BEGIN FUNCTION () #99 #4 - QUERY RUNS
+def fn_QueryRuns(DatabaseFileName=DatabaseFileNameDefault):
+
+    ## DECLARE VARIABLES
+    ListOfHeaders = ["RunID", "CreatedAt", "Codex", "TextNumber", "CustomCorpus", "LengthOfText", "XW", "YH", "DMin", "DMax", "NumberOfMatches"]
+
+    ## RUN QUERY
+    Connection = fn_DatabaseOpen(DatabaseFileName)
+    ListOfRows = Connection.execute("SELECT Runs.RunID, CreatedAt, Codex, TextNumber, CustomCorpus, LengthOfText, XW, YH, DMin, DMax, COUNT(Matches.MatchID)" \
+        " FROM Runs LEFT JOIN Matches ON Matches.RunID = Runs.RunID GROUP BY Runs.RunID ORDER BY Runs.RunID").fetchall()
+    Connection.close()
+
+    ## RETURN VARIABLES
+    return(ListOfHeaders, ListOfRows)
+
+## END FUNCTION
@@ -0,0 +1,51 @@
+## IMPORT MODULES
+import signal
+import threading
+
+## DEFINE CLASS ##
+class cls_CancelToken():
+
+    """
+    ## CLASS FOR CANCEL TOKEN - CANCELTOKEN() - ct; fn_Cancel MAY BE CALLED FROM ANY THREAD (OR A SIGNAL HANDLER); THE ELS SEARCH CHECKS fn_IsCancelled BETWEEN SKIP DISTANCES (d) + ELS SEARCH TERMS AND STOPS WITH THE MATCHES FOUND SO FAR
+    """
+
+    def __init__(self):
+
+        self.Event = threading.Event() ## SET == CANCELLED
+        self.Reason = None ## STRING ## e.g. 'Stopped by user'; None IF NOT CANCELLED
+
+    def fn_Cancel(self, Reason="Stopped by user"):
+
+        ## FIRST REASON IS KEPT
+        if not self.Event.is_set():
+            self.Reason = Reason
+            self.Event.set()
+
+    def fn_IsCancelled(self):
+
+        return(self.Event.is_set())
+
+    def fn_SignalHandle(self, SignalNumber, Frame):
+
+        ## 1ST SIGNAL: CANCEL (THE ELS SEARCH STOPS AT THE NEXT SKIP DISTANCE); 2ND SIGNAL: STOP AT ONCE
+        if self.fn_IsCancelled():
+            raise KeyboardInterrupt
+
+        self.fn_Cancel(f"Stopped by {signal.Signals(SignalNumber).name}")
+
+    def fn_SignalsConnect(self, TupleOfSignalNames=("SIGINT", "SIGTERM", "SIGBREAK")):
+
+        ## Ctrl+C, SIGTERM (e.g. Stop OF gui.py) AND Ctrl+Break (WINDOWS ONLY) CANCEL; ## RETURNS DICT OF THE HANDLERS BEFORE (FOR fn_SignalsDisconnect)
+        DictOfHandlers = {}
+        for EachSignalName in TupleOfSignalNames:
+            if hasattr(signal, EachSignalName):
+                SignalNumber = getattr(signal, EachSignalName)
+                DictOfHandlers[SignalNumber] = signal.signal(SignalNumber, self.fn_SignalHandle)
+
+        return(DictOfHandlers)
+
+    def fn_SignalsDisconnect(self, DictOfHandlers):
+
+        ## HANDLERS BEFORE fn_SignalsConnect
+        for SignalNumber, Handler in DictOfHandlers.items():
+            signal.signal(SignalNumber, Handler)
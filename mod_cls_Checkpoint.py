@@ -0,0 +1,120 @@
+## IMPORT MODULES
+import json
+import os
+import time
+
+## DECLARE VARIABLES
+## CHECKPOINT FILE (JSON LINES) IN THE RUN DIRECTORY: 1ST LINE == THE SEARCH; EACH LINE AFTER == SKIP DISTANCES (d) SEARCHED COMPLETELY FOR ONE ELS SEARCH TERM + THEIR MATCHES (n, d)
+## {"Checkpoint": 1, "Codex": 2, "Text": 43, "CustomCorpus": null, "LengthOfText": 1197042, "ELSSearchTerms": ["משיח"], "SkipDistanceDMinimum": -5000, "SkipDistanceDMaximum": 5000, "ChunkSize": null}
+## {"Stage": "SearchByLetterFirst", "TermNumber": 1, "Window": null, "DRange": [-5000, -4211], "Matches": [[1032, -4988], [88107, -4391]]}
+FileNameForCheckpoint = "CHECKPOINT.jsonl"
+VersionOfCheckpoint = 1
+SecondsBetweenSaves = 30 ## SKIP DISTANCES SEARCHED ARE WRITTEN TO THE FILE AT MOST THIS OFTEN (+ AT THE END OF EACH STAGE); A CRASH LOSES AT MOST THIS MUCH SEARCHING
+
+## DEFINE CLASS ##
+class cls_Checkpoint():
+
+    """
+    ## CLASS FOR CHECKPOINT - CHECKPOINT() - ckpt; #22A / #23 / #22C CALL fn_MatchesGet BEFORE SEARCHING A SKIP DISTANCE d (MATCHES FROM THE FILE IF ALREADY SEARCHED: --resume) AND fn_UnitDone AFTER; A RESUMED SEARCH GIVES THE SAME MATCHES IN THE SAME ORDER AS AN UNINTERRUPTED ONE
+    """
+
+    def __init__(self, DirectoryOfRun, DictOfSearch, IsResume=False):
+
+        self.DirectoryOfRun = DirectoryOfRun ## STRING ## e.g. RUNS/Tanach_Messiah
+        self.FileNameForCheckpoint = os.path.join(DirectoryOfRun, FileNameForCheckpoint) ## STRING
+        self.DictOfSearch = dict(DictOfSearch, Checkpoint=VersionOfCheckpoint) ## DICT ## 1ST LINE OF THE FILE: A RESUMED SEARCH MUST BE THE SAME SEARCH
+        self.DictOfUnitsDone = {} ## KEY IS (Stage, TermNumber, Window, d); VALUE: LIST OF n OF THE MATCHES (FROM THE FILE)
+        self.ListOfUnitsNew = [] ## (Stage, TermNumber, Window, d, LIST OF n) SEARCHED SINCE THE LAST SAVE
+        self.NumberOfUnitsResumed = 0 ## SKIP DISTANCES TAKEN FROM THE FILE INSTEAD OF SEARCHED
+        self.NumberOfUnitsSearched = 0 ## SKIP DISTANCES SEARCHED (AND SAVED)
+        self.TimeOfLastSave = time.time()
+
+        ## BEGIN IF / ELSE - CONTINUE THE CHECKPOINT FILE OR START A NEW ONE
+        if IsResume:
+
+            ## IF NO CHECKPOINT TO RESUME
+            if not os.path.isfile(self.FileNameForCheckpoint):
+                raise ValueError(f"No checkpoint to resume: {self.FileNameForCheckpoint}")
+
+            self.fn_Load()
+
+        else:
+
+            os.makedirs(DirectoryOfRun, exist_ok=True)
+            with open(self.FileNameForCheckpoint, "w", encoding="utf-8") as File:
+                File.write(json.dumps(self.DictOfSearch, ensure_ascii=False) + "\n")
+
+        ## END IF / ELSE
+
+    def fn_Load(self):
+
+        ## ONE LINE PER RANGE OF SKIP DISTANCES; THE LAST LINE MAY BE CUT SHORT BY A CRASH WHILE IT WAS WRITTEN (IGNORED: SEARCHED AGAIN)
+        with open(self.FileNameForCheckpoint, encoding="utf-8") as File:
+            ListOfLines = File.read().split("\n")
+
+        DictOfSearchBefore = json.loads(ListOfLines[0])
+
+        ## IF THE CHECKPOINT IS OF ANOTHER SEARCH
+        ListOfKeysDifferent = [EachKey for EachKey in sorted(set(self.DictOfSearch) | set(DictOfSearchBefore)) if self.DictOfSearch.get(EachKey) != DictOfSearchBefore.get(EachKey)]
+        if ListOfKeysDifferent:
+            raise ValueError(f"Checkpoint {self.FileNameForCheckpoint} is of another search (different: " + ", ".join(f"{EachKey} {DictOfSearchBefore.get(EachKey)!r} -> {self.DictOfSearch.get(EachKey)!r}" for EachKey in ListOfKeysDifferent) + ")")
+
+        ## BEGIN FOR LOOP - EACH RANGE OF SKIP DISTANCES SEARCHED
+        for EachLine in ListOfLines[1:]:
+
+            try:
+                DictOfUnits = json.loads(EachLine)
+            except ValueError:
+                continue
+
+            Stage, ELSSearchTermNumber, Window = DictOfUnits["Stage"], DictOfUnits["TermNumber"], DictOfUnits["Window"]
+            dFrom, dTo = DictOfUnits["DRange"]
+
+            for d in range(dFrom, dTo + 1):
+                self.DictOfUnitsDone[Stage, ELSSearchTermNumber, Window, d] = []
+            for n, d in DictOfUnits["Matches"]:
+                self.DictOfUnitsDone[Stage, ELSSearchTermNumber, Window, d].append(n)
+
+        ## END FOR LOOP
+
+    def fn_MatchesGet(self, Stage, ELSSearchTermNumber, d, Window=None):
+
+        ## ## RETURNS LIST OF n OF THE MATCHES IF d WAS SEARCHED BEFORE (SAME ORDER AS FOUND); None IF NOT (SEARCH IT)
+        ListOfN = self.DictOfUnitsDone.get((Stage, ELSSearchTermNumber, Window, d))
+        if ListOfN is not None:
+            self.NumberOfUnitsResumed += 1
+
+        return(ListOfN)
+
+    def fn_UnitDone(self, Stage, ELSSearchTermNumber, d, ListOfN, Window=None):
+
+        ## d IS SEARCHED COMPLETELY; SAVED WITH THE NEXT fn_Save (AT MOST SecondsBetweenSaves FROM NOW)
+        self.ListOfUnitsNew.append((Stage, ELSSearchTermNumber, Window, d, ListOfN))
+
+        if time.time() - self.TimeOfLastSave >= SecondsBetweenSaves:
+            self.fn_Save()
+
+    def fn_Save(self):
+
+        ## ONE LINE PER RUN OF CONSECUTIVE SKIP DISTANCES OF THE SAME STAGE, ELS SEARCH TERM + WINDOW (THE SEARCH MOVES ALL TERMS ALONG d TOGETHER); FLUSHED TO DISK BEFORE RETURNING
+        ListOfLines = []
+        for Stage, ELSSearchTermNumber, Window, d, ListOfN in sorted(self.ListOfUnitsNew, key=lambda EachUnit: (EachUnit[0], EachUnit[1], EachUnit[2] or 0, EachUnit[3])):
+
+            DictOfUnits = ListOfLines[-1] if ListOfLines else None
+            if DictOfUnits is not None and (DictOfUnits["Stage"], DictOfUnits["TermNumber"], DictOfUnits["Window"], DictOfUnits["DRange"][1] + 1) == (Stage, ELSSearchTermNumber, Window, d):
+                DictOfUnits["DRange"][1] = d
+            else:
+                DictOfUnits = {"Stage": Stage, "TermNumber": ELSSearchTermNumber, "Window": Window, "DRange": [d, d], "Matches": []}
+                ListOfLines.append(DictOfUnits)
+
+            DictOfUnits["Matches"].extend([n, d] for n in ListOfN)
+
+        if ListOfLines:
+            with open(self.FileNameForCheckpoint, "a", encoding="utf-8") as File:
+                File.write("".join(json.dumps(DictOfUnits, ensure_ascii=False) + "\n" for DictOfUnits in ListOfLines))
+                File.flush()
+                os.fsync(File.fileno())
+
+        self.NumberOfUnitsSearched += len(self.ListOfUnitsNew)
+        self.ListOfUnitsNew = []
+        self.TimeOfLastSave = time.time()
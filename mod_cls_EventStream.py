@@ -0,0 +1,38 @@
+## IMPORT MODULES
+import io
+import threading
+
+## DEFINE CLASS ##
+class cls_EventStream(io.TextIOBase):
+
+    """
+    ## CLASS FOR EVENT STREAM - ES() - es; TEXT STREAM FOR sys.stdout (contextlib.redirect_stdout) THAT SENDS EACH LINE PRINTED AS AN EVENT {"Event": "log", "Line": ...} TO fn_EventSend; LINES OF SEVERAL THREADS (e.g. OUTPUT WRITER) ARE SENT ONE AT A TIME; self.Lock ONLY GUARDS THE BUFFER OF LINES: fn_EventSend TAKES ITS OWN LOCK FOR EVERY WRITE (LOG AND PROGRESS EVENTS)
+    """
+
+    def __init__(self, fn_EventSend=None):
+
+        self.fn_EventSend = fn_EventSend ## FUNCTION CALLED WITH EACH EVENT (DICT)
+        self.Buffer = "" ## TEXT AFTER THE LAST NEW LINE
+        self.Lock = threading.Lock()
+
+    def writable(self):
+
+        return(True)
+
+    def write(self, Text):
+
+        ## SEND EACH COMPLETE LINE; KEEP THE REST UNTIL ITS NEW LINE
+        with self.Lock:
+            *ListOfLines, self.Buffer = (self.Buffer + Text).split("\n")
+            for EachLine in ListOfLines:
+                self.fn_EventSend({"Event": "log", "Line": EachLine})
+
+        return(len(Text))
+
+    def flush(self):
+
+        ## SEND THE REST (TEXT WITHOUT NEW LINE)
+        with self.Lock:
+            if self.Buffer:
+                self.fn_EventSend({"Event": "log", "Line": self.Buffer})
+                self.Buffer = ""
@@ -14,9 +14,15 @@ class cls_GlobalSearchObject():
             ListOfFactors=None, YH=None, XW=None, LLL=None, \
             ListOfIndexesCustomL=None, ListOfIndexesCustomLLL=None, \
             sL0=None, sL=None, sLLL0=None, sLLL=None, sN0=None, sN=None, \
-            NPANV=None, ListOfFirstsAndLasts4ELS=None, ListOfBooleanMatches4ELS=None):
+            NPANV=None, ListOfFirstsAndLasts4ELS=None, ListOfBooleanMatches4ELS=None, \
+            CustomCorpusSpec=None, ListOfCorpusOffsets=None, \
+            DictOfSearchTermsWithSpaces=None, SkipDistanceDMinimum=None, SkipDistanceDMaximum=None, \
+            LTM4ELS_LF_POS=None, LTM4ELS_LF_NEG=None, LTM4ELS_LL_POS=None, LTM4ELS_LL_NEG=None, MasterList4LetterPositions_POS=None, MasterList4LetterPositions_NEG=None, \
+            SetOfOutputs=None, RunID=None, FileNameForBundle=None, DictOfCoverage=None):
 
         self.SearchTextChosen = SearchTextChosen ## 1-DIGIT TUPLE ## (12,)
+        self.CustomCorpusSpec = CustomCorpusSpec ## STRING ## e.g. 'Gen 1:1-11:32'; None IF NOT A CUSTOM CORPUS
+        self.ListOfCorpusOffsets = ListOfCorpusOffsets ## 1-BASED INDEX POSITIONS (FirstLetterPositionIndex) ## OFFSET TABLE OF CUSTOM CORPUS: (BookNumber, FirstVerseKey, LastVerseKey, FirstLetterPositionIndex, NumberOfLetters)
         self.LengthOfTextToSearch = LengthOfTextToSearch ## INTEGER
 
         self.D = D ## 3-DIGIT-TUPLE-BASED DICTIONARY KEY POSITION OF (BOOK#, CHAPTER#, VERSE#) - NO SPACES BETWEEN WORDS/LETTERS
@@ -38,6 +44,9 @@ class cls_GlobalSearchObject():
 
         self.ListOfSearchTerms = ListOfSearchTerms ## 0-BASED INDEX POSITIONS
         self.DictOfSearchTerms = DictOfSearchTerms ## 1-BASED DICTIONARY KEY-POSITIONS
+        self.DictOfSearchTermsWithSpaces = DictOfSearchTermsWithSpaces ## 1-BASED DICTIONARY KEY-POSITIONS
+        self.SkipDistanceDMinimum = SkipDistanceDMinimum ## INTEGER
+        self.SkipDistanceDMaximum = SkipDistanceDMaximum ## INTEGER
 
         self.ListOfRegex4TextString = ListOfRegex4TextString ## 0-BASED INDEX POSITIONS
         self.ListOfRegex4ELSSearchTerms = ListOfRegex4ELSSearchTerms ## 0-BASED INDEX POSITIONS
@@ -50,6 +59,13 @@ class cls_GlobalSearchObject():
         self.DictOfMatches4ELS = DictOfMatches4ELS ## 1-BASED DICTIONARY KEY-POSITIONS
         self.DELSO = DELSO ## 1-BASED DICTIONARY KEY-POSITIONS
 
+        self.LTM4ELS_LF_POS = LTM4ELS_LF_POS ## 0-BASED INDEX POSITIONS ## ELS MATCHES BY FIRST LETTER: POSITIVE (d)
+        self.LTM4ELS_LF_NEG = LTM4ELS_LF_NEG ## 0-BASED INDEX POSITIONS ## ELS MATCHES BY FIRST LETTER: NEGATIVE (d)
+        self.LTM4ELS_LL_POS = LTM4ELS_LL_POS ## 0-BASED INDEX POSITIONS ## ELS MATCHES BY LAST LETTER: POSITIVE (d)
+        self.LTM4ELS_LL_NEG = LTM4ELS_LL_NEG ## 0-BASED INDEX POSITIONS ## ELS MATCHES BY LAST LETTER: NEGATIVE (d)
+        self.MasterList4LetterPositions_POS = MasterList4LetterPositions_POS ## 0-BASED INDEX POSITIONS ## ALL LETTER POSITIONS OF EACH ELS MATCH: POSITIVE (d)
+        self.MasterList4LetterPositions_NEG = MasterList4LetterPositions_NEG ## 0-BASED INDEX POSITIONS ## ALL LETTER POSITIONS OF EACH ELS MATCH: NEGATIVE (d)
+
         self.ListOfFactors = ListOfFactors ## 0-BASED INDEX POSITIONS
         self.YH = YH ## INTEGER
         self.XW = XW ## INTEGER
@@ -67,6 +83,11 @@ class cls_GlobalSearchObject():
 
         self.NPANV = NPANV ## 0-BASED INDEX POSITIONS
 
+        self.SetOfOutputs = SetOfOutputs ## SET OF STRINGS ## OUTPUTS WRITTEN BY THE SEARCH
+        self.RunID = RunID ## INTEGER ## RunID IN THE SQLITE DATABASE
+        self.FileNameForBundle = FileNameForBundle ## STRING ## BUNDLE OF ALL FILES OF THE SEARCH
+        self.DictOfCoverage = DictOfCoverage ## DICT ## SKIP DISTANCES (d) SEARCHED COMPLETELY PER ELS SEARCH TERM (MODULE.FUNCTION() #22D)
+
         ## TEST DEVELOPMENT
         ## self.ListOfFirstsAndLasts4ELS = ListOfFirstsAndLasts4ELS
         ## self.ListOfBooleanMatches4ELS = ListOfBooleanMatches4ELS
@@ -0,0 +1,41 @@
+## DEFINE CLASS ##
+class cls_Matrix2DOfLetters():
+
+    """
+    ## CLASS FOR 2D MATRIX OF LETTERS - M2D() - m2d; ROWS ARE CREATED ONE AT A TIME WHEN ITERATED (SAME ROWS AS THE OLD ListOfRowsOfLetters)
+    """
+
+    def __init__(self, S=None, YH=None, XW=None, D5K=None):
+
+        self.S = S ## STRING : LETTERS OF THE TEXT (WITHOUT BLANK SPACES); THE SAME STRING, NOT A COPY
+        self.YH = YH ## INTEGER : NUMBER OF ROWS
+        self.XW = XW ## INTEGER : NUMBER OF COLUMNS
+        self.D5K = D5K ## 1-BASED DICTIONARY KEY-POSITIONS: RETURNS ## 5-DIGIT-TUPLE-BASED DICTIONARY VALUE OF (BOOK#, CHAPTER#, VERSE#, LETTER#INVERSE, LETTER#INTEXT)
+        self.LengthOfText = len(S) if S is not None else None ## INTEGER : NUMBER OF LETTERS (WITHOUT BLANK SPACES)
+
+    def __len__(self):
+
+        return(self.YH)
+
+    def __getitem__(self, RowNumber):
+
+        ## 0-BASED ROW NUMBER
+        if RowNumber < 0:
+            RowNumber += self.YH
+        if not 0 <= RowNumber < self.YH:
+            raise IndexError(f"Row {RowNumber} is not in 2D matrix of {self.YH} rows")
+
+        ## LETTERS OF ROW; LAST ROW IF XW IS NOT A PERFECT FACTOR: REMAINING LETTERS + BLANK SPACES
+        LettersInRow = self.S[RowNumber * self.XW:(RowNumber + 1) * self.XW].ljust(self.XW)
+
+        ## COORDINATES D5K OF FIRST + LAST LETTER IN ROW; LAST ROW: LAST LETTER OF TEXT
+        KeyOfFirstLetterInRow = (RowNumber * self.XW) + 1
+        KeyOfLastLetterInRow = min((RowNumber + 1) * self.XW, self.LengthOfText)
+
+        ## RIGHT-TO-LEFT FOR HEBREW: [D5K OF LAST LETTER, LETTERS REVERSED, D5K OF FIRST LETTER]
+        return([self.D5K[KeyOfLastLetterInRow]] + list(LettersInRow[::-1]) + [self.D5K[KeyOfFirstLetterInRow]])
+
+    def __iter__(self):
+
+        for RowNumber in range(self.YH):
+            yield self[RowNumber]
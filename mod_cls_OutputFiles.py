@@ -0,0 +1,154 @@
+## IMPORT MODULES
+import contextlib
+import gzip
+import io
+import os
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+
+## DECLARE VARIABLES
+DirectoryOfOutputDefault = "USER_GENERATED_FILES"
+SizeOfBuffer = 1048576 ## BYTES WRITTEN TO A MEMBER OF THE BUNDLE AT ONCE
+SizeOfSpoolInMemory = 67108864 ## tar.zst: A MEMBER IS KEPT IN MEMORY UP TO THIS SIZE (LARGER: IN A TEMPORARY FILE OF THE SYSTEM) UNTIL ITS SIZE IS KNOWN FOR THE tar HEADER
+
+## DEFINE CLASS ##
+class cls_OutputStream(io.RawIOBase):
+
+    """
+    ## CLASS FOR OUTPUT STREAM - BINARY STREAM OF ONE MEMBER OF THE BUNDLE; PASSES EACH WRITE TO THE MEMBER AND COUNTS ITS BYTES + ROWS (NEWLINES) FOR MANIFEST.json
+    """
+
+    def __init__(self, FileOfMember):
+
+        self.FileOfMember = FileOfMember ## ZIP MEMBER (zipfile.ZipFile.open(..., 'w')) OR SPOOLED FILE (tar.zst)
+        self.Bytes = 0
+        self.Rows = 0
+
+    def writable(self):
+
+        return(True)
+
+    def write(self, Chunk):
+
+        Chunk = bytes(Chunk)
+        self.FileOfMember.write(Chunk)
+        self.Bytes += len(Chunk)
+        self.Rows += Chunk.count(b"\n")
+
+        return(len(Chunk))
+
+## DEFINE CLASS ##
+class cls_OutputFiles():
+
+    """
+    ## CLASS FOR OUTPUT FILES - OUTPUTFILES() - of; ALL FILES OF ONE SEARCH: EACH WRITER OPENS ITS FILE WITH fn_Open; THE FILE IS IN DirectoryOfOutput, OR (BundleFormat) STREAMED STRAIGHT INTO ITS MEMBER OF ONE .zip / .tar.zst BUNDLE IN DirectoryOfOutput (NO FILE OF ITS OWN);
+    ## ListOfMembers == NAME (+ BYTES, ROWS IN A BUNDLE) OF EACH FILE WRITTEN, IN ORDER; ONLY ONE MEMBER OF A BUNDLE IS WRITTEN AT A TIME (A SECOND fn_Open WAITS)
+    """
+
+    def __init__(self, DirectoryOfOutput=DirectoryOfOutputDefault, FileNameForBundle=None, BundleFormat=None):
+
+        self.DirectoryOfOutput = DirectoryOfOutput ## STRING ## e.g. USER_GENERATED_FILES OR BATCHES/2026_10/JOBID
+        self.BundleFormat = BundleFormat ## STRING ## 'zip' OR 'tar.zst'; None == NO BUNDLE
+        self.FileNameForBundle = FileNameForBundle + "." + BundleFormat if BundleFormat is not None else None ## STRING ## WITH EXTENSION
+        self.ListOfMembers = [] ## ONE DICT PER FILE: Name (+ Bytes, Rows IN A BUNDLE)
+        self.LockOfBundle = threading.Lock()
+
+        os.makedirs(DirectoryOfOutput, exist_ok=True)
+
+        ## BEGIN MATCH CASE - OPEN BUNDLE
+        match BundleFormat:
+
+            case None:
+                self.Bundle = None
+
+            case "zip":
+                self.Bundle = zipfile.ZipFile(self.fn_PathGet(self.FileNameForBundle), 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=6)
+
+            case "tar.zst":
+                import zstandard
+                self.FileOfBundle = open(self.fn_PathGet(self.FileNameForBundle), 'wb')
+                self.StreamOfBundle = zstandard.ZstdCompressor().stream_writer(self.FileOfBundle)
+                self.Bundle = tarfile.open(fileobj=self.StreamOfBundle, mode='w|')
+
+        ## END MATCH CASE
+
+    def fn_PathGet(self, FileName):
+
+        ## PATH OF A FILE IN THE DIRECTORY OF OUTPUT (FILES THAT ARE NEVER BUNDLED, e.g. THE SQLITE DATABASE)
+        return(os.path.join(self.DirectoryOfOutput, FileName))
+
+    @contextlib.contextmanager
+    def fn_Open(self, FileName, Mode='w', IsGzip=False):
+
+        ## Mode 'w' == TEXT (utf-8, newline=''; SAME AS THE CSV FILES); 'wb' == BINARY; IsGzip: COMPRESSED (.gz)
+        IsText = Mode == 'w'
+
+        ## BEGIN IF / ELSE - FILE IN THE DIRECTORY OF OUTPUT OR MEMBER OF THE BUNDLE
+        if self.Bundle is None:
+
+            if IsGzip:
+                f = gzip.open(self.fn_PathGet(FileName), 'wt' if IsText else 'wb', encoding="utf-8" if IsText else None, newline='' if IsText else None)
+            else:
+                f = open(self.fn_PathGet(FileName), Mode, encoding="utf-8" if IsText else None, newline='' if IsText else None)
+
+            with f:
+                yield f
+
+            self.ListOfMembers.append({"Name": FileName})
+
+        else:
+
+            ## zip: STRAIGHT INTO THE MEMBER (ONE AT A TIME); tar.zst: INTO A SPOOLED FILE, ADDED WHEN CLOSED (THE tar HEADER NEEDS THE SIZE)
+            if self.BundleFormat == "zip":
+                self.LockOfBundle.acquire()
+                try:
+                    FileOfMember = self.Bundle.open(FileName, 'w', force_zip64=True) ## SIZE NOT KNOWN BEFORE: ZIP64 ALLOWS MEMBERS OVER 4 GB
+                except BaseException:
+                    self.LockOfBundle.release()
+                    raise
+            else:
+                FileOfMember = tempfile.SpooledTemporaryFile(max_size=SizeOfSpoolInMemory)
+
+            StreamOfMember = cls_OutputStream(FileOfMember)
+            BufferOfMember = io.BufferedWriter(StreamOfMember, SizeOfBuffer)
+            FileOfGzip = gzip.GzipFile(filename=FileName, mode='wb', fileobj=BufferOfMember) if IsGzip else None
+            f = io.TextIOWrapper(FileOfGzip or BufferOfMember, encoding="utf-8", newline='') if IsText else (FileOfGzip or BufferOfMember)
+
+            ## BEGIN TRY / FINALLY - THE MEMBER IS CLOSED (+ THE BUNDLE FREE FOR THE NEXT ONE) ALSO IF THE WRITER FAILS
+            try:
+                yield f
+            finally:
+
+                f.close()
+                BufferOfMember.close()
+
+                if self.BundleFormat == "zip":
+                    FileOfMember.close()
+                    self.LockOfBundle.release()
+                else:
+                    with self.LockOfBundle:
+                        TarInfoOfMember = tarfile.TarInfo(FileName)
+                        TarInfoOfMember.size = StreamOfMember.Bytes
+                        TarInfoOfMember.mtime = int(time.time())
+                        FileOfMember.seek(0)
+                        self.Bundle.addfile(TarInfoOfMember, FileOfMember)
+                    FileOfMember.close()
+
+            ## END TRY / FINALLY
+
+            self.ListOfMembers.append({"Name": FileName, "Bytes": StreamOfMember.Bytes, "Rows": StreamOfMember.Rows})
+
+        ## END IF / ELSE
+
+    def fn_Close(self):
+
+        ## CLOSE BUNDLE (AFTER THE LAST MEMBER)
+        if self.Bundle is not None:
+            self.Bundle.close()
+            if self.BundleFormat == "tar.zst":
+                self.StreamOfBundle.close()
+                self.FileOfBundle.close()
+            self.Bundle = None
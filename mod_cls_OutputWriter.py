@@ -0,0 +1,67 @@
+## IMPORT MODULES
+import concurrent.futures
+import contextvars
+import queue
+import threading
+
+## DEFINE CLASS ##
+class cls_OutputWriter():
+
+    """
+    ## CLASS FOR OUTPUT WRITER - OW() - ow; ONE BACKGROUND THREAD CALLS THE WRITE-OUTPUT-TO-FILE FUNCTIONS IN THE ORDER THEY ARE SUBMITTED, WHILE THE MAIN PROGRAM KEEPS SEARCHING; THE QUEUE IS BOUNDED (fn_Submit WAITS WHEN QueueSize JOBS ARE WAITING); fn_Close WAITS FOR ALL JOBS AND RAISES THE FIRST ERROR (IsRaise=False: ONLY STOPS THE THREAD, e.g. AFTER AN ERROR OF THE MAIN PROGRAM; A 2ND CALL DOES NOTHING)
+    """
+
+    def __init__(self, QueueSize=8, IsInBackground=True):
+
+        self.QueueOfJobs = queue.Queue(maxsize=QueueSize) ## QUEUE OF (FUTURE, FUNCTION, ARGUMENTS, KEYWORD ARGUMENTS); None == NO MORE JOBS
+        self.IsInBackground = IsInBackground ## BOOLEAN : False == EACH JOB IS CALLED AT ONCE BY fn_Submit (NO THREAD)
+        self.ListOfFutures = [] ## ONE FUTURE PER JOB, IN ORDER SUBMITTED; RESULT == RETURN VALUE OF THE FUNCTION
+        self.Context = contextvars.copy_context() ## CONTEXT OF THE MAIN PROGRAM (e.g. np.set_printoptions(legacy="1.25") IS A CONTEXT VARIABLE) - A NEW THREAD WOULD START WITH THE DEFAULTS
+        self.Thread = threading.Thread(target=self.Context.run, args=(self.fn_Run,), name="OutputWriter", daemon=True)
+        self.IsClosed = False ## BOOLEAN : True AFTER fn_Close (NO MORE JOBS, THREAD ENDED)
+
+        if self.IsInBackground:
+            self.Thread.start()
+
+    def fn_RunJob(self, Future, fn, TupleOfArguments, DictOfArguments):
+
+        ## ARGUMENTS THAT ARE FUTURES OF EARLIER JOBS ARE REPLACED BY THEIR RESULTS (EARLIER JOBS ARE DONE: ONE THREAD, IN ORDER)
+        try:
+            TupleOfArguments = tuple(Argument.result() if isinstance(Argument, concurrent.futures.Future) else Argument for Argument in TupleOfArguments)
+            DictOfArguments = {EachKey: Argument.result() if isinstance(Argument, concurrent.futures.Future) else Argument for EachKey, Argument in DictOfArguments.items()}
+            Future.set_result(fn(*TupleOfArguments, **DictOfArguments))
+        except BaseException as e:
+            Future.set_exception(e)
+
+    def fn_Run(self):
+
+        ## BEGIN WHILE LOOP - UNTIL None
+        while (Job := self.QueueOfJobs.get()) is not None:
+            self.fn_RunJob(*Job)
+        ## END WHILE LOOP
+
+    def fn_Submit(self, fn, *TupleOfArguments, **DictOfArguments):
+
+        ## RETURNS FUTURE OF THE RETURN VALUE OF fn(*TupleOfArguments, **DictOfArguments)
+        Future = concurrent.futures.Future()
+        self.ListOfFutures.append(Future)
+
+        if self.IsInBackground:
+            self.QueueOfJobs.put((Future, fn, TupleOfArguments, DictOfArguments))
+        else:
+            self.fn_RunJob(Future, fn, TupleOfArguments, DictOfArguments)
+
+        return(Future)
+
+    def fn_Close(self, IsRaise=True):
+
+        ## NO MORE JOBS; WAIT FOR THE WRITER THREAD TO FINISH ALL JOBS (ALL FILES WRITTEN AND CLOSED)
+        if self.IsInBackground and not self.IsClosed:
+            self.QueueOfJobs.put(None)
+            self.Thread.join()
+        self.IsClosed = True
+
+        ## RAISE FIRST ERROR OF ANY JOB
+        if IsRaise:
+            for Future in self.ListOfFutures:
+                Future.result()
@@ -0,0 +1,111 @@
+## IMPORT MODULES
+import http.server
+import json
+import threading
+
+import mod_7B_SearchJobRun ## MODULE.FUNCTION() #7B - SEARCH JOB RUN; ## RETURNS DictOfResults
+
+from mod_cls_CancelToken import cls_CancelToken as CT
+
+## DEFINE CLASS ##
+class cls_SearchRequestHandler(http.server.BaseHTTPRequestHandler):
+
+    """
+    ## CLASS FOR SEARCH REQUEST HANDLER - SRH(); ONE HTTP REQUEST TO THE SEARCH SERVER (server.py): GET /status; POST /search == ONE SEARCH JOB (JSON) ANSWERED WITH ONE JSON EVENT PER LINE WHILE IT RUNS; POST /cancel == STOP THE RUNNING JOB (IT STILL ANSWERS WITH THE MATCHES FOUND SO FAR); POST /plan == ESTIMATE OF ONE SEARCH JOB (JSON), NOTHING SEARCHED;
+    ## THE SERVER HOLDS sc (SESSION CACHE), LockOfJobs (ONE JOB AT A TIME), ctOfJob (CANCEL TOKEN OF THE RUNNING JOB) AND DictOfStatus
+    """
+
+    def fn_JSONSend(self, StatusCode, DictToSend):
+
+        ## WHOLE ANSWER AT ONCE
+        BytesToSend = json.dumps(DictToSend, ensure_ascii=False).encode("utf-8")
+        self.send_response(StatusCode)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(BytesToSend)))
+        self.end_headers()
+        self.wfile.write(BytesToSend)
+
+    def fn_EventSend(self, DictOfEvent):
+
+        ## ONE EVENT PER LINE; A CLIENT THAT HAS GONE AWAY GETS NO MORE EVENTS + ITS JOB IS CANCELLED (IT STILL WRITES THE FILES OF THE MATCHES FOUND SO FAR)
+        ## EVERY EVENT (LOG LINES OF ANY THREAD, PROGRESS, RESULT) IS WRITTEN UNDER ONE LOCK: LINES OF TWO THREADS ARE NEVER MIXED
+        with self.LockOfEvents:
+
+            if self.IsClientGone:
+                return
+
+            try:
+                self.wfile.write((json.dumps(DictOfEvent, ensure_ascii=False) + "\n").encode("utf-8"))
+                self.wfile.flush()
+            except OSError:
+                self.IsClientGone = True
+                self.ct.fn_Cancel("Client disconnected")
+
+    def do_GET(self):
+
+        ## STATUS: CORPORA IN MEMORY (LAST == MOST RECENTLY USED), JOBS RUN, BUSY
+        if self.path == "/status":
+            self.fn_JSONSend(200, dict(self.server.DictOfStatus, Corpora=self.server.sc.fn_KeysGet(), MaxCorpora=self.server.sc.MaxSessions, IsBusy=self.server.LockOfJobs.locked()))
+        else:
+            self.fn_JSONSend(404, {"Event": "error", "Message": f"Unknown path: {self.path} (GET /status, POST /search, POST /cancel, POST /plan)"})
+
+    def do_POST(self):
+
+        ## CANCEL: STOP THE RUNNING JOB BETWEEN SKIP DISTANCES
+        if self.path == "/cancel":
+            ctOfJob = self.server.ctOfJob
+            if ctOfJob is not None:
+                ctOfJob.fn_Cancel()
+            self.fn_JSONSend(200, {"IsCancelled": ctOfJob is not None})
+            return
+
+        ## PLAN: ESTIMATE OF THE JOB (MODULE.FUNCTION() #7B #3) WHEN NO JOB RUNS (THE CORPUS MAY BE OPENED NOW); ANSWERED AT ONCE
+        if self.path == "/plan":
+            try:
+                DictOfJob = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))).decode("utf-8"))
+                with self.server.LockOfJobs:
+                    DictOfPlan = mod_7B_SearchJobRun.fn_SearchJobPlan(self.server.sc, DictOfJob)
+            except Exception as e:
+                self.fn_JSONSend(400, {"Event": "error", "Message": f"{type(e).__name__}: {e}"})
+            else:
+                self.fn_JSONSend(200, dict({"Event": "plan"}, **DictOfPlan))
+            return
+
+        ## IF PATH IS UNKNOWN
+        if self.path != "/search":
+            self.fn_JSONSend(404, {"Event": "error", "Message": f"Unknown path: {self.path} (GET /status, POST /search, POST /cancel, POST /plan)"})
+            return
+
+        ## READ SEARCH JOB
+        try:
+            DictOfJob = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))).decode("utf-8"))
+        except ValueError as e:
+            self.fn_JSONSend(400, {"Event": "error", "Message": f"Search job is not JSON: {e}"})
+            return
+
+        ## ANSWER: ONE JSON EVENT PER LINE UNTIL THE CONNECTION IS CLOSED
+        self.IsClientGone = False
+        self.LockOfEvents = threading.Lock() ## ONE LOCK FOR EVERY WRITE TO wfile (fn_EventSend)
+        self.ct = CT() ## CANCEL TOKEN OF THIS JOB
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+        self.end_headers()
+
+        ## ONE JOB AT A TIME; THE OTHERS WAIT
+        if self.server.LockOfJobs.locked():
+            self.fn_EventSend({"Event": "queued"})
+
+        with self.server.LockOfJobs:
+
+            self.server.ctOfJob = self.ct
+
+            try:
+                DictOfResults = mod_7B_SearchJobRun.fn_SearchJobRun(self.server.sc, DictOfJob, self.fn_EventSend, self.ct)
+                self.fn_EventSend(dict({"Event": "result"}, **DictOfResults))
+            except Exception as e:
+                self.fn_EventSend({"Event": "error", "Message": f"{type(e).__name__}: {e}"})
+            finally:
+                self.server.ctOfJob = None
+
+            self.server.DictOfStatus["JobsRun"] += 1
+
@@ -0,0 +1,801 @@
+## IMPORT MODULES
+import os
+import time
+import numpy as np
+
+import mod_8_DataObjectsCreate ## MODULE.FUNCTION() #8 - DATA OBJECTS CREATE IN BACKGROUND THREAD; CALLS MODULE.FUNCTIONS() #8A - #11B; ## RETURNS FUTURE OF TUPLE OF DATA OBJECTS
+import mod_8F_DataObjectsCreate ## MODULE.FUNCTION() #8F - DATA OBJECTS CREATE FOR THE LETTER POSITIONS OF THE ELS MATCHES ONLY (CHUNKED ELS SEARCH OUT OF CORE); ## RETURNS DLO, DW
+import mod_9AA_CalculateLetterPercentages ## MODULE.FUNCTION() #9AA - CALCULATE LETTER PERCENTAGES ## RETURNS ListOfTuplesOfLetterStatistics (FOR THE SEARCH PLAN BEFORE #8 IS DONE + OUT OF CORE)
+import mod_9B_GetNumberValues4Words ## MODULE.FUNCTION() #9B - GET NUMBER VALUE OF EACH LETTER IN WORD STRING ## RETURNS ListOfNumberValues4Words
+import mod_10_ListOfIndexesCustomCreate ## MODULE.FUNCTION() #10 - CREATE LIST OF CUSTOM INDEXES FOR EACH LETTER IN SELECTED TEXT NON-0-INDEXED / 1-INDEXED ## RETURNS ListOfIndexesCustom
+import mod_11A_TupleOfWordsAndGematriaValuesCreate ## MODULE.FUNCTION() ## 11A - DATA OBJECT CREATE - RETURNS TUPLE OF WORDS WITH EACH WORD'S GEMATRIA NUMBER VALUE
+import mod_12_GetLengthOfTextToSearch ## MODULE.FUNCTION() #12 - ## RETURNS INTEGER OF THE LENGTH OF THE SELECTED TEXT
+import mod_13_GetListOfFactors ## MODULE.FUNCTION() #13 - ## RETURNS LIST OF INTEGERS/FACTORS/DIVISORS OF THE LENGTH OF THE SELECTED TEXT
+import mod_15_CalculateYH_XW ## MODULE.FUNCTION() #15 - CALCULATE XW AND YH FOR THE 2D MATRIX CSV FILE - RETURNS YH, XW, L
+import mod_16AAAA_DataObjectCreate_DictOfSearchTerms ## MODULE.FUNCTION() #16AAAA - DATA OBJECT CREATE: DictOfSearchTerms
+import mod_18_NumpyArrayOfNumberValuesCreate ## MODULE.FUNCTION() #18 - ## RETURNS NumpyArrayOfNumberValuesOfEntireText
+import mod_19_GetMatchesPerIntegerValue ## MODULE.FUNCTION() #19 - ## RETURNS MATCHES FOR EACH LETTER IN EACH WORD OF ELS SEARCH TERM WITHIN TEXT
+import mod_20_DictOfELSObjectsCreate ## MODULE.FUNCTION() #20 - CREATE DICTIONARY OF ELS SEARCH OBJECTS; ## RETURNS DELSO
+import mod_22D_ELSSearchCoverage ## MODULE.FUNCTION() #22D - ELS SEARCH COVERAGE CREATE; ## RETURNS DictOfCoverage (SKIP DISTANCES SEARCHED COMPLETELY PER ELS SEARCH TERM)
+import mod_22B_NegativesAndPositivesExtract ## MODULE.FUNCTION() #22B - ## RETURNS DELSMP, DELSMN
+import mod_22E_ELSSearchPlanCreate ## MODULE.FUNCTION() #22E - ELS SEARCH PLAN CREATE; ## RETURNS DictOfPlan (ESTIMATED CANDIDATES, MATCHES + SECONDS PER ELS SEARCH TERM AND ENGINE)
+import mod_24_AddSearchResultsToDELSO ## MODULE.FUNCTION() #24 - ## RETURNS DELSO
+import mod_25_UpdateW4ELS ## MODULE.FUNCTION() #25 - ## RETURNS W4ELS
+import mod_26_UpdateW ## MODULE.FUNCTION() #26 - ## RETURNS W
+import mod_27_GatherData4ELSMatches ## MODULE.FUNCTION() #27 - ## RETURNS: LTM4ELS_LF_ABS, DLO, DELSO
+import mod_28_ExtractAllELSLetterPositions ## ## MODULE.FUNCTION() #28 - RETURNS: MasterList4LetterPositions, DLO 
+import mod_96_ProgressEventSend ## MODULE.FUNCTION() #96 - PROGRESS EVENT SEND; EVENTS OF EACH STAGE (STAGE, TERM, d, MATCHES SO FAR, ETA) TO fn_ProgressEvent
+import mod_97_OutputPlanCreate ## MODULE.FUNCTION() #97 - OUTPUT PLAN CREATE; ## RETURNS SetOfOutputs, SetOfStages (ONLY THE STAGES NEEDED FOR THE OUTPUTS CHOSEN)
+import mod_98_FileNamesCreate ## MODULE.FUNCTION() #98
+import mod_98_FileNamesCreate4ELSTerms_POS ## MODULE.FUNCTION() #98 INDIVIDUAL FILES FOR EACH ELS: ALL LETTER MATCHES: POSITIVE
+import mod_98_FileNamesCreate4ELSTerms_NEG ## MODULE.FUNCTION() #98 INDIVIDUAL FILES FOR EACH ELS: ALL LETTER MATCHES: NEGATIVE
+import mod_99_Matrix2DOfLettersCreate ## MODULE.FUNCTION() #99
+import mod_99_WriteOutputToFileCSV_WordsAndGematriaValues ## MODULE.FUNCTION() #99 - 
+import mod_99_WriteOutputToFileCSV_ELSMatches_DATASUMMARY ## MODULE.FUNCTION() #99 - 
+import mod_99_WriteOutputToFileCSV_ELSMatches ## MODULE.FUNCTION() #99 -
+import mod_99_WriteOutputToFileCSV_LetterStatistics ## MODULE.FUNCTION() #99 - 
+import mod_99_WriteOutputToFileCSV_2DMatrix ## MODULE.FUNCTION()
+import mod_99_WriteOutputToSQLite ## MODULE.FUNCTION() #99 - WRITE OUTPUT TO SQLITE (--sqlite); ## RETURNS RunID
+import mod_99_WriteOutputToFile_ELSMatchesAllLetterPositionsConsolidated ## MODULE.FUNCTION() #99 - ALL LETTER POSITIONS OF ALL ELS MATCHES IN ONE FILE (CSV / PARQUET / FEATHER); ## RETURNS FileNameForELSMatchesAllLetterPositions
+import mod_99_WriteOutputToFileXLSX_2DMatrix ## MODULE.FUNCTION() #99 - XLSX 2D MATRIX (--xlsx); CELLS OF ELS MATCHES COLORED PER ELS SEARCH TERM
+import mod_99_WriteOutputToFileCSV_TextDictionary ## MODULE.FUNCTION() #99 - TEXT DICTIONARY (--text-ids): TEXT OF EACH WORD + VERSE OF THE ELS MATCHES, ONCE PER RUN; ## RETURNS FileNameForTextDictionary
+import mod_99_WriteOutputToFileJSON_Coverage ## MODULE.FUNCTION() #99 - COVERAGE OF THE ELS SEARCH (coverage; ALSO WHEN STOPPED EARLY); ## RETURNS FileNameForCoverage
+import mod_99_WriteOutputToBundle ## MODULE.FUNCTION() #99 - WRITE OUTPUT TO BUNDLE (--bundle): ALL FILES OF THE RUN + MANIFEST.json IN ONE .zip / .tar.zst; ## RETURNS FileNameForBundle
+import mod_99_WriteOutputToFile_ELSWindows ## MODULE.FUNCTION() #99 - ELS WINDOWS (--els-windows): SMALL TABLE OF THE 2D MATRIX AROUND EACH ELS MATCH; ## RETURNS FileNameForELSWindows
+## STAGE MODULES ARE IMPORTED WHEN THEIR STAGE RUNS: #21 (pandas) FOR THE IN-MEMORY ELS SEARCH, #22A / #23 (tqdm) IN MEMORY, #22C CHUNKED (--chunk-size), #40 + #41 (pandas) TEST DEVELOPMENT
+
+from mod_cls_Checkpoint import cls_Checkpoint as CKPT
+from mod_cls_OutputFiles import cls_OutputFiles as OF, DirectoryOfOutputDefault
+from mod_cls_GlobalSearchObject import cls_GlobalSearchObject as GSO
+from mod_cls_OutputWriter import cls_OutputWriter as OW
+
+## DECLARE VARIABLES
+FactorXDefault = 50 ## X / W / #COLUMNS OF THE 2D MATRIX IF NOT CHOSEN
+FileNameForLetterCodes = "USER_FILE_LetterCodes.bin" ## BINARY FILE OF GEMATRIA NUMBER VALUES FOR THE CHUNKED ELS SEARCH (IN THE DIRECTORY OF OUTPUT)
+
+## DEFINE CLASS ##
+class cls_Session():
+
+    """
+    ## CLASS FOR SESSION - SESSION() - session; ONE CORPUS (CODEX + TEXT OR CUSTOM CORPUS) READ + PARSED ONCE; fn_Search RUNS ANY NUMBER OF ELS SEARCHES AGAINST IT; DATA OBJECTS THAT DO NOT DEPEND ON THE ELS SEARCH TERMS (#8 - #11B, #18, #21, #26) ARE CREATED ONCE AND KEPT FOR THE NEXT SEARCH; CREATED BY MODULE.FUNCTION() #7A - CORPUS OPEN
+    """
+
+    def __init__(self, NumberOfCodexChosen=None, NumberOfTextChosen=None, CustomCorpusSpec=None, SearchTextChosen=None, D=None, DS=None, ListOfCorpusOffsets=None, IsDataObjectsInBackground=True):
+
+        self.NumberOfCodexChosen = NumberOfCodexChosen ## INTEGER : 1 KOREN; 2 LENINGRAD; 3 MAM
+        self.NumberOfTextChosen = NumberOfTextChosen ## INTEGER : e.g. 1 GENESIS; 48 CUSTOM CORPUS
+        self.CustomCorpusSpec = CustomCorpusSpec ## STRING ## e.g. 'Gen 1:1-11:32'; None IF NOT A CUSTOM CORPUS
+        self.SearchTextChosen = SearchTextChosen ## 1-DIGIT TUPLE ## (12,)
+        self.D = D ## 3-DIGIT-TUPLE-BASED DICTIONARY KEY POSITION OF (BOOK#, CHAPTER#, VERSE#) - NO SPACES BETWEEN WORDS/LETTERS
+        self.DS = DS ## 3-DIGIT-TUPLE-BASED DICTIONARY KEY POSITION OF (BOOK#, CHAPTER#, VERSE#) - WITH SPACES BETWEEN WORDS/LETTERS
+        self.ListOfCorpusOffsets = ListOfCorpusOffsets ## 1-BASED INDEX POSITIONS (FirstLetterPositionIndex) ## OFFSET TABLE OF CUSTOM CORPUS; None IF NOT A CUSTOM CORPUS
+
+        ## CALL MODULE.FUNCTION() #8 - DATA OBJECTS CREATE IN BACKGROUND THREAD - CALLS MODULE.FUNCTIONS() #8A - #11B WHILE THE USER ANSWERS THE REMAINING QUESTIONS (#14, #16A - #17B); fn_DataObjectsGet WAITS FOR THEM
+        ## IsDataObjectsInBackground=False (e.g. p.py --chunk-size OUT OF CORE): NOT STARTED; CREATED BY THE FIRST SEARCH THAT NEEDS THEM
+        self.FutureOfDataObjects = mod_8_DataObjectsCreate.fn_DataObjectsCreateInBackground(D, DS) if IsDataObjectsInBackground else None
+        self.TupleOfDataObjects = None ## (S, L, DL, D5, DLO, ListOfTuplesOfLetterStatistics, LW, LNWEV, DWV, DWT, ListOfIndexes4LettersInEachWord, D5K, DWTK, N, NW, ListOfIndexesCustom, W, DW)
+
+        ## CALL MODULE.FUNCTION() #12 - GET LENGTH OF SELECTED TEXT(S) TO SEARCH
+        ## LENGTH OF TEXT IS TAKEN FROM THE VERSES IN D (SAME LETTERS AS L) SO THAT THE USER IS NOT KEPT WAITING FOR THE BACKGROUND THREAD
+        self.LengthOfTextToSearch = mod_12_GetLengthOfTextToSearch.fn_GetLengthOfTextToSearch("".join(D.values())) ## INTEGER
+
+        ## CALL MODULE.FUNCTION() #13 - GET LIST OF FACTORS FOR THE INTEGER LENGTH OF SELECTED TEXT TO SEARCH
+        self.ListOfFactors = mod_13_GetListOfFactors.fn_GetListOfFactors(self.LengthOfTextToSearch) ## 0-BASED INDEX POSITIONS
+
+        ## CREATED BY THE FIRST SEARCH; KEPT FOR THE NEXT SEARCH
+        self.NPANV = None ## 0-BASED INDEX POSITIONS ## MODULE.FUNCTION() #18
+        self.ListOfIndexesCustomL = None ## 0-BASED INDEX POSITIONS ## MODULE.FUNCTION() #10
+        self.TupleOfPandasObjects = None ## (sL0, sL, sN0, sN) ## MODULE.FUNCTION() #21
+        self.WUpdated = None ## 0-BASED INDEX POSITIONS ## W UPDATED BY MODULE.FUNCTION() #26
+
+    def fn_DataObjectsGet(self):
+
+        ## WAIT FOR BACKGROUND THREAD OF MODULE.FUNCTION() #8 TO FINISH, OR CALL MODULE.FUNCTION() #8 NOW IF NOT STARTED (FIRST CALL ONLY); ## RETURNS TUPLE OF DATA OBJECTS CREATED BY MODULE.FUNCTIONS() #8A - #11B
+        if self.TupleOfDataObjects is None:
+            self.TupleOfDataObjects = self.FutureOfDataObjects.result() if self.FutureOfDataObjects is not None else mod_8_DataObjectsCreate.fn_DataObjectsCreate(self.D, self.DS)
+            self.FutureOfDataObjects = None
+
+        return(self.TupleOfDataObjects)
+
+    def fn_SearchObjectsGet(self):
+
+        ## DATA OBJECTS OF THE ELS SEARCH THAT ONLY DEPEND ON THE TEXT (FIRST CALL ONLY); ## RETURNS NPANV, ListOfIndexesCustomL
+        if self.NPANV is None:
+
+            S, L, DL, D5, DLO, ListOfTuplesOfLetterStatistics, LW, LNWEV, DWV, DWT, ListOfIndexes4LettersInEachWord, D5K, DWTK, N, NW, ListOfIndexesCustom, W, DW = self.fn_DataObjectsGet()
+
+            ## CALL MODULE.FUNCTION() #18 - ## CREATE NUMPY ARRAY OF NUMBER VALUES
+            self.NPANV = mod_18_NumpyArrayOfNumberValuesCreate.fn_NumpyArrayOfNumberValuesCreate(N) ## RETURNS: NumpyArrayOfNumberValuesOfEntireText
+
+            ## CALL MODULE.FUNCTION() #10 - CREATE LIST OF CUSTOM INDEXES NON-0-INDEXED / 1-INDEXED RETURNS LIST OF CUSTOM INDEXES
+            self.ListOfIndexesCustomL = mod_10_ListOfIndexesCustomCreate.fn_ListOfIndexesCustomCreate(L)
+
+        return((self.NPANV, self.ListOfIndexesCustomL))
+
+    def fn_PandasObjectsGet(self):
+
+        ## PANDAS SERIES OF THE TEXT FOR THE IN-MEMORY ELS SEARCH (#22A / #23) + PANDAS SERIES STAGE (FIRST CALL ONLY; NOT NEEDED BY THE CHUNKED ELS SEARCH, WHICH THEN NEVER IMPORTS pandas); ## RETURNS sL0, sL, sN0, sN
+        if self.TupleOfPandasObjects is None:
+
+            ## IMPORT MODULES ONLY IF NEEDED
+            import mod_21_PandasObjectsCreate ## MODULE.FUNCTION() #21 - ## RETURNS sL0, sL, sLLL0, sLLL, sN0, sN)
+
+            S, L, DL, D5, DLO, ListOfTuplesOfLetterStatistics, LW, LNWEV, DWV, DWT, ListOfIndexes4LettersInEachWord, D5K, DWTK, N, NW, ListOfIndexesCustom, W, DW = self.fn_DataObjectsGet()
+            _, ListOfIndexesCustomL = self.fn_SearchObjectsGet()
+
+            ## CALL MODULE.FUNCTION() #21 - sLLL0, sLLL DEPEND ON XW OF EACH SEARCH (fn_Search)
+            sL0, sL, _, _, sN0, sN = mod_21_PandasObjectsCreate.fn_PandasObjectsCreate(L, L, N, ListOfIndexesCustomL, ListOfIndexesCustomL)
+            self.TupleOfPandasObjects = (sL0, sL, sN0, sN)
+
+        return(self.TupleOfPandasObjects)
+
+    def fn_SearchPlan(self, ListOfSearchTermsWithSpaces, SkipDistanceDMinimum, SkipDistanceDMaximum, ListOfOutputs=(), ListOfStages=("GatherByLetterFirst",), ChunkSizeForELSSearch=None, SecondsOfTimeBudget=None, MaxMatches=None, IsEngineChosenByPlan=False):
+
+        ## CALL MODULE.FUNCTION() #22E - ESTIMATE OF THE ELS SEARCH fn_Search WOULD RUN WITH THE SAME ARGUMENTS, WITHOUT SEARCHING; LETTER STATISTICS OF #8 IF DONE, ELSE COUNTED NOW (MODULE.FUNCTION() #9AA); ## RETURNS DictOfPlan
+        _, SetOfStages = mod_97_OutputPlanCreate.fn_OutputPlanCreate(ListOfOutputs, ListOfStages)
+        ListOfTuplesOfLetterStatistics = self.TupleOfDataObjects[5] if self.TupleOfDataObjects is not None else mod_9AA_CalculateLetterPercentages.fn_CalculatePercentages("".join(self.D.values()))
+
+        return(mod_22E_ELSSearchPlanCreate.fn_SearchPlanCreate(ListOfTuplesOfLetterStatistics, self.LengthOfTextToSearch, ListOfSearchTermsWithSpaces, SkipDistanceDMinimum, SkipDistanceDMaximum, \
+            IsSearchByLetterLast="SearchByLetterLast" in SetOfStages, ChunkSize=ChunkSizeForELSSearch, IsSearchByDistance=SecondsOfTimeBudget is not None or MaxMatches is not None, IsEngineChosenByPlan=IsEngineChosenByPlan))
+
+    def fn_Search(self, ListOfSearchTermsWithSpaces, SkipDistanceDMinimum, SkipDistanceDMaximum, FactorX=FactorXDefault, ListOfOutputs=(), ListOfStages=("GatherByLetterFirst",), \
+            ChunkSizeForELSSearch=None, FileFormatForELSLetterPositions="csv", IsLegacyLetterPositionFiles=False, IsMatrixCSVGzip=False, \
+            ListOfMatchIDsForELSWindows=None, XWForELSWindows=None, RowsAroundForELSWindows=mod_99_WriteOutputToFile_ELSWindows.RowsAroundDefault, ColumnsAroundForELSWindows=mod_99_WriteOutputToFile_ELSWindows.ColumnsAroundDefault, \
+            DatabaseFileName=None, IsTextIDsOnly=False, IsOutputInBackground=True, BundleFormat=None, fn_ProgressEvent=None, ct=None, DirectoryOfCheckpoint=None, IsResume=False, \
+            SecondsOfTimeBudget=None, MaxMatches=None, IsEngineChosenByPlan=False, DirectoryOfOutput=DirectoryOfOutputDefault):
+
+        """
+        ## ELS SEARCH OF ListOfSearchTermsWithSpaces (e.g. ['משיח']) WITH SKIP DISTANCES SkipDistanceDMinimum - SkipDistanceDMaximum; WIDTH OF 2D MATRIX FactorX;
+        ## WRITES THE FILES OF ListOfOutputs (SAME NAMES AS python p.py --outputs; () == NO FILES) + RUNS THE EXTRA STAGES IN ListOfStages (DEFAULT: ELS MATCHES BY FIRST LETTER WITH WORD + VERSE FOR THE gso, EVEN WITHOUT FILES);
+        ## ct: CANCEL TOKEN (mod_cls_CancelToken); ct.fn_Cancel() STOPS THE ELS SEARCH BETWEEN SKIP DISTANCES, THE REST RUNS WITH THE MATCHES FOUND SO FAR + gso.DictOfCoverage SAYS WHICH (TERM, d) WERE SEARCHED;
+        ## DirectoryOfCheckpoint: RUN DIRECTORY OF THE CHECKPOINT FILE (mod_cls_Checkpoint); EACH SKIP DISTANCE SEARCHED IS SAVED THERE WITH ITS MATCHES; IsResume=True SKIPS THE SKIP DISTANCES ALREADY IN IT (SAME SEARCH ONLY) + GIVES THE SAME RESULT AS AN UNINTERRUPTED SEARCH;
+        ## SecondsOfTimeBudget / MaxMatches: SKIP DISTANCES ARE SEARCHED BY INCREASING |d|; THE ELS SEARCH STOPS SecondsOfTimeBudget AFTER THE START OF fn_Search OR AFTER THE |d| WITH THE MaxMatchesTH MATCH (ALL MATCHES OF EACH d SEARCHED ARE KEPT);
+        ## THE SEARCH BY LAST LETTER THEN SEARCHES THE SAME SKIP DISTANCES (SAME DEADLINE + MaxMatches; THE SEARCH BY FIRST LETTER GETS HALF OF THE TIME BUDGET); ONLY THE MATCHES OF THE d SEARCHED BY BOTH ARE KEPT; gso.DictOfCoverage["SkipDistanceAbsoluteDone"] == EVERY d WITH |d| <= IT IS SEARCHED;
+        ## ChunkSizeForELSSearch: CHUNKED ELS SEARCH (#22C); OUT OF CORE IF NO OUTPUT / STAGE NEEDS THE WHOLE TEXT (MODULE.FUNCTION() #97 #2): NO DATA OBJECTS OF #8 - #21, gso.DLO + gso.DW ONLY HOLD THE LETTERS + WORDS OF THE ELS MATCHES, gso.S, gso.L, gso.N, ... == None;
+        ## IsEngineChosenByPlan: THE PLAN OF THE SEARCH IS PRINTED FIRST (fn_SearchPlan) + WITHOUT ChunkSizeForELSSearch THE ENGINE IT ESTIMATES FASTER SEARCHES (p.py + THE SEARCH SERVER); False == IN MEMORY UNLESS ChunkSizeForELSSearch IS GIVEN;
+        ## DirectoryOfOutput: DIRECTORY OF ALL FILES OF THE SEARCH (DEFAULT: USER_GENERATED_FILES; e.g. THE DIRECTORY OF A BATCH JOB), ALSO OF THE SQLITE DATABASE IF DatabaseFileName IS NOT GIVEN;
+        ## fn_ProgressEvent: CALLED WITH EACH PROGRESS EVENT {"Event": "progress", "Stage": ..., "Done": ..., "Total": ..., "Term": ..., "D": ..., "Matches": ..., "ETA": ...} (MODULE.FUNCTION() #96); None == NO EVENTS;
+        ## OTHER ARGUMENTS == FLAGS OF p.py; ## RETURNS gso (GLOBAL SEARCH OBJECT) OF THE SEARCH: DELSO, W4ELS, LTM4ELS_LF_POS, LTM4ELS_LF_NEG, ...
+        """
+
+        ## DECLARE VARIABLES
+        TimeOfRunStart = time.time() ## START OF THE SEARCH (--time-budget)
+        TimeOfDeadline = TimeOfRunStart + SecondsOfTimeBudget if SecondsOfTimeBudget is not None else None ## END OF THE TIME BUDGET OF BOTH ELS SEARCHES (BY FIRST LETTER #22A + BY LAST LETTER #23)
+        np.set_printoptions(legacy="1.25") ## NUMPY INTEGERS IN THE CSV FILES AS 40, NOT np.int64(40)
+
+        ## CALL MODULE.FUNCTION() #97 - OUTPUT PLAN CREATE
+        SetOfOutputs, SetOfStages = mod_97_OutputPlanCreate.fn_OutputPlanCreate(ListOfOutputs, ListOfStages)
+        IsSearchByDistance = SecondsOfTimeBudget is not None or MaxMatches is not None ## SKIP DISTANCES BY INCREASING |d| (MODULE.FUNCTION() #22D #3)
+
+        ## IF A TIME BUDGET OR MAX MATCHES IS NOT USABLE
+        if IsSearchByDistance and ChunkSizeForELSSearch is not None:
+            raise ValueError("--time-budget / --max-matches search by increasing |d|; the chunked search (--chunk-size) searches all d of each window at once")
+        if SecondsOfTimeBudget is not None and SecondsOfTimeBudget <= 0:
+            raise ValueError(f"Time budget must be more than 0 seconds, not {SecondsOfTimeBudget}")
+        if MaxMatches is not None and MaxMatches < 1:
+            raise ValueError(f"Max matches must be 1 or more, not {MaxMatches}")
+
+        DatabaseFileName = (DatabaseFileName or os.path.join(DirectoryOfOutput, os.path.basename(mod_99_WriteOutputToSQLite.DatabaseFileNameDefault))) if "sqlite" in SetOfOutputs else None
+        BundleFormat = mod_99_WriteOutputToBundle.fn_BundleFormatGet(BundleFormat) if BundleFormat is not None else None
+
+        ## ELS SEARCH TERMS WITHOUT SPACES; DICTIONARIES OF ELS SEARCH TERMS (1-BASED KEYS)
+        ListOfSearchTermsWithSpaces = list(ListOfSearchTermsWithSpaces)
+        ListOfSearchTerms = [EachSearchTerm.replace(" ", "") for EachSearchTerm in ListOfSearchTermsWithSpaces]
+
+        ## CALL MODULE.FUNCTION() #16AAAA - CREATE DATA OBJECT: DictOfSearchTerms
+        DictOfSearchTerms, DictOfSearchTermsWithSpaces = mod_16AAAA_DataObjectCreate_DictOfSearchTerms.fn_DataObjectsCreate(ListOfSearchTerms, ListOfSearchTermsWithSpaces, len(ListOfSearchTerms))
+
+        ## BEGIN IF - ENGINE CHOSEN BY THE PLAN: WITHOUT ChunkSizeForELSSearch THE ENGINE ESTIMATED FASTER SEARCHES (MODULE.FUNCTION() #22E, PRINTED); CHUNKED WITH THE CHUNK SIZE OF #22C BY DEFAULT
+        if IsEngineChosenByPlan:
+
+            DictOfPlan = self.fn_SearchPlan(ListOfSearchTermsWithSpaces, SkipDistanceDMinimum, SkipDistanceDMaximum, ListOfOutputs, ListOfStages, ChunkSizeForELSSearch, SecondsOfTimeBudget, MaxMatches, IsEngineChosenByPlan=True)
+
+            if ChunkSizeForELSSearch is None and DictOfPlan["EngineChosen"] == "Chunked":
+
+                ## IMPORT MODULES ONLY IF NEEDED
+                import mod_22C_ELSSearchChunked ## MODULE.FUNCTION() #22C - ## RETURNS ELS MATCHES SEARCH BY FIRST OR LAST LETTER IN MEMORY-MAPPED WINDOWS (--chunk-size)
+
+                ChunkSizeForELSSearch = mod_22C_ELSSearchChunked.ChunkSizeDefault
+
+        ## END IF
+
+        ## CALL MODULE.FUNCTION() #97 #2 - OUT OF CORE CHECK; CHUNKED ELS SEARCH WITHOUT THE DATA OBJECTS OF THE WHOLE TEXT
+        IsOutOfCore = mod_97_OutputPlanCreate.fn_IsOutOfCore(SetOfOutputs, SetOfStages, ChunkSizeForELSSearch)
+
+        ## CORPUS OBJECTS OF THE SESSION
+        NumberOfCodexChosen, NumberOfTextChosen, CustomCorpusSpec, D, DS = self.NumberOfCodexChosen, self.NumberOfTextChosen, self.CustomCorpusSpec, self.D, self.DS
+        LengthOfTextToSearch, ListOfFactors = self.LengthOfTextToSearch, self.ListOfFactors
+
+        ## CHECKPOINT OF THE ELS SEARCH (NONE IF None): NEW FILE, OR THE FILE OF THE SAME SEARCH TO RESUME; BEFORE ANY FILE OF OUTPUT IS OPENED (ValueError IF NOT RESUMABLE)
+        ckpt = CKPT(DirectoryOfCheckpoint, {"Codex": NumberOfCodexChosen, "Text": NumberOfTextChosen, "CustomCorpus": CustomCorpusSpec, "LengthOfText": LengthOfTextToSearch, "ELSSearchTerms": ListOfSearchTermsWithSpaces, \
+            "SkipDistanceDMinimum": SkipDistanceDMinimum, "SkipDistanceDMaximum": SkipDistanceDMaximum, "ChunkSize": ChunkSizeForELSSearch}, IsResume) if DirectoryOfCheckpoint is not None else None
+
+        ## CALL MODULE.FUNCTION() #96 - PROGRESS EVENTS OF THIS SEARCH GO TO fn_ProgressEvent (NONE IF None)
+        TokenOfProgress = mod_96_ProgressEventSend.fn_ProgressReceiverSet(fn_ProgressEvent, DictOfSearchTermsWithSpaces)
+
+        ## BEGIN IF / ELSE - DATA OBJECTS OF THE WHOLE TEXT, OR NONE (CHUNKED ELS SEARCH OUT OF CORE)
+        if not IsOutOfCore:
+
+            ## TEST PRINT OUTPUT
+            if ChunkSizeForELSSearch is not None:
+                print(f"CHUNKED ELS SEARCH WITH THE DATA OBJECTS OF THE WHOLE TEXT IN MEMORY; NEEDED BY: {', '.join(sorted(SetOfStages & set(mod_97_OutputPlanCreate.TupleOfStagesOfWholeText) | SetOfOutputs & set(mod_97_OutputPlanCreate.TupleOfOutputsOfWholeText)))}")
+
+            mod_96_ProgressEventSend.fn_ProgressEventSend("DataObjects") ## WAITS FOR MODULE.FUNCTION() #8 (FIRST SEARCH ONLY)
+            S, L, DL, D5, DLO, ListOfTuplesOfLetterStatistics, LW, LNWEV, DWV, DWT, ListOfIndexes4LettersInEachWord, D5K, DWTK, N, NW, ListOfIndexesCustom, W, DW = self.fn_DataObjectsGet()
+            mod_96_ProgressEventSend.fn_ProgressEventSend("SearchObjects") ## MODULE.FUNCTIONS() #18, #10, #21 (FIRST SEARCH ONLY; #21 ONLY IF THE ELS SEARCH IS IN MEMORY OR WITH THE PANDAS SERIES STAGE)
+            NPANV, ListOfIndexesCustomL = self.fn_SearchObjectsGet()
+            sL0, sL, sN0, sN = self.fn_PandasObjectsGet() if ChunkSizeForELSSearch is None or "PandasSeries" in SetOfStages else (None, None, None, None)
+
+        else:
+
+            ## NO OBJECTS OF #8 - #11B, #18, #10, #21; DLO + DW OF THE LETTERS OF THE ELS MATCHES ARE CREATED AFTER THE ELS SEARCH (MODULE.FUNCTION() #8F)
+            S, L, DL, D5, DLO, LW, LNWEV, DWV, DWT, ListOfIndexes4LettersInEachWord, D5K, DWTK, N, NW, ListOfIndexesCustom, W, DW = (None,) * 17
+            NPANV, ListOfIndexesCustomL, sL0, sL, sN0, sN = (None,) * 6
+
+            ## CALL MODULE.FUNCTION() #9AA - LETTER STATISTICS FROM THE VERSES (OF #8 IF ALREADY CREATED BY AN EARLIER SEARCH)
+            ListOfTuplesOfLetterStatistics = (self.TupleOfDataObjects[5] if self.TupleOfDataObjects is not None else mod_9AA_CalculateLetterPercentages.fn_CalculatePercentages("".join(D.values()))) if "statistics" in SetOfOutputs else None
+
+        ## END IF / ELSE
+
+        ## SIZE OF 2D MATRIX: # OF ROWS FOR FactorX COLUMNS (SAME AS MODULE.FUNCTION() #14)
+        FactorY = int((LengthOfTextToSearch / FactorX))
+
+        ## CALL MODULE.FUNCTION() #15 - TAKE INTO ACCOUNT FOR USER CHOICE IF NOT EXACT FACTOR
+        ## YH * XW - LengthOfTextToSearch == BLANK SPACES IN THE LAST ROW IF USER SELECTS FACTOR X THAT IS NOT A PERFECT FACTOR; THE LETTERS ARE NOT COPIED (LLL ONLY FOR THE PANDAS SERIES STAGE)
+        YH, XW = mod_15_CalculateYH_XW.fn_CalculateYH_XW(FactorY, FactorX, ListOfFactors, LengthOfTextToSearch)
+
+        ## CALL MODULE.FUNCTION() #98 - FILE NAMES CREATE
+        FileNameForMatrixXLSX, FileNameForMatrixCSV, FileNameForLetterStatistics, FileNameForGematriaTexts, FileNameForELSMatchesDataSummary, FileNameForELSMatchesByLetterFirstPositive, FileNameForELSMatchesByLetterFirstNegative, FileNameForELSMatchesByLetterLastPositive, FileNameForELSMatchesByLetterLastNegative, FileNameForELSMatchesAllLetterPositions, FileNameForELSWindows, FileNameForTextDictionary, FileNameForCoverage, FileNameForBundle = mod_98_FileNamesCreate.fn_FileNamesCreate(XW, YH, NumberOfTextChosen, NumberOfCodexChosen, CustomCorpusSpec)
+
+        ## BEGIN IF / ELSE - STAGE: 2D MATRIX
+        if "Matrix2D" in SetOfStages:
+
+            ## CALL MODULE.FUNCTION() #99 - 2D MATRIX CREATE FOR OUTPUT
+            ## RETURNS M2D OBJECT: ROWS OF LETTERS ARE CREATED ONE AT A TIME WHEN WRITTEN; LAST ROW IS PADDED WITH BLANK SPACES
+            ListOfRowsOfLetters = mod_99_Matrix2DOfLettersCreate.fn_Matrix2DOfLettersCreate(S, YH, XW, D5K)
+
+        else:
+            ListOfRowsOfLetters = None
+        ## END IF / ELSE
+
+        ## CREATE OUTPUT FILES: EACH WRITER OPENS ITS FILE(S) WITH of; --bundle: STREAMED STRAIGHT INTO ONE ARCHIVE (ONLY THE FILES OF THIS SEARCH, NO FILE OF THEIR OWN)
+        of = OF(DirectoryOfOutput=DirectoryOfOutput, FileNameForBundle=FileNameForBundle, BundleFormat=BundleFormat)
+
+        ## CREATE OUTPUT WRITER: EACH FILE BELOW IS SUBMITTED AS SOON AS ITS DATA IS READY; WRITTEN IN ORDER BY ONE BACKGROUND THREAD WHILE THE SEARCH GOES ON
+        ow = OW(IsInBackground=IsOutputInBackground)
+
+        ## BEGIN TRY / FINALLY - THE OUTPUT WRITER (ITS THREAD) + THE BUNDLE ARE CLOSED ALSO IF THE SEARCH FAILS
+        try:
+
+            if "statistics" in SetOfOutputs:
+
+                ## CALL MODULE.FUNCTION() #99 = OUTPUT/WRITE TO CSV 
+                _ = ow.fn_Submit(mod_99_WriteOutputToFileCSV_LetterStatistics.fn_WriteOutputToFile, ListOfTuplesOfLetterStatistics, FileNameForLetterStatistics, of=of)
+
+            if "matrix" in SetOfOutputs:
+
+                ## CALL MODULE.FUNCTION() #99 = OUTPUT/WRITE TO CSV FILE 2D MATRIX; ROWS ARE CREATED + WRITTEN ONE BLOCK AT A TIME
+                FutureOfFileNameForMatrixCSV = ow.fn_Submit(mod_99_WriteOutputToFileCSV_2DMatrix.fn_WriteOutputToFile, ListOfRowsOfLetters, FileNameForMatrixCSV, IsMatrixCSVGzip, of=of)
+
+
+            mod_96_ProgressEventSend.fn_ProgressEventSend("ELSObjects")
+
+            ## 2ND TIME MODULE.FUNCTION() #9B IS CALLED
+            ## CALL MODULE.FUNCTION() #9B - GET NUMBER VALUE FOR WORDS - RETURNS LIST OF TUPLES OF NUMBER VALUES FOR EACH LETTER OF STRING
+            NW4ELS = mod_9B_GetNumberValues4Words.fn_GetNumberValues(ListOfSearchTerms) ## CALLS MODULE.FUNCTION() #9A; ## RETURNS LIST OF TUPLES OF GEMATRIA VALUES FOR ('WORD', [L,E,T,T,E,R,S], SUM)
+
+            ## 2ND TIME MODULE.FUNCTION() #10 IS CALLED
+            ## CALL MODULE.FUNCTION() #10 - CREATE LIST OF CUSTOM INDEXES NON-0-INDEXED / 1-INDEXED RETURNS LIST OF CUSTOM INDEXES
+            ListOfIndexesCustom = mod_10_ListOfIndexesCustomCreate.fn_ListOfIndexesCustomCreate(ListOfSearchTerms)
+
+            ## 2ND TIME MODULE.FUNCTION() #11 IS CALLED
+            ## CALL MODULE.FUNCTION() #11 - DATA OBJECT CREATE - RETURNS TUPLE OF WORDS WITH EACH WORD'S GEMATRIA NUMBER VALUE
+            W4ELS, DW4ELS = mod_11A_TupleOfWordsAndGematriaValuesCreate.fn_TupleOfWordsAndGematriaValuesCreate(ListOfSearchTermsWithSpaces, NW4ELS, ListOfIndexesCustom, ListOfIndexes4LettersInEachWord=[]) ## PASS EMPTY LIST FOR ELSs B/C NO INDEX POSITIONS FOR THESE
+        
+            ## MODULE.FUNCTION() #18 - NPANV IS CREATED ONCE PER SESSION (fn_SearchObjectsGet); None OUT OF CORE
+
+            ## CALL MODULE.FUNCTION() #19 - DATA OBJECT CREATE - RETURNS DICT OF MATCHES FOR EACH FIRST LETTER OF EACH ELS SEARCH TERM (NO INDEX MATCHES OUT OF CORE)
+            DictOfMatches4ELS = mod_19_GetMatchesPerIntegerValue.fn_GetMatchesPerIntegerValue(NW4ELS, NPANV, LengthOfTextToSearch)
+
+            ## CREATE ELS OBJECTS - CREATE DICTIONARY OF ELS [USER-SEARCH-TERM] OBJECTS
+            ## CALL MODULE.FUNCTION() #20 - DATA OBJECT CREATE - RETURNS DICT OF ELS OBJECTS (DELSO)
+            DELSO = mod_20_DictOfELSObjectsCreate.fn_DictOfELSObjectsCreate(DictOfMatches4ELS)
+
+            ## 3RD TIME MODULE.FUNCTION() #10 IS CALLED: ListOfIndexesCustomL IS CREATED ONCE PER SESSION (fn_SearchObjectsGet)
+
+            ## BEGIN IF / ELSE - STAGE: PANDAS SERIES (TEST DEVELOPMENT); ONLY THE OBJECTS OF LLL DEPEND ON XW OF THIS SEARCH
+            if "PandasSeries" in SetOfStages:
+
+                ## LLL == L + BLANK SPACES IN LAST ROW (NEW LIST) IF USER SELECTS FACTOR X THAT IS NOT A PERFECT FACTOR; ELSE L ITSELF (L IS NEVER ALTERED)
+                LLL = L + ([" "] * (YH * XW - LengthOfTextToSearch)) if YH * XW > LengthOfTextToSearch else L
+
+                ## 4TH TIME MODULE.FUNCTION() #10 IS CALLED
+                ## CREATE NEW INDEX TO ACCOUNT FOR THE EXTRA SPACES OF LAST LINE IF USER CHOOSES XW/#COLUMNS THAT IS NOT PERFECT FACTOR/DIVISOR
+                ## CALL MODULE.FUNCTION() #10 - CREATE LIST OF CUSTOM INDEXES NON-0-INDEXED / 1-INDEXED RETURNS LIST OF CUSTOM INDEXES
+                ListOfIndexesCustomLLL = mod_10_ListOfIndexesCustomCreate.fn_ListOfIndexesCustomCreate(LLL)
+
+                ## IMPORT MODULES ONLY IF NEEDED
+                import mod_21_PandasObjectsCreate ## MODULE.FUNCTION() #21 - ## RETURNS sL0, sL, sLLL0, sLLL, sN0, sN)
+
+                ## CALL MODULE.FUNCTION() #21 - sLLL0, sLLL; sL0, sL, sN0, sN ARE CREATED ONCE PER SESSION (fn_SearchObjectsGet)
+                _, _, sLLL0, sLLL, _, _ = mod_21_PandasObjectsCreate.fn_PandasObjectsCreate(L, LLL, N, ListOfIndexesCustomL, ListOfIndexesCustomLLL)
+
+            else:
+                LLL, ListOfIndexesCustomLLL, sLLL0, sLLL = None, None, None, None
+            ## END IF / ELSE
+
+            #########################################################################################################################
+            ## TEST DEVELOPMENT
+            ## IF LLL IS LONGER THAN L
+            ## THEN USER HAS CHOSEN NON-PERFECT FACTOR/DIVISOR OF LENGTH OF TEXT FOR THE SIZE OF X COLUMNS IN 2D MATRIX;
+            ## THEREFORE BLANK SPACES NEED TO BE APPENDED TO THE TEXT STRING TO COMPENSATE FOR NON-PERFECT FACTORS/DIVISORS THAT USER INPUTS
+
+            ## BEGIN IF / ELSE - STAGE: PANDAS SERIES (TEST DEVELOPMENT)
+            if "PandasSeries" in SetOfStages:
+
+                ## IMPORT MODULES ONLY IF NEEDED
+                import mod_41_SearchForELSSearchTerms ## MODULE.FUNCTION() #41 - RETURNS
+
+                ## BEGIN IF / ELIF BLOCK
+                if LLL > L: ## USER HAS CHOSEN A NON-PERFECT FACTOR/DIVISOR
+
+                    ## CALL MODULE.FUNCTION() #41 RETURNS LIST OF SERIES OF BOOLEAN MATCHES FOR EACH LETTER IN EACH WORD OF ELS SEARCH TERM WITHIN TEXT
+                    ListOfPDSeries4ELSs = mod_41_SearchForELSSearchTerms.fn_SearchForELSSearchTerms(ListOfSearchTerms, LLL, ListOfIndexesCustomLLL)
+
+                elif LLL == L: ## USER HAS CHOSEN A PERFECT FACTOR/DIVISOR
+            
+                    ## CALL MODULE.FUNCTION() #41 RETURNS LIST OF SERIES OF BOOLEAN MATCHES FOR EACH LETTER IN EACH WORD OF ELS SEARCH TERM WITHIN TEXT
+                    ListOfPDSeries4ELSs = mod_41_SearchForELSSearchTerms.fn_SearchForELSSearchTerms(ListOfSearchTerms, L, ListOfIndexesCustomL)
+
+                ## END BEGIN IF / ELIF BLOCK
+
+            else:
+                ListOfPDSeries4ELSs = None
+            ## END IF / ELSE
+            ########################################################################################################################
+
+            ## BEGIN IF / ELSE - CHUNKED ELS SEARCH OR IN-MEMORY ELS SEARCH
+            if ChunkSizeForELSSearch is not None:
+
+                ## IMPORT MODULES ONLY IF NEEDED
+                import mod_22C_ELSSearchChunked ## MODULE.FUNCTION() #22C - ## RETURNS ELS MATCHES SEARCH BY FIRST OR LAST LETTER IN MEMORY-MAPPED WINDOWS (--chunk-size)
+
+                mod_96_ProgressEventSend.fn_ProgressEventSend("LetterCodes")
+
+                ## CALL MODULE.FUNCTION() #22C #1 - WRITE LETTER CODES TO BINARY FILE FOR MEMORY-MAPPED SEARCH: N, OR OUT OF CORE ONE VERSE AT A TIME (MODULE.FUNCTION() #22C #2)
+                _ = mod_22C_ELSSearchChunked.fn_LetterCodeFileWrite(N if N is not None else mod_22C_ELSSearchChunked.fn_LetterCodesOfVersesGet(D), of.fn_PathGet(FileNameForLetterCodes), ChunkSizeForELSSearch)
+
+                ## CALL MODULE.FUNCTION() #22C
+                DELSMLF, DictOfRangesDoneLF = mod_22C_ELSSearchChunked.fn_ELSSearch(of.fn_PathGet(FileNameForLetterCodes), DELSO, SkipDistanceDMinimum, SkipDistanceDMaximum, ChunkSizeForELSSearch, ct=ct, ckpt=ckpt) ## RETURNS DictOfMatches (FIRST LETTER), DictOfRangesDone
+
+            else:
+
+                ## IMPORT MODULES ONLY IF NEEDED
+                import mod_22A_ELSSearchByLetterFirst ## MODULE.FUNCTION() #22A - ## RETURNS ELS MATCHES SEARCH BY FIRST LETTER
+
+                ## CALL MODULE.FUNCTION() #22D #3 - SKIP DISTANCES ORDER; BY INCREASING |d| WITH A TIME BUDGET OR MAX MATCHES
+                ListOfD = mod_22D_ELSSearchCoverage.fn_SkipDistancesOrder(SkipDistanceDMinimum, SkipDistanceDMaximum, IsSearchByDistance)
+
+                ## WITH THE SEARCH BY LAST LETTER: #22A STOPS HALFWAY THROUGH THE TIME BUDGET, SO THAT #23 CAN SEARCH THE SAME d BEFORE THE DEADLINE
+                TimeOfDeadlineLF = TimeOfRunStart + SecondsOfTimeBudget / 2 if TimeOfDeadline is not None and "SearchByLetterLast" in SetOfStages else TimeOfDeadline
+
+                ## CALL MODULE.FUNCTION() #22A
+                DELSMLF, DictOfRangesDoneLF = mod_22A_ELSSearchByLetterFirst.fn_ELSSearch(sL, sN, DELSO, DLO, SkipDistanceDMinimum, SkipDistanceDMaximum, ct=ct, ckpt=ckpt, ListOfD=ListOfD, \
+                    TimeOfDeadline=TimeOfDeadlineLF, MaxMatches=MaxMatches) ## RETURNS DictOfMatches (FIRST LETTER), DictOfRangesDone
+
+            ## END IF / ELSE
+
+            ## FIRST TIME MODULE #22B IS CALLED
+            ## EXTRACT NEGATIVES AND POSITIVES ## ALLOWS US TO KEEP ORIGINAL DELSMLF WITH COORDINATES FOR EACH LETTER FIRST (OF ELS) FOR LATER USE
+            DELSMLF_POS, DELSMLF_NEG = mod_22B_NegativesAndPositivesExtract.fn_NegativesAndPositivesExtract(DELSMLF)  ## mod_22B_NegativesAndPositivesExtract.fn_NegativesAndPositivesExtract(DELSMLF) 
+
+            ## SKIP DISTANCES SEARCHED COMPLETELY BY EACH ELS SEARCH; STAGES NOT RUN BECAUSE THE SEARCH WAS CANCELLED
+            ListOfDictsOfRangesDone, ListOfStagesSkipped = [DictOfRangesDoneLF], []
+
+            ## BEGIN IF / ELSE - STAGE: ELS SEARCH BY LAST LETTER (NOT AFTER A CANCEL)
+            if "SearchByLetterLast" in SetOfStages and not (ct is not None and ct.fn_IsCancelled()):
+
+                ## BEGIN IF / ELSE - CHUNKED ELS SEARCH OR IN-MEMORY ELS SEARCH
+                if ChunkSizeForELSSearch is not None:
+
+                    ## IMPORT MODULES ONLY IF NEEDED
+                    import mod_22C_ELSSearchChunked ## MODULE.FUNCTION() #22C - ## RETURNS ELS MATCHES SEARCH BY FIRST OR LAST LETTER IN MEMORY-MAPPED WINDOWS (--chunk-size)
+
+                    ## CALL MODULE.FUNCTION() #22C
+                    DELSMLL, DictOfRangesDoneLL = mod_22C_ELSSearchChunked.fn_ELSSearch(of.fn_PathGet(FileNameForLetterCodes), DELSO, SkipDistanceDMinimum, SkipDistanceDMaximum, ChunkSizeForELSSearch, IsSearchByLetterLast=True, ct=ct, ckpt=ckpt) ## RETURNS DictOfMatches (LAST LETTER), DictOfRangesDone
+
+                else:
+
+                    ## IMPORT MODULES ONLY IF NEEDED
+                    import mod_23_ELSSearchByLetterLast ## MODULE.FUNCTION() #23 - ## RETURNS ELS MATCHES SEARCH BY LAST LETTER
+
+                    ## SAME SKIP DISTANCES AS THE SEARCH BY FIRST LETTER SEARCHED FOR EVERY ELS SEARCH TERM (ALL OF THEM IF NOT STOPPED BY THE TIME BUDGET OR MAX MATCHES)
+                    ListOfD = [d for d in ListOfD if all(any(dFrom <= d <= dTo for dFrom, dTo in ListOfRangesDone) for ListOfRangesDone in DictOfRangesDoneLF.values())]
+
+                    ## CALL MODULE.FUNCTION() #23
+                    DELSMLL, DictOfRangesDoneLL = mod_23_ELSSearchByLetterLast.fn_ELSSearch(sL, sN, DELSO, DLO, SkipDistanceDMinimum, SkipDistanceDMaximum, ct=ct, ckpt=ckpt, ListOfD=ListOfD, \
+                        TimeOfDeadline=TimeOfDeadline, MaxMatches=MaxMatches) ## RETURNS DictOfMatches (LAST LETTER), DictOfRangesDone
+
+                ## END IF / ELSE
+
+                ## SECOND TIME MODULE #22B IS CALLED
+                ## EXTRACT NEGATIVES AND POSITIVES ## ALLOWS US TO KEEP ORIGINAL DELSMLF WITH COORDINATES FOR EACH LETTER LAST (OF ELS) FOR LATER USE
+                DELSMLL_POS, DELSMLL_NEG = mod_22B_NegativesAndPositivesExtract.fn_NegativesAndPositivesExtract(DELSMLL) ## mod_22B_NegativesAndPositivesExtract.fn_NegativesAndPositivesExtract(DELSMLL) 
+                ListOfDictsOfRangesDone.append(DictOfRangesDoneLL)
+
+            else:
+                DELSMLL, DELSMLL_POS, DELSMLL_NEG = None, {Key: {} for Key in DELSMLF_POS}, {Key: {} for Key in DELSMLF_NEG} ## NO MATCHES BY LAST LETTER FOR EACH ELS SEARCH TERM
+                if "SearchByLetterLast" in SetOfStages:
+                    ListOfStagesSkipped.append("SearchByLetterLast")
+            ## END IF / ELSE
+
+            ## CALL MODULE.FUNCTION() #22D - ELS SEARCH COVERAGE CREATE; A (TERM, d) IS DONE IF EVERY ELS SEARCH RUN SEARCHED IT COMPLETELY
+            DictOfCoverage = mod_22D_ELSSearchCoverage.fn_ELSSearchCoverageCreate(DictOfSearchTermsWithSpaces, SkipDistanceDMinimum, SkipDistanceDMaximum, ListOfDictsOfRangesDone, ListOfStagesSkipped)
+
+            ## TEST PRINT OUTPUT
+            if not DictOfCoverage["IsComplete"]:
+
+                ## STOPPED BY THE USER, BY MAX MATCHES OR BY THE TIME BUDGET
+                if ct is not None and ct.fn_IsCancelled():
+                    DictOfCoverage["StoppedBy"] = ct.Reason
+                elif MaxMatches is not None and sum(len(EachDict) for EachDict in DELSMLF.values()) >= MaxMatches:
+                    DictOfCoverage["StoppedBy"] = f"{MaxMatches} matches reached"
+                elif SecondsOfTimeBudget is not None:
+                    DictOfCoverage["StoppedBy"] = f"time budget of {SecondsOfTimeBudget:g} s used up"
+                else:
+                    DictOfCoverage["StoppedBy"] = "cancelled"
+
+                print("\n")  ## PRINT SPACE
+                print(f"ELS SEARCH STOPPED EARLY ({DictOfCoverage['StoppedBy']}); FILES HOLD THE MATCHES OF THE d SEARCHED")
+                for EachTerm in DictOfCoverage["Terms"]:
+                    print(f"{EachTerm['Term']}: d searched {EachTerm['DRangesDone']}; d left {EachTerm['DRangesLeft']}")
+                print(f"|d| <= {DictOfCoverage['SkipDistanceAbsoluteDone']} fully searched" if DictOfCoverage["SkipDistanceAbsoluteDone"] is not None else "no |d| fully searched")
+
+            ## BEGIN IF - BOTH ELS SEARCHES RUN: MATCHES BY FIRST + LAST LETTER ONLY OF THE d BOTH SEARCHED COMPLETELY (SAME SKIP DISTANCES AS THE COVERAGE)
+            if len(ListOfDictsOfRangesDone) > 1 and not DictOfCoverage["IsComplete"]:
+
+                ## CALL MODULE.FUNCTION() #22D #6 - MATCHES OF RANGES DONE
+                DELSMLF_POS, DELSMLF_NEG = mod_22D_ELSSearchCoverage.fn_MatchesOfRangesDoneGet(DELSMLF_POS, DictOfCoverage), mod_22D_ELSSearchCoverage.fn_MatchesOfRangesDoneGet(DELSMLF_NEG, DictOfCoverage)
+                DELSMLL_POS, DELSMLL_NEG = mod_22D_ELSSearchCoverage.fn_MatchesOfRangesDoneGet(DELSMLL_POS, DictOfCoverage), mod_22D_ELSSearchCoverage.fn_MatchesOfRangesDoneGet(DELSMLL_NEG, DictOfCoverage)
+
+            ## END IF
+
+            ## SAVE THE SKIP DISTANCES SEARCHED SINCE THE LAST SAVE OF THE CHECKPOINT
+            if ckpt is not None:
+                ckpt.fn_Save()
+                print("\n")  ## PRINT SPACE
+                print(f"CHECKPOINT {ckpt.FileNameForCheckpoint}: {ckpt.NumberOfUnitsResumed} SKIP DISTANCES RESUMED, {ckpt.NumberOfUnitsSearched} SEARCHED NOW")
+
+            ## FREE INTERMEDIATES OF THE ELS SEARCH; ONLY KEPT FOR THE gso WITH --outputs test (OBJECTS OF THE TEXT STAY IN THE SESSION FOR THE NEXT SEARCH)
+            if "test" not in SetOfOutputs:
+                NPANV, sL0, sL, sLLL0, sLLL, sN0, sN, ListOfIndexesCustomL, ListOfIndexesCustomLLL, DELSMLF, DELSMLL = None, None, None, None, None, None, None, None, None, None, None
+
+            ## BEGIN IF - CHUNKED ELS SEARCH OUT OF CORE: LETTER + WORD OBJECTS ONLY FOR THE LETTERS OF THE ELS MATCHES (BY FIRST + LAST LETTER)
+            if IsOutOfCore:
+
+                mod_96_ProgressEventSend.fn_ProgressEventSend("LetterObjects")
+
+                ## EACH LETTER POSITION n + (i * d) OF EACH ELS MATCH (n, d, k)
+                SetOfLetterPositions = {n + (EachNumber * d) for EachDictOfMatches in (DELSMLF_POS, DELSMLF_NEG, DELSMLL_POS, DELSMLL_NEG) for EachDict in EachDictOfMatches.values() for n, d, k in EachDict for EachNumber in range(k)}
+
+                ## CALL MODULE.FUNCTION() #8F - DATA OBJECTS CREATE FOR THE LETTER POSITIONS OF THE ELS MATCHES
+                DLO, DW = mod_8F_DataObjectsCreate.fn_DataObjectsCreate(D, DS, SetOfLetterPositions)
+
+            ## END IF
+
+            ## TEXT OF WORD + VERSE FOR THE FILES OF ELS MATCHES + LETTER POSITIONS: (DW, DS); --text-ids: (None, None) == IDS ONLY
+            TupleOfTextsForOutput = (None, None) if IsTextIDsOnly else (DW, DS)
+
+            ## UPDATE ELSO OBJECTS
+            ## CALL MODULE.FUNCTION() #24
+            DELSO = mod_24_AddSearchResultsToDELSO.fn_AddSearchResultsToDELSO(DELSO, DELSMLF_POS, DELSMLF_NEG, DELSMLL_POS, DELSMLL_NEG)
+
+            ## UPDATE W4ELS OBJECT
+            ## CALL MODULE.FUNCTION() #25
+            W4ELS = mod_25_UpdateW4ELS.fn_UpdateW4ELS(W4ELS, DELSO)
+
+            ## BEGIN IF - COVERAGE OF THE ELS SEARCH (ALWAYS WHEN STOPPED EARLY)
+            if "coverage" in SetOfOutputs or not DictOfCoverage["IsComplete"]:
+
+                ## CALL MODULE.FUNCTION() #99 = OUTPUT/WRITE TO JSON FILE SKIP DISTANCES SEARCHED + LEFT FOR EACH ELS SEARCH TERM
+                _ = ow.fn_Submit(mod_99_WriteOutputToFileJSON_Coverage.fn_WriteOutputToFile, DictOfCoverage, FileNameForCoverage, of=of)
+
+            ## END IF
+
+            if "summary" in SetOfOutputs:
+
+                ## CALL MODULE.FUNCTION() #99 = OUTPUT/WRITE TO CSV FILE ALL WORDS OF ELSs WITH EACH WORD'S GEMATRIA VALUE
+                _ = ow.fn_Submit(mod_99_WriteOutputToFileCSV_ELSMatches_DATASUMMARY.fn_WriteOutputToFile, W4ELS, FileNameForELSMatchesDataSummary, of=of)
+
+            ## BEGIN IF - STAGE: UPDATE W
+            if "UpdateW" in SetOfStages:
+
+                ## UPDATE W OBJECT (FIRST SEARCH ONLY; W DOES NOT DEPEND ON THE ELS SEARCH TERMS)
+                if self.WUpdated is None:
+
+                    ## CALL MODULE.FUNCTION() #26
+                    self.WUpdated = mod_26_UpdateW.fn_UpdateW(W, DWTK)
+
+                W = self.WUpdated
+
+            ## END IF
+
+            if "words" in SetOfOutputs:
+
+                ## CALL MODULE.FUNCTION() #99 = OUTPUT/WRITE TO CSV FILE ALL WORDS OF SELECTED TEXT(S) WITH EACH WORD'S GEMATRIA VALUE
+                _ = ow.fn_Submit(mod_99_WriteOutputToFileCSV_WordsAndGematriaValues.fn_WriteOutputToFile, W, FileNameForGematriaTexts, of=of)
+
+            ## BEGIN IF / ELSE - STAGE: GATHER DATA 4 ELS MATCHES BY FIRST LETTER
+            if "GatherByLetterFirst" in SetOfStages:
+
+                mod_96_ProgressEventSend.fn_ProgressEventSend("GatherByLetterFirst")
+
+                ## 1ST TIME MODULE.FUNCTION() #27 IS CALLED
+                ## CALL MODULE.FUNCTION() #27
+                LTM4ELS_LF_POS, DLO, DELSO = mod_27_GatherData4ELSMatches.fn_GatherData4ELSMatches(DictOfSearchTerms, DictOfSearchTermsWithSpaces, DLO, DW, DW4ELS, DELSO, DELSMLF_POS, DS) ## EXTRACT MATCHES POSITIVE
+
+                if "matches" in SetOfOutputs:
+
+                    ## CALL MODULE.FUNCTION() #99 = OUTPUT/WRITE TO CSV FILE ALL MATCHES OF ELS WITH POSITIVE SKIPDISTANCES (d) BY FIRST LETTER
+                    _ = ow.fn_Submit(mod_99_WriteOutputToFileCSV_ELSMatches.fn_WriteOutputToFile, LTM4ELS_LF_POS, FileNameForELSMatchesByLetterFirstPositive, *TupleOfTextsForOutput, of=of)
+        
+                ## 2ND TIME MODULE.FUNCTION() #27 IS CALLED
+                ## CALL MODULE.FUNCTION() #27
+                LTM4ELS_LF_NEG, DLO, DELSO = mod_27_GatherData4ELSMatches.fn_GatherData4ELSMatches(DictOfSearchTerms, DictOfSearchTermsWithSpaces, DLO, DW, DW4ELS, DELSO, DELSMLF_NEG, DS) ## EXTRACT MATCHES NEGATIVE
+
+                if "matches" in SetOfOutputs:
+
+                    ## CALL MODULE.FUNCTION() #99 = OUTPUT/WRITE TO CSV FILE ALL MATCHES OF ELS WITH NEGATIVE SKIPDISTANCES (d) BY FIRST LETTER
+                    _ = ow.fn_Submit(mod_99_WriteOutputToFileCSV_ELSMatches.fn_WriteOutputToFile, LTM4ELS_LF_NEG, FileNameForELSMatchesByLetterFirstNegative, *TupleOfTextsForOutput, of=of)
+
+            else:
+                LTM4ELS_LF_POS, LTM4ELS_LF_NEG = None, None
+            ## END IF / ELSE
+
+            ## BEGIN IF / ELSE - STAGE: GATHER DATA 4 ELS MATCHES BY LAST LETTER
+            if "GatherByLetterLast" in SetOfStages:
+
+                mod_96_ProgressEventSend.fn_ProgressEventSend("GatherByLetterLast")
+
+                ## 3RD TIME MODULE.FUNCTION() #27 IS CALLED
+                ## CALL MODULE.FUNCTION() #27
+                LTM4ELS_LL_POS, DLO, DELSO = mod_27_GatherData4ELSMatches.fn_GatherData4ELSMatches(DictOfSearchTerms, DictOfSearchTermsWithSpaces, DLO, DW, DW4ELS, DELSO, DELSMLL_POS, DS) ## EXTRACT MATCHES POSITIVE
+
+                if "matches" in SetOfOutputs:
+
+                    ## CALL MODULE.FUNCTION() #99 = OUTPUT/WRITE TO CSV FILE ALL MATCHES OF ELS WITH POSITIVE SKIPDISTANCES (d) BY LAST LETTER
+                    _ = ow.fn_Submit(mod_99_WriteOutputToFileCSV_ELSMatches.fn_WriteOutputToFile, LTM4ELS_LL_POS, FileNameForELSMatchesByLetterLastPositive, *TupleOfTextsForOutput, of=of)
+        
+                ## 4TH TIME MODULE.FUNCTION() #27 IS CALLED
+                ## CALL MODULE.FUNCTION() #27
+                LTM4ELS_LL_NEG, DLO, DELSO = mod_27_GatherData4ELSMatches.fn_GatherData4ELSMatches(DictOfSearchTerms, DictOfSearchTermsWithSpaces, DLO, DW, DW4ELS, DELSO, DELSMLL_NEG, DS) ## EXTRACT MATCHES NEGATIVE
+
+                if "matches" in SetOfOutputs:
+
+                    ## CALL MODULE.FUNCTION() #99 = OUTPUT/WRITE TO CSV FILE ALL MATCHES OF ELS WITH NEGATIVE SKIPDISTANCES (d) BY LAST LETTER
+                    _ = ow.fn_Submit(mod_99_WriteOutputToFileCSV_ELSMatches.fn_WriteOutputToFile, LTM4ELS_LL_NEG, FileNameForELSMatchesByLetterLastNegative, *TupleOfTextsForOutput, of=of)
+
+            else:
+                LTM4ELS_LL_POS, LTM4ELS_LL_NEG = None, None
+            ## END IF / ELSE
+
+            ## BEGIN IF / ELSE - STAGE: ALL ELS LETTER POSITIONS
+            if "LetterPositions" in SetOfStages:
+
+                mod_96_ProgressEventSend.fn_ProgressEventSend("LetterPositions")
+
+                ## BEGIN POSITIVE ELS MATCHES
+                ## 1ST TIME MODULE.FUNCTION() #28 IS CALLED
+                ## CALL MODULE.FUNCTION() #28
+                MasterList4LetterPositions_POS, DLO = mod_28_ExtractAllELSLetterPositions.fn_ExtractAllELSLetterPositions(LTM4ELS_LF_POS, DLO, DW, DS) ## RETURNS:
+
+                ## END POSITIVE ELS MATCHES
+
+                ## BEGIN NEGATIVE ELS MATCHES
+                ## 2ND TIME MODULE.FUNCTION() #28 IS CALLED
+                ## CALL MODULE.FUNCTION() #28
+                MasterList4LetterPositions_NEG, DLO = mod_28_ExtractAllELSLetterPositions.fn_ExtractAllELSLetterPositions(LTM4ELS_LF_NEG, DLO, DW, DS) ## RETURNS:
+    
+                ## END NEGATIVE ELS MATCHES
+
+            else:
+                MasterList4LetterPositions_POS, MasterList4LetterPositions_NEG = None, None
+            ## END IF / ELSE
+
+            ## BEGIN TEST DEVELOPMENT
+
+            ## BEGIN IF / ELSE - STAGE: REGEX (TEST DEVELOPMENT)
+            if "Regex" in SetOfStages:
+
+                ## IMPORT MODULES ONLY IF NEEDED
+                import mod_40_ConvertELSQueryToRegex ## MODULE.FUNCTION() #40 - RETURNS ListOfRegex4ELSSearchTerms
+
+                #########################################################################################################################
+                ## TEST DEVELOPMENT
+                ## TEST FOR TEXT STRING
+                ## CALL MODULE.FUNCTION() #40 - CONVERT EACH LETTER IN ELS SEARCH QUERY TO REGULAR EXPRESSIONS (REGEX)
+                ListOfRegex4TextString = mod_40_ConvertELSQueryToRegex.fn_ConvertELSQueryToRegex(L) ## RETURNS LIST OF LISTS OF LETTERS
+
+                ## TEST FOR ELS TERMS
+                ## CALL MODULE.FUNCTION() #40 - CONVERT EACH LETTER IN ELS SEARCH QUERY TO REGULAR EXPRESSIONS (REGEX)
+                ListOfRegex4ELSSearchTerms = mod_40_ConvertELSQueryToRegex.fn_ConvertELSQueryToRegex(ListOfSearchTerms) ## RETURNS LIST OF LISTS OF LETTERS
+                #########################################################################################################################
+
+            else:
+                ListOfRegex4TextString, ListOfRegex4ELSSearchTerms = None, None
+            ## END IF / ELSE
+
+            ## END TEST DEVELOPMENT
+
+            ## MODULES FOR FINAL STEPS OF PROGRAM TO OUTPUT DATA AS CSV FILES
+
+            ## BEGIN IF - STAGE: ALL ELS LETTER POSITIONS
+            if "LetterPositions" in SetOfStages:
+
+                ## CALL MODULE.FUNCTION() #98 - FILE NAMES CREATE POSITIVE
+                FileNamesForELSTerms_POS, Dict4FileNames4ELSTerms_POS = mod_98_FileNamesCreate4ELSTerms_POS.fn_FileNamesCreate(XW, YH, NumberOfCodexChosen, NumberOfTextChosen, W4ELS, DELSO, CustomCorpusSpec)
+    
+                ## CALL MODULE.FUNCTION() #98 - FILE NAMES CREATE NEGATIVE
+                FileNamesForELSTerms_NEG, Dict4FileNames4ELSTerms_NEG = mod_98_FileNamesCreate4ELSTerms_NEG.fn_FileNamesCreate(XW, YH, NumberOfCodexChosen, NumberOfTextChosen, W4ELS, DELSO, CustomCorpusSpec)
+   
+                ## BEGIN IF - ONE FILE OF ALL LETTER POSITIONS (NOT NEEDED FOR --sqlite ALONE)
+                if "letters" in SetOfOutputs:
+
+                    ## CALL MODULE.FUNCTION() #99 : WRITE OUTPUT OF ALL ELS DATA TO ONE FILE KEYED BY MatchID: POSITIVE + NEGATIVE ELS MATCHES
+                    FutureOfFileNameForELSMatchesAllLetterPositions = ow.fn_Submit(mod_99_WriteOutputToFile_ELSMatchesAllLetterPositionsConsolidated.fn_WriteOutputToFile, MasterList4LetterPositions_POS, Dict4FileNames4ELSTerms_POS, MasterList4LetterPositions_NEG, Dict4FileNames4ELSTerms_NEG, FileNameForELSMatchesAllLetterPositions, FileFormatForELSLetterPositions, *TupleOfTextsForOutput, of=of)
+
+                    ## BEGIN IF - OLD LAYOUT: ONE CSV FILE PER ELS MATCH, CREATED FROM THE CONSOLIDATED FILE
+                    if IsLegacyLetterPositionFiles:
+
+                        ## CALL MODULE.FUNCTION() #99 : WRITE OUTPUT OF EACH INDIVIDUAL ELS DATA: POSITIVE + NEGATIVE ELS MATCHES
+                        ## IN A BUNDLE THE CONSOLIDATED FILE IS A MEMBER (NOT READ BACK): ITS ROWS ARE CREATED AGAIN
+                        RowsOfLetterPositions = mod_99_WriteOutputToFile_ELSMatchesAllLetterPositionsConsolidated.fn_RowsCreate(MasterList4LetterPositions_POS, Dict4FileNames4ELSTerms_POS, MasterList4LetterPositions_NEG, Dict4FileNames4ELSTerms_NEG, *TupleOfTextsForOutput) if BundleFormat is not None else None
+                        _ = ow.fn_Submit(mod_99_WriteOutputToFile_ELSMatchesAllLetterPositionsConsolidated.fn_LegacyFilesCreate, FutureOfFileNameForELSMatchesAllLetterPositions, of=of, Rows=RowsOfLetterPositions)
+
+                    ## END IF
+
+                ## END IF
+
+            ## END IF
+
+            ## BEGIN IF - SQLITE DATABASE OF ALL RUNS
+            if "sqlite" in SetOfOutputs:
+
+                ## CALL MODULE.FUNCTION() #99 : WRITE RUN + TERMS + ELS MATCHES (BY FIRST LETTER) + LETTER POSITIONS TO SQLITE
+                FutureOfRunID = ow.fn_Submit(mod_99_WriteOutputToSQLite.fn_WriteOutputToSQLite, DatabaseFileName, NumberOfCodexChosen, NumberOfTextChosen, CustomCorpusSpec, LengthOfTextToSearch, XW, YH, SkipDistanceDMinimum, SkipDistanceDMaximum, DictOfSearchTerms, DictOfSearchTermsWithSpaces, DELSO, DELSMLF_POS, DELSMLF_NEG, LTM4ELS_LF_POS, LTM4ELS_LF_NEG, MasterList4LetterPositions_POS, MasterList4LetterPositions_NEG, DW)
+
+            ## END IF
+
+            ## BEGIN IF - XLSX FILE OF 2D MATRIX
+            if "xlsx" in SetOfOutputs:
+
+                ## CALL MODULE.FUNCTION() #99 = OUTPUT/WRITE TO XLSX FILE 2D MATRIX
+                _ = ow.fn_Submit(mod_99_WriteOutputToFileXLSX_2DMatrix.fn_WriteOutputToFile, YH, XW, ListOfRowsOfLetters, FileNameForMatrixXLSX, DELSO, of=of)
+
+            ## END IF
+
+            ## BEGIN IF - WINDOWS OF THE 2D MATRIX AROUND THE ELS MATCHES
+            if "windows" in SetOfOutputs:
+
+                ## CALL MODULE.FUNCTION() #99 = OUTPUT/WRITE TO CSV (+ XLSX) FILE ELS WINDOWS; MatchIDs AS IN THE CONSOLIDATED FILE OF ALL LETTER POSITIONS
+                FutureOfFileNameForELSWindows = ow.fn_Submit(mod_99_WriteOutputToFile_ELSWindows.fn_WriteOutputToFile, S, D5K, LTM4ELS_LF_POS, LTM4ELS_LF_NEG, FileNameForELSWindows, ListOfMatchIDsForELSWindows, XWForELSWindows, RowsAroundForELSWindows, ColumnsAroundForELSWindows, "xlsx" in SetOfOutputs, of=of)
+
+            ## END IF
+
+            ## BEGIN IF - TEXT DICTIONARY FOR THE IDS OF WORDS + VERSES
+            if IsTextIDsOnly and SetOfOutputs & {"matches", "letters"}:
+
+                ## CALL MODULE.FUNCTION() #99 = OUTPUT/WRITE TO CSV FILE TEXT OF EACH WORD + VERSE OF THE ELS MATCHES, ONCE PER RUN
+                _ = ow.fn_Submit(mod_99_WriteOutputToFileCSV_TextDictionary.fn_WriteOutputToFile, (LTM4ELS_LF_POS, LTM4ELS_LF_NEG, LTM4ELS_LL_POS, LTM4ELS_LL_NEG), (MasterList4LetterPositions_POS, MasterList4LetterPositions_NEG), DW, DS, FileNameForTextDictionary, of=of)
+
+            ## END IF
+
+            ## WAIT FOR THE OUTPUT WRITER TO WRITE + CLOSE ALL FILES; RAISES THE FIRST ERROR OF ANY FILE
+            mod_96_ProgressEventSend.fn_ProgressEventSend("Output")
+            ow.fn_Close()
+
+            ## BEGIN IF - ONE ARCHIVE OF ALL FILES OF THE RUN
+            if BundleFormat is not None:
+
+                ## PARAMETERS + COUNTS OF THE RUN FOR MANIFEST.json
+                DictOfParameters = {"Codex": NumberOfCodexChosen, "Text": NumberOfTextChosen, "CustomCorpus": CustomCorpusSpec, "LengthOfText": LengthOfTextToSearch, "XW": XW, "YH": YH, "SkipDistanceDMinimum": SkipDistanceDMinimum, "SkipDistanceDMaximum": SkipDistanceDMaximum, "ELSSearchTerms": DictOfSearchTermsWithSpaces, "Outputs": sorted(SetOfOutputs)}
+                DictOfCounts = {"ELSMatches": {DictOfSearchTermsWithSpaces[ELSSearchTermNumber]: {"Positive": EachELSObject.NMP, "Negative": EachELSObject.NMN} for ELSSearchTermNumber, EachELSObject in DELSO.items()}, "Coverage": DictOfCoverage}
+
+                mod_96_ProgressEventSend.fn_ProgressEventSend("Bundle")
+
+                ## CALL MODULE.FUNCTION() #99 = OUTPUT/WRITE TO BUNDLE: MANIFEST OF THE FILES THE WRITERS OF THIS SEARCH STREAMED INTO THE BUNDLE (NOT THE SQLITE DATABASE OF ALL RUNS); CLOSES THE BUNDLE
+                FileNameForBundle = mod_99_WriteOutputToBundle.fn_WriteOutputToBundle(of, DictOfParameters, DictOfCounts)
+
+            ## END IF
+
+            else:
+                FileNameForBundle = None
+            ## END IF
+
+            ## RunID OF THE SEARCH IN THE SQLITE DATABASE
+            RunID = FutureOfRunID.result() if "sqlite" in SetOfOutputs else None
+
+        finally:
+            ow.fn_Close(IsRaise=False)
+            of.fn_Close()
+
+        ## END TRY / FINALLY
+
+        ## LAST PROGRESS EVENT OF THE SEARCH; RECEIVER OF THE CALLER BACK
+        mod_96_ProgressEventSend.fn_ProgressEventSend("Done", 1, 1, IsComplete=DictOfCoverage["IsComplete"], Matches=sum(EachELSObject.NMP + EachELSObject.NMN for EachELSObject in DELSO.values()))
+        mod_96_ProgressEventSend.fn_ProgressReceiverReset(TokenOfProgress)
+
+        ## CREATE NEW OBJECT INSTANCE OF CLASS: GLOBAL SEARCH OBJECT
+        gso = GSO()
+
+        ## ADD ATTRIBUTES TO gso
+        gso.SearchTextChosen = self.SearchTextChosen ## 1-DIGIT TUPLE ## (12,)
+        gso.CustomCorpusSpec = CustomCorpusSpec ## STRING ## e.g. 'Gen 1:1-11:32'; None IF NOT A CUSTOM CORPUS
+        gso.ListOfCorpusOffsets = self.ListOfCorpusOffsets ## 1-BASED INDEX POSITIONS (FirstLetterPositionIndex) ## OFFSET TABLE OF CUSTOM CORPUS; None IF NOT A CUSTOM CORPUS
+        gso.LengthOfTextToSearch = LengthOfTextToSearch ## INTEGER
+
+        gso.D = D ## 3-DIGIT-TUPLE-BASED DICTIONARY KEY POSITION OF (BOOK#, CHAPTER#, VERSE#) - NO SPACES BETWEEN WORDS/LETTERS
+        gso.DS = DS ## 3-DIGIT-TUPLE-BASED DICTIONARY KEY POSITION OF (BOOK#, CHAPTER#, VERSE#) - WITH SPACES BETWEEN WORDS/LETTERS
+        gso.S = S ## 0-BASED INDEX POSITIONS
+        gso.L = L ## 0-BASED INDEX POSITIONS
+        gso.DL = DL ## 4-DIGIT-TUPLE-BASED DICTIONARY KEY POSITION OF (BOOK#, CHAPTER#, VERSE#, LETTER#INVERSE) - NO SPACES BETWEEN WORDS/LETTERS
+        gso.D5 = D5 ## 5-DIGIT-TUPLE-BASED DICTIONARY KEY POSITION OF (BOOK#, CHAPTER#, VERSE#, LETTER#INVERSE, LETTER#INTEXT) - NO SPACES BETWEEN WORDS/LETTERS
+        gso.D5K = D5K ## 1-BASED DICTIONARY KEY-POSITIONS: RETURNS ## 5-DIGIT-TUPLE-BASED DICTIONARY VALUE OF (BOOK#, CHAPTER#, VERSE#, LETTER#INVERSE, LETTER#INTEXT)
+        gso.N = N ## 0-BASED INDEX POSITIONS
+
+        gso.LW = LW ## 0-BASED INDEX POSITIONS
+        gso.W = W ## 0-BASED INDEX POSITIONS
+        gso.DW = DW ## 1-BASED DICTIONARY KEY-POSITIONS
+        gso.NW = NW ## 0-BASED INDEX POSITIONS
+        gso.DLO = DLO ## 1-BASED DICTIONARY KEY-POSITIONS
+
+        gso.ListOfSearchTerms = ListOfSearchTerms ## 0-BASED INDEX POSITIONS
+        gso.DictOfSearchTerms = DictOfSearchTerms ## 1-BASED DICTIONARY KEY-POSITIONS
+        gso.DictOfSearchTermsWithSpaces = DictOfSearchTermsWithSpaces ## 1-BASED DICTIONARY KEY-POSITIONS
+        gso.SkipDistanceDMinimum = SkipDistanceDMinimum ## INTEGER
+        gso.SkipDistanceDMaximum = SkipDistanceDMaximum ## INTEGER
+
+        gso.ListOfRegex4TextString = ListOfRegex4TextString ## 0-BASED INDEX POSITIONS
+        gso.ListOfRegex4ELSSearchTerms = ListOfRegex4ELSSearchTerms ## 0-BASED INDEX POSITIONS
+        gso.ListOfRowsOfLetters = ListOfRowsOfLetters ## 0-BASED INDEX POSITIONS
+        gso.ListOfPDSeries4ELSs = ListOfPDSeries4ELSs ## 0-BASED INDEX POSITIONS
+
+        gso.NW4ELS = NW4ELS ## 0-BASED INDEX POSITIONS
+        gso.W4ELS = W4ELS ## 0-BASED INDEX POSITIONS
+        gso.DW4ELS = DW4ELS ## 1-BASED DICTIONARY KEY-POSITIONS
+        gso.DictOfMatches4ELS = DictOfMatches4ELS ## 1-BASED DICTIONARY KEY-POSITIONS
+        gso.DELSO = DELSO ## 1-BASED DICTIONARY KEY-POSITIONS
+
+        gso.LTM4ELS_LF_POS = LTM4ELS_LF_POS ## 0-BASED INDEX POSITIONS ## ELS MATCHES BY FIRST LETTER: POSITIVE (d); None IF STAGE NOT RUN
+        gso.LTM4ELS_LF_NEG = LTM4ELS_LF_NEG ## 0-BASED INDEX POSITIONS ## ELS MATCHES BY FIRST LETTER: NEGATIVE (d); None IF STAGE NOT RUN
+        gso.LTM4ELS_LL_POS = LTM4ELS_LL_POS ## 0-BASED INDEX POSITIONS ## ELS MATCHES BY LAST LETTER: POSITIVE (d); None IF STAGE NOT RUN
+        gso.LTM4ELS_LL_NEG = LTM4ELS_LL_NEG ## 0-BASED INDEX POSITIONS ## ELS MATCHES BY LAST LETTER: NEGATIVE (d); None IF STAGE NOT RUN
+        gso.MasterList4LetterPositions_POS = MasterList4LetterPositions_POS ## 0-BASED INDEX POSITIONS ## ALL LETTER POSITIONS OF EACH ELS MATCH: POSITIVE (d); None IF STAGE NOT RUN
+        gso.MasterList4LetterPositions_NEG = MasterList4LetterPositions_NEG ## 0-BASED INDEX POSITIONS ## ALL LETTER POSITIONS OF EACH ELS MATCH: NEGATIVE (d); None IF STAGE NOT RUN
+
+        gso.ListOfFactors = ListOfFactors ## 0-BASED INDEX POSITIONS
+        gso.YH = YH ## INTEGER
+        gso.XW = XW ## INTEGER
+        gso.LLL = LLL ## 0-BASED INDEX POSITIONS
+
+        gso.ListOfIndexesCustomL = ListOfIndexesCustomL ## 0-BASED INDEX POSITIONS
+        gso.ListOfIndexesCustomLLL = ListOfIndexesCustomLLL ## 0-BASED INDEX POSITIONS
+
+        gso.sL0 = sL0 ## 0-BASED INDEX POSITIONS
+        gso.sL = sL ## 1-BASED INDEX POSITIONS
+        gso.sLLL0 = sLLL0 ## 0-BASED INDEX POSITIONS
+        gso.sLLL = sLLL ## 1-BASED INDEX POSITIONS
+        gso.sN0 = sN0 ## 0-BASED INDEX POSITIONS
+        gso.sN = sN ## 1-BASED INDEX POSITIONS
+
+        gso.NPANV = NPANV ## 0-BASED INDEX POSITIONS
+
+        gso.SetOfOutputs = SetOfOutputs ## SET OF STRINGS ## OUTPUTS WRITTEN BY THE SEARCH
+        gso.DictOfCoverage = DictOfCoverage ## DICT ## SKIP DISTANCES SEARCHED COMPLETELY PER ELS SEARCH TERM; IsComplete == False IF THE SEARCH WAS CANCELLED (MODULE.FUNCTION() #22D)
+        gso.RunID = RunID ## INTEGER ## RunID IN THE SQLITE DATABASE; None WITHOUT sqlite
+        gso.FileNameForBundle = FileNameForBundle ## STRING ## None WITHOUT BundleFormat
+
+        ## RETURN VARIABLES
+        return(gso)
+
+## END CLASS
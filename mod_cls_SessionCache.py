@@ -0,0 +1,50 @@
+## IMPORT MODULES
+import collections
+import threading
+
+import mod_7A_CorpusOpen ## MODULE.FUNCTION() #7A - CORPUS OPEN; ## RETURNS session
+
+## DEFINE CLASS ##
+class cls_SessionCache():
+
+    """
+    ## CLASS FOR SESSION CACHE - SESSIONCACHE() - sc; THE LAST MaxSessions CORPORA OPENED (LEAST RECENTLY USED ONE IS DROPPED FIRST); KEY: (NumberOfCodexChosen, NumberOfTextChosen, CustomCorpusSpec)
+    """
+
+    def __init__(self, MaxSessions=2):
+
+        self.MaxSessions = MaxSessions ## INTEGER : NUMBER OF CORPORA KEPT IN MEMORY
+        self.DictOfSessions = collections.OrderedDict() ## KEY: (CODEX, TEXT, SPEC); VALUE: session; LAST == MOST RECENTLY USED
+        self.Lock = threading.Lock() ## ONE CORPUS IS OPENED AT A TIME
+
+    def fn_KeyCreate(self, NumberOfCodexChosen, NumberOfTextChosen, CustomCorpusSpec=None):
+
+        ## SPEC ONLY COUNTS FOR A CUSTOM CORPUS
+        return((NumberOfCodexChosen, NumberOfTextChosen, CustomCorpusSpec if NumberOfTextChosen == mod_7A_CorpusOpen.NumberOfTextCustomCorpus else None))
+
+    def fn_SessionGet(self, NumberOfCodexChosen, NumberOfTextChosen, CustomCorpusSpec=None):
+
+        ## RETURNS (session, IsOpenedNow); OPENS THE CORPUS (MODULE.FUNCTION() #7A) IF IT IS NOT IN THE CACHE
+        Key = self.fn_KeyCreate(NumberOfCodexChosen, NumberOfTextChosen, CustomCorpusSpec)
+
+        with self.Lock:
+
+            ## IN CACHE: MOST RECENTLY USED NOW
+            if Key in self.DictOfSessions:
+                self.DictOfSessions.move_to_end(Key)
+                return((self.DictOfSessions[Key], False))
+
+            ## NOT IN CACHE: DROP LEAST RECENTLY USED FIRST SO THAT NO MORE THAN MaxSessions CORPORA ARE IN MEMORY
+            while len(self.DictOfSessions) >= self.MaxSessions:
+                self.DictOfSessions.popitem(last=False)
+
+            session = mod_7A_CorpusOpen.fn_CorpusOpen(*Key)
+            self.DictOfSessions[Key] = session
+
+        return((session, True))
+
+    def fn_KeysGet(self):
+
+        ## RETURNS LIST OF KEYS; LAST == MOST RECENTLY USED
+        with self.Lock:
+            return(list(self.DictOfSessions))
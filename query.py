@@ -0,0 +1,45 @@
+## QUERY THE SQLITE DATABASE OF ELS MATCHES WRITTEN BY: python p.py --sqlite
+## e.g. ALL MATCHES OF משיח WITH |d| < 50 IN GENESIS:  python query.py --term משיח --max-abs-d 49 --book 1
+## e.g. LIST OF RUNS:  python query.py --runs
+## e.g. LETTER POSITIONS OF ONE MATCH:  python query.py --letters 17
+
+## BEGIN IMPORT MODULES
+import argparse
+import csv
+import sys
+
+import mod_99_WriteOutputToSQLite ## MODULE.FUNCTION() #99 - WRITE OUTPUT TO SQLITE + QUERIES
+## END IMPORT MODULES
+
+## BEGIN DECLARE VARIABLES
+Parser = argparse.ArgumentParser(description="Query the SQLite database of ELS matches (written by: python p.py --sqlite)")
+Parser.add_argument("--database", default=mod_99_WriteOutputToSQLite.DatabaseFileNameDefault, help="database file (default: %(default)s)")
+Parser.add_argument("--runs", action="store_true", help="list all runs")
+Parser.add_argument("--letters", type=int, metavar="MATCHID", help="list the letter positions of one ELS match")
+Parser.add_argument("--term", help="ELS search term, e.g. משיח")
+Parser.add_argument("--max-abs-d", type=int, help="only matches with |d| <= this skip distance")
+Parser.add_argument("--book", type=int, help="book number (1-39) of the first letter of the match")
+Parser.add_argument("--chapter", type=int, help="chapter of the first letter of the match")
+Parser.add_argument("--run", type=int, help="only matches of this RunID")
+Parser.add_argument("--limit", type=int, help="maximum number of rows")
+## END DECLARE VARIABLES
+
+## BEGIN MAIN PROGRAM
+Arguments = Parser.parse_args()
+
+## BEGIN IF / ELIF / ELSE - TYPE OF QUERY
+if Arguments.runs:
+    ListOfHeaders, ListOfRows = mod_99_WriteOutputToSQLite.fn_QueryRuns(Arguments.database)
+
+elif Arguments.letters is not None:
+    ListOfHeaders, ListOfRows = mod_99_WriteOutputToSQLite.fn_QueryLetterPositions(Arguments.letters, Arguments.database)
+
+else:
+    ListOfHeaders, ListOfRows = mod_99_WriteOutputToSQLite.fn_QueryMatches(Arguments.database, Arguments.term, Arguments.max_abs_d, Arguments.book, Arguments.chapter, Arguments.run, Arguments.limit)
+## END IF / ELIF / ELSE
+
+## WRITE OUTPUT AS CSV (SAME DELIMITER AS THE CSV FILES IN USER_GENERATED_FILES)
+f_csv = csv.writer(sys.stdout, delimiter=';')
+f_csv.writerow(ListOfHeaders)
+f_csv.writerows(ListOfRows)
+## END MAIN PROGRAM
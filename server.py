@@ -0,0 +1,55 @@
+## LOCAL SEARCH SERVER: KEEPS THE LAST CORPORA OPENED IN MEMORY SO THAT REPEATED SEARCHES OF THE SAME TEXT SKIP READING + PARSING IT AND THE IMPORTS
+## e.g. START:  python server.py  (OPTIONAL: --port 8765 --max-corpora 2)
+## e.g. SEARCH:  python client.py --codex 2 --text 1 --dmin -100 --dmax 100 משיח  (gui.py ALSO USES THE SERVER WHEN IT IS RUNNING)
+## e.g. STATUS:  python client.py --status
+## e.g. STOP THE RUNNING SEARCH (IT ANSWERS WITH THE MATCHES FOUND SO FAR + WHICH SKIP DISTANCES WERE SEARCHED):  python client.py --cancel
+## POST /search: ONE SEARCH JOB (JSON, SEE mod_7B_SearchJobRun.py); ANSWER: ONE JSON EVENT PER LINE (log, corpus, ..., LAST: result OR error); FILES ARE WRITTEN TO USER_GENERATED_FILES AS BY p.py
+
+## BEGIN IMPORT MODULES
+import argparse
+import http.server
+import os
+import threading
+import time
+
+import mod_7C_SearchClient ## MODULE.FUNCTION() #7C - SEARCH CLIENT (HOST + PORT DEFAULTS)
+## END IMPORT MODULES
+
+## BEGIN IMPORT CLASSES
+from mod_cls_SessionCache import cls_SessionCache as SESSIONCACHE
+from mod_cls_SearchRequestHandler import cls_SearchRequestHandler as SRH
+## END IMPORT CLASSES
+
+## BEGIN DECLARE VARIABLES
+Parser = argparse.ArgumentParser(description="Local search server: keeps the last corpora opened in memory for repeated searches (clients: client.py, gui.py)")
+Parser.add_argument("--host", default=mod_7C_SearchClient.HostDefault, help="address to listen on (default: %(default)s, this computer only)")
+Parser.add_argument("--port", type=int, default=mod_7C_SearchClient.PortDefault, help="port (default: %(default)s)")
+Parser.add_argument("--max-corpora", type=int, default=2, help="number of corpora kept in memory; the least recently used is dropped first (default: %(default)s)")
+## END DECLARE VARIABLES
+
+## BEGIN MAIN PROGRAM
+Arguments = Parser.parse_args()
+
+## FILES ARE WRITTEN TO USER_GENERATED_FILES NEXT TO THIS SCRIPT
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+## CREATE SERVER: ONE THREAD PER REQUEST (GET /status ANSWERS WHILE A SEARCH RUNS); ONE SEARCH JOB AT A TIME
+Server = http.server.ThreadingHTTPServer((Arguments.host, Arguments.port), SRH)
+Server.daemon_threads = True
+Server.sc = SESSIONCACHE(Arguments.max_corpora)
+Server.LockOfJobs = threading.Lock()
+Server.ctOfJob = None ## CANCEL TOKEN OF THE RUNNING JOB (POST /cancel)
+Server.DictOfStatus = {"Started": time.strftime("%Y-%m-%d %H:%M:%S"), "JobsRun": 0}
+
+## TEST PRINT OUTPUT
+print(f"Search server on http://{Arguments.host}:{Arguments.port} (up to {Arguments.max_corpora} corpora in memory); stop with Ctrl+C")
+
+## BEGIN TRY / EXCEPT - SERVE UNTIL Ctrl+C
+try:
+    Server.serve_forever()
+except KeyboardInterrupt:
+    print("Search server stopped")
+finally:
+    Server.server_close()
+## END TRY / EXCEPT
+## END MAIN PROGRAM
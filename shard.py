@@ -0,0 +1,156 @@
+## SHARDED SEARCH: ONE SEARCH SPLIT OVER MANY MACHINES; EACH SHARD RUNS ANYWHERE THE PROGRAM + texts/ ARE, THE MERGE GIVES THE SAME FILES AS ONE python p.py RUN
+## e.g. SEARCH SPEC (JSON; SAME AS ONE SEARCH JOB OF python client.py / server.py / batch.py):
+##   {"Codex": 2, "Text": 43, "ELSSearchTerms": ["משיח", "תורה"], "SkipDistanceDMinimum": -20000, "SkipDistanceDMaximum": 20000, "XW": 50, "Outputs": ["summary", "matches"]}
+## e.g. python shard.py split spec.json --shards 8 --out SHARDS/tanach       (SHARDS/tanach/SHARD_001_OF_008.json ... 1 FILE PER SHARD; COPY EACH TO ANY MACHINE)
+## e.g. python shard.py run SHARDS/tanach/SHARD_001_OF_008.json             (WRITES SHARD_001_OF_008_RESULT.json NEXT TO IT; Ctrl+C STOPS EARLY, THE MERGE THEN REFUSES THE RESULT)
+## e.g. python shard.py merge SHARDS/tanach/*_RESULT.json --out MERGES/tanach (CHECKS THAT EVERY (TERM, d) IS IN EXACTLY 1 RESULT; FILES IN MERGES/tanach/USER_GENERATED_FILES/)
+## e.g. python shard.py local spec.json --shards 8 --workers 4 --out SHARDS/tanach (SPLIT + EACH SHARD AS A LOCAL PROCESS INSTEAD OF A MACHINE + MERGE, e.g. FOR TESTING)
+
+## BEGIN IMPORT MODULES
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+
+import mod_7E_ShardSpecsCreate ## MODULE.FUNCTION() #7E - SHARD SPECS CREATE; ## RETURNS ListOfShardSpecs
+import mod_7F_ShardRun ## MODULE.FUNCTION() #7F - SHARD RUN; ## RETURNS DictOfShardResult
+import mod_7G_ShardResultsMerge ## MODULE.FUNCTION() #7G - SHARD RESULTS MERGE; ## RETURNS DictOfResults
+
+from mod_cls_CancelToken import cls_CancelToken as CT
+## END IMPORT MODULES
+
+## BEGIN DECLARE VARIABLES
+Parser = argparse.ArgumentParser(description="Split an ELS search into shards, run each shard anywhere, merge the shard results into the files of the whole search")
+SubParsers = Parser.add_subparsers(dest="command", required=True)
+
+ParserSplit = SubParsers.add_parser("split", help="write one shard spec file per shard")
+ParserSplit.add_argument("spec", help="search spec (.json): one search job")
+ParserSplit.add_argument("--shards", type=int, required=True, help="number of shards")
+ParserSplit.add_argument("--out", default=None, help="directory of the shard spec files (default: SHARDS/<name of the spec>)")
+
+ParserRun = SubParsers.add_parser("run", help="run one shard; writes its result file")
+ParserRun.add_argument("shard", help="shard spec file (SHARD_nnn_OF_NNN.json)")
+ParserRun.add_argument("--out", default=None, help="result file (default: <shard spec file>_RESULT.json)")
+
+ParserMerge = SubParsers.add_parser("merge", help="check + merge shard result files into the files of the whole search")
+ParserMerge.add_argument("results", nargs="+", help="shard result files (SHARD_nnn_OF_NNN_RESULT.json)")
+ParserMerge.add_argument("--out", required=True, help="merge directory: USER_GENERATED_FILES/ + MERGED_RESULT.json + CHECKPOINT.jsonl + LOG.txt")
+
+ParserLocal = SubParsers.add_parser("local", help="split, run each shard as a local process, merge")
+ParserLocal.add_argument("spec", help="search spec (.json): one search job")
+ParserLocal.add_argument("--shards", type=int, required=True, help="number of shards")
+ParserLocal.add_argument("--workers", type=int, default=None, help="shards running at the same time (default: number of CPUs)")
+ParserLocal.add_argument("--out", default=None, help="directory of the shards, their results + logs and the merge (MERGE/) (default: SHARDS/<name of the spec>)")
+## END DECLARE VARIABLES
+
+## BEGIN FUNCTION () - SHARD FILE NAMES OF THE DIRECTORY IN ORDER (NOT THE RESULTS)
+def fn_ShardFileNamesGet(DirectoryOfShards):
+
+    return(sorted(EachFileName for EachFileName in glob.glob(os.path.join(DirectoryOfShards, "SHARD_*_OF_*.json")) if not EachFileName.endswith("_RESULT.json")))
+
+## END FUNCTION
+
+## BEGIN FUNCTION () - SHARDS RUN LOCALLY - EACH SHARD AS ITS OWN python shard.py run PROCESS (A STAND-IN FOR A MACHINE), AT MOST NumberOfWorkers AT A TIME; ## RETURNS ListOfFileNamesOfResults
+def fn_ShardsRunLocally(ListOfFileNamesOfShards, NumberOfWorkers):
+
+    ## DECLARE VARIABLES
+    ListOfWaiting = list(ListOfFileNamesOfShards)
+    DictOfRunning = {} ## KEY IS FILE NAME OF THE SHARD; VALUE: (PROCESS, LOG FILE)
+    ListOfFailed = []
+
+    ## BEGIN WHILE LOOP - UNTIL EVERY SHARD HAS RUN
+    while ListOfWaiting or DictOfRunning:
+
+        ## START SHARDS WHILE A WORKER IS FREE
+        while ListOfWaiting and len(DictOfRunning) < NumberOfWorkers:
+            FileNameOfShard = ListOfWaiting.pop(0)
+            FileOfLog = open(FileNameOfShard[:-len(".json")] + ".log", "w", encoding="utf-8")
+            DictOfRunning[FileNameOfShard] = (subprocess.Popen([sys.executable, os.path.abspath(__file__), "run", FileNameOfShard], stdout=FileOfLog, stderr=subprocess.STDOUT), FileOfLog)
+            print(f"Shard {os.path.basename(FileNameOfShard)} started (log: {FileOfLog.name})")
+
+        ## SHARDS DONE
+        time.sleep(0.2)
+        for FileNameOfShard, (Process, FileOfLog) in list(DictOfRunning.items()):
+            if Process.poll() is not None:
+                FileOfLog.close()
+                del DictOfRunning[FileNameOfShard]
+                print(f"Shard {os.path.basename(FileNameOfShard)} {'done' if Process.returncode == 0 else f'FAILED (exit code {Process.returncode}; see {FileOfLog.name})'}")
+                if Process.returncode != 0:
+                    ListOfFailed.append(FileNameOfShard)
+
+    ## END WHILE LOOP
+
+    ## IF A SHARD FAILED
+    if ListOfFailed:
+        raise ValueError(f"{len(ListOfFailed)} shard(s) failed: {', '.join(os.path.basename(EachFileName) for EachFileName in ListOfFailed)}")
+
+    ## RETURN VARIABLES
+    return([EachFileName[:-len(".json")] + "_RESULT.json" for EachFileName in ListOfFileNamesOfShards])
+
+## END FUNCTION
+
+## BEGIN MAIN PROGRAM
+if __name__ == "__main__":
+
+    Arguments = Parser.parse_args()
+
+    ## PATHS OF THE COMMAND LINE ARE FROM THE CURRENT DIRECTORY; texts/ ARE READ NEXT TO THIS SCRIPT
+    FileNameOfInput = os.path.abspath(Arguments.shard if Arguments.command == "run" else Arguments.spec) if Arguments.command != "merge" else None
+    ListOfFileNamesOfResults = [os.path.abspath(EachFileName) for EachFileName in getattr(Arguments, "results", None) or []]
+    DirectoryOfOutput = os.path.abspath(Arguments.out) if Arguments.out else None
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    ## BEGIN TRY / EXCEPT - SPEC, SHARD OR RESULTS NOT USABLE
+    try:
+
+        ## BEGIN MATCH CASE - COMMAND
+        match Arguments.command:
+
+            case "split" | "local":
+
+                with open(FileNameOfInput, encoding="utf-8") as File:
+                    DictOfSpec = json.load(File)
+                DirectoryOfOutput = DirectoryOfOutput or os.path.join("SHARDS", os.path.splitext(os.path.basename(FileNameOfInput))[0])
+
+                ## IF THE DIRECTORY HOLDS SHARDS ALREADY (OF ANOTHER SPLIT: THEIR RESULTS WOULD OVERLAP)
+                if fn_ShardFileNamesGet(DirectoryOfOutput):
+                    raise ValueError(f"{DirectoryOfOutput} holds shards already; choose another directory")
+
+                ListOfShardSpecs = mod_7E_ShardSpecsCreate.fn_ShardSpecsCreate(DictOfSpec, Arguments.shards, DirectoryOfOutput)
+                for DictOfShardSpec in ListOfShardSpecs:
+                    print(f"{DictOfShardSpec['FileName']}: terms {DictOfShardSpec['Shard']['TermNumbers']}, d {DictOfShardSpec['Shard']['SkipDistanceDMinimum']} - {DictOfShardSpec['Shard']['SkipDistanceDMaximum']}")
+
+                ## LOCAL PROCESSES IN PLACE OF MACHINES, THEN THE MERGE
+                if Arguments.command == "local":
+                    ListOfFileNamesOfResults = fn_ShardsRunLocally([DictOfShardSpec["FileName"] for DictOfShardSpec in ListOfShardSpecs], Arguments.workers or os.cpu_count() or 1)
+                    mod_7G_ShardResultsMerge.fn_ShardResultsMerge(ListOfFileNamesOfResults, os.path.join(DirectoryOfOutput, "MERGE"))
+
+            case "run":
+
+                with open(FileNameOfInput, encoding="utf-8") as File:
+                    DictOfShardSpec = json.load(File)
+
+                ## Ctrl+C / SIGTERM STOP THE SHARD AT THE NEXT SKIP DISTANCE; ITS RESULT IS WRITTEN BUT MARKED NOT COMPLETE
+                ct = CT()
+                DictOfSignalHandlers = ct.fn_SignalsConnect()
+                DictOfShardResult = mod_7F_ShardRun.fn_ShardRun(DictOfShardSpec, DirectoryOfOutput or FileNameOfInput[:-len(".json")] + "_RESULT.json", ct=ct)
+                ct.fn_SignalsDisconnect(DictOfSignalHandlers)
+
+                ## EXIT CODE 1 IF STOPPED EARLY
+                if not DictOfShardResult["IsComplete"]:
+                    sys.exit(1)
+
+            case "merge":
+
+                mod_7G_ShardResultsMerge.fn_ShardResultsMerge(ListOfFileNamesOfResults, DirectoryOfOutput)
+
+        ## END MATCH CASE
+
+    except (OSError, ValueError) as e:
+        sys.exit(f"Shard {Arguments.command} failed: {e}")
+    ## END TRY / EXCEPT
+
+## END MAIN PROGRAM
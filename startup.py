@@ -0,0 +1,133 @@
+## STARTUP TIME: SECONDS FROM python p.py TO ITS FIRST PROMPT + SECONDS TO IMPORT gui.py; MODULES IMPORTED BEFORE THE FIRST PROMPT (python -X importtime)
+## THE FIRST PROMPT ONLY NEEDS THE MODULES OF THE PROMPTS: numpy, pandas, tqdm AND THE ELS SEARCH (mod_cls_Session + STAGE MODULES) ARE IMPORTED WHEN THE SEARCH NEEDS THEM
+## e.g. python startup.py                                 (5 RUNS; EXIT CODE 1 IF A MEDIAN IS OVER --target / --target-gui OR A HEAVY MODULE IS IMPORTED BEFORE THE FIRST PROMPT)
+## e.g. python startup.py --runs 10 --target 0.2 --top 20 (20 SLOWEST MODULES IMPORTED BEFORE THE FIRST PROMPT)
+## e.g. python startup.py --record STARTUP.jsonl          (APPENDS ONE JSON LINE PER CHECK: {"Time": ..., "Python": ..., "SecondsToFirstPrompt": ..., "SecondsOfGUIImport": ..., "Imports": [...]} TO COMPARE RELEASES)
+## STARTUP.jsonl (NEXT TO THIS SCRIPT) IS THE TRACKED RECORD OF THE RELEASES: ADD A LINE WITH --record STARTUP.jsonl WHEN THE MODULES IMPORTED BEFORE THE FIRST PROMPT CHANGE
+
+## BEGIN IMPORT MODULES
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+## END IMPORT MODULES
+
+## BEGIN DECLARE VARIABLES
+TextOfFirstPrompt = "Please select codex" ## MODULE.FUNCTION() #0 - FIRST input() OF p.py
+TupleOfModulesNotBeforeFirstPrompt = ("numpy", "pandas", "tqdm", "mod_cls_Session", "mod_21_PandasObjectsCreate", "mod_22A_ELSSearchByLetterFirst", "mod_22C_ELSSearchChunked", "mod_23_ELSSearchByLetterLast", "mod_41_SearchForELSSearchTerms")
+
+Parser = argparse.ArgumentParser(description="Measure the seconds from python p.py to its first prompt and the seconds to import gui.py; list the modules imported before the first prompt")
+Parser.add_argument("--runs", type=int, default=5, help="runs of each measurement; the median counts (default: 5)")
+Parser.add_argument("--target", type=float, default=0.25, help="seconds to the first prompt of p.py not to go over (default: 0.25)")
+Parser.add_argument("--target-gui", type=float, default=0.5, help="seconds to import gui.py not to go over (default: 0.5)")
+Parser.add_argument("--top", type=int, default=10, help="number of the slowest modules to list (default: 10)")
+Parser.add_argument("--record", default=None, help="file to append the result to as one JSON line (.jsonl)")
+## END DECLARE VARIABLES
+
+## BEGIN FUNCTION () - SECONDS TO FIRST PROMPT - python p.py UNTIL THE FIRST PROMPT IS ON STDOUT (input() FLUSHES IT); ## RETURNS SecondsToFirstPrompt
+def fn_SecondsToFirstPromptGet():
+
+    ## DECLARE VARIABLES
+    TextOfOutput = ""
+    TimeStart = time.perf_counter()
+    Process = subprocess.Popen([sys.executable, "p.py"], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, encoding="utf-8")
+
+    ## BEGIN TRY / FINALLY - p.py WAITS AT THE PROMPT; IT IS STOPPED AS SOON AS THE PROMPT IS THERE
+    try:
+        while TextOfFirstPrompt not in TextOfOutput:
+            Character = Process.stdout.read(1)
+            if not Character:
+                raise ValueError(f"p.py ended before its first prompt ('{TextOfFirstPrompt}')")
+            TextOfOutput += Character
+        SecondsToFirstPrompt = time.perf_counter() - TimeStart
+    finally:
+        Process.kill()
+        Process.wait()
+    ## END TRY / FINALLY
+
+    ## RETURN VARIABLES
+    return(SecondsToFirstPrompt)
+
+## END FUNCTION
+
+## BEGIN FUNCTION () - SECONDS OF GUI IMPORT - import gui IN A NEW INTERPRETER (NO WINDOW IS OPENED); None IF tkinter IS NOT INSTALLED; ## RETURNS SecondsOfGUIImport
+def fn_SecondsOfGUIImportGet():
+
+    ## DECLARE VARIABLES
+    Result = subprocess.run([sys.executable, "-c", "import time; TimeStart = time.perf_counter(); import gui; print(time.perf_counter() - TimeStart)"], capture_output=True, text=True)
+
+    ## RETURN VARIABLES
+    return(float(Result.stdout.split()[-1]) if Result.returncode == 0 else None)
+
+## END FUNCTION
+
+## BEGIN FUNCTION () - IMPORTS BEFORE FIRST PROMPT - python -X importtime p.py WITH NO INPUT (STOPS AT THE FIRST PROMPT); ## RETURNS ListOfImports [(Module, SecondsSelf, SecondsCumulative, IsTopLevel), ...]
+def fn_ImportsBeforeFirstPromptGet():
+
+    ## DECLARE VARIABLES
+    Result = subprocess.run([sys.executable, "-X", "importtime", "p.py"], input="", capture_output=True, text=True, encoding="utf-8")
+    ListOfImports = []
+
+    ## BEGIN FOR LOOP - EACH LINE "import time:  SELF [us] | CUMULATIVE | MODULE" (MODULE INDENTED BY ITS DEPTH)
+    for EachLine in Result.stderr.splitlines():
+
+        if not EachLine.startswith("import time:") or "[us]" in EachLine:
+            continue
+        MicrosecondsSelf, MicrosecondsCumulative, Module = EachLine[len("import time:"):].split("|")
+        ListOfImports.append((Module.strip(), int(MicrosecondsSelf) / 1e6, int(MicrosecondsCumulative) / 1e6, not Module[1:].startswith(" ")))
+
+    ## END FOR LOOP
+
+    ## RETURN VARIABLES
+    return(ListOfImports)
+
+## END FUNCTION
+
+## BEGIN MAIN PROGRAM
+if __name__ == "__main__":
+
+    Arguments = Parser.parse_args()
+
+    ## PATHS OF THE COMMAND LINE ARE FROM THE CURRENT DIRECTORY; p.py + gui.py ARE RUN NEXT TO THIS SCRIPT
+    FileNameForRecord = os.path.abspath(Arguments.record) if Arguments.record else None
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    ## BEGIN TRY / EXCEPT - p.py DOES NOT START
+    try:
+        SecondsToFirstPrompt = statistics.median(fn_SecondsToFirstPromptGet() for _ in range(Arguments.runs))
+    except (OSError, ValueError) as e:
+        sys.exit(f"Startup not measured: {e}")
+    ## END TRY / EXCEPT
+
+    ListOfSecondsOfGUIImport = [fn_SecondsOfGUIImportGet() for _ in range(Arguments.runs)]
+    SecondsOfGUIImport = statistics.median(ListOfSecondsOfGUIImport) if None not in ListOfSecondsOfGUIImport else None
+    ListOfImports = fn_ImportsBeforeFirstPromptGet()
+    ListOfModulesNotBeforeFirstPrompt = [Module for Module, _, _, _ in ListOfImports if Module in TupleOfModulesNotBeforeFirstPrompt]
+
+    ## TEST PRINT OUTPUT
+    print(f"p.py TO FIRST PROMPT: {SecondsToFirstPrompt:.3f} s (MEDIAN OF {Arguments.runs} RUNS; TARGET {Arguments.target:.3f} s)")
+    print(f"IMPORT gui.py: {SecondsOfGUIImport:.3f} s (MEDIAN OF {Arguments.runs} RUNS; TARGET {Arguments.target_gui:.3f} s)" if SecondsOfGUIImport is not None else "IMPORT gui.py: NOT MEASURED (tkinter NOT INSTALLED?)")
+    print(f"IMPORTS BEFORE THE FIRST PROMPT: {len(ListOfImports)} MODULES, {sum(SecondsCumulative for _, _, SecondsCumulative, IsTopLevel in ListOfImports if IsTopLevel):.3f} s; SLOWEST (CUMULATIVE):")
+    for Module, SecondsSelf, SecondsCumulative, _ in sorted(ListOfImports, key=lambda EachImport: EachImport[2], reverse=True)[:Arguments.top]:
+        print(f"  {SecondsCumulative:8.4f} s  {Module}")
+    if ListOfModulesNotBeforeFirstPrompt:
+        print(f"IMPORTED BEFORE THE FIRST PROMPT BUT ONLY NEEDED BY THE SEARCH: {', '.join(ListOfModulesNotBeforeFirstPrompt)}")
+
+    ## APPEND THE RESULT TO THE RECORD (ONE JSON LINE PER CHECK)
+    if FileNameForRecord is not None:
+        with open(FileNameForRecord, "a", encoding="utf-8") as File:
+            File.write(json.dumps({"Time": time.strftime("%Y-%m-%dT%H:%M:%S"), "Python": platform.python_version(), "Runs": Arguments.runs, "Target": Arguments.target, "TargetGUI": Arguments.target_gui, \
+                "SecondsToFirstPrompt": round(SecondsToFirstPrompt, 4), "SecondsOfGUIImport": None if SecondsOfGUIImport is None else round(SecondsOfGUIImport, 4), \
+                "Imports": [{"Module": Module, "Seconds": round(SecondsCumulative, 4)} for Module, _, SecondsCumulative, IsTopLevel in ListOfImports if IsTopLevel]}, ensure_ascii=False) + "\n")
+
+    ## EXIT CODE 1 IF OVER A TARGET OR A MODULE OF THE SEARCH IS IMPORTED BEFORE THE FIRST PROMPT (gui.py NOT MEASURED DOES NOT FAIL)
+    IsOverTarget = SecondsToFirstPrompt > Arguments.target or (SecondsOfGUIImport is not None and SecondsOfGUIImport > Arguments.target_gui)
+    if IsOverTarget:
+        print("OVER THE TARGET")
+    sys.exit(1 if IsOverTarget or ListOfModulesNotBeforeFirstPrompt else 0)
+
+## END MAIN PROGRAM